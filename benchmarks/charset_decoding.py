@@ -0,0 +1,66 @@
+"""
+Compares decoding response bodies by `requests` with the charset resolution of Preacher.
+
+Usage:
+    poetry run python benchmarks/charset_decoding.py [size in KiB] [count of text accesses]
+"""
+
+import json
+import sys
+from timeit import timeit
+
+import requests
+
+from preacher.core.request.requester import ResponseBodyWrapper
+
+
+def _create_response(size: int) -> requests.Response:
+    items = []
+    length = 0
+    while length < size * 1024:
+        i = len(items)
+        item = {
+            "id": i,
+            "name": f"東京{i}",
+            "tags": [f"tag{i % 7}", f"tag{i % 13}"],
+            "score": i / 3,
+        }
+        items.append(item)
+        length += len(json.dumps(item, ensure_ascii=False).encode("utf-8"))
+
+    res = requests.Response()
+    res.status_code = 200
+    res.headers["Content-Type"] = "application/octet-stream"  # Without charset.
+    res._content = json.dumps(items, ensure_ascii=False).encode("utf-8")
+    return res
+
+
+def _by_requests(res: requests.Response, count: int) -> None:
+    for _ in range(count):
+        res.text
+
+
+def _by_preacher(res: requests.Response, count: int, detect: bool) -> None:
+    body = ResponseBodyWrapper(res, detect_charset=detect)
+    for _ in range(count):
+        body.text
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1024
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    res = _create_response(size)
+    print(f"Body: {len(res.content) / 1024:.0f} KiB, text accessed {count} times")
+
+    cases = (
+        ("requests (detection every time)", lambda: _by_requests(res, count)),
+        ("preacher --detect-charset", lambda: _by_preacher(res, count, detect=True)),
+        ("preacher (default)", lambda: _by_preacher(res, count, detect=False)),
+    )
+    for label, func in cases:
+        elapsed = timeit(func, number=3) / 3
+        print(f"  {label:<34}{elapsed * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
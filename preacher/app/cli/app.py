@@ -1,12 +1,15 @@
 """CLI Application implementation."""
 
-from typing import Iterable, Optional, Sequence
+from typing import Iterable, Optional, Sequence, Union
 
 from preacher.compilation.argument import Arguments
-from preacher.compilation.scenario import compile_scenarios
+from preacher.compilation.scenario import compile_scenarios, reference_scenarios
 from preacher.compilation.yaml import load_from_paths
+from preacher.core.scenario import DeferredScenario, Scenario
+from preacher.core.scenario.util.adaptive import AimdController
 from preacher.core.scheduling import create_scheduler
 from preacher.core.status import Status
+from preacher.core.request import Backoff, Cassette, CassetteMode
 from preacher.plugin.loader import load_plugins
 from preacher.plugin.manager import get_plugin_manager
 from preacher.presentation.listener import create_listener
@@ -26,9 +29,36 @@ def app(
     report_dir: Optional[str] = None,
     delay: float = 0.1,
     retry: int = 0,
+    backoff: Backoff = Backoff.CONSTANT,
+    max_delay: float = 60.0,
+    retry_budget: Optional[int] = None,
     timeout: Optional[float] = None,
+    connect_timeout: Optional[float] = None,
+    read_timeout: Optional[float] = None,
+    deadline: Optional[float] = None,
     concurrency: int = 1,
     executor_factory: Optional[ExecutorFactory] = None,
+    pool_size: int = 10,
+    keep_alive: bool = True,
+    http2: bool = False,
+    spool_threshold: Optional[int] = None,
+    detect_charset: bool = False,
+    rate_limit: Optional[float] = None,
+    max_in_flight: Optional[int] = None,
+    adaptive_concurrency: bool = False,
+    record_dir: Optional[str] = None,
+    replay_dir: Optional[str] = None,
+    cache_size: Optional[int] = None,
+    compressed: bool = False,
+    compress_threshold: Optional[int] = None,
+    hedge_percentile: Optional[float] = None,
+    circuit_breaker: Optional[int] = None,
+    circuit_reset: float = 30.0,
+    prewarm: Optional[int] = None,
+    stream: bool = False,
+    window: Optional[int] = None,
+    worker_compilation: bool = False,
+    ordered_by_dependency: bool = False,
     plugins: Iterable[str] = (),
     verbosity: int = 0,
 ) -> int:
@@ -53,9 +83,36 @@ def app(
         "  Reporting directory path: %s\n"
         "  Max retry count: %d\n"
         "  Delay between attempts in seconds: %s\n"
+        "  Backoff: %s\n"
+        "  Max delay between attempts in seconds: %s\n"
+        "  Retry budget: %s\n"
         "  Timeout in seconds: %s\n"
+        "  Connect timeout in seconds: %s\n"
+        "  Read timeout in seconds: %s\n"
+        "  Deadline in seconds: %s\n"
         "  Concurrency: %s\n"
         "  Executor: %s\n"
+        "  Pool size: %d\n"
+        "  Keep-alive: %s\n"
+        "  HTTP/2: %s\n"
+        "  Spooling threshold in bytes: %s\n"
+        "  Charset detection: %s\n"
+        "  Rate limit per second: %s\n"
+        "  Max requests in flight: %s\n"
+        "  Adaptive concurrency: %s\n"
+        "  Recording directory path: %s\n"
+        "  Replaying directory path: %s\n"
+        "  Response cache size in bytes: %s\n"
+        "  Compressed responses: %s\n"
+        "  Request compression threshold in bytes: %s\n"
+        "  Hedging percentile: %s\n"
+        "  Circuit breaker threshold: %s\n"
+        "  Circuit reset delay in seconds: %s\n"
+        "  Pre-warmed connections per host: %s\n"
+        "  Streaming results: %s\n"
+        "  Scenario window: %s\n"
+        "  Worker compilation: %s\n"
+        "  Ordered by dependency: %s\n"
         "  Verbosity: %d",
         paths,
         arguments,
@@ -64,9 +121,36 @@ def app(
         report_dir,
         retry,
         delay,
+        backoff,
+        max_delay,
+        retry_budget,
         timeout,
+        connect_timeout,
+        read_timeout,
+        deadline,
         concurrency,
         executor_factory,
+        pool_size,
+        keep_alive,
+        http2,
+        spool_threshold,
+        detect_charset,
+        rate_limit,
+        max_in_flight,
+        adaptive_concurrency,
+        record_dir,
+        replay_dir,
+        cache_size,
+        compressed,
+        compress_threshold,
+        hedge_percentile,
+        circuit_breaker,
+        circuit_reset,
+        prewarm,
+        stream,
+        window,
+        worker_compilation,
+        ordered_by_dependency,
         verbosity,
     )
 
@@ -77,16 +161,32 @@ def app(
         logger.exception(error)
         return 3
 
-    objs = load_from_paths(paths, plugin_manager=plugin_manager, logger=logger)
-    scenarios = compile_scenarios(
-        objs,
-        arguments=arguments,
-        plugin_manager=plugin_manager,
-        logger=logger,
-    )
+    scenarios: Iterable[Union[Scenario, DeferredScenario]]
+    if worker_compilation:
+        scenarios = reference_scenarios(
+            paths,
+            arguments=arguments,
+            plugins=plugins,
+            plugin_manager=plugin_manager,
+            logger=logger,
+        )
+    else:
+        objs = load_from_paths(paths, plugin_manager=plugin_manager, logger=logger)
+        scenarios = compile_scenarios(
+            objs,
+            arguments=arguments,
+            plugin_manager=plugin_manager,
+            logger=logger,
+        )
 
     listener = create_listener(level=level, formatter=ColoredFormatter(), report_dir=report_dir)
     executor_factory = executor_factory or PROCESS_POOL_FACTORY
+    controller = AimdController(max_limit=concurrency) if adaptive_concurrency else None
+    cassette = None
+    if replay_dir:
+        cassette = Cassette(replay_dir, CassetteMode.REPLAY)
+    elif record_dir:
+        cassette = Cassette(record_dir, CassetteMode.RECORD)
     try:
         logger.info("Start running scenarios.")
         with executor_factory.create(concurrency) as executor:
@@ -95,14 +195,42 @@ def app(
                 listener=listener,
                 base_url=base_url,
                 timeout=timeout,
+                connect_timeout=connect_timeout,
+                read_timeout=read_timeout,
+                deadline=deadline,
                 retry=retry,
                 delay=delay,
+                backoff=backoff,
+                max_delay=max_delay,
+                retry_budget=retry_budget,
+                pool_size=pool_size,
+                keep_alive=keep_alive,
+                http2=http2,
+                spool_threshold=spool_threshold,
+                detect_charset=detect_charset,
+                rate_limit=rate_limit,
+                max_in_flight=max_in_flight,
+                concurrency_controller=controller,
+                cassette=cassette,
+                cache_size=cache_size,
+                compressed=compressed,
+                compress_threshold=compress_threshold,
+                hedge_percentile=hedge_percentile,
+                circuit_breaker=circuit_breaker,
+                circuit_reset=circuit_reset,
+                prewarm=prewarm,
+                stream=stream,
+                window=window,
+                ordered_by_dependency=ordered_by_dependency,
+                deferred_concurrency=concurrency,
             )
             status = scheduler.run(scenarios)
     except Exception as error:
         logger.exception(error)
         return 3
     finally:
+        if cassette:
+            cassette.close()
         logger.info("End running scenarios.")
 
     if not status.is_succeeded:
@@ -1,5 +1,11 @@
+import os
 from abc import ABC, abstractmethod
 from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+from preacher.core.request.async_requester import AsyncRequester
+from preacher.core.scenario.util.async_concurrency import AsyncioExecutor
+from preacher.core.scenario.util.hybrid import HybridExecutor
 
 
 class ExecutorFactory(ABC):
@@ -22,5 +28,31 @@ class _ThreadPoolFactory(ExecutorFactory):
         return ThreadPoolExecutor(concurrency)
 
 
+class HybridPoolFactory(ExecutorFactory):
+    """
+    A factory of executors running the given concurrency of threads in worker processes.
+
+    Args:
+        processes: The number of worker processes, which is capped by the concurrency.
+            Defaults to the number of CPUs.
+    """
+
+    def __init__(self, processes: Optional[int] = None):
+        self._processes = processes
+
+    def create(self, concurrency: int) -> Executor:
+        processes = min(self._processes or os.cpu_count() or 1, concurrency)
+        return HybridExecutor(processes, concurrency)
+
+
+class _AsyncioFactory(ExecutorFactory):
+    def create(self, concurrency: int) -> Executor:
+        if not AsyncRequester.is_available():
+            raise RuntimeError("The async executor requires `aiohttp` to be installed.")
+        return AsyncioExecutor(concurrency)
+
+
 PROCESS_POOL_FACTORY = _ProcessPoolFactory()
 THREAD_POOL_FACTORY = _ThreadPoolFactory()
+HYBRID_POOL_FACTORY = HybridPoolFactory()
+ASYNCIO_FACTORY = _AsyncioFactory()
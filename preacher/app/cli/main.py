@@ -6,6 +6,7 @@ from typing import Iterable, Optional, Sequence
 from click import FloatRange
 from click import IntRange
 from click import Path
+from click import UsageError
 from click import argument
 from click import command
 from click import help_option
@@ -15,9 +16,11 @@ from click import version_option
 from preacher import __version__ as _version
 from preacher.compilation.argument import Arguments
 from preacher.core.status import Status
+from preacher.core.request import Backoff
 from .app import app
-from .executor import ExecutorFactory
+from .executor import ASYNCIO_FACTORY, ExecutorFactory
 from .option import ArgumentType
+from .option import BackoffType
 from .option import ExecutorFactoryType
 from .option import LevelType
 from .option import pairs_callback
@@ -29,11 +32,38 @@ _ENV_ARGUMENT = f"{_ENV_PREFIX}ARGUMENT"
 _ENV_LEVEL = f"{_ENV_PREFIX}LEVEL"
 _ENV_RETRY = f"{_ENV_PREFIX}RETRY"
 _ENV_DELAY = f"{_ENV_PREFIX}DELAY"
+_ENV_BACKOFF = f"{_ENV_PREFIX}BACKOFF"
+_ENV_MAX_DELAY = f"{_ENV_PREFIX}MAX_DELAY"
+_ENV_RETRY_BUDGET = f"{_ENV_PREFIX}RETRY_BUDGET"
 _ENV_TIMEOUT = f"{_ENV_PREFIX}TIMEOUT"
+_ENV_CONNECT_TIMEOUT = f"{_ENV_PREFIX}CONNECT_TIMEOUT"
+_ENV_READ_TIMEOUT = f"{_ENV_PREFIX}READ_TIMEOUT"
+_ENV_DEADLINE = f"{_ENV_PREFIX}DEADLINE"
 _ENV_CONCURRENCY = f"{_ENV_PREFIX}CONCURRENCY"
 _ENV_CONCURRENT_EXECUTOR = f"{_ENV_PREFIX}CONCURRENT_EXECUTOR"
 _ENV_REPORT = f"{_ENV_PREFIX}REPORT"
 _ENV_PLUGIN = f"{_ENV_PREFIX}PLUGIN"
+_ENV_POOL_SIZE = f"{_ENV_PREFIX}POOL_SIZE"
+_ENV_KEEP_ALIVE = f"{_ENV_PREFIX}KEEP_ALIVE"
+_ENV_HTTP2 = f"{_ENV_PREFIX}HTTP2"
+_ENV_SPOOL_THRESHOLD = f"{_ENV_PREFIX}SPOOL_THRESHOLD"
+_ENV_DETECT_CHARSET = f"{_ENV_PREFIX}DETECT_CHARSET"
+_ENV_RATE_LIMIT = f"{_ENV_PREFIX}RATE_LIMIT"
+_ENV_MAX_IN_FLIGHT = f"{_ENV_PREFIX}MAX_IN_FLIGHT"
+_ENV_ADAPTIVE_CONCURRENCY = f"{_ENV_PREFIX}ADAPTIVE_CONCURRENCY"
+_ENV_RECORD = f"{_ENV_PREFIX}RECORD"
+_ENV_REPLAY = f"{_ENV_PREFIX}REPLAY"
+_ENV_CACHE_SIZE = f"{_ENV_PREFIX}CACHE_SIZE"
+_ENV_COMPRESSED = f"{_ENV_PREFIX}COMPRESSED"
+_ENV_COMPRESS_THRESHOLD = f"{_ENV_PREFIX}COMPRESS_THRESHOLD"
+_ENV_HEDGE = f"{_ENV_PREFIX}HEDGE"
+_ENV_CIRCUIT_BREAKER = f"{_ENV_PREFIX}CIRCUIT_BREAKER"
+_ENV_CIRCUIT_RESET = f"{_ENV_PREFIX}CIRCUIT_RESET"
+_ENV_PREWARM = f"{_ENV_PREFIX}PREWARM"
+_ENV_STREAM = f"{_ENV_PREFIX}STREAM"
+_ENV_WINDOW = f"{_ENV_PREFIX}WINDOW"
+_ENV_WORKER_COMPILATION = f"{_ENV_PREFIX}WORKER_COMPILATION"
+_ENV_ORDERED_BY_DEPENDENCY = f"{_ENV_PREFIX}ORDERED_BY_DEPENDENCY"
 
 
 @command()
@@ -93,6 +123,31 @@ _ENV_PLUGIN = f"{_ENV_PREFIX}PLUGIN"
     envvar=_ENV_DELAY,
     default=0.1,
 )
+@option(
+    "backoff",
+    "--backoff",
+    help="set the backoff of retries, whose exponential one has full jitter",
+    type=BackoffType(),
+    envvar=_ENV_BACKOFF,
+    default="constant",
+)
+@option(
+    "max_delay",
+    "--max-delay",
+    help="set the max delay between attempts in seconds, which also caps Retry-After",
+    metavar="sec",
+    type=FloatRange(min=0.0),
+    envvar=_ENV_MAX_DELAY,
+    default=60.0,
+)
+@option(
+    "retry_budget",
+    "--retry-budget",
+    help="set the max retry count in total",
+    metavar="num",
+    type=IntRange(min=0),
+    envvar=_ENV_RETRY_BUDGET,
+)
 @option(
     "timeout",
     "-t",
@@ -103,6 +158,33 @@ _ENV_PLUGIN = f"{_ENV_PREFIX}PLUGIN"
     envvar=_ENV_TIMEOUT,
     callback=positive_float_callback,
 )
+@option(
+    "connect_timeout",
+    "--connect-timeout",
+    help="set the timeout in seconds to connect, which overrides --timeout",
+    metavar="sec",
+    type=FloatRange(min=0.0),
+    envvar=_ENV_CONNECT_TIMEOUT,
+    callback=positive_float_callback,
+)
+@option(
+    "read_timeout",
+    "--read-timeout",
+    help="set the timeout in seconds to wait for data, which overrides --timeout",
+    metavar="sec",
+    type=FloatRange(min=0.0),
+    envvar=_ENV_READ_TIMEOUT,
+    callback=positive_float_callback,
+)
+@option(
+    "deadline",
+    "--deadline",
+    help="set the deadline in seconds of each request including its body download",
+    metavar="sec",
+    type=FloatRange(min=0.0),
+    envvar=_ENV_DEADLINE,
+    callback=positive_float_callback,
+)
 @option(
     "concurrency",
     "-c",
@@ -122,6 +204,177 @@ _ENV_PLUGIN = f"{_ENV_PREFIX}PLUGIN"
     envvar=_ENV_CONCURRENT_EXECUTOR,
     default="process",
 )
+@option(
+    "adaptive_concurrency",
+    "--adaptive-concurrency",
+    help="tune the concurrency up to the given one by the observed latency and errors",
+    is_flag=True,
+    envvar=_ENV_ADAPTIVE_CONCURRENCY,
+    default=False,
+)
+@option(
+    "pool_size",
+    "--pool-size",
+    help="set the max number of connections to keep per worker and host",
+    metavar="num",
+    type=IntRange(min=1),
+    envvar=_ENV_POOL_SIZE,
+    default=10,
+)
+@option(
+    "keep_alive",
+    "--keep-alive/--no-keep-alive",
+    help="enable or disable reusing connections",
+    envvar=_ENV_KEEP_ALIVE,
+    default=True,
+)
+@option(
+    "http2",
+    "--http2",
+    help="send requests over multiplexed HTTP/2 connections",
+    is_flag=True,
+    envvar=_ENV_HTTP2,
+    default=False,
+)
+@option(
+    "spool_threshold",
+    "--spool-threshold",
+    help="spool response bodies larger than this size in bytes to temporary files",
+    metavar="bytes",
+    type=IntRange(min=0),
+    envvar=_ENV_SPOOL_THRESHOLD,
+)
+@option(
+    "detect_charset",
+    "--detect-charset",
+    help="detect the charset of response bodies when not given by the headers",
+    is_flag=True,
+    envvar=_ENV_DETECT_CHARSET,
+    default=False,
+)
+@option(
+    "rate_limit",
+    "--rate-limit",
+    help="set the max request rate per second per worker process and host",
+    metavar="num",
+    type=FloatRange(min=0.0),
+    envvar=_ENV_RATE_LIMIT,
+    callback=positive_float_callback,
+)
+@option(
+    "max_in_flight",
+    "--max-in-flight",
+    help="set the max number of requests in flight per worker process and host",
+    metavar="num",
+    type=IntRange(min=1),
+    envvar=_ENV_MAX_IN_FLIGHT,
+)
+@option(
+    "record_dir",
+    "--record",
+    help="record responses to the cassette directory",
+    metavar="dir",
+    type=Path(file_okay=False, writable=True),
+    envvar=_ENV_RECORD,
+)
+@option(
+    "replay_dir",
+    "--replay",
+    help="replay responses from the cassette directory without sending requests",
+    metavar="dir",
+    type=Path(exists=True, file_okay=False),
+    envvar=_ENV_REPLAY,
+)
+@option(
+    "cache_size",
+    "--cache-size",
+    help="cache responses of GET and HEAD requests up to this total size in bytes",
+    metavar="bytes",
+    type=IntRange(min=1),
+    envvar=_ENV_CACHE_SIZE,
+)
+@option(
+    "compressed",
+    "--compressed",
+    help="request compressed responses, which are decoded while downloaded",
+    is_flag=True,
+    envvar=_ENV_COMPRESSED,
+    default=False,
+)
+@option(
+    "compress_threshold",
+    "--compress-threshold",
+    help="compress request bodies larger than this size in bytes by gzip",
+    metavar="bytes",
+    type=IntRange(min=0),
+    envvar=_ENV_COMPRESS_THRESHOLD,
+)
+@option(
+    "hedge_percentile",
+    "--hedge",
+    help="send a duplicate of a GET request slower than this percentile of the recent latency",
+    metavar="percentile",
+    type=FloatRange(min=0.0, max=100.0, min_open=True, max_open=True),
+    envvar=_ENV_HEDGE,
+)
+@option(
+    "circuit_breaker",
+    "--circuit-breaker",
+    help="fail requests to a host immediately after this many consecutive connection failures",
+    metavar="num",
+    type=IntRange(min=1),
+    envvar=_ENV_CIRCUIT_BREAKER,
+)
+@option(
+    "circuit_reset",
+    "--circuit-reset",
+    help="set the delay in seconds before probing a host whose circuit is open",
+    metavar="sec",
+    type=FloatRange(min=0.0),
+    envvar=_ENV_CIRCUIT_RESET,
+    default=30.0,
+    callback=positive_float_callback,
+)
+@option(
+    "prewarm",
+    "--prewarm",
+    help="open this number of connections to each host before the first request of each worker",
+    metavar="num",
+    type=IntRange(min=1),
+    envvar=_ENV_PREWARM,
+)
+@option(
+    "stream",
+    "--stream",
+    help="report scenario results in the order completed",
+    is_flag=True,
+    envvar=_ENV_STREAM,
+    default=False,
+)
+@option(
+    "window",
+    "--window",
+    help="set the max number of scenarios in flight, which are loaded lazily",
+    metavar="num",
+    type=IntRange(min=1),
+    envvar=_ENV_WINDOW,
+)
+@option(
+    "worker_compilation",
+    "--worker-compilation",
+    help="compile and run each scenario wholly in a worker, which receives only its reference",
+    is_flag=True,
+    envvar=_ENV_WORKER_COMPILATION,
+    default=False,
+)
+@option(
+    "ordered_by_dependency",
+    "--ordered-by-dependency",
+    help="run the cases of ordered scenarios concurrently unless they depend on each other",
+    is_flag=True,
+    envvar=_ENV_ORDERED_BY_DEPENDENCY,
+    default=False,
+)
 @option(
     "plugins",
     "-p",
@@ -149,13 +402,47 @@ def main(
     report_dir: Optional[str],
     retry: int,
     delay: float,
+    backoff: Backoff,
+    max_delay: float,
+    retry_budget: Optional[int],
     timeout: Optional[float],
+    connect_timeout: Optional[float],
+    read_timeout: Optional[float],
+    deadline: Optional[float],
     concurrency: int,
     executor_factory: ExecutorFactory,
+    pool_size: int,
+    keep_alive: bool,
+    http2: bool,
+    spool_threshold: Optional[int],
+    detect_charset: bool,
+    rate_limit: Optional[float],
+    max_in_flight: Optional[int],
+    adaptive_concurrency: bool,
+    record_dir: Optional[str],
+    replay_dir: Optional[str],
+    cache_size: Optional[int],
+    compressed: bool,
+    compress_threshold: Optional[int],
+    hedge_percentile: Optional[float],
+    circuit_breaker: Optional[int],
+    circuit_reset: float,
+    prewarm: Optional[int],
+    stream: bool,
+    window: Optional[int],
+    worker_compilation: bool,
+    ordered_by_dependency: bool,
     plugins: Iterable[str],
     verbosity: int,
 ) -> None:
     """Preacher CLI: Web API Verification without Coding"""
+    if record_dir and replay_dir:
+        raise UsageError("--record and --replay cannot be given at once")
+    if worker_compilation and not paths:
+        raise UsageError("--worker-compilation requires scenario paths")
+    if worker_compilation and executor_factory is ASYNCIO_FACTORY:
+        raise UsageError("--worker-compilation is not supported by the async executor")
+
     exit_code = app(
         paths=paths,
         base_url=base_url,
@@ -164,9 +451,36 @@ def main(
         report_dir=report_dir,
         retry=retry,
         delay=delay,
+        backoff=backoff,
+        max_delay=max_delay,
+        retry_budget=retry_budget,
         timeout=timeout,
+        connect_timeout=connect_timeout,
+        read_timeout=read_timeout,
+        deadline=deadline,
         concurrency=concurrency,
         executor_factory=executor_factory,
+        pool_size=pool_size,
+        keep_alive=keep_alive,
+        http2=http2,
+        spool_threshold=spool_threshold,
+        detect_charset=detect_charset,
+        rate_limit=rate_limit,
+        max_in_flight=max_in_flight,
+        adaptive_concurrency=adaptive_concurrency,
+        record_dir=record_dir,
+        replay_dir=replay_dir,
+        cache_size=cache_size,
+        compressed=compressed,
+        compress_threshold=compress_threshold,
+        hedge_percentile=hedge_percentile,
+        circuit_breaker=circuit_breaker,
+        circuit_reset=circuit_reset,
+        prewarm=prewarm,
+        stream=stream,
+        window=window,
+        worker_compilation=worker_compilation,
+        ordered_by_dependency=ordered_by_dependency,
         plugins=plugins,
         verbosity=verbosity,
     )
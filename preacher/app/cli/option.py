@@ -19,7 +19,9 @@ from yaml.error import MarkedYAMLError
 
 from preacher.compilation.argument import Arguments
 from preacher.core.status import Status
-from .executor import ExecutorFactory, PROCESS_POOL_FACTORY, THREAD_POOL_FACTORY
+from preacher.core.request import Backoff
+from .executor import ExecutorFactory, PROCESS_POOL_FACTORY, THREAD_POOL_FACTORY, ASYNCIO_FACTORY
+from .executor import HYBRID_POOL_FACTORY
 
 
 class Level(IntEnum):
@@ -36,6 +38,8 @@ _LEVEL_MAP: Mapping[str, Level] = {str(level): level for level in Level}
 _CONCURRENT_EXECUTOR_FACTORY_MAP: Mapping[str, ExecutorFactory] = {
     "process": PROCESS_POOL_FACTORY,
     "thread": THREAD_POOL_FACTORY,
+    "hybrid": HYBRID_POOL_FACTORY,
+    "async": ASYNCIO_FACTORY,
 }
 
 
@@ -70,6 +74,24 @@ class LevelType(ParamType):
         return next(item for item in Status if item.name.lower() == key)
 
 
+class BackoffType(ParamType):
+
+    _choice = Choice(tuple(item.value for item in Backoff), case_sensitive=False)
+    name = _choice.name
+
+    def get_metavar(self, param: Parameter) -> str:
+        return self._choice.get_metavar(param)
+
+    def get_missing_message(self, param: Parameter) -> str:
+        return self._choice.get_missing_message(param)
+
+    def convert(self, value: Any, param: Optional[Parameter], ctx: Optional[Context]) -> Backoff:
+        if isinstance(value, Backoff):
+            return value
+        key = self._choice.convert(value, param, ctx).lower()
+        return Backoff(key)
+
+
 class ExecutorFactoryType(ParamType):
 
     _choice = Choice(
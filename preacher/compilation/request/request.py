@@ -8,9 +8,10 @@ from typing import Optional, Tuple
 
 from preacher.compilation.argument import Argument, Arguments, inject_arguments
 from preacher.compilation.error import CompilationError, on_key
-from preacher.compilation.util.type import ensure_str, ensure_mapping, or_else
-from preacher.core.request import Request, Method, UrlParams
+from preacher.compilation.util.type import ensure_bool, ensure_str, ensure_mapping, or_else
+from preacher.core.request import Request, Method, Timeouts, UrlParams
 from .request_body import RequestBodyCompiled, RequestBodyCompiler
+from .timeout import compile_timeout
 from .url_param import compile_url_params
 
 _KEY_METHOD = "method"
@@ -18,6 +19,8 @@ _KEY_PATH = "path"
 _KEY_HEADERS = "headers"
 _KEY_PARAMS = "params"
 _KEY_BODY = "body"
+_KEY_CACHE = "cache"
+_KEY_TIMEOUT = "timeout"
 
 _METHOD_MAP = {method.name: method for method in Method}
 
@@ -29,6 +32,8 @@ class RequestCompiled:
     headers: Optional[Mapping[str, str]] = None
     params: Optional[UrlParams] = None
     body: Optional[RequestBodyCompiled] = None
+    cache: Optional[bool] = None
+    timeouts: Optional[Timeouts] = None
 
     def replace(self, other: RequestCompiled) -> RequestCompiled:
         return RequestCompiled(
@@ -37,6 +42,8 @@ class RequestCompiled:
             headers=or_else(other.headers, self.headers),
             params=other.params if other.params is not None else self.params,
             body=or_else(other.body, self.body),
+            cache=or_else(other.cache, self.cache),
+            timeouts=_override_timeouts(self.timeouts, other.timeouts),
         )
 
     def fix(self) -> Request:
@@ -46,6 +53,8 @@ class RequestCompiled:
             headers=self.headers,
             params=self.params,
             body=self.body.fix() if self.body else None,
+            cache=or_else(self.cache, True),
+            timeouts=self.timeouts,
         )
 
 
@@ -116,6 +125,20 @@ class RequestCompiler:
                 body = self._body.compile(body_obj, arguments)
             compiled = replace(compiled, body=body)
 
+        cache_obj = obj.get(_KEY_CACHE)
+        if cache_obj is not None:
+            with on_key(_KEY_CACHE):
+                cache_obj = inject_arguments(cache_obj, arguments)
+                cache = ensure_bool(cache_obj)
+            compiled = replace(compiled, cache=cache)
+
+        timeout_obj = obj.get(_KEY_TIMEOUT)
+        if timeout_obj is not None:
+            with on_key(_KEY_TIMEOUT):
+                timeout_obj = inject_arguments(timeout_obj, arguments)
+                timeouts = compile_timeout(timeout_obj)
+            compiled = replace(compiled, timeouts=_override_timeouts(compiled.timeouts, timeouts))
+
         return compiled
 
     def of_default(self, default: RequestCompiled) -> RequestCompiler:
@@ -145,3 +168,12 @@ def _compile_header_item(key: object, value: object) -> Optional[Tuple[str, str]
     if value is None:
         return None
     return ensure_str(key), ensure_str(value)
+
+
+def _override_timeouts(
+    timeouts: Optional[Timeouts],
+    other: Optional[Timeouts],
+) -> Optional[Timeouts]:
+    if timeouts is None:
+        return other
+    return timeouts.override(other)
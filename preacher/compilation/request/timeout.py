@@ -0,0 +1,45 @@
+"""Timeout compilation."""
+
+from typing import Optional
+
+from preacher.compilation.error import CompilationError, on_key
+from preacher.compilation.util.type import ensure_mapping, ensure_optional_float
+from preacher.core.request import Timeouts
+
+_KEY_CONNECT = "connect"
+_KEY_READ = "read"
+_KEY_DEADLINE = "deadline"
+
+
+def compile_timeout(obj: object) -> Timeouts:
+    """
+    Compile timeouts of a request, which override the default ones field by field.
+
+    Args:
+        obj: A compiled object, which should be a number as the connect and read timeouts
+            or a mapping.
+    Returns:
+        Timeouts as the result of compilation.
+    Raises:
+        CompilationError: when the compilation fails.
+    """
+    if isinstance(obj, (int, float)) and not isinstance(obj, bool):
+        seconds = _compile_seconds(obj)
+        return Timeouts(connect=seconds, read=seconds)
+    obj = ensure_mapping(obj)
+
+    with on_key(_KEY_CONNECT):
+        connect = _compile_seconds(obj.get(_KEY_CONNECT))
+    with on_key(_KEY_READ):
+        read = _compile_seconds(obj.get(_KEY_READ))
+    with on_key(_KEY_DEADLINE):
+        deadline = _compile_seconds(obj.get(_KEY_DEADLINE))
+
+    return Timeouts(connect=connect, read=read, deadline=deadline)
+
+
+def _compile_seconds(obj: object) -> Optional[float]:
+    seconds = ensure_optional_float(obj)
+    if seconds is not None and seconds <= 0.0:
+        raise CompilationError(f"Must be positive, given {seconds}")
+    return seconds
@@ -1,6 +1,7 @@
 from .case import CaseCompiler, CaseCompiled
 from .factory import create_scenario_compiler
 from .integration import compile_scenarios
+from .reference import ScenarioReference, reference_scenarios
 from .scenario import ScenarioCompiler
 
 __all__ = [
@@ -9,4 +10,6 @@ __all__ = [
     "ScenarioCompiler",
     "create_scenario_compiler",
     "compile_scenarios",
+    "ScenarioReference",
+    "reference_scenarios",
 ]
@@ -22,8 +22,10 @@ from preacher.compilation.verification import (
     ResponseDescriptionCompiler,
     DescriptionCompiler,
 )
+from preacher.core.request import HostLimiter, RetryOverride
 from preacher.core.scenario import Case
 from preacher.core.verification import Description
+from .retry import compile_retry
 
 _KEY_LABEL = "label"
 _KEY_ENABLED = "enabled"
@@ -31,6 +33,7 @@ _KEY_CONDITIONS = "when"
 _KEY_REQUEST = "request"
 _KEY_RESPONSE = "response"
 _KEY_WAIT = "wait"
+_KEY_RETRY = "retry"
 
 
 @dataclass(frozen=True)
@@ -41,6 +44,8 @@ class CaseCompiled:
     request: Optional[RequestCompiled] = None
     response: Optional[ResponseDescriptionCompiled] = None
     wait: Optional[timedelta] = None
+    limiter: Optional[HostLimiter] = None
+    retry: Optional[RetryOverride] = None
 
     def replace(self, other: CaseCompiled) -> CaseCompiled:
         return CaseCompiled(
@@ -50,6 +55,8 @@ class CaseCompiled:
             request=or_else(other.request, self.request),
             response=or_else(other.response, self.response),
             wait=or_else(other.wait, self.wait),
+            limiter=or_else(other.limiter, self.limiter),
+            retry=or_else(other.retry, self.retry),
         )
 
     def fix(self) -> Case:
@@ -60,6 +67,8 @@ class CaseCompiled:
             request=self.request.fix() if self.request else None,
             response=self.response.fix() if self.response else None,
             waiting_time=self.wait,
+            limiter=self.limiter,
+            retry=self.retry,
         )
 
 
@@ -150,6 +159,12 @@ class CaseCompiler:
                 wait = compile_timedelta(wait_obj)
             compiled = replace(compiled, wait=wait)
 
+        retry_obj = obj.get(_KEY_RETRY)
+        if retry_obj is not None:
+            with on_key(_KEY_RETRY):
+                retry = compile_retry(retry_obj)
+            compiled = replace(compiled, retry=retry)
+
         return compiled
 
     def of_default(self, default: CaseCompiled) -> CaseCompiler:
@@ -0,0 +1,43 @@
+"""Host limit compilation."""
+
+from preacher.compilation.error import CompilationError, on_key
+from preacher.compilation.util.type import (
+    ensure_mapping,
+    ensure_optional_float,
+    ensure_optional_int,
+)
+from preacher.core.request import HostLimiter
+
+_KEY_RATE = "rate"
+_KEY_BURST = "burst"
+_KEY_MAX_IN_FLIGHT = "max_in_flight"
+
+
+def compile_limiter(obj: object) -> HostLimiter:
+    """
+    Compile a limiter of requests per host.
+
+    Args:
+        obj: A compiled object, which should be a mapping.
+    Returns:
+        A limiter as the result of compilation.
+    Raises:
+        CompilationError: when the compilation fails.
+    """
+    obj = ensure_mapping(obj)
+
+    with on_key(_KEY_RATE):
+        rate = ensure_optional_float(obj.get(_KEY_RATE))
+    with on_key(_KEY_BURST):
+        burst = ensure_optional_int(obj.get(_KEY_BURST))
+    with on_key(_KEY_MAX_IN_FLIGHT):
+        max_in_flight = ensure_optional_int(obj.get(_KEY_MAX_IN_FLIGHT))
+
+    try:
+        return HostLimiter(
+            rate=rate,
+            burst=burst if burst is not None else 1,
+            max_in_flight=max_in_flight,
+        )
+    except ValueError as error:
+        raise CompilationError(str(error), cause=error)
@@ -0,0 +1,148 @@
+"""
+Scenario references, which are compiled in the workers running them
+instead of sending compiled scenarios to the workers.
+"""
+
+import hashlib
+import pickle
+from collections import OrderedDict
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from functools import lru_cache
+from logging import Logger
+from threading import Lock
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from pluggy import PluginManager
+from yamlen import Loader
+
+from preacher.compilation.argument import Arguments
+from preacher.compilation.error import on_index
+from preacher.compilation.yaml import create_loader
+from preacher.core.logger import default_logger
+from preacher.core.scenario import DeferredScenario, Scenario
+from .factory import create_scenario_compiler
+from .scenario import ScenarioCompiler
+
+_CACHE_SIZE = 128
+_DOCUMENTS_CACHE_SIZE = 16
+
+_Key = Tuple[str, int, int, str, Tuple[str, ...]]
+
+_cache_lock = Lock()
+_compiled: "OrderedDict[_Key, Scenario]" = OrderedDict()
+
+
+@dataclass(frozen=True)
+class ScenarioReference(DeferredScenario):
+    """
+    A reference to a scenario in a YAML file, which is compiled in the worker running it.
+    Compiled scenarios and loaded files are cached per worker process.
+
+    Args:
+        path: The path of the YAML file.
+        document: The index of the YAML document in the file.
+        index: The index of the scenario in the flattened document.
+        arguments: Arguments to inject.
+        plugins: The paths of the plugins to compile with.
+    """
+
+    path: str
+    document: int
+    index: int
+    arguments: Arguments = field(default_factory=dict)
+    plugins: Tuple[str, ...] = ()
+
+    def construct(self) -> Scenario:
+        key = (self.path, self.document, self.index, _hash(self.arguments), self.plugins)
+        with _cache_lock:
+            scenario = _compiled.get(key)
+            if scenario is not None:
+                _compiled.move_to_end(key)
+                return scenario
+
+        scenario = self._compile()
+        with _cache_lock:
+            _compiled[key] = scenario
+            if len(_compiled) > _CACHE_SIZE:
+                _compiled.popitem(last=False)
+        return scenario
+
+    def _compile(self) -> Scenario:
+        obj = _load_documents(self.path, self.plugins)[self.document]
+        indices, leaf = _flatten(obj)[self.index]
+        compiler = _compiler_of(self.plugins)
+        with ExitStack() as stack:
+            for index in indices:
+                stack.enter_context(on_index(index))
+            return compiler.compile(leaf, arguments=self.arguments)
+
+
+def reference_scenarios(
+    paths: Sequence[str],
+    arguments: Optional[Arguments] = None,
+    plugins: Iterable[str] = (),
+    plugin_manager: Optional[PluginManager] = None,
+    logger: Optional[Logger] = None,
+) -> Iterator[ScenarioReference]:
+    """
+    List references to the scenarios in YAML files, which are loaded but not compiled.
+
+    Args:
+        paths: The paths of YAML files.
+        arguments: Arguments to inject.
+        plugins: The paths of the plugins loaded by `plugin_manager`,
+            which are loaded again in the workers.
+        plugin_manager: A plugin manager to load the files.
+        logger: A logger.
+    """
+    logger = logger or default_logger
+    loader = create_loader(plugin_manager=plugin_manager, logger=logger)
+    arguments = arguments or {}
+    plugins = tuple(plugins)
+    for path in paths:
+        logger.debug("Load: %s", path)
+        for document, obj in enumerate(loader.load_all_from_path(path)):
+            for index in range(len(_flatten(obj))):
+                yield ScenarioReference(path, document, index, arguments, plugins)
+
+
+def _flatten(obj: object) -> List[Tuple[Tuple[int, ...], object]]:
+    """Flattens nested lists as `compile_flattening` does, with the indices of the items."""
+    if not isinstance(obj, list):
+        return [((), obj)]
+    return [
+        ((index,) + indices, leaf)
+        for index, item in enumerate(obj)
+        for indices, leaf in _flatten(item)
+    ]
+
+
+def _hash(arguments: Arguments) -> str:
+    return hashlib.sha1(pickle.dumps(sorted(arguments.items()))).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _plugin_manager_of(plugins: Tuple[str, ...]) -> PluginManager:
+    # Imported here because the plugins depend on the compilation.
+    from preacher.plugin.loader import load_plugins
+    from preacher.plugin.manager import get_plugin_manager
+
+    manager = get_plugin_manager()
+    load_plugins(manager, plugins)
+    return manager
+
+
+@lru_cache(maxsize=None)
+def _loader_of(plugins: Tuple[str, ...]) -> Loader:
+    return create_loader(plugin_manager=_plugin_manager_of(plugins))
+
+
+@lru_cache(maxsize=None)
+def _compiler_of(plugins: Tuple[str, ...]) -> ScenarioCompiler:
+    return create_scenario_compiler(plugin_manager=_plugin_manager_of(plugins))
+
+
+@lru_cache(maxsize=_DOCUMENTS_CACHE_SIZE)
+def _load_documents(path: str, plugins: Tuple[str, ...]) -> List[object]:
+    return list(_loader_of(plugins).load_all_from_path(path))
@@ -0,0 +1,64 @@
+"""Retry compilation."""
+
+from typing import Optional
+
+from preacher.compilation.error import CompilationError, on_key
+from preacher.compilation.util.type import (
+    ensure_mapping,
+    ensure_optional_float,
+    ensure_optional_int,
+    ensure_optional_str,
+)
+from preacher.core.request import Backoff, RetryOverride
+
+_KEY_COUNT = "count"
+_KEY_DELAY = "delay"
+_KEY_BACKOFF = "backoff"
+_KEY_MAX_DELAY = "max_delay"
+
+
+def compile_retry(obj: object) -> RetryOverride:
+    """
+    Compile a retry policy of a case, which overrides the default one.
+
+    Args:
+        obj: A compiled object, which should be an integer as the count of retries
+            or a mapping.
+    Returns:
+        An override of the retry policy as the result of compilation.
+    Raises:
+        CompilationError: when the compilation fails.
+    """
+    if isinstance(obj, int) and not isinstance(obj, bool):
+        obj = {_KEY_COUNT: obj}
+    obj = ensure_mapping(obj)
+
+    with on_key(_KEY_COUNT):
+        count = ensure_optional_int(obj.get(_KEY_COUNT))
+        if count is not None and count < 0:
+            raise CompilationError(f"Must be zero or positive, given {count}")
+    with on_key(_KEY_DELAY):
+        delay = _compile_seconds(obj.get(_KEY_DELAY))
+    with on_key(_KEY_BACKOFF):
+        backoff = _compile_backoff(obj.get(_KEY_BACKOFF))
+    with on_key(_KEY_MAX_DELAY):
+        max_delay = _compile_seconds(obj.get(_KEY_MAX_DELAY))
+
+    return RetryOverride(retry=count, delay=delay, backoff=backoff, max_delay=max_delay)
+
+
+def _compile_seconds(obj: object) -> Optional[float]:
+    seconds = ensure_optional_float(obj)
+    if seconds is not None and seconds < 0.0:
+        raise CompilationError(f"Must be zero or positive, given {seconds}")
+    return seconds
+
+
+def _compile_backoff(obj: object) -> Optional[Backoff]:
+    value = ensure_optional_str(obj)
+    if value is None:
+        return None
+    try:
+        return Backoff(value.lower())
+    except ValueError as error:
+        raise CompilationError(f"Invalid backoff: {value}", cause=error)
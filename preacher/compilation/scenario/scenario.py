@@ -18,7 +18,8 @@ from preacher.compilation.util.type import (
 )
 from preacher.compilation.verification import DescriptionCompiler
 from preacher.core.scenario import Scenario, Case
-from .case import CaseCompiler
+from .case import CaseCompiler, CaseCompiled
+from .limit import compile_limiter
 
 _KEY_LABEL = "label"
 _KEY_WHEN = "when"
@@ -27,6 +28,7 @@ _KEY_ORDERED = "ordered"
 _KEY_CASES = "cases"
 _KEY_PARAMETERS = "parameters"
 _KEY_SUBSCENARIOS = "subscenarios"
+_KEY_LIMIT = "limit"
 
 
 class ScenarioCompiler:
@@ -54,13 +56,23 @@ class ScenarioCompiler:
         with on_key(_KEY_LABEL):
             label = ensure_optional_str(label_obj)
 
+        # The limiter is shared by all the cases in this scenario and its subscenarios.
+        case_compiler = self._case
+        limit_obj = inject_arguments(obj.get(_KEY_LIMIT), arguments)
+        if limit_obj is not None:
+            with on_key(_KEY_LIMIT):
+                limiter = compile_limiter(limit_obj)
+            case_compiler = case_compiler.of_default(CaseCompiled(limiter=limiter))
+
         parameters_obj = obj.get(_KEY_PARAMETERS)
         if parameters_obj is not None:
             with on_key(_KEY_PARAMETERS):
                 parameters_obj = ensure_list(parameters_obj)
                 parameters = list(map_compile(compile_parameter, parameters_obj))
+            compiler = ScenarioCompiler(description=self._description, case=case_compiler)
             subscenarios = [
-                self._compile_parameterized(obj, arguments, parameter) for parameter in parameters
+                compiler._compile_parameterized(obj, arguments, parameter)
+                for parameter in parameters
             ]
             return Scenario(label=label, subscenarios=subscenarios)
 
@@ -70,7 +82,7 @@ class ScenarioCompiler:
 
         default_obj = inject_arguments(obj.get(_KEY_DEFAULT, {}), arguments)
         with on_key(_KEY_DEFAULT):
-            case_compiler = self._case.compile_default(default_obj)
+            case_compiler = case_compiler.compile_default(default_obj)
 
         condition_obj = inject_arguments(obj.get(_KEY_WHEN, []), arguments)
         with on_key(_KEY_WHEN):
@@ -144,7 +156,8 @@ class ScenarioCompiler:
         arguments: Arguments,
         parameter: Parameter,
     ) -> Scenario:
-        template = {k: v for (k, v) in obj.items() if k not in (_KEY_LABEL, _KEY_PARAMETERS)}
+        excluded_keys = (_KEY_LABEL, _KEY_PARAMETERS, _KEY_LIMIT)
+        template = {k: v for (k, v) in obj.items() if k not in excluded_keys}
         template["label"] = parameter.label
 
         arguments = dict(arguments)
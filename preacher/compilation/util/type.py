@@ -55,6 +55,42 @@ def ensure_optional_str(obj: object) -> Optional[str]:
     return ensure_str(obj)
 
 
+def ensure_optional_int(obj: object) -> Optional[int]:
+    """
+    Ensure an optional integer object.
+
+    Args:
+        obj: An ensured object, which should be an `int` value or `None`.
+    Returns:
+        The compiled value.
+    Raises:
+        CompilationError: when compilation fails.
+    """
+    if obj is None:
+        return None
+    if isinstance(obj, bool) or not isinstance(obj, int):
+        raise CompilationError(f"Must be an integer, given {type(obj)}")
+    return obj
+
+
+def ensure_optional_float(obj: object) -> Optional[float]:
+    """
+    Ensure an optional number object.
+
+    Args:
+        obj: An ensured object, which should be an `int` or `float` value or `None`.
+    Returns:
+        The compiled value as a `float` value.
+    Raises:
+        CompilationError: when compilation fails.
+    """
+    if obj is None:
+        return None
+    if isinstance(obj, bool) or not isinstance(obj, (int, float)):
+        raise CompilationError(f"Must be a number, given {type(obj)}")
+    return float(obj)
+
+
 def ensure_list(obj: object) -> list:
     """
     Ensure a list object.
@@ -3,11 +3,12 @@ Value analysis.
 """
 
 import json
+import mmap
 from abc import ABC, abstractmethod
 from functools import partial
 from typing import Callable, Dict, Generic, Mapping, Optional, TypeVar
 
-from lxml.etree import _Element as Element, XMLParser, fromstring
+from lxml.etree import _Element as Element, XMLParser, fromstring, parse
 
 from preacher.core.request.response import ResponseBody
 from preacher.core.util.functional import recursive_map
@@ -77,14 +78,30 @@ class _LazyLoader(Generic[Source, T]):
 JSON_LOAD = json.loads
 JSON_ERROR = ExtractionError("Not a valid JSON content")
 XML_LOAD = partial(fromstring, parser=XMLParser())
+XML_PARSE = partial(parse, parser=XMLParser())
 XML_ERROR = ExtractionError("Not a valid XML content")
 
 
+def _load_etree(body: ResponseBody) -> Element:
+    buffer = body.buffer
+    if isinstance(buffer, mmap.mmap):
+        # Memory-mapped contents are parsed incrementally without copying.
+        buffer.seek(0)
+        return XML_PARSE(buffer).getroot()
+    return XML_LOAD(body.content)
+
+
+def _load_json(body: ResponseBody) -> object:
+    return JSON_LOAD(body.text)
+
+
 class ResponseBodyAnalyzer(Analyzer):
+    """Analyzes a response body, which is not accessed until needed."""
+
     def __init__(self, body: ResponseBody):
         self._body = body
-        self._etree_loader = _LazyLoader(body.content, XML_LOAD, XML_ERROR)
-        self._json_loader = _LazyLoader(body.text, JSON_LOAD, JSON_ERROR)
+        self._etree_loader = _LazyLoader(body, _load_etree, XML_ERROR)
+        self._json_loader = _LazyLoader(body, _load_json, JSON_ERROR)
 
     def for_text(self, extract: Callable[[str], T]) -> T:
         return extract(self._body.text)
@@ -1,10 +1,20 @@
 """Request compilation."""
 
+from .breaker import CircuitBreaker, CircuitOpenError
+from .cache import ResponseCache
+from .cassette import Cassette, CassetteMode
 from .header import Headers
+from .hedging import Hedging
+from .limit import HostLimiter
+from .prewarm import Prewarming
 from .request import Request, Method
 from .request_body import RequestBody, UrlencodedRequestBody, JsonRequestBody
 from .requester import Requester, ExecutionReport, PreparedRequest
 from .response import Response, ResponseBody
+from .retry import Backoff, RetryPolicy, RetryOverride, RetryBudget
+from .session import SessionFactory
+from .timeout import Timeouts, DeadlineExceeded
+from .timing import Timing
 from .url_param import UrlParams, UrlParam
 
 __all__ = [
@@ -20,5 +30,21 @@ __all__ = [
     "ResponseBody",
     "Requester",
     "ExecutionReport",
+    "Timing",
+    "Timeouts",
+    "DeadlineExceeded",
     "PreparedRequest",
+    "SessionFactory",
+    "HostLimiter",
+    "Backoff",
+    "RetryPolicy",
+    "RetryOverride",
+    "RetryBudget",
+    "Cassette",
+    "CassetteMode",
+    "ResponseCache",
+    "Hedging",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "Prewarming",
 ]
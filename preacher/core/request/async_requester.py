@@ -0,0 +1,322 @@
+"""
+An asyncio-native requester, which requires `aiohttp`.
+"""
+
+import asyncio
+from contextlib import AsyncExitStack, ExitStack
+from dataclasses import replace
+from functools import partial
+from time import perf_counter
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Mapping, Optional, Tuple, Union
+
+from preacher.core.context import Context, closed_context
+from preacher.core.datetime import now
+from preacher.core.status import Status
+from preacher.core.util.error import to_message
+from .charset import resolve_encoding
+from .compression import compress_body
+from .limit import HostLimiter
+from .request import Request
+from .requester import ExecutionReport, generate_id, prepare_request, to_prepared_request
+from .response import Response
+from .static import StaticResponse, StaticResponseBody
+from .timeout import Timeouts
+from .timing import Phases
+
+if TYPE_CHECKING:
+    import aiohttp  # pragma: no cover
+    import requests  # pragma: no cover
+
+    from .breaker import CircuitBreaker  # pragma: no cover
+    from .cache import ResponseCache  # pragma: no cover
+    from .cassette import Cassette  # pragma: no cover
+    from .hedging import Hedging  # pragma: no cover
+
+
+def create_client_session() -> "aiohttp.ClientSession":
+    """
+    Creates a client session, which must be called in a running event loop.
+    Proxies are given by environment variables as `requests` does.
+    The session traces the connection setup of requests to time their phases.
+    """
+    import aiohttp
+
+    return aiohttp.ClientSession(trust_env=True, trace_configs=[_create_trace_config()])
+
+
+def _create_trace_config() -> "aiohttp.TraceConfig":
+    # DNS resolution is done while creating a connection,
+    # and TLS handshakes cannot be told apart from TCP connections.
+    import aiohttp
+
+    async def on_dns_start(_session, ctx: SimpleNamespace, _params) -> None:
+        ctx.dns_starts = perf_counter()
+
+    async def on_dns_end(_session, ctx: SimpleNamespace, _params) -> None:
+        phases = ctx.trace_request_ctx
+        if isinstance(phases, Phases):
+            phases.dns = perf_counter() - ctx.dns_starts
+
+    async def on_connection_start(_session, ctx: SimpleNamespace, _params) -> None:
+        ctx.connection_starts = perf_counter()
+
+    async def on_connection_end(_session, ctx: SimpleNamespace, _params) -> None:
+        phases = ctx.trace_request_ctx
+        if isinstance(phases, Phases):
+            total = perf_counter() - ctx.connection_starts
+            phases.connect = max(total - (phases.dns or 0.0), 0.0)
+
+    config = aiohttp.TraceConfig()
+    config.on_dns_resolvehost_start.append(on_dns_start)
+    config.on_dns_resolvehost_end.append(on_dns_end)
+    config.on_connection_create_start.append(on_connection_start)
+    config.on_connection_create_end.append(on_connection_end)
+    return config
+
+
+class AsyncRequester:
+    def __init__(
+        self,
+        base_url: str = "",
+        timeout: Union[None, float, Timeouts] = None,
+        detect_charset: bool = False,
+        limiter: Optional[HostLimiter] = None,
+        cassette: Optional["Cassette"] = None,
+        cache: Optional["ResponseCache"] = None,
+        compress_threshold: Optional[int] = None,
+        hedging: Optional["Hedging"] = None,
+        breaker: Optional["CircuitBreaker"] = None,
+    ):
+        """
+        Args:
+            base_url: A base URL.
+            timeout: The timeouts, which are overridden by the ones of requests.
+                A number in seconds is the connect and read timeouts.
+                ``None`` means no timeout.
+            detect_charset: Whether to detect the charset of response bodies
+                when not given by the headers. Otherwise UTF-8 is used.
+            limiter: A limiter of requests per host, which applies to all the requests.
+            cassette: A cassette to record responses to,
+                or to replay responses from without sending requests.
+            cache: A cache of responses, which is used unless requests opt out.
+            compress_threshold: The max size in bytes of request bodies to send uncompressed.
+                Larger bodies are compressed by gzip.
+                ``None`` means no compression.
+                Compressed responses are always requested as `aiohttp` does.
+            hedging: A hedging policy of ``GET`` requests,
+                which sends duplicates of slow requests and cancels the slower ones.
+            breaker: A circuit breaker per host,
+                which fails requests immediately while the host is down.
+        Raises:
+            ValueError: when given an invalid compression threshold.
+        """
+        if compress_threshold is not None and compress_threshold < 0:
+            raise ValueError(
+                f"`compress_threshold` must be zero or positive, given {compress_threshold}"
+            )
+
+        self._base_url = base_url
+        self._timeouts = Timeouts.of(timeout)
+        self._detect_charset = detect_charset
+        self._limiter = limiter
+        self._cassette = cassette
+        self._cache = cache
+        self._compress_threshold = compress_threshold
+        self._hedging = hedging
+        self._breaker = breaker
+
+    @property
+    def base_url(self) -> str:
+        return self._base_url
+
+    async def execute(
+        self,
+        request: Request,
+        session: Optional["aiohttp.ClientSession"] = None,
+        context: Optional[Context] = None,
+        limiter: Optional[HostLimiter] = None,
+    ) -> Tuple[ExecutionReport, Optional[Response]]:
+        """
+        Executes a request asynchronously.
+        The contract is the same as :meth:`Requester.execute`.
+
+        Args:
+            request: A request.
+            session: A client session to execute.
+            context: Execution context.
+            limiter: A limiter of requests per host in addition to the one of the requester.
+        Returns:
+            A tuple of execution report and response.
+            When there is no response, the response will be ``None``.
+        """
+        if session is None:
+            async with create_client_session() as new_session:
+                return await self.execute(
+                    request,
+                    session=new_session,
+                    context=context,
+                    limiter=limiter,
+                )
+
+        context = context if context is not None else Context()
+        starts = now()
+        report = ExecutionReport(starts=starts)
+        try:
+            with closed_context(context, starts=starts) as context:
+                prepped = prepare_request(request, context, base_url=self._base_url)
+            if self._compress_threshold is not None:
+                compress_body(prepped, self._compress_threshold)
+        except Exception as error:
+            message = to_message(error)
+            report = replace(report, status=Status.FAILURE, message=message)
+            return report, None
+
+        prepared_request = to_prepared_request(prepped)
+        report = replace(report, request=prepared_request)
+
+        try:
+            response = await self._fetch(request, session, prepped, limiter)
+        except Exception as error:
+            message = to_message(error)
+            report = replace(report, status=Status.UNSTABLE, message=message)
+            return report, None
+
+        report = replace(
+            report,
+            status=Status.SUCCESS,
+            elapsed=response.elapsed,
+            timing=response.timing,
+        )
+        return report, response
+
+    async def _fetch(
+        self,
+        request: Request,
+        session: "aiohttp.ClientSession",
+        prepped: "requests.PreparedRequest",
+        limiter: Optional[HostLimiter],
+    ) -> Response:
+        cache = self._cache if request.cache else None
+        key = None
+        if cache:
+            key, cached = cache.lookup(
+                prepped.method or "",
+                prepped.url or "",
+                prepped.headers,
+                detect_charset=self._detect_charset,
+            )
+            if cached:
+                return cached
+
+        prepared_request = to_prepared_request(prepped)
+        cassette = self._cassette
+        if cassette and cassette.replaying:
+            response = cassette.replay(prepared_request, detect_charset=self._detect_charset)
+        else:
+            timeouts = self._timeouts.override(request.timeouts)
+            response = await self._dispatch(session, prepped, limiter, timeouts)
+            if cassette:
+                cassette.record(prepared_request, response)
+
+        if cache and key:
+            response = cache.store(key, response, detect_charset=self._detect_charset)
+        return response
+
+    async def _dispatch(
+        self,
+        session: "aiohttp.ClientSession",
+        prepped: "requests.PreparedRequest",
+        limiter: Optional[HostLimiter],
+        timeouts: Timeouts,
+    ) -> Response:
+        import aiohttp
+
+        with ExitStack() as stack:
+            if self._breaker:
+                failures = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+                stack.enter_context(self._breaker.guard(prepped.url or "", failures))
+            send = partial(self._attempt, session, prepped, limiter, timeouts)
+            hedging = self._hedging
+            if hedging and prepped.method == "GET":
+                return await hedging.async_run(prepped.url or "", send)
+            return await send()
+
+    async def _attempt(
+        self,
+        session: "aiohttp.ClientSession",
+        prepped: "requests.PreparedRequest",
+        limiter: Optional[HostLimiter],
+        timeouts: Timeouts,
+    ) -> Response:
+        async with AsyncExitStack() as stack:
+            for host_limiter in (self._limiter, limiter):
+                if host_limiter:
+                    await stack.enter_async_context(host_limiter.async_limit(prepped.url or ""))
+            return await self._send(
+                session,
+                method=prepped.method or "",
+                url=prepped.url or "",
+                headers=prepped.headers,
+                body=prepped.body,
+                timeouts=timeouts,
+            )
+
+    async def _send(
+        self,
+        session: "aiohttp.ClientSession",
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        body: Optional[object],
+        timeouts: Timeouts,
+    ) -> Response:
+        import aiohttp
+
+        # The deadline includes downloading the body as the total timeout does.
+        timeout = aiohttp.ClientTimeout(
+            total=timeouts.deadline,
+            sock_connect=timeouts.connect,
+            sock_read=timeouts.read,
+        )
+        phases = Phases()
+        starts = perf_counter()
+        async with session.request(
+            method,
+            url,
+            headers=headers,
+            data=body,
+            timeout=timeout,
+            trace_request_ctx=phases,
+        ) as res:
+            received = perf_counter()
+            content = await res.read()
+        ends = perf_counter()
+        timing = replace(phases.to_timing(received - starts), download=ends - received)
+
+        # Names are converted to lower case to normalize.
+        # Multiple values are joined as `requests` does.
+        names = {name.lower() for name in res.headers.keys()}
+        response_headers = {name: ", ".join(res.headers.getall(name)) for name in names}
+
+        return StaticResponse(
+            id=generate_id(),
+            elapsed=received - starts,
+            status_code=res.status,
+            headers=response_headers,
+            body=StaticResponseBody(
+                content,
+                encoding=resolve_encoding(response_headers),
+                detect=self._detect_charset,
+            ),
+            timing=timing,
+        )
+
+    @staticmethod
+    def is_available() -> bool:
+        try:
+            import aiohttp  # noqa: F401
+
+            return True
+        except ImportError:  # pragma: no cover
+            return False
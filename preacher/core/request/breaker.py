@@ -0,0 +1,122 @@
+"""
+Per-host circuit breakers, which fail fast while a host is down.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple, Type
+
+from preacher.core.util.process import ProcessShared
+from .host import host_of
+
+Failures = Tuple[Type[BaseException], ...]
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is short-circuited by an open circuit."""
+
+
+class _HostState:
+    def __init__(self):
+        self.failures = 0
+        self.opened: Optional[float] = None  # Monotonic time when the circuit opened.
+        self.probing = False
+
+
+class CircuitBreaker(ProcessShared):
+    """
+    A circuit breaker per host, which is given as the scheme and the network location.
+
+    The circuit of a host opens after `threshold` consecutive connection failures,
+    and requests to the host fail immediately while the circuit is open.
+    After `reset_timeout` seconds, the circuit half-opens to let one request probe the host:
+    the circuit closes when the probe succeeds, and opens again when it fails.
+
+    Breakers are shared by the threads in a process,
+    and so each worker process finds a host down by itself.
+
+    Args:
+        threshold: The count of consecutive connection failures to open the circuit.
+        reset_timeout: The seconds to keep the circuit open before probing the host.
+    Raises:
+        ValueError: when given invalid parameters.
+    """
+
+    def __init__(self, threshold: int = 5, reset_timeout: float = 30.0):
+        if threshold < 1:
+            raise ValueError(f"`threshold` must be positive, given {threshold}")
+        if reset_timeout <= 0.0:
+            raise ValueError(f"`reset_timeout` must be positive, given {reset_timeout}")
+
+        self._threshold = threshold
+        self._reset_timeout = reset_timeout
+        self._hosts: Dict[Tuple[str, str], _HostState] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def threshold(self) -> int:
+        return self._threshold
+
+    @property
+    def reset_timeout(self) -> float:
+        return self._reset_timeout
+
+    @contextmanager
+    def guard(self, url: str, failures: Failures) -> Iterator[None]:
+        """
+        Guards a request to the URL, which is counted as a connection failure
+        when it raises one of `failures`, or as a success when it raises nothing.
+        Other errors are not counted.
+        This never blocks, and so is available also in coroutines.
+
+        Raises:
+            CircuitOpenError: when the circuit of the host is open.
+        """
+        key = host_of(url)
+        probing = self._enter(key, url)
+        try:
+            yield
+        except failures:
+            self._exit(key, probing, failed=True)
+            raise
+        except BaseException:
+            self._exit(key, probing, failed=None)
+            raise
+        self._exit(key, probing, failed=False)
+
+    def _enter(self, key: Tuple[str, str], url: str) -> bool:
+        """Returns whether the request probes the host."""
+        with self._lock:
+            state = self._hosts.get(key)
+            if state is None:
+                state = _HostState()
+                self._hosts[key] = state
+            if state.opened is None:
+                return False
+            if state.probing or time.monotonic() < state.opened + self._reset_timeout:
+                scheme, netloc = key
+                raise CircuitOpenError(
+                    f"The circuit of {scheme}://{netloc} is open"
+                    f" after {state.failures} consecutive connection failures: {url}"
+                )
+            state.probing = True
+            return True
+
+    def _exit(self, key: Tuple[str, str], probing: bool, failed: Optional[bool]) -> None:
+        with self._lock:
+            state = self._hosts[key]
+            if probing:
+                state.probing = False
+            if failed is None:
+                return
+            if not failed:
+                state.failures = 0
+                state.opened = None
+                return
+            state.failures += 1
+            if probing or state.failures >= self._threshold:
+                state.opened = time.monotonic()
+
+    def _shared_args(self) -> Tuple:
+        return self._threshold, self._reset_timeout
@@ -0,0 +1,252 @@
+"""
+Per-run response caches, which revalidate cached responses conditionally.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Dict, Mapping, MutableMapping, Optional, Tuple
+
+from preacher.core.util.process import ProcessShared
+from .charset import resolve_encoding
+from .requester import generate_id
+from .response import Response
+from .static import StaticResponse, StaticResponseBody
+
+_CACHEABLE_METHODS = frozenset(("GET", "HEAD"))
+_VALIDATORS = (("etag", "If-None-Match"), ("last-modified", "If-Modified-Since"))
+_CONDITIONAL_HEADERS = frozenset(
+    ("if-none-match", "if-modified-since", "if-match", "if-unmodified-since", "if-range")
+)
+_BODY_HEADERS = frozenset(("content-length", "content-encoding", "transfer-encoding"))
+
+
+@dataclass(frozen=True)
+class _Entry:
+    headers: Mapping[str, str]
+    content: bytes
+    expires: float  # Monotonic time until when the entry is fresh.
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        return {
+            request_name: self.headers[name]
+            for name, request_name in _VALIDATORS
+            if name in self.headers
+        }
+
+
+class ResponseCache(ProcessShared):
+    """
+    A response cache of safe methods, which evicts the least recently used responses
+    when the total size of the bodies exceeds `max_size`.
+
+    Responses are cached when they are successful
+    and have either validators (``ETag`` or ``Last-Modified``)
+    or a positive ``max-age`` of ``Cache-Control``, unless ``no-store`` is given.
+    Fresh responses are reused without sending requests.
+    Stale ones are revalidated by conditional requests,
+    and reused when the server answers ``304 Not Modified``.
+
+    Caches are shared by the threads in a process, and each process caches its own entries.
+
+    Args:
+        max_size: The max total size in bytes of the cached bodies.
+    Raises:
+        ValueError: when given an invalid size.
+    """
+
+    def __init__(self, max_size: int):
+        if max_size < 1:
+            raise ValueError(f"`max_size` must be positive, given {max_size}")
+
+        self._max_size = max_size
+        self._size = 0
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def lookup(
+        self,
+        method: str,
+        url: str,
+        headers: MutableMapping[str, str],
+        detect_charset: bool = False,
+    ) -> Tuple[Optional[str], Optional[Response]]:
+        """
+        Looks up the cached response of a request.
+        When the cached response is stale, the validators are added to the request headers.
+
+        Args:
+            method: The request method.
+            url: The request URL.
+            headers: The request headers, which are updated for revalidation.
+            detect_charset: Whether to detect the charset of the cached body
+                when not given by the headers.
+        Returns:
+            A tuple of the cache key and the fresh response.
+            The key is ``None`` when the request is not cacheable,
+            e.g. already conditional,
+            and the response is ``None`` when a request should be sent.
+        """
+        if method.upper() not in _CACHEABLE_METHODS:
+            return None, None
+        if any(name.lower() in _CONDITIONAL_HEADERS for name in headers):
+            return None, None
+
+        key = _key_of(method, url, headers)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None:
+            return key, None
+        if entry.fresh:
+            return key, _to_response(entry, elapsed=0.0, detect_charset=detect_charset)
+
+        headers.update(entry.validators)
+        return key, None
+
+    def store(self, key: str, response: Response, detect_charset: bool = False) -> Response:
+        """
+        Stores the response of the request looked up by the key if cacheable.
+
+        Args:
+            key: The cache key given by :meth:`lookup`.
+            response: The response, whose body is read entirely when cacheable.
+            detect_charset: Whether to detect the charset of the cached body
+                when not given by the headers.
+        Returns:
+            The response to use, which is the cached one when not modified.
+        """
+        if response.status_code == 304:
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is None:
+                return response
+            headers = dict(entry.headers)
+            headers.update(
+                (name, value)
+                for name, value in response.headers.items()
+                if name not in _BODY_HEADERS
+            )
+            entry = replace(entry, headers=headers, expires=_expires(headers))
+            self._put(key, entry)
+            response.close()
+            return _to_response(
+                entry,
+                elapsed=response.elapsed,
+                original=response,
+                detect_charset=detect_charset,
+            )
+
+        if response.status_code != 200 or not _is_cacheable(response.headers):
+            self._remove(key)
+            return response
+
+        entry = _Entry(
+            headers=response.headers,
+            content=response.body.content,
+            expires=_expires(response.headers),
+        )
+        self._put(key, entry)
+        return response
+
+    def _put(self, key: str, entry: _Entry) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+            if entry.size > self._max_size:
+                return
+            self._entries[key] = entry
+            self._size += entry.size
+            while self._size > self._max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+
+    def _remove(self, key: str) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+
+    def _shared_args(self) -> Tuple:
+        return (self._max_size,)
+
+
+def _key_of(method: str, url: str, headers: Mapping[str, str]) -> str:
+    digest = hashlib.sha256()
+    digest.update(method.upper().encode("utf-8"))
+    digest.update(b"\n")
+    digest.update(url.encode("utf-8"))
+    for name, value in sorted((name.lower(), value) for name, value in headers.items()):
+        digest.update(b"\n")
+        digest.update(f"{name}: {value}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _cache_control(headers: Mapping[str, str]) -> Dict[str, str]:
+    directives = {}
+    for directive in headers.get("cache-control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"')
+    return directives
+
+
+def _max_age(headers: Mapping[str, str]) -> int:
+    directives = _cache_control(headers)
+    if "no-cache" in directives:
+        return 0
+    try:
+        return max(int(directives.get("max-age", "0")), 0)
+    except ValueError:
+        return 0
+
+
+def _is_cacheable(headers: Mapping[str, str]) -> bool:
+    if "no-store" in _cache_control(headers):
+        return False
+    return _max_age(headers) > 0 or any(name in headers for name, _ in _VALIDATORS)
+
+
+def _expires(headers: Mapping[str, str]) -> float:
+    return time.monotonic() + _max_age(headers)
+
+
+def _to_response(
+    entry: _Entry,
+    elapsed: float,
+    original: Optional[Response] = None,
+    detect_charset: bool = False,
+) -> Response:
+    return StaticResponse(
+        id=generate_id(),
+        elapsed=elapsed,
+        status_code=200,
+        headers=entry.headers,
+        body=StaticResponseBody(
+            entry.content,
+            encoding=resolve_encoding(entry.headers),
+            detect=detect_charset,
+        ),
+        timing=original.timing if original else None,
+    )
@@ -0,0 +1,221 @@
+"""
+Cassettes, which record responses on disk and replay them without any network.
+"""
+
+import base64
+import glob
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+import zlib
+from dataclasses import dataclass
+from enum import Enum
+from typing import IO, Dict, List, Optional, Tuple, Union
+
+from preacher.core.util.process import ProcessShared
+from .charset import resolve_encoding
+from .requester import PreparedRequest, generate_id
+from .response import Response
+from .static import StaticResponse, StaticResponseBody
+
+_DATA_SUFFIX = ".data"
+_INDEX_SUFFIX = ".index"
+_CHUNK_SIZE = 64 * 1024
+_BODY_HEADERS = frozenset(("content-length", "content-encoding", "transfer-encoding"))
+
+
+class CassetteMode(Enum):
+    RECORD = "record"
+    REPLAY = "replay"
+
+
+@dataclass(frozen=True)
+class _Entry:
+    path: str
+    offset: int
+    length: int
+    recorded: float
+
+
+class Cassette(ProcessShared):
+    """
+    A directory that stores recorded responses keyed by the method, the URL and the body
+    of the requests.
+
+    Each process records to its own pair of files:
+    a data file of compressed entries and an index file of the entry locations,
+    so that concurrent workers never write to the same file.
+    When the same request is recorded more than once, e.g. by retrying,
+    the recordings are replayed in the order of recording
+    and the last one is replayed repeatedly after all the recordings are replayed.
+    The files are shared by the threads and the unpickled copies in a process.
+
+    Args:
+        path: The directory path of the cassette.
+        mode: Whether to record or to replay.
+    """
+
+    def __init__(self, path: str, mode: CassetteMode):
+        self._path = path
+        self._mode = mode
+        self._lock = threading.Lock()
+
+        self._data: Optional[IO[bytes]] = None
+        self._index: Optional[IO[str]] = None
+        self._entries: Optional[Dict[str, List[_Entry]]] = None
+        self._replayed: Dict[str, int] = {}
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def mode(self) -> CassetteMode:
+        return self._mode
+
+    @property
+    def replaying(self) -> bool:
+        return self._mode is CassetteMode.REPLAY
+
+    def record(self, request: PreparedRequest, response: Response) -> None:
+        """
+        Records the response of the request, whose body is read entirely
+        and compressed into the data file in chunks.
+        The headers about the transfer of the body are not recorded
+        since the body is recorded decoded.
+        """
+        header = {
+            "request": {
+                "method": request.method,
+                "url": request.url,
+                "headers": dict(request.headers),
+                "body": _encode_body(request.body),
+            },
+            "status_code": response.status_code,
+            "headers": {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in _BODY_HEADERS
+            },
+            "elapsed": response.elapsed,
+        }
+        body = response.body.buffer  # Read before locking not to block the others.
+
+        with self._lock:
+            data, index = self._open_files()
+            offset = data.tell()
+            compressor = zlib.compressobj()
+            data.write(compressor.compress(json.dumps(header).encode("utf-8") + b"\n"))
+            with memoryview(body) as view:
+                for start in range(0, len(view), _CHUNK_SIZE):
+                    end = start + _CHUNK_SIZE
+                    data.write(compressor.compress(view[start:end]))
+            data.write(compressor.flush())
+            data.flush()
+            entry = {
+                "key": _key_of(request),
+                "offset": offset,
+                "length": data.tell() - offset,
+                "recorded": time.time(),
+            }
+            index.write(json.dumps(entry) + "\n")
+            index.flush()
+
+    def replay(self, request: PreparedRequest, detect_charset: bool = False) -> Response:
+        """
+        Replays the recorded response of the request.
+
+        Args:
+            request: A request.
+            detect_charset: Whether to detect the charset of the response body
+                when not given by the headers.
+        Returns:
+            The recorded response.
+        Raises:
+            LookupError: when the request has not been recorded.
+        """
+        key = _key_of(request)
+        with self._lock:
+            entries = self._load_entries().get(key)
+            if not entries:
+                raise LookupError(f"Not recorded: {request.method} {request.url}")
+            count = self._replayed.get(key, 0)
+            self._replayed[key] = count + 1
+        entry = entries[min(count, len(entries) - 1)]
+
+        with open(entry.path, "rb") as f:
+            f.seek(entry.offset)
+            payload = zlib.decompress(f.read(entry.length))
+        header_line, body = payload.split(b"\n", 1)
+        header = json.loads(header_line)
+        headers = header["headers"]
+        return StaticResponse(
+            id=generate_id(),
+            elapsed=header["elapsed"],
+            status_code=header["status_code"],
+            headers=headers,
+            body=StaticResponseBody(
+                body,
+                encoding=resolve_encoding(headers),
+                detect=detect_charset,
+            ),
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            for f in (self._data, self._index):
+                if f:
+                    f.close()
+            self._data = None
+            self._index = None
+
+    def _open_files(self) -> Tuple[IO[bytes], IO[str]]:
+        if self._data is None or self._index is None:
+            os.makedirs(self._path, exist_ok=True)
+            name = os.path.join(self._path, str(uuid.uuid4()))
+            self._data = open(name + _DATA_SUFFIX, "ab")
+            self._index = open(name + _INDEX_SUFFIX, "a", encoding="utf-8")
+        return self._data, self._index
+
+    def _load_entries(self) -> Dict[str, List[_Entry]]:
+        if self._entries is None:
+            entries: Dict[str, List[_Entry]] = {}
+            for index_path in glob.glob(os.path.join(self._path, "*" + _INDEX_SUFFIX)):
+                data_path = os.path.splitext(index_path)[0] + _DATA_SUFFIX
+                with open(index_path, encoding="utf-8") as f:
+                    for line in f:
+                        obj = json.loads(line)
+                        entry = _Entry(data_path, obj["offset"], obj["length"], obj["recorded"])
+                        entries.setdefault(obj["key"], []).append(entry)
+            for key_entries in entries.values():
+                key_entries.sort(key=lambda e: e.recorded)
+            self._entries = entries
+        return self._entries
+
+    def _shared_args(self) -> Tuple:
+        return self._path, self._mode
+
+
+def _encode_body(body: Union[None, str, bytes]) -> Optional[str]:
+    if body is None:
+        return None
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    return base64.b64encode(body).decode("ascii")
+
+
+def _key_of(request: PreparedRequest) -> str:
+    body: Union[None, str, bytes] = request.body
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+
+    digest = hashlib.sha256()
+    digest.update(request.method.upper().encode("utf-8"))
+    digest.update(b"\n")
+    digest.update(request.url.encode("utf-8"))
+    digest.update(b"\n")
+    digest.update(body or b"")
+    return digest.hexdigest()
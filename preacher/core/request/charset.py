@@ -0,0 +1,69 @@
+"""
+Charset resolution of response bodies.
+"""
+
+import codecs
+from email.message import Message
+from typing import Mapping, Optional
+
+try:
+    from charset_normalizer import detect
+except ImportError:  # pragma: no cover
+    from chardet import detect  # type: ignore
+
+from .response import Buffer
+
+DEFAULT_ENCODING = "utf-8"
+
+
+def resolve_encoding(headers: Mapping[str, str]) -> Optional[str]:
+    """
+    Resolves the encoding of a response body from its headers without reading the body.
+    The charset parameter of the Content-Type is honoured when it is a known codec.
+    JSON bodies without the charset are regarded as UTF-8 (RFC 8259.)
+
+    Args:
+        headers: Response headers, whose names are case-insensitive or lower case.
+    Returns:
+        The encoding, or ``None`` when unknown.
+    """
+    content_type = headers.get("content-type")
+    if not content_type:
+        return None
+
+    message = Message()
+    message["Content-Type"] = content_type
+    charset = message.get_param("charset")
+    if isinstance(charset, str):
+        try:
+            return codecs.lookup(charset.strip("'\"")).name
+        except LookupError:
+            pass
+
+    media_type = message.get_content_type()
+    if media_type == "application/json" or media_type.endswith("+json"):
+        return DEFAULT_ENCODING
+    return None
+
+
+def detect_encoding(content: Buffer) -> str:
+    """Detects the encoding by the content, which is expensive for large contents."""
+    encoding = detect(content[:])["encoding"]
+    return encoding or DEFAULT_ENCODING
+
+
+def decode(content: Buffer, encoding: Optional[str], detect: bool = False) -> str:
+    """
+    Decodes a content.
+
+    Args:
+        content: A content.
+        encoding: The resolved encoding.
+        detect: Whether to detect the encoding when not resolved.
+            Otherwise UTF-8 is used.
+    Returns:
+        The decoded text, where undecodable bytes are replaced.
+    """
+    if encoding is None:
+        encoding = detect_encoding(content) if detect else DEFAULT_ENCODING
+    return str(content, encoding, errors="replace")
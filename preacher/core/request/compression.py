@@ -0,0 +1,51 @@
+"""
+Compressed transfers: content negotiation of responses and compression of request bodies.
+"""
+
+import zlib
+
+import requests
+from urllib3.util.request import ACCEPT_ENCODING
+
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def accept_encoding() -> str:
+    """
+    Returns the content codings that can be decoded,
+    which are gzip and deflate, and brotli or zstd when the decoders are installed.
+    """
+    return ", ".join(coding.strip() for coding in ACCEPT_ENCODING.split(","))
+
+
+def negotiate_encoding(prepped: requests.PreparedRequest) -> None:
+    """Requests compressed responses unless the request has its own ``Accept-Encoding``."""
+    prepped.headers.setdefault("Accept-Encoding", accept_encoding())
+
+
+def compress_body(prepped: requests.PreparedRequest, threshold: int) -> None:
+    """
+    Compresses the request body by gzip when larger than the threshold in bytes.
+    Bodies already encoded and streamed ones are kept as they are.
+    """
+    body = prepped.body
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    if not isinstance(body, bytes) or len(body) <= threshold:
+        return
+    if "Content-Encoding" in prepped.headers:
+        return
+
+    compressed = gzip_compress(body)
+    prepped.body = compressed
+    prepped.headers["Content-Encoding"] = "gzip"
+    prepped.headers["Content-Length"] = str(len(compressed))
+
+
+def gzip_compress(data: bytes) -> bytes:
+    """
+    Compresses data in the gzip format without the modification time,
+    so that the same data are always compressed into the same bytes.
+    """
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, _GZIP_WBITS)
+    return compressor.compress(data) + compressor.flush()
@@ -0,0 +1,174 @@
+"""
+Hedged requests, which cut the tail latency by sending duplicates of slow requests.
+"""
+
+import asyncio
+import math
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+from preacher.core.util.process import ProcessShared
+from .host import host_of
+from .response import Response
+
+_MAX_WORKERS = 256
+
+
+class Hedging(ProcessShared):
+    """
+    A hedging policy, which sends a duplicate of a request
+    when the request has not answered by the `percentile` of the recent latency of the host,
+    and takes the response that arrives first.
+
+    Latencies are observed for each host, which is given as the scheme and the network location,
+    and hedging starts after `min_samples` latencies are observed.
+    Requests are sent in the threads of the policy to wait for the one answering first,
+    and so the other cannot be interrupted but is closed when it answers.
+    Asynchronous requests are cancelled instead.
+
+    Policies are shared by the threads in a process,
+    and each process observes the latencies of its own requests.
+
+    Args:
+        percentile: The percentile of the recent latency to wait for, in (0, 100).
+        window: The number of the recent latencies to observe per host.
+        min_samples: The min number of latencies to start hedging.
+    Raises:
+        ValueError: when given invalid parameters.
+    """
+
+    def __init__(self, percentile: float = 95.0, window: int = 100, min_samples: int = 10):
+        if not 0.0 < percentile < 100.0:
+            raise ValueError(f"`percentile` must be in (0, 100), given {percentile}")
+        if window < 1:
+            raise ValueError(f"`window` must be positive, given {window}")
+        if not 0 < min_samples <= window:
+            raise ValueError(f"`min_samples` must be in [1, window], given {min_samples}")
+
+        self._percentile = percentile
+        self._window = window
+        self._min_samples = min_samples
+        self._latencies: Dict[Tuple[str, str], Deque[float]] = {}
+        self._lock = threading.Lock()
+        self._pool: Optional[Tuple[int, ThreadPoolExecutor]] = None
+
+    @property
+    def percentile(self) -> float:
+        return self._percentile
+
+    def delay(self, url: str) -> Optional[float]:
+        """
+        Returns the seconds to wait for a request to the host of the URL before hedging,
+        or ``None`` when not enough latencies are observed.
+        """
+        with self._lock:
+            latencies = sorted(self._latencies.get(host_of(url), ()))
+        if len(latencies) < self._min_samples:
+            return None
+        index = math.ceil(self._percentile / 100.0 * len(latencies)) - 1
+        return latencies[max(index, 0)]
+
+    def observe(self, url: str, latency: float) -> None:
+        """Observes the latency of a request to the host of the URL."""
+        key = host_of(url)
+        with self._lock:
+            latencies = self._latencies.get(key)
+            if latencies is None:
+                latencies = deque(maxlen=self._window)
+                self._latencies[key] = latencies
+            latencies.append(latency)
+
+    def run(self, url: str, send: Callable[[], Response]) -> Response:
+        """
+        Sends a request to the URL by `send`, hedging it if slow.
+        Raises the error of the first request when no request succeeds.
+        """
+        delay = self.delay(url)
+        if delay is None:
+            return self._timed(url, send)
+
+        executor = self._executor()
+        primary = executor.submit(self._timed, url, send)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+
+        hedge = executor.submit(self._timed, url, send)
+        return _first_response([primary, hedge])
+
+    async def async_run(self, url: str, send: Callable[[], Awaitable[Response]]) -> Response:
+        """The asynchronous version of :meth:`run`, which cancels the slower request."""
+        delay = self.delay(url)
+        if delay is None:
+            return await self._async_timed(url, send)
+
+        primary = asyncio.ensure_future(self._async_timed(url, send))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+
+        hedge = asyncio.ensure_future(self._async_timed(url, send))
+        tasks = [primary, hedge]
+        pending = set(tasks)
+        try:
+            while pending:
+                _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in tasks:
+                    if task.done() and task.exception() is None:
+                        return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+        raise _first_error(tasks)
+
+    def _timed(self, url: str, send: Callable[[], Response]) -> Response:
+        starts = time.perf_counter()
+        response = send()
+        self.observe(url, time.perf_counter() - starts)
+        return response
+
+    async def _async_timed(self, url: str, send: Callable[[], Awaitable[Response]]) -> Response:
+        starts = time.perf_counter()
+        response = await send()
+        self.observe(url, time.perf_counter() - starts)
+        return response
+
+    def _executor(self) -> ThreadPoolExecutor:
+        # Forked processes must not share threads with their parent.
+        pid = os.getpid()
+        with self._lock:
+            if self._pool is None or self._pool[0] != pid:
+                executor = ThreadPoolExecutor(_MAX_WORKERS, thread_name_prefix="preacher-hedging")
+                self._pool = (pid, executor)
+            return self._pool[1]
+
+    def _shared_args(self) -> Tuple:
+        return self._percentile, self._window, self._min_samples
+
+
+def _first_response(futures: List["Future[Response]"]) -> Response:
+    pending = set(futures)
+    while pending:
+        _, pending = wait(pending, return_when=FIRST_COMPLETED)
+        succeeded = [f for f in futures if f.done() and f.exception() is None]
+        if succeeded:
+            winner = succeeded[0]
+            for future in futures:
+                if future is not winner:
+                    future.cancel()
+                    future.add_done_callback(_discard)
+            return winner.result()
+    raise _first_error(futures)
+
+
+def _discard(future: "Future[Response]") -> None:
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def _first_error(futures: Iterable) -> BaseException:
+    return next(f.exception() for f in futures if f.exception() is not None)
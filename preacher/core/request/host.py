@@ -0,0 +1,12 @@
+"""
+Hosts of URLs, by which requests are limited and observed.
+"""
+
+from typing import Tuple
+from urllib.parse import urlsplit
+
+
+def host_of(url: str) -> Tuple[str, str]:
+    """Returns the host of the URL, which is given as the scheme and the network location."""
+    split = urlsplit(url)
+    return split.scheme, split.netloc
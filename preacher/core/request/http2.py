@@ -0,0 +1,170 @@
+"""
+HTTP/2 transport, which requires `httpx` with HTTP/2 support.
+"""
+
+from datetime import timedelta
+from http.client import HTTPMessage
+from time import perf_counter
+from typing import TYPE_CHECKING, Iterator, Mapping, Optional, Tuple, Union
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.cookies import extract_cookies_to_jar
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+if TYPE_CHECKING:
+    import httpx  # pragma: no cover
+
+Timeout = Union[None, float, Tuple[Optional[float], Optional[float]]]
+
+
+class _OriginalResponse:
+    """Provides headers to extract cookies as `http.client.HTTPResponse` does."""
+
+    def __init__(self, msg: HTTPMessage):
+        self.msg = msg
+
+
+class _RawResponse:
+    """Provides the streamed body as `urllib3.HTTPResponse` does."""
+
+    def __init__(self, res: "httpx.Response"):
+        self._res = res
+        self._chunks: Optional[Iterator[bytes]] = None
+        self._buffer = b""
+
+        msg = HTTPMessage()
+        for name, value in res.headers.multi_items():
+            msg[name] = value
+        self._original_response = _OriginalResponse(msg)
+
+    def stream(self, amt: Optional[int] = None, decode_content: bool = True) -> Iterator[bytes]:
+        if decode_content:
+            return self._res.iter_bytes(amt)
+        return self._res.iter_raw(amt)
+
+    def read(self, amt: Optional[int] = None, decode_content: bool = False, **_kwargs) -> bytes:
+        """Reads at most `amt` bytes, or all the rest when not given."""
+        if self._chunks is None:
+            self._chunks = self._res.iter_bytes() if decode_content else self._res.iter_raw()
+        if amt is None:
+            data = self._buffer + b"".join(self._chunks)
+            self._buffer = b""
+            return data
+
+        while len(self._buffer) < amt:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        data = self._buffer[:amt]
+        self._buffer = self._buffer[amt:]
+        return data
+
+    def close(self) -> None:
+        self._res.close()
+
+    def release_conn(self) -> None:
+        self._res.close()
+
+
+class Http2Adapter(BaseAdapter):
+    """
+    An adapter that sends requests over HTTP/2 with `httpx`.
+    Concurrent requests to the same origin are multiplexed on one connection,
+    and so this adapter should be shared by threads.
+
+    HTTPS connections negotiate HTTP/2 with ALPN and fall back to HTTP/1.1.
+    Plain HTTP connections use HTTP/2 with prior knowledge (h2c).
+    Proxies are given by environment variables.
+
+    Args:
+        pool_size: The max number of connections to keep.
+        keep_alive: Whether to keep connections alive to reuse.
+        transport: A transport of `httpx`, mainly for testing.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        transport: Optional["httpx.BaseTransport"] = None,
+    ):
+        import httpx
+
+        super().__init__()
+        limits = httpx.Limits(max_keepalive_connections=pool_size if keep_alive else 0)
+        self._secure_client = httpx.Client(http2=True, limits=limits, transport=transport)
+        self._plain_client = httpx.Client(
+            http1=False,
+            http2=True,
+            limits=limits,
+            transport=transport,
+        )
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Timeout = None,
+        verify: Union[bool, str] = True,
+        cert: Union[None, bytes, str, Tuple[Union[bytes, str], Union[bytes, str]]] = None,
+        proxies: Optional[Mapping[str, str]] = None,
+    ) -> requests.Response:
+        import httpx
+
+        url = request.url or ""
+        client = self._secure_client if url.startswith("https:") else self._plain_client
+        built = client.build_request(
+            method=request.method or "GET",
+            url=url,
+            headers=dict(request.headers),
+            content=request.body,
+            timeout=_to_httpx_timeout(timeout),
+        )
+        starts = perf_counter()
+        try:
+            res = client.send(built, stream=True)
+        except httpx.TimeoutException as error:
+            raise requests.Timeout(error, request=request)
+        except httpx.TransportError as error:
+            raise requests.ConnectionError(error, request=request)
+        elapsed = perf_counter() - starts  # Until the response headers are received.
+
+        response = requests.Response()
+        response.status_code = res.status_code
+        response.reason = res.reason_phrase
+        response.headers = CaseInsensitiveDict(res.headers.items())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = _RawResponse(res)
+        response.url = url
+        response.request = request
+        response.elapsed = timedelta(seconds=elapsed)
+        extract_cookies_to_jar(response.cookies, request, response.raw)
+
+        if not stream:
+            response.content  # Reads the whole body.
+        return response
+
+    def close(self) -> None:
+        pass  # Kept open to be shared.
+
+    @staticmethod
+    def is_available() -> bool:
+        try:
+            import httpx  # noqa: F401
+            import h2  # noqa: F401
+
+            return True
+        except ImportError:  # pragma: no cover
+            return False
+
+
+def _to_httpx_timeout(timeout: Timeout) -> "httpx.Timeout":
+    import httpx
+
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(None, connect=connect, read=read)
+    return httpx.Timeout(timeout)
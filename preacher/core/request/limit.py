@@ -0,0 +1,131 @@
+"""
+Per-host rate limiting and in-flight caps.
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, Iterator, Optional, Tuple
+
+from preacher.core.util.process import ProcessShared
+from .host import host_of
+
+_POLLING_INTERVAL = 0.01
+
+
+class _HostState:
+    def __init__(self, burst: int, max_in_flight: Optional[int]):
+        self.lock = threading.Lock()
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.slots = threading.BoundedSemaphore(max_in_flight) if max_in_flight else None
+
+
+class HostLimiter(ProcessShared):
+    """
+    Limits requests per host, which is given as the scheme and the network location.
+    The request rate is limited by a token bucket, which allows `burst` requests at once
+    and refills `rate` tokens per second.
+    The count of requests in flight is capped by `max_in_flight`.
+    Requesters hold the slot of a request until its response is closed
+    since response bodies are downloaded lazily.
+
+    Limiters are shared by the threads in a process, but not between processes.
+
+    Args:
+        rate: The max request rate per second per host. ``None`` means no limit.
+        burst: The max count of requests sent at once per host.
+        max_in_flight: The max count of requests in flight per host. ``None`` means no limit.
+    Raises:
+        ValueError: when given invalid limits.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: int = 1,
+        max_in_flight: Optional[int] = None,
+    ):
+        if rate is not None and rate <= 0.0:
+            raise ValueError(f"`rate` must be positive, given {rate}")
+        if burst < 1:
+            raise ValueError(f"`burst` must be positive, given {burst}")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError(f"`max_in_flight` must be positive, given {max_in_flight}")
+
+        self._rate = rate
+        self._burst = burst
+        self._max_in_flight = max_in_flight
+        self._hosts: Dict[Tuple[str, str], _HostState] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> Optional[float]:
+        return self._rate
+
+    @property
+    def burst(self) -> int:
+        return self._burst
+
+    @property
+    def max_in_flight(self) -> Optional[int]:
+        return self._max_in_flight
+
+    @contextmanager
+    def limit(self, url: str) -> Iterator[None]:
+        """Waits for the host of the URL to be available, blocking the current thread."""
+        state = self._state(url)
+        if state.slots:
+            state.slots.acquire()
+        try:
+            delay = self._reserve(state)
+            if delay > 0.0:
+                time.sleep(delay)
+            yield
+        finally:
+            if state.slots:
+                state.slots.release()
+
+    @asynccontextmanager
+    async def async_limit(self, url: str) -> AsyncIterator[None]:
+        """Waits for the host of the URL to be available without blocking the event loop."""
+        state = self._state(url)
+        if state.slots:
+            while not state.slots.acquire(blocking=False):
+                await asyncio.sleep(_POLLING_INTERVAL)
+        try:
+            delay = self._reserve(state)
+            if delay > 0.0:
+                await asyncio.sleep(delay)
+            yield
+        finally:
+            if state.slots:
+                state.slots.release()
+
+    def _state(self, url: str) -> _HostState:
+        key = host_of(url)
+        with self._lock:
+            state = self._hosts.get(key)
+            if state is None:
+                state = _HostState(self._burst, self._max_in_flight)
+                self._hosts[key] = state
+        return state
+
+    def _reserve(self, state: _HostState) -> float:
+        """Takes a token and returns the delay until it is available."""
+        rate = self._rate
+        if rate is None:
+            return 0.0
+
+        with state.lock:
+            now = time.monotonic()
+            state.tokens = min(float(self._burst), state.tokens + (now - state.updated) * rate)
+            state.updated = now
+            state.tokens -= 1.0
+            if state.tokens >= 0.0:
+                return 0.0
+            return -state.tokens / rate
+
+    def _shared_args(self) -> Tuple:
+        return self._rate, self._burst, self._max_in_flight
@@ -0,0 +1,60 @@
+"""
+Connection pre-warming, which opens connections before the first requests.
+"""
+
+from typing import List, Optional
+from urllib.parse import urlsplit, urlunsplit
+
+from .unix import UNIX_SCHEME
+
+_SCHEMES = frozenset(("http", "https", UNIX_SCHEME))
+
+
+class Prewarming:
+    """
+    Hosts to open connections to in each worker before its first request,
+    which takes the connection setup off the latency of the first cases.
+    Hosts are given as the origins of the request paths joined to `base_url`.
+
+    Hosts are expected to be added before requests are sent,
+    so that pickled copies sent to worker processes have all of them.
+
+    Args:
+        connections: The number of connections to open per host,
+            which is capped by the pool size.
+        base_url: The base URL of requests.
+        timeout: The timeout in seconds to connect. ``None`` means no timeout.
+    Raises:
+        ValueError: when given an invalid number of connections.
+    """
+
+    def __init__(self, connections: int, base_url: str = "", timeout: Optional[float] = None):
+        if connections < 1:
+            raise ValueError(f"`connections` must be positive, given {connections}")
+
+        self._connections = connections
+        self._base_url = base_url
+        self._timeout = timeout
+        self._origins: List[str] = []
+
+    @property
+    def connections(self) -> int:
+        return self._connections
+
+    @property
+    def timeout(self) -> Optional[float]:
+        return self._timeout
+
+    @property
+    def origins(self) -> List[str]:
+        """The origins of the hosts in the order added."""
+        return list(self._origins)
+
+    def add(self, path: str) -> None:
+        """Adds the host of a request path, which is ignored unless it is an HTTP one."""
+        split = urlsplit(self._base_url + path)
+        if split.scheme.lower() not in _SCHEMES or not split.netloc:
+            return
+        origin = urlunsplit((split.scheme, split.netloc, "/", "", ""))
+        if origin not in self._origins:
+            self._origins.append(origin)
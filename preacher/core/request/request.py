@@ -5,6 +5,8 @@ from typing import Optional
 
 from .header import Headers
 from .request_body import RequestBody
+from .template import RequestTemplate
+from .timeout import Timeouts
 from .url_param import UrlParams
 
 
@@ -23,12 +25,23 @@ class Request:
         headers: Optional[Headers] = None,
         params: Optional[UrlParams] = None,
         body: Optional[RequestBody] = None,
+        cache: bool = True,
+        timeouts: Optional[Timeouts] = None,
     ):
         self._method = method
         self._path = path
         self._headers = headers or {}
         self._params = params or {}
         self._body = body
+        self._cache = cache
+        self._timeouts = timeouts
+        self._template = RequestTemplate(
+            method=method.value,
+            path=path,
+            headers=self._headers,
+            params=self._params,
+            body=body,
+        )
 
     @property
     def method(self) -> Method:
@@ -49,3 +62,18 @@ class Request:
     @property
     def body(self) -> Optional[RequestBody]:
         return self._body
+
+    @property
+    def cache(self) -> bool:
+        """Whether the response can be cached when a response cache is enabled."""
+        return self._cache
+
+    @property
+    def timeouts(self) -> Optional[Timeouts]:
+        """The timeouts overriding the ones of requesters field by field."""
+        return self._timeouts
+
+    @property
+    def template(self) -> RequestTemplate:
+        """The template compiled on construction."""
+        return self._template
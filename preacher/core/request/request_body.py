@@ -1,6 +1,6 @@
 import json
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Mapping, Optional
 
 from preacher.core.context import Context
 from preacher.core.util.functional import recursive_map
@@ -15,6 +15,11 @@ class RequestBody(ABC):
     def content_type(self) -> str:
         ...  # pragma: no cover
 
+    @property
+    def is_static(self) -> bool:
+        """Whether the body is always resolved into the same one. Defaults to ``False``."""
+        return False
+
     @abstractmethod
     def resolve(self, context: Optional[Context] = None) -> Any:
         ...  # pragma: no cover
@@ -28,6 +33,10 @@ class UrlencodedRequestBody(RequestBody):
     def content_type(self) -> str:
         return "application/x-www-form-urlencoded"
 
+    @property
+    def is_static(self) -> bool:
+        return not contains_value(self._params)
+
     def resolve(self, context: Optional[Context] = None) -> Any:
         return resolve_url_params(self._params, context)
 
@@ -40,6 +49,10 @@ class JsonRequestBody(RequestBody):
     def content_type(self) -> str:
         return "application/json"
 
+    @property
+    def is_static(self) -> bool:
+        return not contains_value(self._data)
+
     def resolve(self, context: Optional[Context] = None) -> Any:
         def _resolve_value(obj: object) -> object:
             if isinstance(obj, Value):
@@ -51,3 +64,14 @@ class JsonRequestBody(RequestBody):
 
         resolved = recursive_map(_resolve_value, self._data)
         return json.dumps(resolved, separators=(",", ":"))
+
+
+def contains_value(obj: object) -> bool:
+    """Returns whether the object contains values to resolve recursively."""
+    if isinstance(obj, Value):
+        return True
+    if isinstance(obj, Mapping):
+        return any(contains_value(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(contains_value(value) for value in obj)
+    return False
@@ -1,41 +1,114 @@
 import uuid
-from copy import copy
+from contextlib import ExitStack
+from functools import partial
 from dataclasses import dataclass, field, replace
 from datetime import datetime
-from typing import Mapping, Union, Optional, Tuple
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, Dict, Mapping, Union, Optional, Tuple
 
 import requests
 
-from preacher import __version__ as _version
 from preacher.core.context import Context, closed_context
 from preacher.core.datetime import now
 from preacher.core.status import Statused, Status
 from preacher.core.util.error import to_message
+from .charset import decode, resolve_encoding
+from .compression import compress_body, negotiate_encoding
+from .limit import HostLimiter
 from .request import Request
 from .response import Response, ResponseBody
-from .url_param import resolve_url_params
+from .session import ProxyCache, SessionFactory
+from .spool import SpooledResponseBody
+from .timeout import Timeouts, iter_by
+from .timing import Timing, recording_phases
 
-_DEFAULT_HEADERS = {"User-Agent": f"Preacher {_version}"}
+if TYPE_CHECKING:
+    from .breaker import CircuitBreaker  # pragma: no cover
+    from .cache import ResponseCache  # pragma: no cover
+    from .cassette import Cassette  # pragma: no cover
+    from .hedging import Hedging  # pragma: no cover
+
+_DRAIN_LIMIT = 64 * 1024
+_CHUNK_SIZE = 64 * 1024
+_CONNECTION_FAILURES = (requests.ConnectionError, requests.Timeout)
 
 
 class ResponseBodyWrapper(ResponseBody):
-    def __init__(self, res: requests.Response):
+    """
+    A response body, which is downloaded in chunks when accessed at first.
+    The text is decoded once by the charset resolved from the headers,
+    or by the detected one only when `detect_charset` is enabled.
+    When given `deadline` in the clock of `time.perf_counter`,
+    downloading fails after the deadline.
+    """
+
+    def __init__(
+        self,
+        res: requests.Response,
+        detect_charset: bool = False,
+        deadline: Optional[float] = None,
+    ):
         self._res = res
+        self._detect_charset = detect_charset
+        self._deadline = deadline
+        self._content: Optional[bytes] = None
+        self._text: Optional[str] = None
+        self._download_time: Optional[float] = None
+
+    @property
+    def download_time(self) -> Optional[float]:
+        """Seconds spent downloading the content, or ``None`` before downloading."""
+        return self._download_time
 
     @property
     def text(self) -> str:
-        return self._res.text
+        if self._text is None:
+            encoding = resolve_encoding(self._res.headers)
+            self._text = decode(self.content, encoding, detect=self._detect_charset)
+        return self._text
 
     @property
     def content(self) -> bytes:
-        return self._res.content
+        if self._content is None:
+            starts = perf_counter()
+            if self._deadline is None:
+                self._content = self._res.content
+            else:
+                chunks = self._res.iter_content(_CHUNK_SIZE)
+                self._content = b"".join(iter_by(chunks, self._deadline))
+            self._download_time = perf_counter() - starts
+        return self._content
 
 
 class ResponseWrapper(Response):
-    def __init__(self, id: str, res: requests.Response):
+    def __init__(
+        self,
+        id: str,
+        res: requests.Response,
+        spool_threshold: Optional[int] = None,
+        detect_charset: bool = False,
+        timing: Optional[Timing] = None,
+        deadline: Optional[float] = None,
+        release: Optional[Callable[[], None]] = None,
+    ):
         self._id = id
         self._res = res
-        self._body = ResponseBodyWrapper(self._res)
+        self._timing = timing
+        self._release = release
+        self._body: Union[ResponseBodyWrapper, SpooledResponseBody]
+        if spool_threshold is None:
+            self._body = ResponseBodyWrapper(
+                self._res,
+                detect_charset=detect_charset,
+                deadline=deadline,
+            )
+        else:
+            self._body = SpooledResponseBody(
+                self._res,
+                threshold=spool_threshold,
+                detect_charset=detect_charset,
+                deadline=deadline,
+            )
 
     @property
     def id(self) -> str:
@@ -59,6 +132,38 @@ class ResponseWrapper(Response):
     def body(self) -> ResponseBody:
         return self._body
 
+    @property
+    def timing(self) -> Optional[Timing]:
+        if self._timing is None:
+            return None
+        return replace(self._timing, download=self._body.download_time)
+
+    def download(self) -> None:
+        """Downloads the body now instead of when accessed at first."""
+        body = self._body
+        if isinstance(body, SpooledResponseBody):
+            body.buffer
+        else:
+            body.content
+
+    def close(self) -> None:
+        # Small bodies are drained to return the connection to the pool.
+        # Larger ones are discarded by closing the connection instead of downloading.
+        length = self._res.headers.get("Content-Length", "")
+        if length.isdigit() and int(length) <= _DRAIN_LIMIT:
+            try:
+                self._res.content
+            except Exception:
+                pass
+        try:
+            self._res.close()
+            if isinstance(self._body, SpooledResponseBody):
+                self._body.close()
+        finally:
+            release, self._release = self._release, None
+            if release:
+                release()
+
 
 @dataclass
 class PreparedRequest:
@@ -74,31 +179,96 @@ class ExecutionReport(Statused):
     starts: datetime = field(default_factory=now)
     request: Optional[PreparedRequest] = None
     message: Optional[str] = None
+    elapsed: Optional[float] = None  # Seconds until the response headers are received.
+    timing: Optional[Timing] = None
 
 
 class Requester:
     def __init__(
         self,
         base_url: str = "",
-        timeout: Optional[float] = None,
+        timeout: Union[None, float, Timeouts] = None,
+        session_factory: Optional[SessionFactory] = None,
+        spool_threshold: Optional[int] = None,
+        detect_charset: bool = False,
+        limiter: Optional[HostLimiter] = None,
+        cassette: Optional["Cassette"] = None,
+        cache: Optional["ResponseCache"] = None,
+        compressed: bool = False,
+        compress_threshold: Optional[int] = None,
+        hedging: Optional["Hedging"] = None,
+        breaker: Optional["CircuitBreaker"] = None,
     ):
         """
         Args:
             base_url: A base URL.
-            timeout: The timeout in seconds. ``None`` means no timeout.
+            timeout: The timeouts, which are overridden by the ones of requests.
+                A number in seconds is the connect and read timeouts.
+                ``None`` means no timeout.
+                With a deadline, response bodies are downloaded in execution.
+            session_factory: A factory of sessions,
+                which are used when no session is given in execution.
+            spool_threshold: The max size in bytes of response bodies to keep in memory.
+                Larger bodies are spooled to temporary files.
+                ``None`` means no spooling.
+            detect_charset: Whether to detect the charset of response bodies
+                when not given by the headers, which is expensive for large bodies.
+                Otherwise UTF-8 is used.
+            limiter: A limiter of requests per host, which applies to all the requests.
+                A request is in flight until its response is closed
+                since the body is downloaded lazily.
+            cassette: A cassette to record responses to,
+                or to replay responses from without sending requests.
+            cache: A cache of responses, which is used unless requests opt out.
+            compressed: Whether to request compressed responses,
+                which are decoded in chunks while downloaded.
+            compress_threshold: The max size in bytes of request bodies to send uncompressed.
+                Larger bodies are compressed by gzip.
+                ``None`` means no compression.
+            hedging: A hedging policy of ``GET`` requests,
+                which sends duplicates of slow requests.
+            breaker: A circuit breaker per host,
+                which fails requests immediately while the host is down.
+        Raises:
+            ValueError: when given an invalid spooling or compression threshold.
         """
+        if spool_threshold is not None and spool_threshold < 0:
+            raise ValueError(
+                f"`spool_threshold` must be zero or positive, given {spool_threshold}"
+            )
+        if compress_threshold is not None and compress_threshold < 0:
+            raise ValueError(
+                f"`compress_threshold` must be zero or positive, given {compress_threshold}"
+            )
+
         self._base_url = base_url
-        self._timeout = timeout
+        self._timeouts = Timeouts.of(timeout)
+        self._session_factory = session_factory or SessionFactory()
+        self._spool_threshold = spool_threshold
+        self._detect_charset = detect_charset
+        self._proxy_cache = ProxyCache()
+        self._limiter = limiter
+        self._cassette = cassette
+        self._cache = cache
+        self._compressed = compressed
+        self._compress_threshold = compress_threshold
+        self._hedging = hedging
+        self._breaker = breaker
 
     @property
     def base_url(self) -> str:
         return self._base_url
 
+    def create_session(self) -> requests.Session:
+        """Creates a session that shares connection pools of the current worker."""
+        return self._session_factory.create()
+
     def execute(
         self,
         request: Request,
         session: Optional[requests.Session] = None,
         context: Optional[Context] = None,
+        limiter: Optional[HostLimiter] = None,
     ) -> Tuple[ExecutionReport, Optional[Response]]:
         """
         Executes a request.
@@ -106,70 +276,186 @@ class Requester:
         Args:
             request: A request.
             session: A session object to execute.
+                When not given, a session is created by the session factory.
             context: Execution context.
+            limiter: A limiter of requests per host in addition to the one of the requester.
         Returns:
             A tuple of execution report and response.
             When there is no response, the response will be ``None``.
+            The response body is streamed when accessed at first,
+            and so the response should be closed after use.
         """
         if session is None:
-            with requests.Session() as new_session:
-                return self.execute(request, session=new_session)
+            with self.create_session() as new_session:
+                return self.execute(
+                    request,
+                    session=new_session,
+                    context=context,
+                    limiter=limiter,
+                )
 
         context = context if context is not None else Context()
         starts = now()
         report = ExecutionReport(starts=starts)
         try:
             with closed_context(context, starts=starts) as context:
-                prepped = self._prepare_request(request, context)
-            proxies = session.rebuild_proxies(prepped, proxies=None)
+                prepped = prepare_request(request, context, base_url=self._base_url)
+            if self._compressed:
+                negotiate_encoding(prepped)
+            if self._compress_threshold is not None:
+                compress_body(prepped, self._compress_threshold)
+            proxies = self._proxy_cache.resolve(session, prepped)
         except Exception as error:
             message = to_message(error)
             report = replace(report, status=Status.FAILURE, message=message)
             return report, None
 
-        report = replace(
-            report,
-            request=PreparedRequest(
-                method=prepped.method or "",
-                url=prepped.url or "",
-                headers=prepped.headers,
-                body=prepped.body,
-            ),
-        )
+        prepared_request = to_prepared_request(prepped)
+        report = replace(report, request=prepared_request)
 
         try:
-            res = session.send(prepped, proxies=proxies, timeout=self._timeout)
+            response = self._fetch(request, session, prepped, proxies, limiter)
         except Exception as error:
             message = to_message(error)
             report = replace(report, status=Status.UNSTABLE, message=message)
             return report, None
 
-        report = replace(report, status=Status.SUCCESS)
-        response = ResponseWrapper(id=_generate_id(), res=res)
-        return report, response
-
-    def _prepare_request(self, request: Request, context: Context) -> requests.PreparedRequest:
-        url = self._base_url + request.path
-        headers = copy(_DEFAULT_HEADERS)
-
-        data = None
-        if request.body:
-            content_type = request.body.content_type
-            headers["Content-Type"] = content_type
-            data = request.body.resolve(context)
-
-        headers.update(request.headers)
-        params = resolve_url_params(request.params, context)
-
-        req = requests.Request(
-            method=request.method.value,
-            url=url,
-            headers=headers,
-            params=params,
-            data=data,
+        report = replace(
+            report,
+            status=Status.SUCCESS,
+            elapsed=response.elapsed,
+            timing=response.timing,
         )
-        return req.prepare()
+        return report, response
 
+    def _fetch(
+        self,
+        request: Request,
+        session: requests.Session,
+        prepped: requests.PreparedRequest,
+        proxies: Dict[str, str],
+        limiter: Optional[HostLimiter],
+    ) -> Response:
+        cache = self._cache if request.cache else None
+        key = None
+        if cache:
+            key, cached = cache.lookup(
+                prepped.method or "",
+                prepped.url or "",
+                prepped.headers,
+                detect_charset=self._detect_charset,
+            )
+            if cached:
+                return cached
+
+        prepared_request = to_prepared_request(prepped)
+        cassette = self._cassette
+        if cassette and cassette.replaying:
+            response = cassette.replay(prepared_request, detect_charset=self._detect_charset)
+        else:
+            timeouts = self._timeouts.override(request.timeouts)
+            response = self._send(session, prepped, proxies, limiter, timeouts)
 
-def _generate_id() -> str:
+        try:
+            if cassette and not cassette.replaying:
+                cassette.record(prepared_request, response)
+            if cache and key:
+                response = cache.store(key, response, detect_charset=self._detect_charset)
+        except BaseException:
+            # Closed not to hold the slots of the limiters.
+            response.close()
+            raise
+        return response
+
+    def _send(
+        self,
+        session: requests.Session,
+        prepped: requests.PreparedRequest,
+        proxies: Dict[str, str],
+        limiter: Optional[HostLimiter],
+        timeouts: Timeouts,
+    ) -> Response:
+        with ExitStack() as stack:
+            if self._breaker:
+                stack.enter_context(self._breaker.guard(prepped.url or "", _CONNECTION_FAILURES))
+            send = partial(self._attempt, session, prepped, proxies, limiter, timeouts)
+            hedging = self._hedging
+            if hedging and prepped.method == "GET":
+                return hedging.run(prepped.url or "", send)
+            return send()
+
+    def _attempt(
+        self,
+        session: requests.Session,
+        prepped: requests.PreparedRequest,
+        proxies: Dict[str, str],
+        limiter: Optional[HostLimiter],
+        timeouts: Timeouts,
+    ) -> Response:
+        with ExitStack() as stack:
+            for host_limiter in (self._limiter, limiter):
+                if host_limiter:
+                    stack.enter_context(host_limiter.limit(prepped.url or ""))
+            with recording_phases() as phases:
+                starts = perf_counter()
+                res = session.send(
+                    prepped,
+                    stream=True,
+                    proxies=proxies,
+                    timeout=timeouts.to_requests(),
+                )
+                elapsed = perf_counter() - starts
+            # The slots are held until the response is closed since the body is streamed.
+            release = stack.pop_all().close
+
+        deadline = None
+        if timeouts.deadline is not None:
+            deadline = starts + timeouts.deadline
+        response = ResponseWrapper(
+            id=generate_id(),
+            res=res,
+            spool_threshold=self._spool_threshold,
+            detect_charset=self._detect_charset,
+            timing=phases.to_timing(elapsed),
+            deadline=deadline,
+            release=release,
+        )
+        if deadline is not None:
+            # Downloaded in execution to fail by the deadline.
+            try:
+                response.download()
+            except BaseException:
+                response.close()
+                raise
+        return response
+
+
+def prepare_request(
+    request: Request,
+    context: Context,
+    base_url: str = "",
+) -> requests.PreparedRequest:
+    """
+    Prepares a request to send.
+
+    Args:
+        request: A request.
+        context: A resolution context.
+        base_url: A base URL.
+    Returns:
+        The prepared request.
+    """
+    return request.template.prepare(context, base_url=base_url)
+
+
+def to_prepared_request(prepped: requests.PreparedRequest) -> PreparedRequest:
+    return PreparedRequest(
+        method=prepped.method or "",
+        url=prepped.url or "",
+        headers=prepped.headers,
+        body=prepped.body,
+    )
+
+
+def generate_id() -> str:
     return str(uuid.uuid4())
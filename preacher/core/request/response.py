@@ -1,7 +1,12 @@
 """Response."""
 
+import mmap
 from abc import ABC, abstractmethod
-from typing import Mapping
+from typing import Iterator, Mapping, Optional, Union
+
+from .timing import Timing
+
+Buffer = Union[bytes, mmap.mmap]
 
 
 class ResponseBody(ABC):
@@ -15,6 +20,18 @@ class ResponseBody(ABC):
     def content(self) -> bytes:
         ...  # pragma: no cover
 
+    @property
+    def buffer(self) -> Buffer:
+        """
+        The content as a read-only buffer, which may be memory-mapped
+        to avoid copying large contents. Defaults to the content.
+        """
+        return self.content
+
+    def iter_text(self) -> Iterator[str]:
+        """Iterates the text in chunks. Defaults to the whole text at once."""
+        yield self.text
+
 
 class Response(ABC):
     @property
@@ -41,3 +58,14 @@ class Response(ABC):
     @abstractmethod
     def body(self) -> ResponseBody:
         ...  # pragma: no cover
+
+    @property
+    def timing(self) -> Optional[Timing]:
+        """The timing of the network phases, or ``None`` when not measured."""
+        return None
+
+    def close(self) -> None:
+        """
+        Releases the resources of the response such as the connection.
+        The body may not be available after closing.
+        """
@@ -0,0 +1,202 @@
+"""
+Retry policies.
+"""
+
+import random
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from multiprocessing.managers import BaseManager
+from typing import Optional, Tuple
+
+from .response import Response
+from preacher.core.util.process import ProcessShared
+
+
+DEFAULT_MAX_DELAY = 60.0
+
+
+class Backoff(Enum):
+    CONSTANT = "constant"
+    EXPONENTIAL = "exponential"
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    A retry policy.
+
+    With the constant backoff, attempts are delayed by `delay` seconds.
+    With the exponential backoff, the n-th retry is delayed by a random time
+    between 0 and ``delay * 2 ** (n - 1)`` seconds (full jitter),
+    not to make failing cases retry in lockstep.
+    Delays are capped by `max_delay`, which defaults to `DEFAULT_MAX_DELAY`.
+
+    The ``Retry-After`` header of a response is honoured when longer than the delay.
+    When it is longer than `max_delay`, retrying stops not to block a worker for long.
+    Delays never exceed `max_delay` anyway.
+
+    Raises:
+        ValueError: when given invalid values.
+    """
+
+    retry: int = 0
+    delay: float = 0.1
+    backoff: Backoff = Backoff.CONSTANT
+    max_delay: float = DEFAULT_MAX_DELAY
+
+    def __post_init__(self):
+        if self.retry < 0:
+            raise ValueError(f"`retry` must be zero or positive, given {self.retry}")
+        if self.delay < 0.0:
+            raise ValueError(f"`delay` must be zero or positive, given {self.delay}")
+        if self.max_delay < 0.0:
+            raise ValueError(f"`max_delay` must be zero or positive, given {self.max_delay}")
+
+    @property
+    def attempts(self) -> int:
+        return self.retry + 1
+
+    def accepts(self, response: Optional[Response]) -> bool:
+        """Returns whether the response allows retrying within `max_delay`."""
+        if response is None:
+            return True
+        retry_after = parse_retry_after(response)
+        return retry_after is None or retry_after <= self.max_delay
+
+    def wait_time(self, attempt: int, response: Optional[Response] = None) -> float:
+        """
+        Computes the delay after a failed attempt.
+
+        Args:
+            attempt: The number of the failed attempt, which starts from 1.
+            response: The response of the failed attempt.
+        Returns:
+            The delay in seconds.
+        """
+        if self.backoff is Backoff.EXPONENTIAL:
+            delay = random.uniform(0.0, self.delay * 2.0 ** (attempt - 1))
+        else:
+            delay = self.delay
+        retry_after = parse_retry_after(response) if response else None
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return min(delay, self.max_delay)
+
+
+@dataclass(frozen=True)
+class RetryOverride:
+    """Overrides the given fields of a retry policy, which is given per case."""
+
+    retry: Optional[int] = None
+    delay: Optional[float] = None
+    backoff: Optional[Backoff] = None
+    max_delay: Optional[float] = None
+
+    def apply(self, policy: RetryPolicy) -> RetryPolicy:
+        return RetryPolicy(
+            retry=self.retry if self.retry is not None else policy.retry,
+            delay=self.delay if self.delay is not None else policy.delay,
+            backoff=self.backoff or policy.backoff,
+            max_delay=self.max_delay if self.max_delay is not None else policy.max_delay,
+        )
+
+
+class RetryBudget(ProcessShared):
+    """
+    The max count of retries in a run, which is shared by the threads and the processes.
+    The count is kept in this process until the budget is sent to another process,
+    and then served by a manager process so that all the processes count the retries together.
+
+    Args:
+        retries: The max count of retries.
+        counter: The counter of the remaining retries shared by the processes,
+            which is given when the budget is restored in another process.
+    Raises:
+        ValueError: when given a negative count.
+    """
+
+    def __init__(self, retries: int, counter: Optional["_Counter"] = None):
+        if retries < 0:
+            raise ValueError(f"`retries` must be zero or positive, given {retries}")
+
+        self._retries = retries
+        self._counter = counter if counter is not None else _Counter(retries)
+        self._shared = counter is not None
+        self._manager: Optional[BaseManager] = None
+        self._lock = threading.Lock()
+
+    @property
+    def retries(self) -> int:
+        return self._retries
+
+    @property
+    def remaining(self) -> int:
+        return self._counter.remaining()
+
+    def acquire(self) -> bool:
+        """Consumes a retry and returns whether it is allowed."""
+        with self._lock:
+            return self._counter.acquire()
+
+    def _shared_args(self) -> Tuple:
+        with self._lock:
+            if not self._shared:
+                # Started lazily not to run a manager unless sent to other processes.
+                manager = _CounterManager()
+                manager.start()
+                self._manager = manager
+                self._counter = manager.Counter(self._counter.remaining())  # type: ignore
+                self._shared = True
+            return self._retries, self._counter
+
+
+class _Counter:
+    """A counter of the remaining retries, which is served by a manager between processes."""
+
+    def __init__(self, count: int):
+        self._count = count
+        self._lock = threading.Lock()
+
+    def remaining(self) -> int:
+        return self._count
+
+    def acquire(self) -> bool:
+        with self._lock:
+            if self._count <= 0:
+                return False
+            self._count -= 1
+            return True
+
+
+class _CounterManager(BaseManager):
+    pass
+
+
+_CounterManager.register("Counter", _Counter)
+
+
+def parse_retry_after(response: Response) -> Optional[float]:
+    """
+    Parses the ``Retry-After`` header of a response.
+
+    Returns:
+        The delay in seconds, or ``None`` when not given or invalid.
+    """
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0.0)
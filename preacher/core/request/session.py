@@ -0,0 +1,250 @@
+"""
+Sessions sharing per-worker connection pools.
+"""
+
+import os
+import threading
+from typing import Dict, Iterable, Optional, Set, Tuple, cast
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import DEFAULT_POOLSIZE, BaseAdapter, HTTPAdapter
+from requests.auth import _basic_auth_str
+from requests.utils import get_auth_from_url
+from urllib3.connectionpool import HTTPConnectionPool
+
+from .http2 import Http2Adapter
+from .prewarm import Prewarming
+from .timing import TimedHTTPConnectionPool, TimedHTTPSConnectionPool
+from .unix import UNIX_SCHEME, UnixHTTPConnectionPool
+
+_LOCAL = threading.local()
+_SHARED_LOCK = threading.Lock()
+_SHARED_PID: Optional[int] = None
+_SHARED_ADAPTERS: Dict[Tuple[int, bool], Http2Adapter] = {}
+
+
+class PooledAdapter(HTTPAdapter):
+    """
+    An HTTP adapter that is shared by sessions.
+    Closing sessions does not close the connections, which are reused by the following sessions.
+    New connections record the timing of their setup.
+    Connections to Unix domain sockets are pooled per socket in the same way.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOLSIZE, keep_alive: bool = True):
+        self._pool_size = pool_size
+        self._keep_alive = keep_alive
+        self._prewarmed: Set[str] = set()
+        super().__init__(pool_maxsize=pool_size)
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+            UNIX_SCHEME: UnixHTTPConnectionPool,
+        }
+        self.poolmanager.key_fn_by_scheme[UNIX_SCHEME] = self.poolmanager.key_fn_by_scheme["http"]
+
+    def prewarm(
+        self,
+        origins: Iterable[str],
+        connections: int,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Opens connections to the origins and keeps them in the pools, handshaking TLS if needed.
+        Origins are pre-warmed only once, and connections failing to open are ignored,
+        which are opened again on demand.
+        """
+        for origin in origins:
+            if origin in self._prewarmed:
+                continue
+            self._prewarmed.add(origin)
+
+            try:
+                pool = self._pool_of(origin)
+            except Exception:
+                continue
+
+            opened = []
+            try:
+                for _ in range(min(connections, self._pool_size)):
+                    # Taken out of the pool to open distinct connections.
+                    conn = pool._get_conn()
+                    opened.append(conn)
+                    if getattr(conn, "sock", None) is None:
+                        if timeout is not None:
+                            conn.timeout = timeout
+                        conn.connect()
+            except Exception:
+                pass
+            finally:
+                for conn in opened:
+                    pool._put_conn(conn)
+
+    def _pool_of(self, url: str) -> HTTPConnectionPool:
+        # Sessions send requests to verify certificates without client ones by default.
+        if hasattr(self, "get_connection_with_tls_context"):
+            request = requests.Request("GET", url).prepare()
+            pool = self.get_connection_with_tls_context(request, verify=True)
+        else:
+            pool = self.get_connection(url)  # pragma: no cover
+        return cast(HTTPConnectionPool, pool)
+
+    def add_headers(self, request: requests.PreparedRequest, **kwargs) -> None:
+        if not self._keep_alive:
+            request.headers["Connection"] = "close"
+
+    def close(self) -> None:
+        pass  # Kept open to be shared.
+
+
+class SessionFactory:
+    """
+    Creates sessions that share connection pools per worker, which is a thread in a process.
+    Connection pools are keyed by hosts, and so warm connections are reused across cases
+    and scenarios run by the same worker.
+    Each session has its own cookies.
+
+    When HTTP/2 is enabled, connections are shared by all the threads in a process instead,
+    so that concurrent requests to the same origin are multiplexed on one connection.
+    Requests to Unix domain sockets (``http+unix``) always use HTTP/1.1.
+
+    When given `prewarming`, connections to its hosts are opened
+    when each worker creates its first session, unless HTTP/2 is enabled
+    or connections are not kept alive.
+
+    Args:
+        pool_size: The max number of connections to keep per host.
+        keep_alive: Whether to keep connections alive to reuse.
+        http2: Whether to use HTTP/2, which requires `httpx` with HTTP/2 support.
+        prewarming: The hosts to open connections to in advance.
+    Raises:
+        RuntimeError: When HTTP/2 is required but not available.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOLSIZE,
+        keep_alive: bool = True,
+        http2: bool = False,
+        prewarming: Optional[Prewarming] = None,
+    ):
+        if pool_size < 1:
+            raise ValueError(f"`pool_size` must be positive, given {pool_size}")
+        if http2 and not Http2Adapter.is_available():
+            raise RuntimeError("HTTP/2 requires httpx[http2]: pip install preacher[http2]")
+
+        self._pool_size = pool_size
+        self._keep_alive = keep_alive
+        self._http2 = http2
+        self._prewarming = prewarming
+
+    @property
+    def pool_size(self) -> int:
+        return self._pool_size
+
+    @property
+    def keep_alive(self) -> bool:
+        return self._keep_alive
+
+    @property
+    def http2(self) -> bool:
+        return self._http2
+
+    def create(self) -> requests.Session:
+        adapter = self.adapter()
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.mount(f"{UNIX_SCHEME}://", self._pooled_adapter())
+
+        prewarming = self._prewarming
+        if prewarming and self._keep_alive and not self._http2:
+            self._pooled_adapter().prewarm(
+                prewarming.origins,
+                prewarming.connections,
+                timeout=prewarming.timeout,
+            )
+        return session
+
+    def adapter(self) -> BaseAdapter:
+        """Returns the adapter of the current worker, which is created if needed."""
+        if self._http2:
+            return self._shared_http2_adapter()
+        return self._pooled_adapter()
+
+    def _pooled_adapter(self) -> PooledAdapter:
+        adapters = _worker_adapters()
+        key = (self._pool_size, self._keep_alive)
+        adapter = adapters.get(key)
+        if adapter is None:
+            adapter = PooledAdapter(pool_size=self._pool_size, keep_alive=self._keep_alive)
+            adapters[key] = adapter
+        return adapter
+
+    def _shared_http2_adapter(self) -> Http2Adapter:
+        global _SHARED_PID
+        key = (self._pool_size, self._keep_alive)
+        with _SHARED_LOCK:
+            # Forked processes must not share connections with their parent.
+            pid = os.getpid()
+            if _SHARED_PID != pid:
+                _SHARED_PID = pid
+                _SHARED_ADAPTERS.clear()
+
+            adapter = _SHARED_ADAPTERS.get(key)
+            if adapter is None:
+                adapter = Http2Adapter(pool_size=self._pool_size, keep_alive=self._keep_alive)
+                _SHARED_ADAPTERS[key] = adapter
+            return adapter
+
+
+def _worker_adapters() -> Dict[Tuple[int, bool], PooledAdapter]:
+    # Forked processes must not share connections with their parent.
+    pid = os.getpid()
+    if getattr(_LOCAL, "pid", None) != pid:
+        _LOCAL.pid = pid
+        _LOCAL.adapters = {}
+    return _LOCAL.adapters
+
+
+class ProxyCache:
+    """
+    Caches proxies resolved from the environment per scheme and host,
+    because resolving them can be expensive.
+    Sessions are expected to share their proxy settings.
+    """
+
+    def __init__(self):
+        self._proxies: Dict[Tuple[str, str], Dict[str, str]] = {}
+
+    def resolve(
+        self,
+        session: requests.Session,
+        request: requests.PreparedRequest,
+    ) -> Dict[str, str]:
+        """
+        Resolves the proxies of the request,
+        setting the proxy authorization header as `requests.Session.rebuild_proxies` does.
+        Requests to Unix domain sockets are never proxied.
+        """
+        url = urlsplit(request.url or "")
+        if url.scheme == UNIX_SCHEME:
+            return {}
+        key = (url.scheme, url.netloc)
+        proxies = self._proxies.get(key)
+        if proxies is None:
+            proxies = session.rebuild_proxies(request, proxies=None)
+            self._proxies[key] = proxies
+            return proxies
+
+        request.headers.pop("Proxy-Authorization", None)
+        proxy = proxies.get(url.scheme)
+        if proxy:
+            username, password = get_auth_from_url(proxy)
+            if username and password:
+                request.headers["Proxy-Authorization"] = _basic_auth_str(username, password)
+        return proxies
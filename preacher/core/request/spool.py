@@ -0,0 +1,127 @@
+"""
+Response bodies spooled to temporary files.
+"""
+
+import codecs
+import mmap
+import tempfile
+from time import perf_counter
+from typing import IO, Iterator, List, Optional
+
+import requests
+
+from .charset import DEFAULT_ENCODING, detect_encoding, resolve_encoding
+from .response import Buffer, ResponseBody
+from .timeout import iter_by
+
+_CHUNK_SIZE = 64 * 1024
+
+
+class SpooledResponseBody(ResponseBody):
+    """
+    A response body that is spooled to a temporary file when larger than the threshold.
+    A spooled body is exposed through a read-only memory-mapped buffer,
+    which is paged in by the OS instead of being held in the process memory.
+
+    The content is downloaded in chunks when accessed at first.
+    The text is decoded once as `ResponseBodyWrapper` does.
+    Iterate the text in chunks not to hold the whole text of a large body.
+
+    Args:
+        res: A streamed response.
+        threshold: The max size in bytes to keep in memory.
+        detect_charset: Whether to detect the charset when not given by the headers.
+        deadline: The deadline to download by in the clock of `time.perf_counter`.
+    """
+
+    def __init__(
+        self,
+        res: requests.Response,
+        threshold: int,
+        detect_charset: bool = False,
+        deadline: Optional[float] = None,
+    ):
+        if threshold < 0:
+            raise ValueError(f"`threshold` must be zero or positive, given {threshold}")
+
+        self._res = res
+        self._threshold = threshold
+        self._detect_charset = detect_charset
+        self._deadline = deadline
+        self._encoding: Optional[str] = None
+        self._text: Optional[str] = None
+        self._buffer: Optional[Buffer] = None
+        self._file: Optional[IO[bytes]] = None
+        self._download_time: Optional[float] = None
+
+    @property
+    def spooled(self) -> bool:
+        return self._file is not None
+
+    @property
+    def download_time(self) -> Optional[float]:
+        """Seconds spent downloading the content, or ``None`` before downloading."""
+        return self._download_time
+
+    @property
+    def encoding(self) -> str:
+        if self._encoding is None:
+            encoding = resolve_encoding(self._res.headers)
+            if encoding is None and self._detect_charset:
+                encoding = detect_encoding(self.buffer)
+            self._encoding = encoding or DEFAULT_ENCODING
+        return self._encoding
+
+    @property
+    def buffer(self) -> Buffer:
+        if self._buffer is None:
+            starts = perf_counter()
+            self._buffer = self._download()
+            self._download_time = perf_counter() - starts
+        return self._buffer
+
+    @property
+    def content(self) -> bytes:
+        buffer = self.buffer
+        if isinstance(buffer, bytes):
+            return buffer
+        return buffer[:]  # Copies the whole content.
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = str(self.buffer, self.encoding, errors="replace")
+        return self._text
+
+    def iter_text(self) -> Iterator[str]:
+        buffer = self.buffer
+        decoder = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+        for begin in range(0, len(buffer), _CHUNK_SIZE):
+            end = begin + _CHUNK_SIZE
+            yield decoder.decode(buffer[begin:end])
+        yield decoder.decode(b"", final=True)
+
+    def close(self) -> None:
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        if self._file:
+            self._file.close()
+
+    def _download(self) -> Buffer:
+        chunks: List[bytes] = []
+        size = 0
+        iterator = iter_by(self._res.iter_content(_CHUNK_SIZE), self._deadline)
+        for chunk in iterator:
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > self._threshold:
+                return self._spool(chunks, iterator)
+        return b"".join(chunks)
+
+    def _spool(self, chunks: List[bytes], rest: Iterator[bytes]) -> mmap.mmap:
+        self._file = tempfile.TemporaryFile()
+        self._file.writelines(chunks)
+        chunks.clear()
+        self._file.writelines(rest)
+        self._file.flush()
+        return mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
@@ -0,0 +1,73 @@
+"""
+Responses whose bodies have already been read.
+"""
+
+from typing import Mapping, Optional
+
+from .charset import decode
+from .response import Response, ResponseBody
+from .timing import Timing
+
+
+class StaticResponseBody(ResponseBody):
+    """A response body that has already been read, whose text is decoded once."""
+
+    def __init__(self, content: bytes, encoding: Optional[str] = None, detect: bool = False):
+        self._content = content
+        self._encoding = encoding
+        self._detect = detect
+        self._text: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = decode(self._content, self._encoding, detect=self._detect)
+        return self._text
+
+    @property
+    def content(self) -> bytes:
+        return self._content
+
+
+class StaticResponse(Response):
+    """A response whose body has already been read."""
+
+    def __init__(
+        self,
+        id: str,
+        elapsed: float,
+        status_code: int,
+        headers: Mapping[str, str],
+        body: ResponseBody,
+        timing: Optional[Timing] = None,
+    ):
+        self._id = id
+        self._elapsed = elapsed
+        self._status_code = status_code
+        self._headers = headers
+        self._body = body
+        self._timing = timing
+
+    @property
+    def id(self) -> str:
+        return self._id
+
+    @property
+    def elapsed(self) -> float:
+        return self._elapsed
+
+    @property
+    def status_code(self) -> int:
+        return self._status_code
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return self._headers
+
+    @property
+    def body(self) -> ResponseBody:
+        return self._body
+
+    @property
+    def timing(self) -> Optional[Timing]:
+        return self._timing
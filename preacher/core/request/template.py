@@ -0,0 +1,87 @@
+"""
+Request templates, which are compiled to be prepared quickly.
+"""
+
+from typing import Dict, Optional
+
+import requests
+
+from preacher import __version__ as _version
+from preacher.core.context import Context
+from .header import Headers
+from .request_body import RequestBody, contains_value
+from .url_param import UrlParams, resolve_url_params
+
+_DEFAULT_HEADERS = {"User-Agent": f"Preacher {_version}"}
+
+
+class RequestTemplate:
+    """
+    A request template, whose headers are merged in advance.
+
+    A static template, which has no values to resolve in its parameters and body,
+    is prepared once per base URL and is copied for each attempt.
+    A dynamic one resolves only its parameters and body for each attempt.
+    """
+
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        headers: Headers,
+        params: UrlParams,
+        body: Optional[RequestBody] = None,
+    ):
+        merged_headers = dict(_DEFAULT_HEADERS)
+        if body:
+            merged_headers["Content-Type"] = body.content_type
+        merged_headers.update(headers)
+
+        self._method = method
+        self._path = path
+        self._headers = merged_headers
+        self._params = params
+        self._body = body
+        self._static = not contains_value(params) and (body is None or body.is_static)
+        self._prepared: Dict[str, requests.PreparedRequest] = {}
+
+    @property
+    def is_static(self) -> bool:
+        return self._static
+
+    def prepare(self, context: Context, base_url: str = "") -> requests.PreparedRequest:
+        """
+        Prepares a request to send.
+
+        Args:
+            context: A resolution context.
+            base_url: A base URL.
+        Returns:
+            The prepared request, which can be modified by the caller.
+        """
+        if not self._static:
+            return self._prepare(context, base_url)
+
+        prepped = self._prepared.get(base_url)
+        if prepped is None:
+            prepped = self._prepare(context, base_url)
+            self._prepared[base_url] = prepped
+        return prepped.copy()
+
+    def _prepare(self, context: Context, base_url: str) -> requests.PreparedRequest:
+        data = self._body.resolve(context) if self._body else None
+        params = resolve_url_params(self._params, context)
+        req = requests.Request(
+            method=self._method,
+            url=base_url + self._path,
+            headers=dict(self._headers),
+            params=params,
+            data=data,
+        )
+        return req.prepare()
+
+    def __getstate__(self) -> Dict[str, object]:
+        # Prepared requests are cached per process.
+        state = self.__dict__.copy()
+        state["_prepared"] = {}
+        return state
@@ -0,0 +1,82 @@
+"""
+Request timeouts.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+import requests
+
+_Seconds = Optional[float]
+
+
+class DeadlineExceeded(requests.Timeout):
+    """Raised when a request does not complete including its body by the deadline."""
+
+
+@dataclass(frozen=True)
+class Timeouts:
+    """
+    Timeouts of a request in seconds. ``None`` means no timeout.
+
+    The connect timeout limits establishing a connection,
+    and the read timeout limits each wait for the server to send data.
+    The deadline limits the whole request from sending it to downloading its body.
+    """
+
+    connect: _Seconds = None
+    read: _Seconds = None
+    deadline: _Seconds = None
+
+    @staticmethod
+    def of(timeout: Union[None, float, Timeouts]) -> Timeouts:
+        """Converts a number into the connect and read timeouts as `requests` does."""
+        if isinstance(timeout, Timeouts):
+            return timeout
+        return Timeouts(connect=timeout, read=timeout)
+
+    def override(self, other: Optional[Timeouts]) -> Timeouts:
+        """Returns the timeouts overridden by the ones given in `other`."""
+        if other is None:
+            return self
+        return Timeouts(
+            connect=_or_else(other.connect, self.connect),
+            read=_or_else(other.read, self.read),
+            deadline=_or_else(other.deadline, self.deadline),
+        )
+
+    def to_requests(self) -> Tuple[_Seconds, _Seconds]:
+        """
+        Returns the connect and read timeouts for `requests`,
+        which are capped by the deadline so that a stalled request never waits much longer.
+        """
+        return _capped(self.connect, self.deadline), _capped(self.read, self.deadline)
+
+
+def iter_by(chunks: Iterable[bytes], deadline: Optional[float]) -> Iterator[bytes]:
+    """
+    Iterates the chunks of a body while downloading them.
+
+    Args:
+        chunks: The chunks of a body.
+        deadline: The deadline in the clock of `time.perf_counter`. ``None`` means no deadline.
+    Raises:
+        DeadlineExceeded: when the deadline passes before the last chunk.
+    """
+    for chunk in chunks:
+        if deadline is not None and perf_counter() > deadline:
+            raise DeadlineExceeded("The request did not complete by the deadline")
+        yield chunk
+
+
+def _or_else(value: _Seconds, default: _Seconds) -> _Seconds:
+    return value if value is not None else default
+
+
+def _capped(value: _Seconds, cap: _Seconds) -> _Seconds:
+    if cap is None:
+        return value
+    return cap if value is None else min(value, cap)
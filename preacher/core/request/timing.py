@@ -0,0 +1,129 @@
+"""
+Timing of the network phases of requests.
+
+Connection setup is measured by the connection pools of `PooledAdapter`,
+which record the phases of the connections made in the current thread.
+"""
+
+import socket
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Iterator, Optional
+
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError
+
+_LOCAL = threading.local()
+
+
+@dataclass(frozen=True)
+class Timing:
+    """
+    Seconds spent in each phase of a request.
+    ``None`` means the phase is not measured,
+    e.g. connection setup when a pooled connection is reused.
+    """
+
+    dns: Optional[float] = None  # Resolving the host name.
+    connect: Optional[float] = None  # Establishing the TCP connection.
+    tls: Optional[float] = None  # Handshaking TLS.
+    ttfb: Optional[float] = None  # Sending the request until the response headers arrive.
+    download: Optional[float] = None  # Downloading the response body.
+
+
+class Phases:
+    """Mutable timing of the connection setup, recorded while a request is sent."""
+
+    def __init__(self):
+        self.dns: Optional[float] = None
+        self.connect: Optional[float] = None
+        self.tls: Optional[float] = None
+
+    @property
+    def setup(self) -> float:
+        return sum(phase for phase in (self.dns, self.connect, self.tls) if phase is not None)
+
+    def to_timing(self, elapsed: float) -> Timing:
+        """
+        Args:
+            elapsed: Seconds until the response headers arrive, including the setup.
+        """
+        return Timing(
+            dns=self.dns,
+            connect=self.connect,
+            tls=self.tls,
+            ttfb=max(elapsed - self.setup, 0.0),
+        )
+
+
+@contextmanager
+def recording_phases() -> Iterator[Phases]:
+    """Records the phases of the connections made in the current thread."""
+    phases = Phases()
+    previous = getattr(_LOCAL, "phases", None)
+    _LOCAL.phases = phases
+    try:
+        yield phases
+    finally:
+        _LOCAL.phases = previous
+
+
+def _current_phases() -> Optional[Phases]:
+    return getattr(_LOCAL, "phases", None)
+
+
+class TimedHTTPConnection(HTTPConnection):
+    """An HTTP connection that resolves the host by itself to time DNS and TCP separately."""
+
+    def _new_conn(self) -> socket.socket:
+        phases = _current_phases()
+        if phases is None:
+            return super()._new_conn()
+
+        host = self._dns_host
+        starts = perf_counter()
+        try:
+            addresses = socket.getaddrinfo(host, self.port, type=socket.SOCK_STREAM)
+        except OSError:
+            return super()._new_conn()  # Fails in the same way as usual.
+        resolved = perf_counter()
+        phases.dns = resolved - starts
+
+        error: Optional[NewConnectionError] = None
+        try:
+            for address in addresses:
+                self._dns_host = str(address[4][0])
+                try:
+                    sock = super()._new_conn()
+                except NewConnectionError as e:
+                    error = e
+                    continue
+                phases.connect = perf_counter() - resolved
+                return sock
+        finally:
+            self._dns_host = host
+        assert error is not None  # getaddrinfo never returns an empty list.
+        raise error
+
+
+class TimedHTTPSConnection(TimedHTTPConnection, HTTPSConnection):
+    """An HTTPS connection that also times the TLS handshake."""
+
+    def connect(self) -> None:
+        phases = _current_phases()
+        starts = perf_counter()
+        super().connect()
+        if phases is not None and phases.dns is not None and phases.connect is not None:
+            total = perf_counter() - starts
+            phases.tls = max(total - phases.dns - phases.connect, 0.0)
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
@@ -0,0 +1,59 @@
+"""
+HTTP over Unix domain sockets, which are addressed by ``http+unix`` URLs.
+
+The host of a URL is the percent-encoded path of the socket,
+e.g. ``http+unix://%2Frun%2Fapi.sock/path`` for ``/run/api.sock``.
+"""
+
+import socket
+from time import perf_counter
+from urllib.parse import unquote, urlsplit
+
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.exceptions import NewConnectionError
+from urllib3.poolmanager import SSL_KEYWORDS
+
+from .timing import _current_phases
+
+UNIX_SCHEME = "http+unix"
+
+
+def is_unix_url(url: str) -> bool:
+    """Returns whether the URL is addressed to a Unix domain socket."""
+    return urlsplit(url).scheme.lower() == UNIX_SCHEME
+
+
+class UnixHTTPConnection(HTTPConnection):
+    """An HTTP connection over the Unix domain socket given as the host."""
+
+    def _new_conn(self) -> socket.socket:
+        phases = _current_phases()
+        starts = perf_counter()
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            # The default timeout of `urllib3` is not a number, which keeps the socket default.
+            if self.timeout is None or isinstance(self.timeout, (int, float)):
+                sock.settimeout(self.timeout)
+            sock.connect(unquote(self.host))
+        except OSError as error:
+            sock.close()
+            raise NewConnectionError(
+                self, f"Failed to establish a new connection: {error}"
+            ) from error
+        if phases is not None:
+            phases.connect = perf_counter() - starts
+        return sock
+
+
+class UnixHTTPConnectionPool(HTTPConnectionPool):
+    """A connection pool per socket, whose connections are reused as TCP ones are."""
+
+    scheme = UNIX_SCHEME
+    ConnectionCls = UnixHTTPConnection
+
+    def __init__(self, *args, **kwargs):
+        # TLS settings are given by pool managers as HTTPS ones, which are not used.
+        for keyword in SSL_KEYWORDS:
+            kwargs.pop(keyword, None)
+        super().__init__(*args, **kwargs)
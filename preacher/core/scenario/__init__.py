@@ -2,6 +2,7 @@ from .case import Case
 from .case_listener import CaseListener
 from .case_result import CaseResult
 from .case_runner import CaseRunner
+from .deferred import DeferredScenario
 from .scenario import Scenario
 from .scenario_result import ScenarioResult
 from .scenario_runner import ScenarioRunner
@@ -12,6 +13,7 @@ __all__ = [
     "CaseRunner",
     "CaseListener",
     "CaseResult",
+    "DeferredScenario",
     "Scenario",
     "ScenarioRunner",
     "ScenarioResult",
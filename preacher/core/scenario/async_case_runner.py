@@ -0,0 +1,60 @@
+from typing import TYPE_CHECKING, Optional
+
+from preacher.core.context import Context, closed_context
+from preacher.core.datetime import now
+from preacher.core.extraction import MappingAnalyzer
+from preacher.core.unit.async_runner import AsyncUnitRunner
+from preacher.core.verification import Verification
+from .case import Case
+from .case_listener import CaseListener
+from .case_result import CaseResult
+
+if TYPE_CHECKING:
+    import aiohttp  # pragma: no cover
+
+
+class AsyncCaseRunner:
+    """
+    The asynchronous version of `CaseRunner`,
+    which requests without blocking the event loop.
+    """
+
+    def __init__(self, unit_runner: AsyncUnitRunner, listener: Optional[CaseListener] = None):
+        self._unit_runner = unit_runner
+        self._listener = listener or CaseListener()
+
+    @property
+    def base_url(self) -> str:
+        return self._unit_runner.base_url
+
+    async def run(
+        self,
+        case: Case,
+        session: Optional["aiohttp.ClientSession"] = None,
+        context: Optional[Context] = None,
+    ) -> CaseResult:
+        if not case.enabled:
+            return CaseResult(label=case.label)
+
+        context = context if context is not None else Context()
+        with closed_context(context, starts=now(), base_url=self.base_url) as context:
+            context_analyzer = MappingAnalyzer(context)
+            conditions = Verification.collect(
+                condition.verify(context_analyzer, context) for condition in case.conditions
+            )
+            if not conditions.status.is_succeeded:
+                return CaseResult(case.label, conditions)
+
+            execution, response, verification = await self._unit_runner.run(
+                request=case.request,
+                requirements=case.response,
+                session=session,
+                context=context,
+                limiter=case.limiter,
+                retry=case.retry,
+            )
+        self._listener.on_execution(execution, response)
+        if response:
+            response.close()
+
+        return CaseResult(case.label, conditions, execution, verification)
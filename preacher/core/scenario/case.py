@@ -6,7 +6,7 @@ along the given descriptions.
 from datetime import timedelta
 from typing import Optional, List
 
-from preacher.core.request import Request
+from preacher.core.request import Request, HostLimiter, RetryOverride
 from preacher.core.verification import Description
 from preacher.core.verification import ResponseDescription
 
@@ -25,6 +25,8 @@ class Case:
         request: Optional[Request] = None,
         response: Optional[ResponseDescription] = None,
         waiting_time: Optional[timedelta] = None,
+        limiter: Optional[HostLimiter] = None,
+        retry: Optional[RetryOverride] = None,
     ):
         self._label = label
         self._enabled = enabled
@@ -32,6 +34,8 @@ class Case:
         self._request = request or Request()
         self._response = response or ResponseDescription()
         self._waiting_time = waiting_time or timedelta()
+        self._limiter = limiter
+        self._retry = retry
 
     @property
     def label(self) -> Optional[str]:
@@ -56,3 +60,11 @@ class Case:
     @property
     def waiting_time(self) -> timedelta:
         return self._waiting_time
+
+    @property
+    def limiter(self) -> Optional[HostLimiter]:
+        return self._limiter
+
+    @property
+    def retry(self) -> Optional[RetryOverride]:
+        return self._retry
@@ -1,4 +1,3 @@
-from time import sleep
 from typing import Optional
 
 import requests
@@ -14,6 +13,12 @@ from .case_result import CaseResult
 
 
 class CaseRunner:
+    """
+    Runs cases.
+    The waiting times of cases are not waited for here,
+    but by the tasks that submit cases not to occupy workers while waiting.
+    """
+
     def __init__(self, unit_runner: UnitRunner, listener: Optional[CaseListener] = None):
         self._unit_runner = unit_runner
         self._listener = listener or CaseListener()
@@ -22,6 +27,9 @@ class CaseRunner:
     def base_url(self) -> str:
         return self._unit_runner.base_url
 
+    def create_session(self) -> requests.Session:
+        return self._unit_runner.create_session()
+
     def run(
         self,
         case: Case,
@@ -40,14 +48,16 @@ class CaseRunner:
             if not conditions.status.is_succeeded:
                 return CaseResult(case.label, conditions)
 
-            sleep(max(case.waiting_time.total_seconds(), 0.0))
-
             execution, response, verification = self._unit_runner.run(
                 request=case.request,
                 requirements=case.response,
                 session=session,
                 context=context,
+                limiter=case.limiter,
+                retry=case.retry,
             )
         self._listener.on_execution(execution, response)
+        if response:
+            response.close()
 
         return CaseResult(case.label, conditions, execution, verification)
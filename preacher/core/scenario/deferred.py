@@ -0,0 +1,48 @@
+"""
+Deferred scenarios, which are constructed in the workers running them.
+Only compact references and encoded results are sent between processes.
+"""
+
+import pickle
+import zlib
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from typing import Callable
+
+from .scenario import Scenario
+from .scenario_result import ScenarioResult
+from .scenario_task import ScenarioTask
+
+
+class DeferredScenario(ABC):
+    """A picklable reference to a scenario, which is constructed in a worker."""
+
+    @abstractmethod
+    def construct(self) -> Scenario:
+        """
+        Constructs the scenario.
+
+        Raises:
+            Exception: when the construction fails.
+        """
+
+
+def encode_result(result: ScenarioResult) -> bytes:
+    """Encodes a scenario result compactly to send it between processes."""
+    return zlib.compress(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def decode_result(data: bytes) -> ScenarioResult:
+    """Decodes a scenario result encoded by `encode_result`."""
+    return pickle.loads(zlib.decompress(data))
+
+
+class DeferredScenarioTask(ScenarioTask):
+    def __init__(self, future: "Future[bytes]"):
+        self._future = future
+
+    def result(self) -> ScenarioResult:
+        return decode_result(self._future.result())
+
+    def add_done_callback(self, fn: Callable[[ScenarioTask], None]) -> None:
+        self._future.add_done_callback(lambda _: fn(self))
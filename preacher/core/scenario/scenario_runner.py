@@ -1,21 +1,45 @@
-from concurrent.futures import Executor
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Union
 
 from preacher.core.context import Context, CONTEXT_KEY_BASE_URL, CONTEXT_KEY_STARTS
 from preacher.core.datetime import now
 from preacher.core.extraction import MappingAnalyzer
 from preacher.core.status import Status
+from preacher.core.util.error import to_message
 from preacher.core.verification import Verification
+from .async_case_runner import AsyncCaseRunner
 from .case_runner import CaseRunner
+from .deferred import DeferredScenario, DeferredScenarioTask, encode_result
 from .scenario import Scenario
 from .scenario_result import ScenarioResult
 from .scenario_task import ScenarioTask, StaticScenarioTask, RunningScenarioTask
-from .util.concurrency import CasesTask, OrderedCasesTask, UnorderedCasesTask
+from .util.async_concurrency import AsyncDependentCasesTask, AsyncOrderedCasesTask
+from .util.async_concurrency import AsyncUnorderedCasesTask
+from .util.concurrency import CasesTask, DependentCasesTask, OrderedCasesTask, UnorderedCasesTask
 
 
 class ScenarioRunner:
-    def __init__(self, executor: Executor, case_runner: CaseRunner):
+    def __init__(
+        self,
+        executor: Executor,
+        case_runner: Union[CaseRunner, AsyncCaseRunner],
+        ordered_by_dependency: bool = False,
+        deferred_concurrency: int = 1,
+    ):
+        """
+        Args:
+            executor: An executor to run cases.
+                When given an `AsyncCaseRunner`, this should be an `AsyncioExecutor`.
+            case_runner: A case runner.
+            ordered_by_dependency: Whether to run the cases of ordered scenarios concurrently
+                unless they depend on each other by the context.
+            deferred_concurrency: The number of threads to run the cases of a deferred scenario
+                in the worker running it.
+        """
         self._executor = executor
         self._case_runner = case_runner
+        self._ordered_by_dependency = ordered_by_dependency
+        self._deferred_concurrency = deferred_concurrency
 
     def submit(self, scenario: Scenario) -> ScenarioTask:
         starts = now()
@@ -38,15 +62,7 @@ class ScenarioRunner:
             result = ScenarioResult(label=scenario.label, status=status, conditions=conditions)
             return StaticScenarioTask(result)
 
-        if scenario.ordered:
-            cases: CasesTask = OrderedCasesTask(
-                self._executor,
-                self._case_runner,
-                scenario.cases,
-                context=context,
-            )
-        else:
-            cases = UnorderedCasesTask(self._executor, self._case_runner, scenario.cases)
+        cases = self._submit_cases(scenario, context)
         subscenarios = [self.submit(subscenario) for subscenario in scenario.subscenarios]
         return RunningScenarioTask(
             label=scenario.label,
@@ -54,3 +70,86 @@ class ScenarioRunner:
             cases=cases,
             subscenarios=subscenarios,
         )
+
+    def submit_deferred(self, scenario: DeferredScenario) -> ScenarioTask:
+        """
+        Submits a deferred scenario, which is constructed and run wholly in a worker.
+        The cases of the scenario run on `deferred_concurrency` threads in the worker.
+
+        Raises:
+            ValueError: when the case runner is an `AsyncCaseRunner`.
+        """
+        case_runner = self._case_runner
+        if isinstance(case_runner, AsyncCaseRunner):
+            raise ValueError("Deferred scenarios are not supported by async case runners")
+        future = self._executor.submit(
+            run_deferred,
+            case_runner,
+            scenario,
+            concurrency=self._deferred_concurrency,
+            ordered_by_dependency=self._ordered_by_dependency,
+        )
+        return DeferredScenarioTask(future)
+
+    def _submit_cases(self, scenario: Scenario, context: Context) -> CasesTask:
+        case_runner = self._case_runner
+        if isinstance(case_runner, AsyncCaseRunner):
+            if scenario.ordered and self._ordered_by_dependency:
+                return AsyncDependentCasesTask(
+                    self._executor,
+                    case_runner,
+                    scenario.cases,
+                    context=context,
+                )
+            if scenario.ordered:
+                return AsyncOrderedCasesTask(
+                    self._executor,
+                    case_runner,
+                    scenario.cases,
+                    context=context,
+                )
+            return AsyncUnorderedCasesTask(self._executor, case_runner, scenario.cases)
+
+        if scenario.ordered and self._ordered_by_dependency:
+            return DependentCasesTask(self._executor, case_runner, scenario.cases, context=context)
+        if scenario.ordered:
+            return OrderedCasesTask(
+                self._executor,
+                case_runner,
+                scenario.cases,
+                context=context,
+            )
+        return UnorderedCasesTask(self._executor, case_runner, scenario.cases)
+
+
+def run_deferred(
+    case_runner: CaseRunner,
+    scenario: DeferredScenario,
+    concurrency: int = 1,
+    ordered_by_dependency: bool = False,
+) -> bytes:
+    """
+    Constructs and runs a deferred scenario in a worker,
+    whose cases run on a worker-local thread pool of `concurrency`.
+
+    Returns:
+        The result encoded by `encode_result`.
+    """
+    try:
+        constructed = scenario.construct()
+    except Exception as error:
+        result = ScenarioResult(
+            label="Not a constructed scenario",
+            status=Status.FAILURE,
+            message=to_message(error),
+        )
+        return encode_result(result)
+
+    with ThreadPoolExecutor(concurrency) as executor:
+        runner = ScenarioRunner(
+            executor=executor,
+            case_runner=case_runner,
+            ordered_by_dependency=ordered_by_dependency,
+        )
+        result = runner.submit(constructed).result()
+    return encode_result(result)
@@ -1,10 +1,12 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Callable, Optional, List
 
 from preacher.core.status import StatusedList, merge_statuses
 from preacher.core.verification import Verification
 from .scenario_result import ScenarioResult
-from .util.concurrency import CasesTask
+from .util.concurrency import CasesTask, when_all_done
 
 
 class ScenarioTask(ABC):
@@ -12,6 +14,14 @@ class ScenarioTask(ABC):
     def result(self) -> ScenarioResult:
         ...  # pragma: no cover
 
+    @abstractmethod
+    def add_done_callback(self, fn: Callable[[ScenarioTask], None]) -> None:
+        """
+        Adds a callback called with this task when its result is ready,
+        which is called immediately when it is already ready.
+        """
+        ...  # pragma: no cover
+
 
 class StaticScenarioTask(ScenarioTask):
     def __init__(self, result: ScenarioResult):
@@ -20,6 +30,9 @@ class StaticScenarioTask(ScenarioTask):
     def result(self) -> ScenarioResult:
         return self._result
 
+    def add_done_callback(self, fn: Callable[[ScenarioTask], None]) -> None:
+        fn(self)
+
 
 class RunningScenarioTask(ScenarioTask):
     def __init__(
@@ -44,3 +57,6 @@ class RunningScenarioTask(ScenarioTask):
             cases=cases,
             subscenarios=subscenarios,
         )
+
+    def add_done_callback(self, fn: Callable[[ScenarioTask], None]) -> None:
+        when_all_done([self._cases, *self._subscenarios], lambda: fn(self))
@@ -0,0 +1,232 @@
+"""
+Adaptive concurrency, which tunes the number of tasks in flight by observed latency and errors.
+"""
+
+import time
+from collections import deque
+from concurrent.futures import Executor, Future
+from functools import partial
+from threading import Condition, Lock
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Tuple
+from urllib.parse import urlsplit
+
+from preacher.core.request import ExecutionReport
+from preacher.core.scenario.case_result import CaseResult
+from preacher.core.scenario.deferred import decode_result
+from preacher.core.scenario.scenario_result import ScenarioResult
+from preacher.core.status import Status, StatusedList
+from .timer import copy_outcome
+
+_CONGESTION_STATUSES = (Status.UNSTABLE,)
+
+_Task = Tuple[Future, Callable, Tuple, Dict[str, Any]]
+
+
+class AimdController:
+    """
+    Controls the concurrency limit by additive-increase/multiplicative-decrease (AIMD.)
+
+    The limit doubles per round trip (slow start) until the first congestion,
+    and then increases by one per round trip.
+    A congestion is signaled by request errors
+    or latency longer than `tolerance` times the shortest latency ever observed
+    for the same endpoint, which decreases the limit by `backoff`.
+    Signals of tasks submitted before the last decrease are ignored
+    not to decrease the limit repeatedly for the same congestion.
+
+    Args:
+        max_limit: The max concurrency limit.
+        min_limit: The min concurrency limit.
+        tolerance: The acceptable ratio of latency to the shortest one.
+        backoff: The ratio to decrease the limit by.
+    Raises:
+        ValueError: when given invalid parameters.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        tolerance: float = 2.0,
+        backoff: float = 0.5,
+    ):
+        if min_limit < 1:
+            raise ValueError(f"`min_limit` must be positive, given {min_limit}")
+        if max_limit < min_limit:
+            raise ValueError(f"`max_limit` must be at least {min_limit}, given {max_limit}")
+        if tolerance <= 1.0:
+            raise ValueError(f"`tolerance` must be greater than 1, given {tolerance}")
+        if not 0.0 < backoff < 1.0:
+            raise ValueError(f"`backoff` must be between 0 and 1, given {backoff}")
+
+        self._max_limit = max_limit
+        self._min_limit = min_limit
+        self._tolerance = tolerance
+        self._backoff = backoff
+
+        self._lock = Lock()
+        self._limit = float(min_limit)
+        self._slow_start = True
+        self._min_latencies: Dict[str, float] = {}
+        self._decreased = float("-inf")
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def observe(
+        self,
+        submitted: float,
+        latencies: Iterable[Tuple[str, float]] = (),
+        error: bool = False,
+    ) -> None:
+        """
+        Observes a completed task.
+
+        Args:
+            submitted: The monotonic time when the task was submitted.
+            latencies: Pairs of an endpoint and the latency of a request to it in seconds.
+            error: Whether the task had request errors.
+        """
+        with self._lock:
+            congested = error
+            for endpoint, latency in latencies:
+                min_latency = min(self._min_latencies.get(endpoint, latency), latency)
+                self._min_latencies[endpoint] = min_latency
+                congested = congested or latency > min_latency * self._tolerance
+
+            if congested:
+                if submitted > self._decreased:
+                    self._limit = max(self._limit * self._backoff, float(self._min_limit))
+                    self._slow_start = False
+                    self._decreased = time.monotonic()
+                return
+
+            increment = 1.0 if self._slow_start else 1.0 / self._limit
+            self._limit = min(self._limit + increment, float(self._max_limit))
+
+
+class AdaptiveExecutor(Executor):
+    """
+    An executor that keeps the number of tasks in flight within the limit of the controller,
+    which observes the latency and errors of the executed cases.
+    Tasks over the limit are queued and submitted in order as tasks in flight are done,
+    so that submissions never block, even in the callbacks of other tasks.
+    The limit should not exceed the number of workers of the wrapped executor
+    so that the latency is not inflated by queueing.
+
+    Args:
+        executor: An executor to run tasks.
+        controller: A controller of the concurrency limit.
+    """
+
+    def __init__(self, executor: Executor, controller: AimdController):
+        self._executor = executor
+        self._controller = controller
+        self._condition = Condition()
+        self._queue: Deque[_Task] = deque()
+        self._in_flight = 0
+        self._shutdown = False
+
+    @property
+    def executor(self) -> Executor:
+        return self._executor
+
+    def submit(self, fn, *args, **kwargs) -> Future:  # type: ignore
+        future: Future = Future()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._queue.append((future, fn, args, kwargs))
+        self._submit_queued()
+        return future
+
+    def shutdown(self, wait: bool = True, **kwargs) -> None:
+        with self._condition:
+            self._shutdown = True
+            if wait:
+                # Queued tasks are submitted to the wrapped executor before shutting it down.
+                while self._queue or self._in_flight:
+                    self._condition.wait()
+            cancelled = list(self._queue)
+            self._queue.clear()
+        for future, *_ in cancelled:
+            future.cancel()
+        self._executor.shutdown(wait=wait, **kwargs)
+
+    def _submit_queued(self) -> None:
+        while True:
+            with self._condition:
+                if not self._queue or self._in_flight >= self._controller.limit:
+                    return
+                future, fn, args, kwargs = self._queue.popleft()
+                self._in_flight += 1
+            if not future.set_running_or_notify_cancel():
+                self._release()
+                continue
+
+            submitted = time.monotonic()
+            try:
+                inner = self._executor.submit(fn, *args, **kwargs)
+            except BaseException as error:
+                self._release()
+                future.set_exception(error)
+                continue
+            inner.add_done_callback(partial(self._on_done, submitted, future))
+
+    def _on_done(self, submitted: float, future: Future, inner: Future) -> None:
+        try:
+            executions = _collect_executions(inner)
+            latencies = [
+                (_endpoint(execution), execution.elapsed)
+                for execution in executions
+                if execution.elapsed is not None
+            ]
+            error = any(execution.status in _CONGESTION_STATUSES for execution in executions)
+            if latencies or error:
+                self._controller.observe(submitted, latencies, error=error)
+        finally:
+            # Tasks submitted in the callbacks are queued until released.
+            copy_outcome(inner, future)
+            self._release()
+            self._submit_queued()
+
+    def _release(self) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+
+def _collect_executions(future: Future) -> List[ExecutionReport]:
+    if future.cancelled() or future.exception() is not None:
+        return []
+    return list(_iter_executions(future.result()))
+
+
+def _iter_executions(result: object) -> Iterator[ExecutionReport]:
+    """
+    Iterates the executions in a result of a task,
+    which is a case result, a list of results, a result paired with a context
+    or a scenario result encoded by a worker.
+    """
+    if isinstance(result, bytes):
+        result = decode_result(result)
+    if isinstance(result, tuple) and result:
+        result = result[0]
+
+    if isinstance(result, CaseResult):
+        yield result.execution
+    elif isinstance(result, StatusedList):
+        for item in result.items:
+            yield from _iter_executions(item)
+    elif isinstance(result, ScenarioResult):
+        yield from _iter_executions(result.cases)
+        yield from _iter_executions(result.subscenarios)
+
+
+def _endpoint(execution: ExecutionReport) -> str:
+    request = execution.request
+    if request is None:
+        return ""
+    url = urlsplit(request.url)
+    return f"{request.method} {url.scheme}://{url.netloc}{url.path}"
@@ -0,0 +1,211 @@
+import asyncio
+from concurrent.futures import Executor, Future
+from contextvars import ContextVar
+from functools import partial
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional, Set
+
+from preacher.core.context import Context
+from preacher.core.request.async_requester import create_client_session
+from preacher.core.scenario.async_case_runner import AsyncCaseRunner
+from preacher.core.scenario.case import Case
+from preacher.core.scenario.case_result import CaseResult
+from preacher.core.status import StatusedList
+from .concurrency import CaseOutcome, CasesResult, CasesTask, DependencyFuture, SegmentedFuture
+from .concurrency import waiting_seconds, when_all_done
+from .dependency import RecordingContext
+from .timer import submit_later
+
+if TYPE_CHECKING:
+    import aiohttp  # pragma: no cover
+
+
+class AsyncioExecutor(Executor):
+    """
+    An executor that runs tasks on an event loop in a dedicated thread.
+    Coroutine functions are run on the event loop directly
+    and the other callables are run in the default executor of the loop.
+    The tasks share a client session, which pools connections on the event loop.
+
+    Args:
+        concurrency: The max count of tasks that are run concurrently.
+    """
+
+    def __init__(self, concurrency: int = 1):
+        if concurrency < 1:
+            raise ValueError(f"`concurrency` must be positive, given {concurrency}")
+
+        self._concurrency = concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._futures: Set[Future] = set()
+        self._lock = Lock()
+        self._shutdown = False
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def submit(self, fn, *args, **kwargs) -> Future:  # type: ignore
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            future = asyncio.run_coroutine_threadsafe(self._run(fn, *args, **kwargs), self._loop)
+            self._futures.add(future)
+        future.add_done_callback(self._discard)
+        return future
+
+    def shutdown(self, wait: bool = True, **_kwargs) -> None:
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            futures = list(self._futures)
+
+        if not wait:
+            for future in futures:
+                future.cancel()
+        for future in futures:
+            try:
+                future.exception()
+            except BaseException:
+                pass  # Errors are given to the callers of `submit`.
+
+        asyncio.run_coroutine_threadsafe(self._close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def client_session(self) -> "aiohttp.ClientSession":
+        """
+        Returns the client session shared by the tasks, which must be called on the event loop.
+        The session is created at first and closed on shutdown.
+        """
+        if self._session is None:
+            self._session = create_client_session()
+        return self._session
+
+    async def _run(self, fn, *args, **kwargs):
+        if self._semaphore is None:
+            # Created lazily to bind to the running loop.
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+        _RUNNING_EXECUTOR.set(self)  # Set in the context of this task only.
+
+        async with self._semaphore:
+            if asyncio.iscoroutinefunction(fn):
+                return await fn(*args, **kwargs)
+            return await self._loop.run_in_executor(None, partial(fn, *args, **kwargs))
+
+    async def _close(self) -> None:
+        # Lets the cancelled tasks finish not to leave their coroutines unawaited.
+        tasks = asyncio.all_tasks() - {asyncio.current_task()}
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._session is not None:
+            await self._session.close()
+
+    def _discard(self, future: Future) -> None:
+        with self._lock:
+            self._futures.discard(future)
+
+
+_RUNNING_EXECUTOR: "ContextVar[Optional[AsyncioExecutor]]" = ContextVar(
+    "_RUNNING_EXECUTOR",
+    default=None,
+)
+
+
+def _client_session() -> Optional["aiohttp.ClientSession"]:
+    """
+    Returns the client session of the executor running the current task,
+    or ``None`` to let the runner create one when run by another executor.
+    """
+    executor = _RUNNING_EXECUTOR.get()
+    if executor is None:
+        return None
+    return executor.client_session()
+
+
+async def _run_case(runner: AsyncCaseRunner, case: Case) -> CaseResult:
+    return await runner.run(case, session=_client_session())
+
+
+async def _run_cases_in_order(
+    runner: AsyncCaseRunner,
+    cases: Iterable[Case],
+    context: Optional[Context],
+) -> CasesResult:
+    session = _client_session()
+    results = []
+    for case in cases:
+        results.append(await runner.run(case, session=session, context=context))
+    return StatusedList(results), context
+
+
+class AsyncOrderedCasesTask(CasesTask):
+    def __init__(
+        self,
+        executor: Executor,
+        runner: AsyncCaseRunner,
+        cases: Iterable[Case],
+        context: Optional[Context] = None,
+    ):
+        self._future: Future = SegmentedFuture(
+            executor,
+            _run_cases_in_order,
+            runner,
+            cases,
+            context,
+        )
+
+    def result(self) -> StatusedList[CaseResult]:
+        return self._future.result()
+
+    def add_done_callback(self, fn: Callable[[CasesTask], None]) -> None:
+        self._future.add_done_callback(lambda _: fn(self))
+
+
+async def _run_case_in_context(
+    runner: AsyncCaseRunner,
+    case: Case,
+    context: Context,
+) -> CaseOutcome:
+    recording = RecordingContext(**context)
+    result = await runner.run(case, session=_client_session(), context=recording)
+    return result, recording.written()
+
+
+class AsyncDependentCasesTask(CasesTask):
+    def __init__(
+        self,
+        executor: Executor,
+        runner: AsyncCaseRunner,
+        cases: Iterable[Case],
+        context: Optional[Context] = None,
+    ):
+        self._future: Future = DependencyFuture(
+            executor,
+            _run_case_in_context,
+            runner,
+            cases,
+            context,
+        )
+
+    def result(self) -> StatusedList[CaseResult]:
+        return self._future.result()
+
+    def add_done_callback(self, fn: Callable[[CasesTask], None]) -> None:
+        self._future.add_done_callback(lambda _: fn(self))
+
+
+class AsyncUnorderedCasesTask(CasesTask):
+    def __init__(self, executor: Executor, runner: AsyncCaseRunner, cases: Iterable[Case]):
+        self._futures: List[Future] = [
+            submit_later(executor, waiting_seconds(case), _run_case, runner, case)
+            for case in cases
+        ]
+
+    def result(self) -> StatusedList[CaseResult]:
+        return StatusedList.collect(f.result() for f in self._futures)
+
+    def add_done_callback(self, fn: Callable[[CasesTask], None]) -> None:
+        when_all_done(self._futures, lambda: fn(self))
@@ -1,14 +1,20 @@
-from abc import ABC, abstractmethod
-from concurrent.futures import Executor
-from typing import Iterable, Optional
+from __future__ import annotations
 
-from requests import Session
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, Future
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from preacher.core.context import Context
 from preacher.core.scenario.case import Case
 from preacher.core.scenario.case_result import CaseResult
 from preacher.core.scenario.case_runner import CaseRunner
 from preacher.core.status import StatusedList
+from .dependency import RecordingContext, analyze_dependencies
+from .timer import submit_later
+
+CasesResult = Tuple[StatusedList[CaseResult], Optional[Context]]
+CaseOutcome = Tuple[CaseResult, Dict[str, object]]
 
 
 class CasesTask(ABC):
@@ -16,16 +22,233 @@ class CasesTask(ABC):
     def result(self) -> StatusedList[CaseResult]:
         ...  # pragma: no cover
 
+    @abstractmethod
+    def add_done_callback(self, fn: Callable[[CasesTask], None]) -> None:
+        ...  # pragma: no cover
+
+
+def when_all_done(items: Sequence[Any], fn: Callable[[], None]) -> None:
+    """
+    Calls `fn` once after all the items are done,
+    which are futures or tasks that have `add_done_callback`.
+    `fn` is called in the thread completing the last item,
+    or immediately when all of them have been done.
+    """
+    if not items:
+        fn()
+        return
+
+    lock = Lock()
+    remaining = [len(items)]
+
+    def _on_done(_: object) -> None:
+        with lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if last:
+            fn()
+
+    for item in items:
+        item.add_done_callback(_on_done)
+
+
+def waiting_seconds(case: Case) -> float:
+    """Returns the seconds to wait for before a case is run."""
+    if not case.enabled:
+        return 0.0
+    return max(case.waiting_time.total_seconds(), 0.0)
+
+
+def split_by_waits(cases: Iterable[Case]) -> List[Tuple[float, List[Case]]]:
+    """
+    Splits ordered cases into segments that start after waiting,
+    each of which is a pair of the seconds to wait for and the cases.
+    """
+    segments: List[Tuple[float, List[Case]]] = [(0.0, [])]
+    for case in cases:
+        seconds = waiting_seconds(case)
+        if seconds > 0.0:
+            segments.append((seconds, []))
+        segments[-1][1].append(case)
+    if not segments[0][1] and len(segments) > 1:
+        segments.pop(0)
+    return segments
+
+
+class SegmentedFuture(Future):
+    """
+    A future of ordered cases, whose segments are submitted one by one after waiting
+    so that waiting cases do not occupy the workers of the executor.
+    The context returned by each segment is given to the next one.
+
+    Args:
+        executor: An executor to run segments.
+        fn: A function to run a segment,
+            which is called with the runner, the cases and the context.
+        runner: A case runner.
+        cases: Ordered cases.
+        context: A context shared by the cases.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        fn: Callable[..., object],
+        runner: object,
+        cases: Iterable[Case],
+        context: Optional[Context],
+    ):
+        super().__init__()
+        self._executor = executor
+        self._fn = fn
+        self._runner = runner
+        self._segments = split_by_waits(cases)
+        self._results: List[CaseResult] = []
+
+        self.set_running_or_notify_cancel()
+        self._submit(0, context)
+
+    def _submit(self, index: int, context: Optional[Context]) -> None:
+        if index >= len(self._segments):
+            self.set_result(StatusedList(self._results))
+            return
+
+        seconds, cases = self._segments[index]
+        try:
+            future = submit_later(self._executor, seconds, self._fn, self._runner, cases, context)
+        except BaseException as error:
+            self.set_exception(error)
+            return
+        future.add_done_callback(lambda f: self._on_done(index, f))
+
+    def _on_done(self, index: int, future: Future) -> None:
+        try:
+            results, context = future.result()
+        except BaseException as error:
+            self.set_exception(error)
+            return
+        self._results.extend(results.items)
+        self._submit(index + 1, context)
+
+
+class DependencyFuture(Future):
+    """
+    A future of ordered cases, each of which is submitted after the cases it depends on
+    so that the cases independent of each other run concurrently.
+    Each case is given the context written by the cases it depends on in the order of the cases.
+
+    Args:
+        executor: An executor to run cases, whose submission must not block
+            since the dependents are submitted in the callbacks of the cases done.
+        fn: A function to run a case, which is called with the runner, the case and the context
+            and returns the result and the context values written by the case.
+        runner: A case runner.
+        cases: Ordered cases.
+        context: A context shared by the cases.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        fn: Callable[..., object],
+        runner: object,
+        cases: Iterable[Case],
+        context: Optional[Context],
+    ):
+        super().__init__()
+        self._executor = executor
+        self._fn = fn
+        self._runner = runner
+        self._cases = list(cases)
+        self._context = context if context is not None else Context()
+        self._dependencies = analyze_dependencies(self._cases)
+        self._dependents: List[List[int]] = [[] for _ in self._cases]
+        for index, dependencies in enumerate(self._dependencies):
+            for dependency in dependencies:
+                self._dependents[dependency].append(index)
+        self._remaining = [len(dependencies) for dependencies in self._dependencies]
+        self._outcomes: Dict[int, CaseOutcome] = {}
+        self._lock = Lock()
+        self._failed = False
+
+        self.set_running_or_notify_cancel()
+        if not self._cases:
+            self.set_result(StatusedList([]))
+            return
+        # Listed in advance not to submit the cases made ready by the cases done immediately.
+        roots = [index for index, remaining in enumerate(self._remaining) if not remaining]
+        for index in roots:
+            self._submit(index)
+
+    def _submit(self, index: int) -> None:
+        case = self._cases[index]
+        context = Context(**self._context)
+        for dependency in sorted(self._dependencies[index]):
+            _, written = self._outcomes[dependency]
+            context.update(written)
+
+        try:
+            future = submit_later(
+                self._executor,
+                waiting_seconds(case),
+                self._fn,
+                self._runner,
+                case,
+                context,
+            )
+        except BaseException as error:
+            self._fail(error)
+            return
+        future.add_done_callback(lambda f: self._on_done(index, f))
+
+    def _on_done(self, index: int, future: Future) -> None:
+        try:
+            outcome = future.result()
+        except BaseException as error:
+            self._fail(error)
+            return
+
+        ready = []
+        with self._lock:
+            if self._failed:
+                return
+            self._outcomes[index] = outcome
+            for dependent in self._dependents[index]:
+                self._remaining[dependent] -= 1
+                if not self._remaining[dependent]:
+                    ready.append(dependent)
+            done = len(self._outcomes) == len(self._cases)
+
+        for dependent in ready:
+            self._submit(dependent)
+        if done:
+            self.set_result(StatusedList([self._outcomes[i][0] for i in range(len(self._cases))]))
+
+    def _fail(self, error: BaseException) -> None:
+        with self._lock:
+            if self._failed:
+                return
+            self._failed = True
+        self.set_exception(error)
+
+
+def _run_case_in_context(runner: CaseRunner, case: Case, context: Context) -> CaseOutcome:
+    """Runs a case, returning the result and the context values written by the case."""
+    recording = RecordingContext(**context)
+    result = runner.run(case, context=recording)
+    return result, recording.written()
+
 
 def _run_cases_in_order(
     runner: CaseRunner,
     cases: Iterable[Case],
     context: Optional[Context],
-) -> StatusedList[CaseResult]:
-    with Session() as session:
-        return StatusedList.collect(
+) -> CasesResult:
+    with runner.create_session() as session:
+        results = StatusedList.collect(
             runner.run(case, session=session, context=context) for case in cases
         )
+    return results, context
 
 
 class OrderedCasesTask(CasesTask):
@@ -36,15 +259,42 @@ class OrderedCasesTask(CasesTask):
         cases: Iterable[Case],
         context: Optional[Context] = None,
     ):
-        self._future = executor.submit(_run_cases_in_order, runner, cases, context)
+        self._future = SegmentedFuture(executor, _run_cases_in_order, runner, cases, context)
 
     def result(self) -> StatusedList[CaseResult]:
         return self._future.result()
 
+    def add_done_callback(self, fn: Callable[[CasesTask], None]) -> None:
+        self._future.add_done_callback(lambda _: fn(self))
+
+
+class DependentCasesTask(CasesTask):
+    """Ordered cases, which run concurrently unless they depend on each other by the context."""
+
+    def __init__(
+        self,
+        executor: Executor,
+        runner: CaseRunner,
+        cases: Iterable[Case],
+        context: Optional[Context] = None,
+    ):
+        self._future = DependencyFuture(executor, _run_case_in_context, runner, cases, context)
+
+    def result(self) -> StatusedList[CaseResult]:
+        return self._future.result()
+
+    def add_done_callback(self, fn: Callable[[CasesTask], None]) -> None:
+        self._future.add_done_callback(lambda _: fn(self))
+
 
 class UnorderedCasesTask(CasesTask):
     def __init__(self, executor: Executor, runner: CaseRunner, cases: Iterable[Case]):
-        self._futures = [executor.submit(runner.run, case) for case in cases]
+        self._futures = [
+            submit_later(executor, waiting_seconds(case), runner.run, case) for case in cases
+        ]
 
     def result(self) -> StatusedList[CaseResult]:
         return StatusedList.collect(f.result() for f in self._futures)
+
+    def add_done_callback(self, fn: Callable[[CasesTask], None]) -> None:
+        when_all_done(self._futures, lambda: fn(self))
@@ -0,0 +1,162 @@
+"""
+Dependency analysis of ordered cases,
+which finds the cases that each case depends on by the context values
+written by descriptions with ``value_name`` and read by `ContextualValue`.
+"""
+
+from dataclasses import dataclass
+from datetime import date, time, timedelta
+from enum import Enum
+from types import ModuleType
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Set
+
+from preacher.core.context import Context
+from preacher.core.scenario.case import Case
+from preacher.core.value import Value
+from preacher.core.value.impl.context import ContextualValue
+from preacher.core.value.impl.datetime import DatetimeValueWithFormat, RelativeDatetime
+from preacher.core.value.impl.static import StaticValue
+from preacher.core.verification import Description, MatcherFactory, MatcherWrappingPredicate
+from preacher.core.verification import Predicate, RecursiveMatcherFactory, StaticMatcherFactory
+from preacher.core.verification import ValueMatcherFactory
+
+_ATOMIC_TYPES = (type(None), bool, int, float, str, bytes, date, time, timedelta, Enum)
+_OPAQUE_TYPES = (type, ModuleType)
+
+# The types that can use the context, whose known implementations are analyzed.
+_CONTEXTUAL_TYPES = (Value, Predicate, MatcherFactory)
+_KNOWN_TYPES = frozenset(
+    (
+        StaticValue,
+        ContextualValue,
+        RelativeDatetime,
+        DatetimeValueWithFormat,
+        MatcherWrappingPredicate,
+        StaticMatcherFactory,
+        ValueMatcherFactory,
+        RecursiveMatcherFactory,
+    )
+)
+
+
+@dataclass(frozen=True)
+class ContextAccess:
+    """
+    The context values that a case reads and writes.
+
+    Args:
+        reads: The keys read by the case. ``None`` means any key.
+        writes: The keys written by the case.
+        barrier: Whether the case must run after all the preceding cases
+            and before all the following cases,
+            which is the case when it waits or can use the context in unknown ways.
+    """
+
+    reads: Optional[FrozenSet[str]] = frozenset()
+    writes: FrozenSet[str] = frozenset()
+    barrier: bool = False
+
+    def depends_on(self, preceding: "ContextAccess") -> bool:
+        """Returns whether this case depends on the preceding one."""
+        if self.barrier or preceding.barrier:
+            return True
+        if self.reads is None:
+            return bool(preceding.writes)
+        return not self.reads.isdisjoint(preceding.writes)
+
+
+class RecordingContext(Context):
+    """A context recording the keys written to it."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._written: Set[str] = set()
+
+    def __setitem__(self, key: str, value: object) -> None:
+        super().__setitem__(key, value)
+        self._written.add(key)
+
+    def written(self) -> Dict[str, object]:
+        """Returns the values written to this context, which are left in it."""
+        return {key: self[key] for key in self._written if key in self}
+
+
+def analyze_access(case: Case) -> ContextAccess:
+    """
+    Analyzes the context values that a case reads and writes.
+    Conditions of a case can read any key
+    because they extract values from the context by queries.
+    """
+    if not case.enabled:
+        return ContextAccess()
+
+    inspector = _Inspector()
+    inspector.inspect(case)
+    waits = case.waiting_time.total_seconds() > 0.0
+    return ContextAccess(
+        reads=None if case.conditions else frozenset(inspector.reads),
+        writes=frozenset(inspector.writes),
+        barrier=waits or inspector.unknown,
+    )
+
+
+def analyze_dependencies(cases: Sequence[Case]) -> List[FrozenSet[int]]:
+    """
+    Analyzes the indices of the preceding cases that each of ordered cases depends on.
+    A case depends on all the preceding cases that write the context values it reads,
+    so that it is given the values in the order of the cases.
+    """
+    accesses = [analyze_access(case) for case in cases]
+    return [
+        frozenset(
+            preceding_index
+            for preceding_index, preceding in enumerate(accesses[:index])
+            if access.depends_on(preceding)
+        )
+        for index, access in enumerate(accesses)
+    ]
+
+
+class _Inspector:
+    def __init__(self):
+        self.reads: Set[str] = set()
+        self.writes: Set[str] = set()
+        self.unknown = False
+        # Inspected objects are kept not to reuse the IDs of temporary ones.
+        self._visited: Dict[int, object] = {}
+
+    def inspect(self, root: object) -> None:
+        stack = [root]
+        while stack:
+            obj = stack.pop()
+            if isinstance(obj, _ATOMIC_TYPES + _OPAQUE_TYPES) or id(obj) in self._visited:
+                continue
+            self._visited[id(obj)] = obj
+            self._inspect_one(obj)
+            stack.extend(_children_of(obj))
+
+    def _inspect_one(self, obj: object) -> None:
+        if isinstance(obj, ContextualValue):
+            self.reads.add(obj.key)
+        elif isinstance(obj, Description) and obj.value_name:
+            self.writes.add(obj.value_name)
+        elif isinstance(obj, ValueMatcherFactory):
+            # Values can be built from the arguments when creating matchers.
+            self.inspect(obj.value)
+        elif isinstance(obj, _CONTEXTUAL_TYPES) and type(obj) not in _KNOWN_TYPES:
+            self.unknown = True
+
+
+def _children_of(obj: object) -> Iterable[object]:
+    if isinstance(obj, Mapping):
+        return [item for pair in obj.items() for item in pair]
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return list(obj)
+
+    children = list(getattr(obj, "__dict__", {}).values())
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            if hasattr(obj, slot):
+                children.append(getattr(obj, slot))
+    return children
@@ -0,0 +1,207 @@
+"""
+Hybrid concurrency, which runs tasks in threads of multiple worker processes.
+"""
+
+import multiprocessing
+import pickle
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
+from itertools import count
+from queue import Empty
+from threading import Lock, Thread
+from typing import Dict, List, Optional, Tuple
+
+_POLL_SECONDS = 0.1
+
+_Outcome = Tuple[bool, bytes]
+_STARTED = None  # Sent as the outcome when a worker takes a task.
+
+
+class HybridExecutor(Executor):
+    """
+    An executor that runs tasks in threads of worker processes.
+    The processes run CPU-bound verification in parallel,
+    and the threads keep many requests in flight in each process.
+
+    Tasks are queued once and taken by whichever thread is idle,
+    which distributes them across the processes by their loads.
+    Callables and their arguments must be picklable as in `ProcessPoolExecutor`.
+
+    Futures are marked running when the workers notify that they have taken the tasks.
+    Cancelling is best-effort since a task can be taken before the notification arrives,
+    in which case the task still runs but its result is discarded.
+
+    Args:
+        processes: The number of worker processes.
+        threads: The total number of worker threads,
+            which are distributed across the processes evenly.
+    Raises:
+        ValueError: when given invalid numbers.
+    """
+
+    def __init__(self, processes: int, threads: int):
+        if processes < 1:
+            raise ValueError(f"`processes` must be positive, given {processes}")
+        if threads < processes:
+            raise ValueError(f"`threads` must be at least {processes}, given {threads}")
+
+        self._threads = threads
+        self._pending: Dict[int, Future] = {}
+        self._ids = count()
+        self._lock = Lock()
+        self._shutdown = False
+        self._broken = False
+
+        context = multiprocessing.get_context()
+        self._tasks = context.Queue()
+        self._results = context.Queue()
+        self._processes = [
+            context.Process(target=_work, args=(self._tasks, self._results, n), daemon=True)
+            for n in _distribute(threads, processes)
+        ]
+        for process in self._processes:
+            process.start()
+
+        # Started after forking not to be copied into the worker processes.
+        self._collector = Thread(target=self._collect, daemon=True)
+        self._collector.start()
+
+    @property
+    def processes(self) -> int:
+        return len(self._processes)
+
+    @property
+    def threads(self) -> int:
+        return self._threads
+
+    def submit(self, fn, *args, **kwargs) -> Future:  # type: ignore
+        future: Future = Future()
+        try:
+            payload = pickle.dumps((fn, args, kwargs), pickle.HIGHEST_PROTOCOL)
+        except Exception as error:
+            future.set_exception(error)
+            return future
+
+        with self._lock:
+            if self._broken:
+                raise BrokenProcessPool("A worker process terminated abruptly")
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            task_id = next(self._ids)
+            self._pending[task_id] = future
+            self._tasks.put((task_id, payload))
+        return future
+
+    def shutdown(self, wait: bool = True, **_kwargs) -> None:
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+
+        # Each thread stops by taking one of these after all the tasks.
+        for _ in range(self._threads):
+            self._tasks.put(None)
+        if not wait:
+            return
+
+        for process in self._processes:
+            process.join()
+        self._results.put(None)
+        self._collector.join()
+        self._tasks.close()
+        self._results.close()
+
+    def _collect(self) -> None:
+        while True:
+            try:
+                item = self._results.get(timeout=_POLL_SECONDS)
+            except Empty:
+                if self._stopped():
+                    return
+                continue
+            if item is None:
+                return
+
+            task_id, outcome = item
+            if outcome is _STARTED:
+                self._start(task_id)
+            else:
+                self._finish(task_id, outcome)
+
+    def _start(self, task_id: int) -> None:
+        with self._lock:
+            future = self._pending.get(task_id)
+            if future is None or future.set_running_or_notify_cancel():
+                return
+            # Cancelled before taken, whose result is to be discarded.
+            del self._pending[task_id]
+
+    def _finish(self, task_id: int, outcome: _Outcome) -> None:
+        with self._lock:
+            future = self._pending.pop(task_id, None)
+        if future is None:
+            return
+        succeeded, payload = outcome
+        try:
+            value = pickle.loads(payload)
+        except Exception as error:
+            future.set_exception(error)
+            return
+        if succeeded:
+            future.set_result(value)
+        else:
+            future.set_exception(value)
+
+    def _stopped(self) -> bool:
+        """
+        Returns whether the worker processes have stopped,
+        failing the pending tasks when a worker process terminated abruptly.
+        """
+        exited = [process for process in self._processes if not process.is_alive()]
+        if self._shutdown and all(process.exitcode == 0 for process in exited):
+            return len(exited) == len(self._processes)
+        if not exited:
+            return False
+
+        with self._lock:
+            self._broken = True
+            futures = list(self._pending.values())
+            self._pending.clear()
+        for future in futures:
+            if future.running() or future.set_running_or_notify_cancel():
+                future.set_exception(BrokenProcessPool("A worker process terminated abruptly"))
+        return True
+
+
+def _distribute(threads: int, processes: int) -> List[int]:
+    quotient, remainder = divmod(threads, processes)
+    return [quotient + (1 if index < remainder else 0) for index in range(processes)]
+
+
+def _work(tasks, results, threads: int) -> None:
+    workers = [Thread(target=_serve, args=(tasks, results)) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+def _serve(tasks, results) -> None:
+    while True:
+        task: Optional[Tuple[int, bytes]] = tasks.get()
+        if task is None:
+            return
+        task_id, payload = task
+        results.put((task_id, _STARTED))
+        results.put((task_id, _call(payload)))
+
+
+def _call(payload: bytes) -> _Outcome:
+    try:
+        fn, args, kwargs = pickle.loads(payload)
+        return True, pickle.dumps(fn(*args, **kwargs), pickle.HIGHEST_PROTOCOL)
+    except BaseException as error:
+        try:
+            return False, pickle.dumps(error, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return False, pickle.dumps(RuntimeError(repr(error)), pickle.HIGHEST_PROTOCOL)
@@ -2,27 +2,67 @@
 Retrying utilities.
 """
 
+import asyncio
 import time
 
-from typing import Callable, TypeVar
+from typing import Awaitable, Callable, TypeVar, Union
 
 
 T = TypeVar("T")
 
+Delay = Union[float, Callable[[int, T], float]]
+
+
+def _compute_delay(delay: Delay, attempt: int, result: T) -> float:
+    if callable(delay):
+        return delay(attempt, result)
+    return delay
+
 
 def retry_while_false(
     func: Callable[[], T],
     attempts: int = 1,
-    delay: float = 0.1,
+    delay: Delay = 0.1,
     predicate: Callable[[T], bool] = bool,
 ) -> T:
+    """
+    Calls `func` until the result satisfies `predicate` at most `attempts` times.
+
+    Args:
+        func: A function to call.
+        attempts: The max count of attempts.
+        delay: The delay between attempts in seconds,
+            or a function that computes it from the attempt number and the result.
+        predicate: A predicate of results.
+    Returns:
+        The result of the last attempt.
+    """
     if attempts < 1:
         raise ValueError(f"`attempts` must be positive, given {attempts}")
 
-    for _ in range(attempts - 1):
+    for attempt in range(1, attempts):
         result = func()
         if predicate(result):
             return result
-        time.sleep(delay)
+        time.sleep(_compute_delay(delay, attempt, result))
 
     return func()
+
+
+async def async_retry_while_false(
+    func: Callable[[], Awaitable[T]],
+    attempts: int = 1,
+    delay: Delay = 0.1,
+    predicate: Callable[[T], bool] = bool,
+) -> T:
+    """The asynchronous version of `retry_while_false`, which sleeps without blocking."""
+    if attempts < 1:
+        raise ValueError(f"`attempts` must be positive, given {attempts}")
+
+    for attempt in range(1, attempts):
+        result = await func()
+        if predicate(result):
+            return result
+        await asyncio.sleep(_compute_delay(delay, attempt, result))
+
+    return await func()
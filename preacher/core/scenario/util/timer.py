@@ -0,0 +1,105 @@
+"""
+Delayed submission, which waits without occupying the workers of executors.
+"""
+
+import heapq
+import itertools
+import time
+from concurrent.futures import CancelledError, Executor, Future
+from threading import Condition, Lock, Thread
+from typing import Callable, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+
+class Timer:
+    """
+    Calls functions after delays in a dedicated thread, which lives while calls are pending.
+    The functions should return soon not to delay the others.
+    """
+
+    def __init__(self):
+        self._condition = Condition()
+        self._queue: List[Tuple[float, int, Callable[[], None]]] = []
+        self._counter = itertools.count()
+        self._thread: Optional[Thread] = None
+
+    def call_later(self, delay: float, fn: Callable[[], None]) -> None:
+        with self._condition:
+            when = time.monotonic() + max(delay, 0.0)
+            heapq.heappush(self._queue, (when, next(self._counter), fn))
+            if self._thread is None:
+                self._thread = Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._queue:
+                    self._thread = None
+                    return
+                when, _, fn = self._queue[0]
+                remaining = when - time.monotonic()
+                if remaining > 0.0:
+                    self._condition.wait(remaining)
+                    continue
+                heapq.heappop(self._queue)
+            fn()
+
+
+_TIMERS: "WeakKeyDictionary[Executor, Timer]" = WeakKeyDictionary()
+_TIMERS_LOCK = Lock()
+
+
+def _timer_of(executor: Executor) -> Timer:
+    with _TIMERS_LOCK:
+        timer = _TIMERS.get(executor)
+        if timer is None:
+            timer = Timer()
+            _TIMERS[executor] = timer
+        return timer
+
+
+def submit_later(executor: Executor, delay: float, fn, *args, **kwargs) -> Future:
+    """
+    Submits a task to the executor after the delay.
+    The task is submitted at once when the delay is not positive.
+    Otherwise, it is submitted in the timer thread of the executor,
+    so the submission must not block not to delay the other tasks waiting for it.
+
+    Args:
+        executor: An executor to run the task.
+        delay: The delay in seconds.
+        fn: The function of the task.
+    Returns:
+        A future of the task, which fails when the submission fails.
+    """
+    if delay <= 0.0:
+        return executor.submit(fn, *args, **kwargs)
+
+    future: Future = Future()
+
+    def _submit() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            inner = executor.submit(fn, *args, **kwargs)
+        except BaseException as error:
+            future.set_exception(error)
+            return
+        inner.add_done_callback(lambda _: copy_outcome(inner, future))
+
+    _timer_of(executor).call_later(delay, _submit)
+    return future
+
+
+def copy_outcome(source: Future, destination: Future) -> None:
+    """Copies the outcome of a done future to a running one, failing it when cancelled."""
+    if source.cancelled():
+        destination.set_exception(CancelledError())
+        return
+    error = source.exception()
+    if error is not None:
+        destination.set_exception(error)
+        return
+    destination.set_result(source.result())
@@ -1,9 +1,29 @@
 from concurrent.futures import Executor
-from typing import Optional
+from typing import Optional, Union
 
-from preacher.core.request import Requester
+from requests.adapters import DEFAULT_POOLSIZE
+
+from preacher.core.request import (
+    Backoff,
+    Cassette,
+    CircuitBreaker,
+    Hedging,
+    HostLimiter,
+    Prewarming,
+    Requester,
+    ResponseCache,
+    RetryBudget,
+    SessionFactory,
+    Timeouts,
+)
+from preacher.core.request.async_requester import AsyncRequester
+from preacher.core.request.unix import is_unix_url
 from preacher.core.scenario import CaseRunner, ScenarioRunner
+from preacher.core.scenario.async_case_runner import AsyncCaseRunner
+from preacher.core.scenario.util.adaptive import AdaptiveExecutor, AimdController
+from preacher.core.scenario.util.async_concurrency import AsyncioExecutor
 from preacher.core.unit import UnitRunner
+from preacher.core.unit.async_runner import AsyncUnitRunner
 from .listener import Listener
 from .scenario_scheduler import ScenarioScheduler
 
@@ -12,12 +32,164 @@ def create_scheduler(
     executor: Executor,
     base_url: str = "",
     timeout: Optional[float] = None,
+    connect_timeout: Optional[float] = None,
+    read_timeout: Optional[float] = None,
+    deadline: Optional[float] = None,
     retry: int = 0,
     delay: float = 0.1,
+    backoff: Backoff = Backoff.CONSTANT,
+    max_delay: float = 60.0,
+    retry_budget: Optional[int] = None,
     listener: Optional[Listener] = None,
+    pool_size: int = DEFAULT_POOLSIZE,
+    keep_alive: bool = True,
+    http2: bool = False,
+    spool_threshold: Optional[int] = None,
+    detect_charset: bool = False,
+    rate_limit: Optional[float] = None,
+    max_in_flight: Optional[int] = None,
+    concurrency_controller: Optional[AimdController] = None,
+    cassette: Optional[Cassette] = None,
+    cache_size: Optional[int] = None,
+    compressed: bool = False,
+    compress_threshold: Optional[int] = None,
+    hedge_percentile: Optional[float] = None,
+    circuit_breaker: Optional[int] = None,
+    circuit_reset: float = 30.0,
+    prewarm: Optional[int] = None,
+    stream: bool = False,
+    window: Optional[int] = None,
+    ordered_by_dependency: bool = False,
+    deferred_concurrency: int = 1,
 ) -> ScenarioScheduler:
-    requester = Requester(base_url=base_url, timeout=timeout)
-    unit_runner = UnitRunner(requester=requester, retry=retry, delay=delay)
-    case_runner = CaseRunner(unit_runner=unit_runner, listener=listener)
-    runner = ScenarioRunner(executor=executor, case_runner=case_runner)
-    return ScenarioScheduler(runner=runner, listener=listener)
+    """
+    Create a scenario scheduler.
+    Requests time out after `timeout` seconds to connect and to read,
+    which are given separately by `connect_timeout` and `read_timeout`,
+    and fail after `deadline` seconds including downloading their bodies.
+    When given an `AsyncioExecutor`, requests are sent by an asyncio-native requester.
+    Otherwise, requests share connection pools of `pool_size` per worker and host,
+    or multiplexed HTTP/2 connections per process when `http2` is enabled.
+    Response bodies larger than `spool_threshold` are spooled to temporary files.
+    Requests are limited to `rate_limit` per second and `max_in_flight` at once per host,
+    which applies in each worker process.
+    When given `concurrency_controller`, the number of tasks in flight is tuned by it.
+    Delays between attempts are capped by `max_delay` seconds even with ``Retry-After``.
+    Retries stop after `retry_budget` retries in total, which are counted across the processes.
+    When given `cassette`, responses are recorded to it or replayed from it.
+    When given `cache_size`, responses are cached up to the size in bytes in each worker process.
+    Compressed responses are requested when `compressed` is enabled,
+    which is always the case with an `AsyncioExecutor`,
+    and request bodies larger than `compress_threshold` are compressed.
+    When given `hedge_percentile`, slow ``GET`` requests are hedged
+    after the percentile of the recent latency per host in each worker process.
+    When given `circuit_breaker`, requests to a host fail immediately
+    after the number of consecutive connection failures in each worker process,
+    until the host is probed successfully after `circuit_reset` seconds.
+    When given `prewarm`, each worker opens the number of connections to each host
+    of the scenarios before its first request.
+    When `stream` is enabled, results are reported in the order completed.
+    When given `window`, at most the number of scenarios are in flight,
+    and the next ones are constructed and submitted as slots free up.
+    When `ordered_by_dependency` is enabled, the cases of ordered scenarios run concurrently
+    unless they depend on each other by the context.
+    Deferred scenarios run their cases on `deferred_concurrency` threads
+    in the worker running each of them.
+
+    Raises:
+        ValueError: When HTTP/2, spooling, a Unix domain socket or pre-warming
+            is required with an `AsyncioExecutor`.
+    """
+    connect_timeout = connect_timeout if connect_timeout is not None else timeout
+    read_timeout = read_timeout if read_timeout is not None else timeout
+    timeouts = Timeouts(connect=connect_timeout, read=read_timeout, deadline=deadline)
+
+    limiter = None
+    if rate_limit is not None or max_in_flight is not None:
+        limiter = HostLimiter(rate=rate_limit, max_in_flight=max_in_flight)
+
+    budget = RetryBudget(retry_budget) if retry_budget is not None else None
+    cache = ResponseCache(cache_size) if cache_size is not None else None
+    hedging = Hedging(percentile=hedge_percentile) if hedge_percentile is not None else None
+    breaker = None
+    if circuit_breaker is not None:
+        breaker = CircuitBreaker(threshold=circuit_breaker, reset_timeout=circuit_reset)
+
+    prewarming = None
+    case_runner: Union[CaseRunner, AsyncCaseRunner]
+    if isinstance(executor, AsyncioExecutor):
+        if http2:
+            raise ValueError("HTTP/2 is not supported by the async executor")
+        if spool_threshold is not None:
+            raise ValueError("Spooling is not supported by the async executor")
+        if is_unix_url(base_url):
+            raise ValueError("Unix domain sockets are not supported by the async executor")
+        if prewarm is not None:
+            raise ValueError("Pre-warming is not supported by the async executor")
+        async_requester = AsyncRequester(
+            base_url=base_url,
+            timeout=timeouts,
+            detect_charset=detect_charset,
+            limiter=limiter,
+            cassette=cassette,
+            cache=cache,
+            compress_threshold=compress_threshold,
+            hedging=hedging,
+            breaker=breaker,
+        )
+        async_unit_runner = AsyncUnitRunner(
+            requester=async_requester,
+            retry=retry,
+            delay=delay,
+            backoff=backoff,
+            max_delay=max_delay,
+            budget=budget,
+        )
+        case_runner = AsyncCaseRunner(unit_runner=async_unit_runner, listener=listener)
+    else:
+        if prewarm is not None:
+            prewarming = Prewarming(prewarm, base_url=base_url, timeout=connect_timeout)
+        session_factory = SessionFactory(
+            pool_size=pool_size,
+            keep_alive=keep_alive,
+            http2=http2,
+            prewarming=prewarming,
+        )
+        requester = Requester(
+            base_url=base_url,
+            timeout=timeouts,
+            session_factory=session_factory,
+            spool_threshold=spool_threshold,
+            detect_charset=detect_charset,
+            limiter=limiter,
+            cassette=cassette,
+            cache=cache,
+            compressed=compressed,
+            compress_threshold=compress_threshold,
+            hedging=hedging,
+            breaker=breaker,
+        )
+        unit_runner = UnitRunner(
+            requester=requester,
+            retry=retry,
+            delay=delay,
+            backoff=backoff,
+            max_delay=max_delay,
+            budget=budget,
+        )
+        case_runner = CaseRunner(unit_runner=unit_runner, listener=listener)
+    if concurrency_controller:
+        executor = AdaptiveExecutor(executor, concurrency_controller)
+    runner = ScenarioRunner(
+        executor=executor,
+        case_runner=case_runner,
+        ordered_by_dependency=ordered_by_dependency,
+        deferred_concurrency=deferred_concurrency,
+    )
+    return ScenarioScheduler(
+        runner=runner,
+        listener=listener,
+        prewarming=prewarming,
+        streaming=stream,
+        window=window,
+    )
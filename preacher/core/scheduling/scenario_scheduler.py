@@ -1,6 +1,10 @@
-from typing import Iterable, Iterator, Optional
+from collections import deque
+from itertools import chain, islice
+from queue import Queue
+from typing import Deque, Iterable, Iterator, Optional, Union
 
-from preacher.core.scenario import Scenario
+from preacher.core.request import Prewarming
+from preacher.core.scenario import DeferredScenario, Scenario
 from preacher.core.scenario import ScenarioRunner
 from preacher.core.scenario import ScenarioResult
 from preacher.core.scenario import ScenarioTask
@@ -8,24 +12,68 @@ from preacher.core.scenario.scenario_task import StaticScenarioTask
 from preacher.core.status import Status
 from .listener import Listener
 
+_Entry = Union[Scenario, DeferredScenario, ScenarioResult]
+
 
 class ScenarioScheduler:
-    def __init__(self, runner: ScenarioRunner, listener: Optional[Listener] = None):
+    def __init__(
+        self,
+        runner: ScenarioRunner,
+        listener: Optional[Listener] = None,
+        prewarming: Optional[Prewarming] = None,
+        streaming: bool = False,
+        window: Optional[int] = None,
+    ):
+        """
+        Args:
+            runner: A scenario runner.
+            listener: A listener of the results.
+            prewarming: The hosts to open connections to in advance.
+                When given, the scenarios in the first window are constructed before running,
+                and the hosts of their requests are added to it.
+                The hosts of the following scenarios are added as they are constructed.
+            streaming: Whether to give the results to the listener in the order completed,
+                instead of in the order of the scenarios.
+            window: The max number of scenarios in flight.
+                Scenarios are constructed and submitted lazily as the running ones complete.
+                When not streaming, the completed ones count until their results are reported
+                in order, and so at most this number of scenarios are held.
+                ``None`` means no limit.
+        Raises:
+            ValueError: when given an invalid window.
+        """
+        if window is not None and window < 1:
+            raise ValueError(f"`window` must be positive, given {window}")
+
         self._runner = runner
         self._listener = listener or Listener()
+        self._prewarming = prewarming
+        self._streaming = streaming
+        self._window = window
 
-    def run(self, scenarios: Iterable[Scenario]) -> Status:
+    def run(self, scenarios: Iterable[Union[Scenario, DeferredScenario]]) -> Status:
         """
         Run the scenarios.
 
         Args:
             scenarios: An iterator of scenarios,
                 which can raise `Exception` for each iteration.
+                Deferred scenarios are constructed and run wholly in workers.
         Returns:
             The execution status.
         """
-        tasks = self._submit_all(scenarios)
-        results = (task.result() for task in list(tasks))
+        entries: Iterator[_Entry] = _construct_all(scenarios)
+        prewarming = self._prewarming
+        if prewarming:
+            head = list(islice(entries, self._window))
+            for entry in head:
+                _add_hosts_of(prewarming, entry)
+            entries = chain(head, _adding_hosts(prewarming, entries))
+
+        if self._streaming:
+            results = self._stream(entries)
+        else:
+            results = self._in_order(entries)
 
         status = Status.SKIPPED
         for result in results:
@@ -35,20 +83,91 @@ class ScenarioScheduler:
         self._listener.on_end(status)
         return status
 
-    def _submit_all(self, scenarios: Iterable[Scenario]) -> Iterator[ScenarioTask]:
-        iterator = iter(scenarios)
+    def _in_order(self, entries: Iterator[_Entry]) -> Iterator[ScenarioResult]:
+        if self._window is None:
+            tasks = [self._submit(entry) for entry in entries]
+            for task in tasks:
+                yield task.result()
+            return
+
+        # Finished scenarios hold their slots until reported not to pile up behind a slow one.
+        submitted: Deque[ScenarioTask] = deque()
+        while True:
+            while len(submitted) < self._window:
+                entry = next(entries, None)
+                if entry is None:
+                    break
+                submitted.append(self._submit(entry))
+
+            if not submitted:
+                return
+            yield submitted.popleft().result()
+
+    def _stream(self, entries: Iterator[_Entry]) -> Iterator[ScenarioResult]:
+        for task in self._complete(entries):
+            yield task.result()
+
+    def _complete(self, entries: Iterator[_Entry]) -> Iterator[ScenarioTask]:
+        """Submits the entries within the window and iterates the tasks in the order completed."""
+        completed: "Queue[ScenarioTask]" = Queue()
+        in_flight = 0
+        exhausted = False
         while True:
-            try:
-                scenario = next(iterator)
-            except StopIteration:
-                break
-            except Exception as error:
-                result = ScenarioResult(
-                    label="Not a constructed scenario",
-                    status=Status.FAILURE,
-                    message=f"{error.__class__.__name__}: {error}",
-                )
-                yield StaticScenarioTask(result)
-                continue
-
-            yield self._runner.submit(scenario)
+            while not exhausted and (self._window is None or in_flight < self._window):
+                entry = next(entries, None)
+                if entry is None:
+                    exhausted = True
+                    break
+                task = self._submit(entry)
+                task.add_done_callback(completed.put)
+                in_flight += 1
+
+            if not in_flight:
+                return
+            task = completed.get()
+            in_flight -= 1
+            yield task
+
+    def _submit(self, entry: _Entry) -> ScenarioTask:
+        if isinstance(entry, ScenarioResult):
+            return StaticScenarioTask(entry)
+        if isinstance(entry, DeferredScenario):
+            return self._runner.submit_deferred(entry)
+        return self._runner.submit(entry)
+
+
+def _construct_all(scenarios: Iterable[Union[Scenario, DeferredScenario]]) -> Iterator[_Entry]:
+    iterator = iter(scenarios)
+    while True:
+        try:
+            scenario = next(iterator)
+        except StopIteration:
+            break
+        except Exception as error:
+            yield ScenarioResult(
+                label="Not a constructed scenario",
+                status=Status.FAILURE,
+                message=f"{error.__class__.__name__}: {error}",
+            )
+            continue
+
+        yield scenario
+
+
+def _adding_hosts(prewarming: Prewarming, entries: Iterator[_Entry]) -> Iterator[_Entry]:
+    for entry in entries:
+        _add_hosts_of(prewarming, entry)
+        yield entry
+
+
+def _add_hosts_of(prewarming: Prewarming, entry: _Entry) -> None:
+    if isinstance(entry, Scenario):
+        _add_hosts(prewarming, entry)
+
+
+def _add_hosts(prewarming: Prewarming, scenario: Scenario) -> None:
+    for case in scenario.cases:
+        if case.enabled:
+            prewarming.add(case.request.path)
+    for subscenario in scenario.subscenarios:
+        _add_hosts(prewarming, subscenario)
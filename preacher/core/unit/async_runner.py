@@ -0,0 +1,89 @@
+"""An asynchronous executor."""
+
+from dataclasses import replace
+from functools import partial
+from typing import TYPE_CHECKING, Optional
+
+from preacher.core.context import Context, closed_context
+from preacher.core.request import (
+    Backoff,
+    HostLimiter,
+    Request,
+    RetryBudget,
+    RetryOverride,
+    RetryPolicy,
+)
+from preacher.core.request.async_requester import AsyncRequester
+from preacher.core.scenario.util.retry import async_retry_while_false
+from preacher.core.verification import ResponseDescription
+from .runner import Result, retrying_delay, retrying_predicate
+
+if TYPE_CHECKING:
+    import aiohttp  # pragma: no cover
+
+
+class AsyncUnitRunner:
+    def __init__(
+        self,
+        requester: AsyncRequester,
+        retry: int = 0,
+        delay: float = 0.1,
+        backoff: Backoff = Backoff.CONSTANT,
+        max_delay: float = 60.0,
+        budget: Optional[RetryBudget] = None,
+    ):
+        """The same as `UnitRunner` except for the requester."""
+        self._requester = requester
+        self._policy = RetryPolicy(
+            retry=retry,
+            delay=delay,
+            backoff=backoff,
+            max_delay=max_delay,
+        )
+        self._budget = budget
+
+    @property
+    def base_url(self) -> str:
+        return self._requester.base_url
+
+    async def run(
+        self,
+        request: Request,
+        requirements: ResponseDescription,
+        session: Optional["aiohttp.ClientSession"] = None,
+        context: Optional[Context] = None,
+        limiter: Optional[HostLimiter] = None,
+        retry: Optional[RetryOverride] = None,
+    ) -> Result:
+        context = context if context is not None else Context()
+        policy = retry.apply(self._policy) if retry else self._policy
+        return await async_retry_while_false(
+            partial(self._execute, request, requirements, session, context, limiter),
+            attempts=policy.attempts,
+            delay=retrying_delay(policy),
+            predicate=retrying_predicate(policy, self._budget),
+        )
+
+    async def _execute(
+        self,
+        request: Request,
+        requirements: ResponseDescription,
+        session: Optional["aiohttp.ClientSession"],
+        context: Context,
+        limiter: Optional[HostLimiter],
+    ) -> Result:
+        execution, response = await self._requester.execute(
+            request,
+            session=session,
+            context=context,
+            limiter=limiter,
+        )
+        if not response:
+            return execution, None, None
+
+        with closed_context(context, starts=execution.starts):
+            verification = requirements.verify(response, context)
+
+        # The body has been downloaded by the verification if needed.
+        execution = replace(execution, timing=response.timing)
+        return execution, response, verification
@@ -1,12 +1,23 @@
 """An executor."""
 
+from dataclasses import replace
 from functools import partial
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 
 import requests
 
 from preacher.core.context import Context, closed_context
-from preacher.core.request import Request, Response, Requester, ExecutionReport
+from preacher.core.request import (
+    Backoff,
+    ExecutionReport,
+    HostLimiter,
+    Request,
+    Requester,
+    Response,
+    RetryBudget,
+    RetryOverride,
+    RetryPolicy,
+)
 from preacher.core.scenario.util.retry import retry_while_false
 from preacher.core.verification import ResponseDescription, ResponseVerification
 
@@ -22,32 +33,101 @@ def predicate(result: Result) -> bool:
     return verification.status.is_succeeded
 
 
-class UnitRunner:
-    def __init__(self, requester: Requester, retry: int = 0, delay: float = 0.1):
-        if retry < 0:
-            raise ValueError(f"`retry` must be zero or positive, given {retry}")
+def closing_predicate(result: Result) -> bool:
+    """The same as `predicate`, but closes the responses to be discarded by retrying."""
+    succeeded = predicate(result)
+    _, response, _ = result
+    if not succeeded and response:
+        response.close()
+    return succeeded
+
+
+def retrying_predicate(
+    policy: RetryPolicy,
+    budget: Optional[RetryBudget] = None,
+) -> Callable[[Result], bool]:
+    """
+    Creates a predicate that accepts a result also when retrying is not allowed
+    by the policy or the budget.
+    The responses to be discarded by retrying are closed.
+    """
+
+    def _predicate(result: Result) -> bool:
+        if predicate(result):
+            return True
+        _, response, _ = result
+        if not policy.accepts(response):
+            return True
+        if budget and not budget.acquire():
+            return True
+        return closing_predicate(result)
+
+    return _predicate
+
+
+def retrying_delay(policy: RetryPolicy) -> Callable[[int, Result], float]:
+    """Creates a function that computes the delay after a failed attempt."""
+
+    def _delay(attempt: int, result: Result) -> float:
+        _, response, _ = result
+        return policy.wait_time(attempt, response)
 
+    return _delay
+
+
+class UnitRunner:
+    def __init__(
+        self,
+        requester: Requester,
+        retry: int = 0,
+        delay: float = 0.1,
+        backoff: Backoff = Backoff.CONSTANT,
+        max_delay: float = 60.0,
+        budget: Optional[RetryBudget] = None,
+    ):
+        """
+        Args:
+            requester: A requester.
+            retry: The max count of retries.
+            delay: The delay between attempts in seconds, or the base of the exponential backoff.
+            backoff: The backoff of retries.
+            max_delay: The max delay between attempts in seconds.
+            budget: The budget of retries, which is shared by all the cases.
+        Raises:
+            ValueError: when given invalid retrying parameters.
+        """
         self._requester = requester
-        self._retry = retry
-        self._delay = delay
+        self._policy = RetryPolicy(
+            retry=retry,
+            delay=delay,
+            backoff=backoff,
+            max_delay=max_delay,
+        )
+        self._budget = budget
 
     @property
     def base_url(self) -> str:
         return self._requester.base_url
 
+    def create_session(self) -> requests.Session:
+        return self._requester.create_session()
+
     def run(
         self,
         request: Request,
         requirements: ResponseDescription,
         session: Optional[requests.Session] = None,
         context: Optional[Context] = None,
+        limiter: Optional[HostLimiter] = None,
+        retry: Optional[RetryOverride] = None,
     ) -> Result:
         context = context if context is not None else Context()
+        policy = retry.apply(self._policy) if retry else self._policy
         return retry_while_false(
-            partial(self._execute, request, requirements, session, context),
-            attempts=self._retry + 1,
-            delay=self._delay,
-            predicate=predicate,
+            partial(self._execute, request, requirements, session, context, limiter),
+            attempts=policy.attempts,
+            delay=retrying_delay(policy),
+            predicate=retrying_predicate(policy, self._budget),
         )
 
     def _execute(
@@ -56,12 +136,20 @@ class UnitRunner:
         requirements: ResponseDescription,
         session: Optional[requests.Session],
         context: Context,
+        limiter: Optional[HostLimiter],
     ) -> Result:
-        execution, response = self._requester.execute(request, session=session, context=context)
+        execution, response = self._requester.execute(
+            request,
+            session=session,
+            context=context,
+            limiter=limiter,
+        )
         if not response:
             return execution, None, None
 
         with closed_context(context, starts=execution.starts):
             verification = requirements.verify(response, context)
 
+        # The body has been downloaded by the verification if needed.
+        execution = replace(execution, timing=response.timing)
         return execution, response, verification
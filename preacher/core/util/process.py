@@ -0,0 +1,73 @@
+"""
+Process-local sharing utilities.
+"""
+
+import os
+import threading
+import uuid
+from typing import Callable, Dict, Optional, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+_LOCK = threading.Lock()
+_PID: Optional[int] = None
+_REGISTRY: Dict[str, object] = {}
+
+
+def register(key: str, obj: object) -> None:
+    """Registers an object to be restored by the key in this process."""
+    with _LOCK:
+        _registry().setdefault(key, obj)
+
+
+def restore(key: str, factory: Callable[[], T]) -> T:
+    """
+    Restores the object registered by the key in this process,
+    or creates and registers one by the factory when not registered.
+    This is useful to share the states of unpickled objects in each process.
+    """
+    with _LOCK:
+        registry = _registry()
+        obj = registry.get(key)
+        if obj is None:
+            obj = factory()
+            registry[key] = obj
+        return obj  # type: ignore
+
+
+def _registry() -> Dict[str, object]:
+    global _PID
+    # Forked processes must not share states with their parent.
+    pid = os.getpid()
+    if _PID != pid:
+        _PID = pid
+        _REGISTRY.clear()
+    return _REGISTRY
+
+
+class ProcessShared:
+    """
+    A mixin of objects shared by the threads in a process.
+    Unpickled copies of an object are restored as the object itself in the process,
+    and as one object created anew in each of the other processes,
+    so that their states are shared in each process but not between processes.
+
+    Subclasses give the arguments to create an object anew by :meth:`_shared_args`.
+    """
+
+    def _shared_args(self) -> Tuple:
+        raise NotImplementedError()  # pragma: no cover
+
+    def __reduce__(self):
+        key = self.__dict__.setdefault("_shared_key", str(uuid.uuid4()))
+        register(key, self)
+        return _restore_shared, (type(self), key, self._shared_args())
+
+
+def _restore_shared(cls: Type[ProcessShared], key: str, args: Tuple) -> ProcessShared:
+    def _create() -> ProcessShared:
+        obj = cls(*args)
+        obj.__dict__["_shared_key"] = key
+        return obj
+
+    return restore(key, _create)
@@ -22,6 +22,11 @@ class Description:
         self._predicates = predicates
         self._value_name = value_name
 
+    @property
+    def value_name(self) -> Optional[str]:
+        """The name of the context value to store the extracted value as."""
+        return self._value_name
+
     def verify(self, analyzer: Analyzer, context: Optional[Context] = None) -> Verification:
         try:
             value = self._extractor.extract(analyzer)
@@ -63,6 +63,11 @@ class ValueMatcherFactory(MatcherFactory):
         self._arg = arg
         self._value_func = value_func
 
+    @property
+    def value(self) -> Value:
+        """The value to resolve when creating a matcher."""
+        return self._ensure_value()
+
     def create(self, context: Optional[Context] = None) -> Matcher:
         resolved_value = self._ensure_value().resolve(context)
         return self._inner_factory(resolved_value)
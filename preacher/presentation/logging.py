@@ -5,7 +5,7 @@ import sys
 import uuid
 from typing import Iterable, Iterator, Optional
 
-from preacher.core.request import ExecutionReport
+from preacher.core.request import ExecutionReport, Timing
 from preacher.core.scenario import ScenarioResult, CaseResult
 from preacher.core.status import Status
 from preacher.core.verification import ResponseVerification, Verification
@@ -60,8 +60,10 @@ class LoggingReporter:
         level = _LEVEL_MAP[status]
 
         self._log(level, "Execution: %s", status)
-        if execution.message:
-            with self._nesting():
+        with self._nesting():
+            if execution.timing:
+                self._log(level, "Timing: %s", _format_timing(execution.timing))
+            if execution.message:
                 self._multi_line_message(level, execution.message)
 
     def show_response_verification(
@@ -125,6 +127,19 @@ class LoggingReporter:
         self._indent = original
 
 
+def _format_timing(timing: Timing) -> str:
+    phases = (
+        ("DNS", timing.dns),
+        ("Connect", timing.connect),
+        ("TLS", timing.tls),
+        ("TTFB", timing.ttfb),
+        ("Download", timing.download),
+    )
+    return ", ".join(
+        f"{name} {seconds * 1000:.3f} ms" for name, seconds in phases if seconds is not None
+    )
+
+
 def create_logging_reporter(
     logger: Optional[logging.Logger] = None,
     logger_name: str = "",
@@ -14,6 +14,7 @@ from pytest import fixture
 
 from preacher.app.cli.app import app
 from preacher.app.cli.executor import ExecutorFactory
+from preacher.core.request import Cassette, CassetteMode
 from preacher.core.scenario import Scenario
 from preacher.core.scheduling import ScenarioScheduler
 from preacher.core.status import Status
@@ -70,6 +71,9 @@ def test_app_normal(mocker, base_dir, executor, executor_factory):
     scheduler = NonCallableMock(ScenarioScheduler)
     scheduler.run.side_effect = _run
     scheduler_ctor = mocker.patch(f"{PKG}.create_scheduler", return_value=scheduler)
+    controller_ctor = mocker.patch(f"{PKG}.AimdController", return_value=sentinel.controller)
+    cassette = NonCallableMock(Cassette)
+    cassette_ctor = mocker.patch(f"{PKG}.Cassette", return_value=cassette)
 
     exit_code = app(
         paths=sentinel.paths,
@@ -79,9 +83,36 @@ def test_app_normal(mocker, base_dir, executor, executor_factory):
         report_dir=sentinel.report_dir,
         retry=sentinel.retry,
         delay=sentinel.delay,
+        backoff=sentinel.backoff,
+        max_delay=sentinel.max_delay,
+        retry_budget=sentinel.retry_budget,
         timeout=sentinel.timeout,
+        connect_timeout=sentinel.connect_timeout,
+        read_timeout=sentinel.read_timeout,
+        deadline=sentinel.deadline,
         concurrency=sentinel.concurrency,
         executor_factory=executor_factory,
+        pool_size=sentinel.pool_size,
+        keep_alive=sentinel.keep_alive,
+        http2=sentinel.http2,
+        spool_threshold=sentinel.spool_threshold,
+        detect_charset=sentinel.detect_charset,
+        rate_limit=sentinel.rate_limit,
+        max_in_flight=sentinel.max_in_flight,
+        adaptive_concurrency=True,
+        record_dir=sentinel.record_dir,
+        replay_dir=sentinel.replay_dir,
+        cache_size=sentinel.cache_size,
+        compressed=sentinel.compressed,
+        compress_threshold=sentinel.compress_threshold,
+        hedge_percentile=sentinel.hedge_percentile,
+        circuit_breaker=sentinel.circuit_breaker,
+        circuit_reset=sentinel.circuit_reset,
+        prewarm=sentinel.prewarm,
+        stream=sentinel.stream,
+        window=sentinel.window,
+        worker_compilation=False,
+        ordered_by_dependency=sentinel.ordered_by_dependency,
         plugins=sentinel.plugins,
         verbosity=sentinel.verbosity,
     )
@@ -113,9 +144,38 @@ def test_app_normal(mocker, base_dir, executor, executor_factory):
         listener=sentinel.listener,
         base_url=sentinel.base_url,
         timeout=sentinel.timeout,
+        connect_timeout=sentinel.connect_timeout,
+        read_timeout=sentinel.read_timeout,
+        deadline=sentinel.deadline,
         retry=sentinel.retry,
         delay=sentinel.delay,
+        backoff=sentinel.backoff,
+        max_delay=sentinel.max_delay,
+        retry_budget=sentinel.retry_budget,
+        pool_size=sentinel.pool_size,
+        keep_alive=sentinel.keep_alive,
+        http2=sentinel.http2,
+        spool_threshold=sentinel.spool_threshold,
+        detect_charset=sentinel.detect_charset,
+        rate_limit=sentinel.rate_limit,
+        max_in_flight=sentinel.max_in_flight,
+        concurrency_controller=sentinel.controller,
+        cassette=cassette,
+        cache_size=sentinel.cache_size,
+        compressed=sentinel.compressed,
+        compress_threshold=sentinel.compress_threshold,
+        hedge_percentile=sentinel.hedge_percentile,
+        circuit_breaker=sentinel.circuit_breaker,
+        circuit_reset=sentinel.circuit_reset,
+        prewarm=sentinel.prewarm,
+        stream=sentinel.stream,
+        window=sentinel.window,
+        ordered_by_dependency=sentinel.ordered_by_dependency,
+        deferred_concurrency=sentinel.concurrency,
     )
+    controller_ctor.assert_called_once_with(max_limit=sentinel.concurrency)
+    cassette_ctor.assert_called_once_with(sentinel.replay_dir, CassetteMode.REPLAY)
+    cassette.close.assert_called_once_with()
     executor_factory.create.assert_called_once_with(sentinel.concurrency)
     scheduler.run.assert_called_once()
     executor.__exit__.assert_called_once()
@@ -146,3 +206,37 @@ def test_app_scenario_running_raises_an_unexpected_error(mocker, executor_factor
     assert exit_code == 3
 
     executor.__exit__.assert_called_once()
+
+
+def test_app_worker_compilation(mocker, executor_factory):
+    mocker.patch(f"{PKG}.get_plugin_manager", return_value=sentinel.plugin_manager)
+    mocker.patch(f"{PKG}.load_plugins")
+    load_from_paths = mocker.patch(f"{PKG}.load_from_paths")
+    reference_scenarios = mocker.patch(f"{PKG}.reference_scenarios")
+    reference_scenarios.return_value = iter([sentinel.reference])
+
+    def _run(scenarios: Iterable[Scenario]) -> Status:
+        assert list(scenarios) == [sentinel.reference]
+        return Status.SUCCESS
+
+    scheduler = NonCallableMock(ScenarioScheduler)
+    scheduler.run.side_effect = _run
+    mocker.patch(f"{PKG}.create_scheduler", return_value=scheduler)
+
+    exit_code = app(
+        paths=sentinel.paths,
+        arguments=sentinel.args,
+        executor_factory=executor_factory,
+        worker_compilation=True,
+        plugins=sentinel.plugins,
+    )
+    assert exit_code == 0
+
+    reference_scenarios.assert_called_once_with(
+        sentinel.paths,
+        arguments=sentinel.args,
+        plugins=sentinel.plugins,
+        plugin_manager=sentinel.plugin_manager,
+        logger=ANY,
+    )
+    load_from_paths.assert_not_called()
@@ -1,6 +1,13 @@
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
-from preacher.app.cli.executor import PROCESS_POOL_FACTORY, THREAD_POOL_FACTORY
+from pytest import raises
+
+from preacher.app.cli.executor import PROCESS_POOL_FACTORY, THREAD_POOL_FACTORY, ASYNCIO_FACTORY
+from preacher.app.cli.executor import HYBRID_POOL_FACTORY, HybridPoolFactory
+from preacher.core.scenario.util.async_concurrency import AsyncioExecutor
+from preacher.core.scenario.util.hybrid import HybridExecutor
+
+PKG = "preacher.app.cli.executor"
 
 
 def test_process_pool_factory():
@@ -11,3 +18,29 @@ def test_process_pool_factory():
 def test_thread_pool_factory():
     executor = THREAD_POOL_FACTORY.create(1)
     assert isinstance(executor, ThreadPoolExecutor)
+
+
+def test_asyncio_factory():
+    with ASYNCIO_FACTORY.create(1) as executor:
+        assert isinstance(executor, AsyncioExecutor)
+
+
+def test_asyncio_factory_without_aiohttp(mocker):
+    mocker.patch(f"{PKG}.AsyncRequester.is_available", return_value=False)
+    with raises(RuntimeError):
+        ASYNCIO_FACTORY.create(1)
+
+
+def test_hybrid_pool_factory(mocker):
+    mocker.patch(f"{PKG}.os.cpu_count", return_value=4)
+
+    with HYBRID_POOL_FACTORY.create(10) as executor:
+        assert isinstance(executor, HybridExecutor)
+        assert executor.processes == 4
+        assert executor.threads == 10
+
+    with HYBRID_POOL_FACTORY.create(2) as executor:
+        assert executor.processes == 2
+
+    with HybridPoolFactory(processes=3).create(6) as executor:
+        assert executor.processes == 3
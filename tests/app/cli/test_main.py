@@ -7,6 +7,7 @@ from pytest import fixture, mark
 from preacher.app.cli.executor import PROCESS_POOL_FACTORY, THREAD_POOL_FACTORY
 from preacher.app.cli.main import main
 from preacher.core.status import Status
+from preacher.core.request import Backoff
 
 PKG = "preacher.app.cli.main"
 
@@ -50,12 +51,37 @@ def test_show_and_exit(args):
         ["--retry", "-1"],
         ["-d", "foo"],
         ["--delay", "-0.1"],
+        ["--backoff", "linear"],
+        ["--max-delay", "-1"],
+        ["--retry-budget", "-1"],
         ["-t", "foo"],
         ["--timeout", "0.0"],
+        ["--connect-timeout", "0"],
+        ["--read-timeout", "foo"],
+        ["--deadline", "0.0"],
         ["-c", "foo"],
         ["--concurrency", "0"],
         ["-C", "foo"],
         ["--concurrent-executor", "foo"],
+        ["--adaptive-concurrency", "foo"],
+        ["--pool-size", "0"],
+        ["--spool-threshold", "-1"],
+        ["--rate-limit", "0"],
+        ["--rate-limit", "foo"],
+        ["--max-in-flight", "0"],
+        ["--replay", "invalid"],
+        ["--cache-size", "0"],
+        ["--compressed", "foo"],
+        ["--compress-threshold", "-1"],
+        ["--hedge", "0"],
+        ["--hedge", "100"],
+        ["--circuit-breaker", "0"],
+        ["--circuit-reset", "0"],
+        ["--prewarm", "0"],
+        ["--stream", "foo"],
+        ["--window", "0"],
+        ["--worker-compilation", "foo"],
+        ["--ordered-by-dependency", "foo"],
         ["-p", "invalid"],
         ["--plugin", "invalid"],
         ["dir"],
@@ -67,6 +93,35 @@ def test_given_invalid_options(args, base_dir):
     assert result.exit_code == 2
 
 
+def test_given_both_record_and_replay(mocker, base_dir):
+    app = mocker.patch(f"{PKG}.app", return_value=0)
+
+    cassette = os.path.join(base_dir, "dir")
+    result = CliRunner().invoke(main, ["--record", cassette, "--replay", cassette])
+    assert result.exit_code == 2
+    app.assert_not_called()
+
+
+def test_given_worker_compilation_without_paths(mocker):
+    app = mocker.patch(f"{PKG}.app", return_value=0)
+
+    result = CliRunner().invoke(main, ["--worker-compilation"])
+    assert result.exit_code == 2
+    app.assert_not_called()
+
+
+def test_given_worker_compilation_with_async_executor(mocker, tmp_path):
+    app = mocker.patch(f"{PKG}.app", return_value=0)
+    path = tmp_path / "scenario.yml"
+    path.write_text("label: scenario")
+
+    args = ["--worker-compilation", "--executor", "async", str(path)]
+    result = CliRunner().invoke(main, args)
+    assert result.exit_code == 2
+    assert "async executor" in result.output
+    app.assert_not_called()
+
+
 @mark.parametrize(
     "env",
     (
@@ -77,10 +132,37 @@ def test_given_invalid_options(args, base_dir):
             "PREACHER_CLI_LEVEL": "",
             "PREACHER_CLI_RETRY": "",
             "PREACHER_CLI_DELAY": "",
+            "PREACHER_CLI_BACKOFF": "",
+            "PREACHER_CLI_MAX_DELAY": "",
+            "PREACHER_CLI_RETRY_BUDGET": "",
             "PREACHER_CLI_TIMEOUT": "",
+            "PREACHER_CLI_CONNECT_TIMEOUT": "",
+            "PREACHER_CLI_READ_TIMEOUT": "",
+            "PREACHER_CLI_DEADLINE": "",
             "PREACHER_CLI_CONCURRENCY": "",
             "PREACHER_CLI_CONCURRENT_EXECUTOR": "",
             "PREACHER_CLI_PLUGIN": "",
+            "PREACHER_CLI_POOL_SIZE": "",
+            "PREACHER_CLI_KEEP_ALIVE": "",
+            "PREACHER_CLI_HTTP2": "",
+            "PREACHER_CLI_SPOOL_THRESHOLD": "",
+            "PREACHER_CLI_DETECT_CHARSET": "",
+            "PREACHER_CLI_RATE_LIMIT": "",
+            "PREACHER_CLI_MAX_IN_FLIGHT": "",
+            "PREACHER_CLI_ADAPTIVE_CONCURRENCY": "",
+            "PREACHER_CLI_RECORD": "",
+            "PREACHER_CLI_REPLAY": "",
+            "PREACHER_CLI_CACHE_SIZE": "",
+            "PREACHER_CLI_COMPRESSED": "",
+            "PREACHER_CLI_COMPRESS_THRESHOLD": "",
+            "PREACHER_CLI_HEDGE": "",
+            "PREACHER_CLI_CIRCUIT_BREAKER": "",
+            "PREACHER_CLI_CIRCUIT_RESET": "",
+            "PREACHER_CLI_PREWARM": "",
+            "PREACHER_CLI_STREAM": "",
+            "PREACHER_CLI_WINDOW": "",
+            "PREACHER_CLI_WORKER_COMPILATION": "",
+            "PREACHER_CLI_ORDERED_BY_DEPENDENCY": "",
         },
     ),
 )
@@ -97,9 +179,36 @@ def test_default(mocker, env):
         report_dir=None,
         retry=0,
         delay=0.1,
+        backoff=Backoff.CONSTANT,
+        max_delay=60.0,
+        retry_budget=None,
         timeout=None,
+        connect_timeout=None,
+        read_timeout=None,
+        deadline=None,
         concurrency=1,
         executor_factory=PROCESS_POOL_FACTORY,
+        pool_size=10,
+        keep_alive=True,
+        http2=False,
+        spool_threshold=None,
+        detect_charset=False,
+        rate_limit=None,
+        max_in_flight=None,
+        adaptive_concurrency=False,
+        record_dir=None,
+        replay_dir=None,
+        cache_size=None,
+        compressed=False,
+        compress_threshold=None,
+        hedge_percentile=None,
+        circuit_breaker=None,
+        circuit_reset=30.0,
+        prewarm=None,
+        stream=False,
+        window=None,
+        worker_compilation=False,
+        ordered_by_dependency=False,
         plugins=(),
         verbosity=0,
     )
@@ -127,12 +236,56 @@ def test_arguments(mocker, base_dir):
         "5",
         "--delay",
         "2.5",
+        "--backoff",
+        "Exponential",
+        "--max-delay",
+        "30",
+        "--retry-budget",
+        "100",
         "--timeout",
         "3.5",
+        "--connect-timeout",
+        "1.5",
+        "--read-timeout",
+        "10",
+        "--deadline",
+        "30",
         "--concurrency",
         "4",
         "--executor",
         "thread",
+        "--adaptive-concurrency",
+        "--record",
+        os.path.join(base_dir, "cassette"),
+        "--pool-size",
+        "20",
+        "--no-keep-alive",
+        "--http2",
+        "--spool-threshold",
+        "1048576",
+        "--detect-charset",
+        "--rate-limit",
+        "2.5",
+        "--max-in-flight",
+        "3",
+        "--cache-size",
+        "65536",
+        "--compressed",
+        "--compress-threshold",
+        "1024",
+        "--hedge",
+        "95",
+        "--circuit-breaker",
+        "5",
+        "--circuit-reset",
+        "10",
+        "--prewarm",
+        "2",
+        "--stream",
+        "--window",
+        "100",
+        "--worker-compilation",
+        "--ordered-by-dependency",
         "-p",
         os.path.join(base_dir, "plugin.py"),
         "--plugin",
@@ -147,10 +300,36 @@ def test_arguments(mocker, base_dir):
         "PREACHER_CLI_LEVEL": "foo",
         "PREACHER_CLI_RETRY": "foo",
         "PREACHER_CLI_DELAY": "foo",
+        "PREACHER_CLI_BACKOFF": "foo",
+        "PREACHER_CLI_MAX_DELAY": "foo",
+        "PREACHER_CLI_RETRY_BUDGET": "foo",
         "PREACHER_CLI_TIMEOUT": "foo",
+        "PREACHER_CLI_CONNECT_TIMEOUT": "foo",
+        "PREACHER_CLI_READ_TIMEOUT": "foo",
+        "PREACHER_CLI_DEADLINE": "foo",
         "PREACHER_CLI_CONCURRENCY": "foo",
         "PREACHER_CLI_CONCURRENT_EXECUTOR": "foo",
         "PREACHER_CLI_PLUGIN": "foo",
+        "PREACHER_CLI_POOL_SIZE": "foo",
+        "PREACHER_CLI_KEEP_ALIVE": "foo",
+        "PREACHER_CLI_HTTP2": "foo",
+        "PREACHER_CLI_SPOOL_THRESHOLD": "foo",
+        "PREACHER_CLI_DETECT_CHARSET": "foo",
+        "PREACHER_CLI_RATE_LIMIT": "foo",
+        "PREACHER_CLI_MAX_IN_FLIGHT": "foo",
+        "PREACHER_CLI_ADAPTIVE_CONCURRENCY": "foo",
+        "PREACHER_CLI_RECORD": "foo",
+        "PREACHER_CLI_CACHE_SIZE": "foo",
+        "PREACHER_CLI_COMPRESSED": "foo",
+        "PREACHER_CLI_COMPRESS_THRESHOLD": "foo",
+        "PREACHER_CLI_HEDGE": "foo",
+        "PREACHER_CLI_CIRCUIT_BREAKER": "foo",
+        "PREACHER_CLI_CIRCUIT_RESET": "foo",
+        "PREACHER_CLI_PREWARM": "foo",
+        "PREACHER_CLI_STREAM": "foo",
+        "PREACHER_CLI_WINDOW": "foo",
+        "PREACHER_CLI_WORKER_COMPILATION": "foo",
+        "PREACHER_CLI_ORDERED_BY_DEPENDENCY": "foo",
     }
     result = CliRunner().invoke(main, args=args, env=env)
     assert result.exit_code == 0
@@ -162,9 +341,36 @@ def test_arguments(mocker, base_dir):
         report_dir=os.path.join(base_dir, "report"),
         retry=5,
         delay=2.5,
+        backoff=Backoff.EXPONENTIAL,
+        max_delay=30.0,
+        retry_budget=100,
         timeout=3.5,
+        connect_timeout=1.5,
+        read_timeout=10.0,
+        deadline=30.0,
         concurrency=4,
         executor_factory=THREAD_POOL_FACTORY,
+        pool_size=20,
+        keep_alive=False,
+        http2=True,
+        spool_threshold=1048576,
+        detect_charset=True,
+        rate_limit=2.5,
+        max_in_flight=3,
+        adaptive_concurrency=True,
+        record_dir=os.path.join(base_dir, "cassette"),
+        replay_dir=None,
+        cache_size=65536,
+        compressed=True,
+        compress_threshold=1024,
+        hedge_percentile=95.0,
+        circuit_breaker=5,
+        circuit_reset=10.0,
+        prewarm=2,
+        stream=True,
+        window=100,
+        worker_compilation=True,
+        ordered_by_dependency=True,
         plugins=(os.path.join(base_dir, "plugin.py"), os.path.join(base_dir, "dir")),
         verbosity=1,
     )
@@ -180,9 +386,35 @@ def test_environ(mocker, base_dir):
         "PREACHER_CLI_REPORT": "reports/",
         "PREACHER_CLI_RETRY": "10",
         "PREACHER_CLI_DELAY": "1.2",
+        "PREACHER_CLI_BACKOFF": "exponential",
+        "PREACHER_CLI_MAX_DELAY": "10",
+        "PREACHER_CLI_RETRY_BUDGET": "0",
         "PREACHER_CLI_TIMEOUT": "3.4",
+        "PREACHER_CLI_CONNECT_TIMEOUT": "0.5",
+        "PREACHER_CLI_READ_TIMEOUT": "2",
+        "PREACHER_CLI_DEADLINE": "5.5",
         "PREACHER_CLI_CONCURRENCY": "5",
         "PREACHER_CLI_CONCURRENT_EXECUTOR": "thread",
+        "PREACHER_CLI_POOL_SIZE": "3",
+        "PREACHER_CLI_KEEP_ALIVE": "false",
+        "PREACHER_CLI_HTTP2": "true",
+        "PREACHER_CLI_SPOOL_THRESHOLD": "0",
+        "PREACHER_CLI_DETECT_CHARSET": "true",
+        "PREACHER_CLI_RATE_LIMIT": "10",
+        "PREACHER_CLI_MAX_IN_FLIGHT": "1",
+        "PREACHER_CLI_ADAPTIVE_CONCURRENCY": "true",
+        "PREACHER_CLI_REPLAY": os.path.join(base_dir, "dir"),
+        "PREACHER_CLI_CACHE_SIZE": "1024",
+        "PREACHER_CLI_COMPRESSED": "true",
+        "PREACHER_CLI_COMPRESS_THRESHOLD": "0",
+        "PREACHER_CLI_HEDGE": "99.9",
+        "PREACHER_CLI_CIRCUIT_BREAKER": "3",
+        "PREACHER_CLI_CIRCUIT_RESET": "1.5",
+        "PREACHER_CLI_PREWARM": "4",
+        "PREACHER_CLI_STREAM": "true",
+        "PREACHER_CLI_WINDOW": "1000",
+        "PREACHER_CLI_WORKER_COMPILATION": "false",
+        "PREACHER_CLI_ORDERED_BY_DEPENDENCY": "true",
         "PREACHER_CLI_PLUGIN": ":".join(
             (
                 os.path.join(base_dir, "plugin.py"),
@@ -200,9 +432,36 @@ def test_environ(mocker, base_dir):
         report_dir="reports/",
         retry=10,
         delay=1.2,
+        backoff=Backoff.EXPONENTIAL,
+        max_delay=10.0,
+        retry_budget=0,
         timeout=3.4,
+        connect_timeout=0.5,
+        read_timeout=2.0,
+        deadline=5.5,
         concurrency=5,
         executor_factory=THREAD_POOL_FACTORY,
+        pool_size=3,
+        keep_alive=False,
+        http2=True,
+        spool_threshold=0,
+        detect_charset=True,
+        rate_limit=10.0,
+        max_in_flight=1,
+        adaptive_concurrency=True,
+        record_dir=None,
+        replay_dir=os.path.join(base_dir, "dir"),
+        cache_size=1024,
+        compressed=True,
+        compress_threshold=0,
+        hedge_percentile=99.9,
+        circuit_breaker=3,
+        circuit_reset=1.5,
+        prewarm=4,
+        stream=True,
+        window=1000,
+        worker_compilation=False,
+        ordered_by_dependency=True,
         plugins=(os.path.join(base_dir, "plugin.py"), os.path.join(base_dir, "dir")),
         verbosity=0,
     )
@@ -1,6 +1,7 @@
 from click import Option
 
-from preacher.app.cli.executor import PROCESS_POOL_FACTORY, THREAD_POOL_FACTORY
+from preacher.app.cli.executor import PROCESS_POOL_FACTORY, THREAD_POOL_FACTORY, ASYNCIO_FACTORY
+from preacher.app.cli.executor import HYBRID_POOL_FACTORY
 from preacher.app.cli.option import LevelType, ExecutorFactoryType
 from preacher.core.status import Status
 
@@ -25,9 +26,13 @@ def test_executor_factory_type():
     tp = ExecutorFactoryType()
 
     param = Option(["--executor"])
-    assert tp.get_metavar(param) == "[process|thread]"
-    assert tp.get_missing_message(param) == "Choose from:\n\tprocess,\n\tthread"
+    assert tp.get_metavar(param) == "[process|thread|hybrid|async]"
+    assert tp.get_missing_message(param) == (
+        "Choose from:\n\tprocess,\n\tthread,\n\thybrid,\n\tasync"
+    )
 
     assert tp.convert("process", None, None) is PROCESS_POOL_FACTORY
     assert tp.convert("Thread", None, None) is THREAD_POOL_FACTORY
+    assert tp.convert("hybrid", None, None) is HYBRID_POOL_FACTORY
+    assert tp.convert("ASYNC", None, None) is ASYNCIO_FACTORY
     assert tp.convert(PROCESS_POOL_FACTORY, None, None) is PROCESS_POOL_FACTORY
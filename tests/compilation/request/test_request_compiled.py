@@ -2,7 +2,7 @@ from unittest.mock import Mock, NonCallableMock, sentinel
 
 from preacher.compilation.request.request import RequestCompiled
 from preacher.compilation.request.request_body import RequestBodyCompiled
-from preacher.core.request import Method
+from preacher.core.request import Method, Timeouts
 
 PKG = "preacher.compilation.request.request"
 
@@ -14,6 +14,8 @@ def test_replace():
         headers=sentinel.initial_headers,
         params=sentinel.initial_params,
         body=sentinel.initial_body,
+        cache=sentinel.initial_cache,
+        timeouts=Timeouts(connect=1.0, read=2.0),
     )
 
     other = RequestCompiled()
@@ -23,6 +25,8 @@ def test_replace():
     assert replaced.headers is sentinel.initial_headers
     assert replaced.params is sentinel.initial_params
     assert replaced.body is sentinel.initial_body
+    assert replaced.cache is sentinel.initial_cache
+    assert replaced.timeouts == Timeouts(connect=1.0, read=2.0)
 
     other = RequestCompiled(
         method=sentinel.method,
@@ -30,6 +34,8 @@ def test_replace():
         headers=sentinel.headers,
         params=sentinel.params,
         body=sentinel.body,
+        cache=sentinel.cache,
+        timeouts=Timeouts(read=3.0, deadline=4.0),
     )
     replaced = initial.replace(other)
     assert replaced.method is sentinel.method
@@ -37,6 +43,11 @@ def test_replace():
     assert replaced.headers is sentinel.headers
     assert replaced.params is sentinel.params
     assert replaced.body is sentinel.body
+    assert replaced.cache is sentinel.cache
+    assert replaced.timeouts == Timeouts(connect=1.0, read=3.0, deadline=4.0)
+
+    replaced = RequestCompiled().replace(other)
+    assert replaced.timeouts == Timeouts(read=3.0, deadline=4.0)
 
 
 def test_fix_hollow(mocker):
@@ -52,6 +63,8 @@ def test_fix_hollow(mocker):
         headers=None,
         params=None,
         body=None,
+        cache=True,
+        timeouts=None,
     )
 
 
@@ -66,6 +79,8 @@ def test_fix_filled(mocker):
         headers=sentinel.headers,
         params=sentinel.params,
         body=body,
+        cache=False,
+        timeouts=sentinel.timeouts,
     )
     fixed = compiled.fix()
     assert fixed is sentinel.fixed
@@ -76,5 +91,7 @@ def test_fix_filled(mocker):
         headers=sentinel.headers,
         params=sentinel.params,
         body=sentinel.body,
+        cache=False,
+        timeouts=sentinel.timeouts,
     )
     body.fix.assert_called_once_with()
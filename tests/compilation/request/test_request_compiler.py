@@ -6,7 +6,7 @@ from preacher.compilation.argument import Argument
 from preacher.compilation.error import CompilationError, NamedNode, IndexedNode
 from preacher.compilation.request.request import RequestCompiler, RequestCompiled
 from preacher.compilation.request.request_body import RequestBodyCompiler
-from preacher.core.request import Method
+from preacher.core.request import Method, Timeouts
 
 PKG = "preacher.compilation.request.request"
 
@@ -26,6 +26,7 @@ def default() -> RequestCompiled:
         headers=sentinel.default_headers,
         params=sentinel.default_params,
         body=sentinel.default_body,
+        cache=sentinel.default_cache,
     )
 
 
@@ -44,6 +45,9 @@ def compiler(body, default: RequestCompiled) -> RequestCompiler:
         ({"headers": ""}, [NamedNode("headers")]),
         ({"headers": {"int": 1}}, [NamedNode("headers")]),
         ({"headers": {1: "not-a-string-key"}}, [NamedNode("headers")]),
+        ({"cache": "false"}, [NamedNode("cache")]),
+        ({"timeout": -1}, [NamedNode("timeout")]),
+        ({"timeout": {"read": "1"}}, [NamedNode("timeout"), NamedNode("read")]),
     ),
 )
 def test_given_an_invalid_obj(compiler: RequestCompiler, obj, expected_path):
@@ -59,6 +63,8 @@ def test_given_an_empty_mapping(compiler: RequestCompiler):
     assert compiled.headers is sentinel.default_headers
     assert compiled.params is sentinel.default_params
     assert compiled.body is sentinel.default_body
+    assert compiled.cache is sentinel.default_cache
+    assert compiled.timeouts is None
 
 
 @mark.parametrize(
@@ -92,6 +98,23 @@ def test_given_valid_headers(compiler: RequestCompiler, headers_obj, expected):
     assert compiled.headers == expected
 
 
+@mark.parametrize("cache_obj", (True, False))
+def test_given_a_valid_cache(compiler: RequestCompiler, cache_obj):
+    compiled = compiler.compile({"cache": Argument("cache")}, {"cache": cache_obj})
+    assert compiled.cache is cache_obj
+
+
+def test_given_timeouts(body):
+    default = RequestCompiled(timeouts=Timeouts(connect=1.0, read=2.0))
+    compiler = RequestCompiler(body=body, default=default)
+
+    compiled = compiler.compile({"timeout": Argument("timeout")}, {"timeout": 3})
+    assert compiled.timeouts == Timeouts(connect=3.0, read=3.0)
+
+    compiled = compiler.compile({"timeout": {"read": 5, "deadline": 10.5}})
+    assert compiled.timeouts == Timeouts(connect=1.0, read=5.0, deadline=10.5)
+
+
 def test_given_an_invalid_params(compiler: RequestCompiler, mocker):
     compile_params = mocker.patch(f"{PKG}.compile_url_params")
     compile_params.side_effect = CompilationError("msg", node=NamedNode("x"))
@@ -162,6 +185,7 @@ def test_of_default_no_body(compiler: RequestCompiler, body, mocker):
             headers=sentinel.new_default_headers,
             params=sentinel.new_default_params,
             body=sentinel.default_body,
+            cache=sentinel.default_cache,
         ),
     )
     body.of_default.assert_not_called()
@@ -183,6 +207,7 @@ def test_of_default_body(compiler: RequestCompiler, body, mocker):
             headers=sentinel.default_headers,
             params=sentinel.default_params,
             body=sentinel.new_default_body,
+            cache=sentinel.default_cache,
         ),
     )
     body.of_default.assert_called_once_with(sentinel.new_default_body)
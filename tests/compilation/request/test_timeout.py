@@ -0,0 +1,38 @@
+from pytest import mark, raises
+
+from preacher.compilation.error import CompilationError, NamedNode
+from preacher.compilation.request.timeout import compile_timeout
+from preacher.core.request import Timeouts
+
+
+@mark.parametrize(
+    ("obj", "expected_path"),
+    (
+        ("", []),
+        (True, []),
+        (0, []),
+        (-1.0, []),
+        ({"connect": "1"}, [NamedNode("connect")]),
+        ({"connect": 0}, [NamedNode("connect")]),
+        ({"read": -1}, [NamedNode("read")]),
+        ({"deadline": 0.0}, [NamedNode("deadline")]),
+    ),
+)
+def test_given_invalid_values(obj, expected_path):
+    with raises(CompilationError) as error_info:
+        compile_timeout(obj)
+    assert error_info.value.path == expected_path
+
+
+@mark.parametrize("obj", (2, 2.0))
+def test_given_a_number(obj):
+    assert compile_timeout(obj) == Timeouts(connect=2.0, read=2.0)
+
+
+def test_given_an_empty_object():
+    assert compile_timeout({}) == Timeouts()
+
+
+def test_given_a_filled_object():
+    timeouts = compile_timeout({"connect": 1, "read": 2.5, "deadline": 10})
+    assert timeouts == Timeouts(connect=1.0, read=2.5, deadline=10.0)
@@ -7,6 +7,7 @@ from preacher.compilation.request import RequestCompiler
 from preacher.compilation.scenario.case import CaseCompiled, CaseCompiler
 from preacher.compilation.verification.description import DescriptionCompiler
 from preacher.compilation.verification.response import ResponseDescriptionCompiler
+from preacher.core.request import RetryOverride
 
 PKG = "preacher.compilation.scenario.case"
 
@@ -46,6 +47,8 @@ def desc():
         ({"label": []}, [NamedNode("label")]),
         ({"enabled": []}, [NamedNode("enabled")]),
         ({"wait": "foo"}, [NamedNode("wait")]),
+        ({"retry": "foo"}, [NamedNode("retry")]),
+        ({"retry": {"count": -1}}, [NamedNode("retry"), NamedNode("count")]),
     ),
 )
 def test_given_invalid_values(compiler: CaseCompiler, value, expected_path):
@@ -89,6 +92,7 @@ def test_given_an_empty_object(compiler: CaseCompiler, req, res):
     assert compiled.request is None
     assert compiled.response is None
     assert compiled.wait is None
+    assert compiled.retry is None
 
     req.compile.assert_not_called()
     res.compile.assert_not_called()
@@ -103,6 +107,7 @@ def test_creates_a_case(compiler: CaseCompiler, req, res, desc):
             "request": {"path": "/path"},
             "response": {"key": "value"},
             "wait": "2 minutes",
+            "retry": 2,
         }
     )
     assert compiled.label == "label"
@@ -112,6 +117,7 @@ def test_creates_a_case(compiler: CaseCompiler, req, res, desc):
     assert compiled.response is sentinel.response
     assert compiled.wait
     assert compiled.wait.total_seconds() == 120.0
+    assert compiled.retry == RetryOverride(retry=2)
 
     req.compile.assert_called_once_with({"path": "/path"})
     res.compile.assert_called_once_with({"key": "value"})
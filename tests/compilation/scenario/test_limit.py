@@ -0,0 +1,37 @@
+from pytest import mark, raises
+
+from preacher.compilation.error import CompilationError, NamedNode
+from preacher.compilation.scenario.limit import compile_limiter
+
+
+@mark.parametrize(
+    ("obj", "expected_path"),
+    (
+        ("", []),
+        ({"rate": "1"}, [NamedNode("rate")]),
+        ({"rate": True}, [NamedNode("rate")]),
+        ({"burst": 1.5}, [NamedNode("burst")]),
+        ({"max_in_flight": "2"}, [NamedNode("max_in_flight")]),
+        ({"rate": 0}, []),
+        ({"burst": 0}, []),
+        ({"max_in_flight": 0}, []),
+    ),
+)
+def test_given_invalid_values(obj, expected_path):
+    with raises(CompilationError) as error_info:
+        compile_limiter(obj)
+    assert error_info.value.path == expected_path
+
+
+def test_given_an_empty_object():
+    limiter = compile_limiter({})
+    assert limiter.rate is None
+    assert limiter.burst == 1
+    assert limiter.max_in_flight is None
+
+
+def test_given_a_filled_object():
+    limiter = compile_limiter({"rate": 2, "burst": 3, "max_in_flight": 4})
+    assert limiter.rate == 2.0
+    assert limiter.burst == 3
+    assert limiter.max_in_flight == 4
@@ -0,0 +1,86 @@
+import pickle
+
+from pluggy import PluginManager
+from pytest import fixture, raises
+
+from preacher.compilation.error import CompilationError
+from preacher.compilation.scenario import reference
+from preacher.compilation.scenario.reference import ScenarioReference, reference_scenarios
+from preacher.core.scenario import Scenario
+from preacher.plugin import impl
+from preacher.plugin.manager import get_plugin_manager
+
+PKG = "preacher.compilation.scenario.reference"
+
+
+@fixture
+def plugin_manager(mocker) -> PluginManager:
+    manager = get_plugin_manager()
+    if not manager.is_registered(impl):
+        manager.register(impl)
+    mocker.patch(f"{PKG}._plugin_manager_of", return_value=manager)
+    reference._loader_of.cache_clear()
+    reference._compiler_of.cache_clear()
+    return manager
+
+
+@fixture
+def path(tmp_path) -> str:
+    path = tmp_path / "scenario.yml"
+    path.write_text(
+        "label: first\n"
+        "---\n"
+        "- label: second\n"
+        "- - label: third\n"
+        "  - label: !argument label\n"
+        "---\n"
+        "- label: fifth\n"
+        "- cases: 1\n"
+    )
+    return str(path)
+
+
+def test_reference_scenarios(path, plugin_manager):
+    references = list(
+        reference_scenarios(
+            [path],
+            arguments={"label": "fourth"},
+            plugin_manager=plugin_manager,
+        )
+    )
+    assert [(ref.document, ref.index) for ref in references] == [
+        (0, 0),
+        (1, 0),
+        (1, 1),
+        (1, 2),
+        (2, 0),
+        (2, 1),
+    ]
+    assert all(ref.path == path for ref in references)
+    assert all(ref.arguments == {"label": "fourth"} for ref in references)
+    assert all(ref.plugins == () for ref in references)
+
+    labels = [scenario.label for scenario in (ref.construct() for ref in references[:5])]
+    assert labels == ["first", "second", "third", "fourth", "fifth"]
+
+
+def test_reference_is_compiled_once(path, plugin_manager):
+    reference = ScenarioReference(path, 1, 2, {"label": "label"})
+    scenario = reference.construct()
+    assert isinstance(scenario, Scenario)
+    assert scenario.label == "label"
+    assert reference.construct() is scenario
+
+    other = ScenarioReference(path, 1, 2, {"label": "other"})
+    assert other.construct().label == "other"
+
+
+def test_reference_is_picklable(path):
+    reference = ScenarioReference(path, 0, 0, {"label": "label"})
+    assert pickle.loads(pickle.dumps(reference)) == reference
+
+
+def test_reference_compilation_error(path, plugin_manager):
+    with raises(CompilationError) as error_info:
+        ScenarioReference(path, 2, 1).construct()
+    assert error_info.value.render_path() == "[1].cases[0]"
@@ -0,0 +1,44 @@
+from pytest import mark, raises
+
+from preacher.compilation.error import CompilationError, NamedNode
+from preacher.compilation.scenario.retry import compile_retry
+from preacher.core.request import Backoff, RetryOverride
+
+
+@mark.parametrize(
+    ("obj", "expected_path"),
+    (
+        ("", []),
+        (True, []),
+        (-1, [NamedNode("count")]),
+        ({"count": "1"}, [NamedNode("count")]),
+        ({"count": -1}, [NamedNode("count")]),
+        ({"delay": "1"}, [NamedNode("delay")]),
+        ({"delay": -0.1}, [NamedNode("delay")]),
+        ({"backoff": 1}, [NamedNode("backoff")]),
+        ({"backoff": "linear"}, [NamedNode("backoff")]),
+        ({"max_delay": -1}, [NamedNode("max_delay")]),
+    ),
+)
+def test_given_invalid_values(obj, expected_path):
+    with raises(CompilationError) as error_info:
+        compile_retry(obj)
+    assert error_info.value.path == expected_path
+
+
+def test_given_an_integer():
+    assert compile_retry(3) == RetryOverride(retry=3)
+
+
+def test_given_an_empty_object():
+    assert compile_retry({}) == RetryOverride()
+
+
+def test_given_a_filled_object():
+    override = compile_retry({"count": 2, "delay": 1, "backoff": "Exponential", "max_delay": 5})
+    assert override == RetryOverride(
+        retry=2,
+        delay=1.0,
+        backoff=Backoff.EXPONENTIAL,
+        max_delay=5.0,
+    )
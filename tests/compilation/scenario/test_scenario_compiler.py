@@ -5,7 +5,7 @@ from pytest import mark, raises, fixture
 from preacher.compilation.argument import Argument
 from preacher.compilation.error import CompilationError, NamedNode, IndexedNode
 from preacher.compilation.parameter import Parameter
-from preacher.compilation.scenario.case import CaseCompiler
+from preacher.compilation.scenario.case import CaseCompiler, CaseCompiled
 from preacher.compilation.scenario.scenario import ScenarioCompiler
 from preacher.compilation.verification import DescriptionCompiler
 
@@ -52,6 +52,7 @@ def sub_case():
         ("", []),
         ({"label": []}, [NamedNode("label")]),
         ({"ordered": 1}, [NamedNode("ordered")]),
+        ({"limit": ""}, [NamedNode("limit")]),
         ({"parameters": ""}, [NamedNode("parameters"), IndexedNode(0)]),
         ({"subscenarios": ""}, [NamedNode("subscenarios"), IndexedNode(0)]),
     ),
@@ -140,6 +141,41 @@ def test_given_a_filled_object(
     sub_case.compile_fixed.assert_called_once_with({"e": "v7"})
 
 
+def test_given_a_limit(compiler: ScenarioCompiler, case, case_of_default, mocker):
+    mocker.patch(f"{PKG}.Scenario", return_value=sentinel.scenario)
+    compile_limiter = mocker.patch(f"{PKG}.compile_limiter", return_value=sentinel.limiter)
+    limited_case = NonCallableMock(CaseCompiler)
+    limited_case.compile_default.return_value = case_of_default
+    case.of_default.return_value = limited_case
+
+    scenario = compiler.compile(
+        {"limit": {"rate": Argument("rate")}, "cases": [{}]},
+        arguments={"rate": 1.5},
+    )
+    assert scenario is sentinel.scenario
+
+    compile_limiter.assert_called_once_with({"rate": 1.5})
+    case.of_default.assert_called_once_with(CaseCompiled(limiter=sentinel.limiter))
+    case.compile_default.assert_not_called()
+    limited_case.compile_default.assert_called_once_with({})
+    case_of_default.compile_fixed.assert_called_once_with({})
+
+
+def test_given_a_limit_with_parameters(compiler: ScenarioCompiler, case, mocker):
+    mocker.patch(f"{PKG}.Scenario", return_value=sentinel.scenario)
+    compile_limiter = mocker.patch(f"{PKG}.compile_limiter", return_value=sentinel.limiter)
+    mocker.patch(f"{PKG}.compile_parameter", return_value=Parameter(label="param"))
+    limited_case = NonCallableMock(CaseCompiler)
+    case.of_default.return_value = limited_case
+
+    compiler.compile({"limit": {}, "parameters": [sentinel.param_obj1, sentinel.param_obj2]})
+
+    # The limiter is compiled once to be shared by the parameterized scenarios.
+    compile_limiter.assert_called_once_with({})
+    case.compile_default.assert_not_called()
+    limited_case.compile_default.assert_has_calls([call({}), call({})])
+
+
 def test_given_empty_parameter(compiler: ScenarioCompiler, mocker):
     ctor = mocker.patch(f"{PKG}.Scenario", return_value=sentinel.scenario)
     compile_parameter = mocker.patch(f"{PKG}.compile_parameter")
@@ -1,4 +1,4 @@
-from unittest.mock import Mock, NonCallableMock, sentinel
+from unittest.mock import Mock, NonCallableMock, PropertyMock, sentinel
 
 from pytest import fixture, raises
 
@@ -46,3 +46,16 @@ def test_for_etree(extract):
         analyzer.for_etree(extract)
 
     extract.assert_not_called()
+
+
+def test_body_is_not_accessed_until_needed(extract):
+    body = NonCallableMock(ResponseBody)
+    text = PropertyMock(return_value='{"k":"v"}')
+    type(body).text = text
+
+    analyzer = ResponseBodyAnalyzer(body)
+    text.assert_not_called()
+
+    analyzer.for_mapping(extract)
+    analyzer.for_mapping(extract)
+    text.assert_called_once_with()
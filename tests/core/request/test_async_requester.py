@@ -0,0 +1,391 @@
+import asyncio
+import gzip
+import uuid
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import AsyncIterator
+from unittest.mock import ANY, Mock, NonCallableMagicMock, NonCallableMock, sentinel
+
+import requests
+from multidict import CIMultiDict
+from pytest import fixture, raises
+
+from preacher.core.request.async_requester import AsyncRequester, StaticResponse
+from preacher.core.request.async_requester import _create_trace_config, create_client_session
+from preacher.core.request.breaker import CircuitBreaker
+from preacher.core.request.cache import ResponseCache
+from preacher.core.request.cassette import Cassette
+from preacher.core.request.hedging import Hedging
+from preacher.core.request.limit import HostLimiter
+from preacher.core.request.request import Request, Method
+from preacher.core.request.request_body import RequestBody
+from preacher.core.request.timeout import Timeouts
+from preacher.core.request.timing import Phases
+from preacher.core.status import Status
+
+PKG = "preacher.core.request.async_requester"
+
+
+class _Response:
+    def __init__(self):
+        self.status = 402
+        self.headers = CIMultiDict(
+            [
+                ("Header-Name", "v1"),
+                ("header-name", "v2"),
+                ("Content-Type", "text/plain; charset=shift_jis"),
+            ]
+        )
+
+    async def read(self) -> bytes:
+        return "東京".encode("shift_jis")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class _Session:
+    def __init__(self, error: Exception = None):
+        self.calls = []
+        self._error = error
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        if self._error:
+            raise self._error
+        return _Response()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+
+@fixture
+def body():
+    mock = NonCallableMock(RequestBody)
+    mock.content_type = "text/plain"
+    mock.resolve.return_value = {"x": "y"}
+    return mock
+
+
+def test_default_request(mocker):
+    session = _Session()
+    mocker.patch(f"{PKG}.create_client_session", return_value=session)
+
+    requester = AsyncRequester(base_url="http://base-url.org")
+    assert requester.base_url == "http://base-url.org"
+
+    report, response = asyncio.run(requester.execute(Request()))
+    assert report.status is Status.SUCCESS
+    assert report.request.method == "GET"
+    assert report.request.url == "http://base-url.org/"
+    assert report.request.headers["User-Agent"].startswith("Preacher")
+    assert report.request.body is None
+    assert response
+
+    method, url, kwargs = session.calls[0]
+    assert method == "GET"
+    assert url == "http://base-url.org/"
+    assert kwargs["headers"]["User-Agent"].startswith("Preacher")
+    assert kwargs["data"] is None
+    assert kwargs["timeout"].total is None
+
+
+def test_when_request_preparation_fails(mocker):
+    mocker.patch(f"{PKG}.now", return_value=sentinel.now)
+
+    req = NonCallableMock(requests.Request)
+    req.prepare.side_effect = RuntimeError("msg")
+    mocker.patch("requests.Request", return_value=req)
+
+    session = _Session()
+    requester = AsyncRequester("base-url")
+    execution, response = asyncio.run(requester.execute(Request(), session=session))
+
+    assert execution.status is Status.FAILURE
+    assert execution.starts is sentinel.now
+    assert execution.request is None
+    assert execution.message == "RuntimeError: msg"
+    assert response is None
+    assert not session.calls
+
+
+def test_when_request_fails():
+    session = _Session(error=RuntimeError("msg"))
+    requester = AsyncRequester("http://base.org/")
+    execution, response = asyncio.run(requester.execute(Request(), session=session))
+
+    assert execution.status is Status.UNSTABLE
+    assert execution.request.url == "http://base.org/"
+    assert execution.message == "RuntimeError: msg"
+    assert response is None
+
+
+def test_when_request_succeeds(mocker, body):
+    uuid_obj = NonCallableMagicMock(uuid.UUID)
+    uuid_obj.__str__.return_value = "id"
+    mocker.patch("uuid.uuid4", return_value=uuid_obj)
+
+    request = Request(
+        method=Method.POST,
+        path="/path",
+        headers={"k1": "v1"},
+        params={"a": ["b", "c"]},
+        body=body,
+    )
+    session = _Session()
+    requester = AsyncRequester("https://a.com", timeout=5.0)
+    report, response = asyncio.run(
+        requester.execute(request, session=session, context={"foo": "bar"})
+    )
+    assert report.status is Status.SUCCESS
+    assert report.elapsed == response.elapsed
+    assert report.timing == response.timing
+    assert report.request.method == "POST"
+    assert report.request.url == "https://a.com/path?a=b&a=c"
+    assert report.request.headers["Content-Type"] == "text/plain"
+    assert report.request.headers["k1"] == "v1"
+    assert report.request.body == "x=y"
+
+    assert isinstance(response, StaticResponse)
+    assert response.id == "id"
+    assert response.elapsed >= 0.0
+    assert response.status_code == 402
+    assert response.headers == {
+        "header-name": "v1, v2",
+        "content-type": "text/plain; charset=shift_jis",
+    }
+    assert response.body.text == "東京"
+    assert response.body.content == "東京".encode("shift_jis")
+    assert response.timing
+    assert response.timing.dns is None
+    assert response.timing.ttfb is not None
+    assert response.timing.download is not None
+
+    body.resolve.assert_called_once_with({"foo": "bar"})
+
+    method, url, kwargs = session.calls[0]
+    assert method == "POST"
+    assert url == "https://a.com/path?a=b&a=c"
+    assert kwargs["data"] == "x=y"
+    assert kwargs["timeout"].total is None
+    assert kwargs["timeout"].sock_connect == 5.0
+    assert kwargs["timeout"].sock_read == 5.0
+    assert isinstance(kwargs["trace_request_ctx"], Phases)
+
+
+def test_elapsed_until_headers(mocker):
+    # Starts, receives the headers and then finishes downloading the body.
+    mocker.patch(f"{PKG}.perf_counter", side_effect=[1.0, 1.5, 4.0])
+
+    requester = AsyncRequester("http://base")
+    report, response = asyncio.run(requester.execute(Request(), session=_Session()))
+    assert report.status is Status.SUCCESS
+    assert response.elapsed == 0.5
+    assert report.elapsed == 0.5
+    assert response.timing.download == 2.5
+
+
+def test_create_client_session():
+    async def _create():
+        async with create_client_session() as session:
+            assert session.trust_env
+            assert len(session.trace_configs) == 1
+
+    asyncio.run(_create())
+
+
+def test_trace_config():
+    config = _create_trace_config()
+    phases = Phases()
+    ctx = SimpleNamespace(trace_request_ctx=phases)
+
+    async def _trace():
+        await config.on_connection_create_start[0](None, ctx, None)
+        await config.on_dns_resolvehost_start[0](None, ctx, None)
+        await config.on_dns_resolvehost_end[0](None, ctx, None)
+        await config.on_connection_create_end[0](None, ctx, None)
+
+    asyncio.run(_trace())
+    assert phases.dns is not None
+    assert phases.connect is not None
+    assert phases.tls is None
+
+
+def test_trace_config_without_phases():
+    config = _create_trace_config()
+    ctx = SimpleNamespace(trace_request_ctx=None)
+
+    async def _trace():
+        await config.on_dns_resolvehost_start[0](None, ctx, None)
+        await config.on_dns_resolvehost_end[0](None, ctx, None)
+        await config.on_connection_create_start[0](None, ctx, None)
+        await config.on_connection_create_end[0](None, ctx, None)
+
+    asyncio.run(_trace())
+
+
+def test_is_available():
+    assert AsyncRequester.is_available()
+
+
+def test_limiters():
+    entered = []
+
+    def _limiter(name: str) -> HostLimiter:
+        @asynccontextmanager
+        async def _limit(url: str) -> AsyncIterator[None]:
+            entered.append((name, url))
+            yield
+            assert len(session.calls) == 1
+
+        return NonCallableMock(HostLimiter, async_limit=Mock(side_effect=_limit))
+
+    session = _Session()
+    requester = AsyncRequester("http://base", limiter=_limiter("requester"))
+    report, _ = asyncio.run(
+        requester.execute(Request(path="/path"), session=session, limiter=_limiter("case"))
+    )
+    assert report.status is Status.SUCCESS
+    assert entered == [("requester", "http://base/path"), ("case", "http://base/path")]
+
+
+def test_recording():
+    cassette = NonCallableMock(Cassette, replaying=False)
+    session = _Session()
+    requester = AsyncRequester("http://base", cassette=cassette)
+    report, response = asyncio.run(requester.execute(Request(path="/path"), session=session))
+    assert report.status is Status.SUCCESS
+
+    assert len(session.calls) == 1
+    cassette.record.assert_called_once_with(report.request, response)
+
+
+def test_replaying():
+    response = NonCallableMock(StaticResponse, elapsed=0.5)
+    cassette = NonCallableMock(Cassette, replaying=True)
+    cassette.replay.return_value = response
+    session = _Session()
+    requester = AsyncRequester("http://base", cassette=cassette)
+    report, actual = asyncio.run(requester.execute(Request(path="/path"), session=session))
+    assert report.status is Status.SUCCESS
+    assert report.elapsed == 0.5
+    assert actual is response
+
+    assert not session.calls
+    cassette.replay.assert_called_once_with(report.request, detect_charset=False)
+    cassette.record.assert_not_called()
+
+
+def test_cached_responses():
+    cached = NonCallableMock(StaticResponse, elapsed=0.0, timing=None)
+    cache = NonCallableMock(ResponseCache)
+    cache.lookup.return_value = ("key", cached)
+    session = _Session()
+    requester = AsyncRequester("http://base", cache=cache)
+    report, response = asyncio.run(requester.execute(Request(path="/path"), session=session))
+    assert report.status is Status.SUCCESS
+    assert response is cached
+
+    assert not session.calls
+    cache.store.assert_not_called()
+
+
+def test_responses_stored_to_the_cache():
+    stored = NonCallableMock(StaticResponse, elapsed=1.0, timing=None)
+    cache = NonCallableMock(ResponseCache)
+    cache.lookup.return_value = ("key", None)
+    cache.store.return_value = stored
+    session = _Session()
+    requester = AsyncRequester("http://base", detect_charset=True, cache=cache)
+    report, response = asyncio.run(requester.execute(Request(path="/path"), session=session))
+    assert report.status is Status.SUCCESS
+    assert response is stored
+
+    assert len(session.calls) == 1
+    cache.store.assert_called_once_with("key", ANY, detect_charset=True)
+
+
+def test_requests_opting_out_of_the_cache():
+    cache = NonCallableMock(ResponseCache)
+    session = _Session()
+    requester = AsyncRequester("http://base", cache=cache)
+    request = Request(path="/path", cache=False)
+    report, _ = asyncio.run(requester.execute(request, session=session))
+    assert report.status is Status.SUCCESS
+
+    assert len(session.calls) == 1
+    cache.lookup.assert_not_called()
+
+
+def test_compression(body):
+    with raises(ValueError):
+        AsyncRequester(compress_threshold=-1)
+
+    body.resolve.return_value = {"x": "y" * 100}
+    session = _Session()
+    requester = AsyncRequester("http://base", compress_threshold=10)
+    request = Request(method=Method.POST, body=body)
+    report, _ = asyncio.run(requester.execute(request, session=session))
+    assert report.status is Status.SUCCESS
+
+    _, _, kwargs = session.calls[0]
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert gzip.decompress(kwargs["data"]) == ("x=" + "y" * 100).encode("utf-8")
+
+
+def test_hedging(body):
+    async def _run(url, send):
+        return await send()
+
+    hedging = NonCallableMock(Hedging, async_run=Mock(side_effect=_run))
+    session = _Session()
+    requester = AsyncRequester("http://base", hedging=hedging)
+
+    report, _ = asyncio.run(requester.execute(Request(path="/path"), session=session))
+    assert report.status is Status.SUCCESS
+    hedging.async_run.assert_called_once_with("http://base/path", ANY)
+    assert len(session.calls) == 1
+
+    request = Request(method=Method.POST, body=body)
+    report, _ = asyncio.run(requester.execute(request, session=session))
+    assert report.status is Status.SUCCESS
+    hedging.async_run.assert_called_once()
+    assert len(session.calls) == 2
+
+
+def test_circuit_breaker():
+    import aiohttp
+
+    session = _Session(error=aiohttp.ClientConnectionError("refused"))
+    requester = AsyncRequester("http://base", breaker=CircuitBreaker(threshold=2))
+
+    for _ in range(2):
+        report, _ = asyncio.run(requester.execute(Request(path="/path"), session=session))
+        assert report.status is Status.UNSTABLE
+        assert report.message == "ClientConnectionError: refused"
+
+    report, response = asyncio.run(requester.execute(Request(path="/path"), session=session))
+    assert report.status is Status.UNSTABLE
+    assert report.message
+    assert report.message.startswith("CircuitOpenError: ")
+    assert response is None
+    assert len(session.calls) == 2
+
+
+def test_timeouts():
+    session = _Session()
+    requester = AsyncRequester("http://base", timeout=Timeouts(connect=1.0, deadline=3.0))
+    request = Request(path="/path", timeouts=Timeouts(read=2.0))
+    report, _ = asyncio.run(requester.execute(request, session=session))
+    assert report.status is Status.SUCCESS
+
+    _, _, kwargs = session.calls[0]
+    assert kwargs["timeout"].total == 3.0
+    assert kwargs["timeout"].sock_connect == 1.0
+    assert kwargs["timeout"].sock_read == 2.0
@@ -0,0 +1,114 @@
+import pickle
+from unittest.mock import Mock
+
+from pytest import fixture, mark, raises
+
+from preacher.core.request.breaker import CircuitBreaker, CircuitOpenError
+
+PKG = "preacher.core.request.breaker"
+URL = "http://a.com/path"
+FAILURES = (ConnectionError,)
+
+
+@fixture
+def clock(mocker):
+    clock = Mock(return_value=0.0)
+    mocker.patch(f"{PKG}.time.monotonic", clock)
+    return clock
+
+
+def _fail(breaker: CircuitBreaker, url: str = URL) -> None:
+    with raises(ConnectionError):
+        with breaker.guard(url, FAILURES):
+            raise ConnectionError("refused")
+
+
+def _succeed(breaker: CircuitBreaker, url: str = URL) -> None:
+    with breaker.guard(url, FAILURES):
+        pass
+
+
+@mark.parametrize(
+    "kwargs",
+    (
+        {"threshold": 0},
+        {"reset_timeout": 0.0},
+        {"reset_timeout": -1.0},
+    ),
+)
+def test_given_invalid_parameters(kwargs):
+    with raises(ValueError):
+        CircuitBreaker(**kwargs)
+
+
+def test_circuit_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(threshold=2, reset_timeout=10.0)
+    assert breaker.threshold == 2
+    assert breaker.reset_timeout == 10.0
+
+    _fail(breaker)
+    _succeed(breaker)
+    _fail(breaker)
+    _fail(breaker)
+
+    with raises(CircuitOpenError) as error_info:
+        _succeed(breaker)
+    assert "http://a.com" in str(error_info.value)
+    assert "2 consecutive connection failures" in str(error_info.value)
+
+    _succeed(breaker, "http://b.com/path")
+    _succeed(breaker, "https://a.com/path")
+
+
+def test_other_errors_are_not_counted(clock):
+    breaker = CircuitBreaker(threshold=1)
+    with raises(ValueError):
+        with breaker.guard(URL, FAILURES):
+            raise ValueError("invalid")
+    _succeed(breaker)
+
+
+def test_circuit_half_opens(clock):
+    breaker = CircuitBreaker(threshold=1, reset_timeout=10.0)
+    _fail(breaker)
+
+    clock.return_value = 9.9
+    with raises(CircuitOpenError):
+        _succeed(breaker)
+
+    # Only one request probes the host.
+    clock.return_value = 10.0
+    with breaker.guard(URL, FAILURES):
+        with raises(CircuitOpenError):
+            _succeed(breaker)
+
+    # The circuit closes after the probe succeeds.
+    _fail(breaker)
+    clock.return_value = 20.0
+    _succeed(breaker)
+    _succeed(breaker)
+
+
+def test_circuit_opens_again_when_probing_fails(clock):
+    breaker = CircuitBreaker(threshold=2, reset_timeout=10.0)
+    _fail(breaker)
+    _fail(breaker)
+
+    clock.return_value = 10.0
+    _fail(breaker)
+    clock.return_value = 19.9
+    with raises(CircuitOpenError):
+        _succeed(breaker)
+
+    # The probe is released also by errors that are not counted.
+    clock.return_value = 20.0
+    with raises(ValueError):
+        with breaker.guard(URL, FAILURES):
+            raise ValueError("invalid")
+    _succeed(breaker)
+
+
+def test_unpickled_copies_share_states():
+    breaker = CircuitBreaker()
+    copied = pickle.loads(pickle.dumps(breaker))
+    assert copied is breaker
@@ -0,0 +1,175 @@
+import pickle
+from typing import Dict, Optional
+from unittest.mock import NonCallableMock
+
+from pytest import mark, raises
+
+from preacher.core.request.cache import ResponseCache
+from preacher.core.request.response import Response
+from preacher.core.request.static import StaticResponse, StaticResponseBody
+from preacher.core.request.timing import Timing
+
+URL = "https://a.com/path"
+
+
+def _response(
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None,
+    content: bytes = b"body",
+) -> Response:
+    return StaticResponse(
+        id="id",
+        elapsed=0.5,
+        status_code=status_code,
+        headers=headers or {},
+        body=StaticResponseBody(content),
+        timing=Timing(ttfb=0.5),
+    )
+
+
+@mark.parametrize("max_size", (-1, 0))
+def test_given_invalid_max_size(max_size):
+    with raises(ValueError):
+        ResponseCache(max_size)
+
+
+@mark.parametrize("method", ("POST", "PUT", "DELETE"))
+def test_unsafe_methods_are_not_cached(method):
+    cache = ResponseCache(1024)
+    assert cache.lookup(method, URL, {}) == (None, None)
+
+
+@mark.parametrize("name", ("If-None-Match", "if-modified-since", "If-Match"))
+def test_conditional_requests_are_not_cached(name):
+    cache = ResponseCache(1024)
+    assert cache.lookup("GET", URL, {name: "x"}) == (None, None)
+
+
+def test_fresh_responses_are_reused():
+    cache = ResponseCache(1024)
+    assert cache.max_size == 1024
+
+    key, cached = cache.lookup("GET", URL, {"Accept": "text/plain"})
+    assert key
+    assert cached is None
+
+    response = _response(headers={"cache-control": "public, max-age=60"})
+    assert cache.store(key, response) is response
+    assert cache.size == 4
+
+    headers = {"Accept": "text/plain"}
+    same_key, cached = cache.lookup("get", URL, headers)
+    assert same_key == key
+    assert cached
+    assert cached.status_code == 200
+    assert cached.elapsed == 0.0
+    assert cached.headers == {"cache-control": "public, max-age=60"}
+    assert cached.body.content == b"body"
+    assert cached.timing is None
+    assert headers == {"Accept": "text/plain"}
+
+    other_key, cached = cache.lookup("GET", URL, {"Accept": "text/html"})
+    assert other_key != key
+    assert cached is None
+
+
+@mark.parametrize(
+    ("headers", "expected"),
+    (
+        ({"etag": '"v1"'}, {"If-None-Match": '"v1"'}),
+        ({"last-modified": "Mon"}, {"If-Modified-Since": "Mon"}),
+        (
+            {"etag": '"v1"', "last-modified": "Mon", "cache-control": "no-cache, max-age=60"},
+            {"If-None-Match": '"v1"', "If-Modified-Since": "Mon"},
+        ),
+    ),
+)
+def test_stale_responses_are_revalidated(headers, expected):
+    cache = ResponseCache(1024)
+    key, _ = cache.lookup("GET", URL, {})
+    assert key
+    cache.store(key, _response(headers=headers))
+
+    request_headers: Dict[str, str] = {}
+    _, cached = cache.lookup("GET", URL, request_headers)
+    assert cached is None
+    assert request_headers == expected
+
+    not_modified = NonCallableMock(
+        Response,
+        status_code=304,
+        headers={"etag": '"v1"', "content-length": "0", "x-new": "new"},
+        elapsed=0.25,
+        timing=Timing(ttfb=0.25),
+    )
+    revalidated = cache.store(key, not_modified)
+    assert revalidated.status_code == 200
+    assert revalidated.elapsed == 0.25
+    assert revalidated.timing == Timing(ttfb=0.25)
+    assert revalidated.headers["x-new"] == "new"
+    assert "content-length" not in revalidated.headers
+    assert revalidated.body.content == b"body"
+    not_modified.close.assert_called_once_with()
+
+
+def test_not_modified_without_entries():
+    cache = ResponseCache(1024)
+    key, _ = cache.lookup("GET", URL, {})
+    assert key
+    response = _response(status_code=304)
+    assert cache.store(key, response) is response
+
+
+@mark.parametrize(
+    ("status_code", "headers"),
+    (
+        (200, {}),
+        (200, {"etag": '"v1"', "cache-control": "no-store"}),
+        (200, {"cache-control": "max-age=invalid"}),
+        (404, {"etag": '"v1"'}),
+    ),
+)
+def test_uncacheable_responses(status_code, headers):
+    cache = ResponseCache(1024)
+    key, _ = cache.lookup("GET", URL, {})
+    assert key
+    cache.store(key, _response(headers={"cache-control": "max-age=60"}))
+
+    response = _response(status_code=status_code, headers=headers)
+    assert cache.store(key, response) is response
+    assert cache.size == 0
+    assert cache.lookup("GET", URL, {}) == (key, None)
+
+
+def test_least_recently_used_responses_are_evicted():
+    cache = ResponseCache(10)
+    keys = []
+    for path in ("a", "b", "c"):
+        key, _ = cache.lookup("GET", f"{URL}/{path}", {})
+        assert key
+        cache.store(key, _response(headers={"cache-control": "max-age=60"}, content=b"1234"))
+        keys.append(key)
+        if path == "b":
+            cache.lookup("GET", f"{URL}/a", {})  # Used recently.
+    assert cache.size == 8
+
+    assert cache.lookup("GET", f"{URL}/a", {})[1]
+    assert cache.lookup("GET", f"{URL}/b", {})[1] is None
+    assert cache.lookup("GET", f"{URL}/c", {})[1]
+
+    # Too large to cache.
+    key, _ = cache.lookup("GET", f"{URL}/d", {})
+    assert key
+    cache.store(key, _response(headers={"cache-control": "max-age=60"}, content=b"x" * 11))
+    assert cache.lookup("GET", f"{URL}/d", {})[1] is None
+    assert cache.size == 8
+
+
+def test_unpickled_copies_share_entries():
+    cache = ResponseCache(1024)
+    key, _ = cache.lookup("GET", URL, {})
+    assert key
+    cache.store(key, _response(headers={"cache-control": "max-age=60"}))
+
+    copied = pickle.loads(pickle.dumps(cache))
+    assert copied is cache
@@ -0,0 +1,113 @@
+import json
+import os
+import pickle
+import zlib
+from tempfile import TemporaryDirectory
+from unittest.mock import NonCallableMock
+
+from pytest import fixture, raises
+
+from preacher.core.request.cassette import Cassette, CassetteMode
+from preacher.core.request.requester import PreparedRequest
+from preacher.core.request.response import Response, ResponseBody
+
+PKG = "preacher.core.request.cassette"
+
+
+@fixture
+def path():
+    with TemporaryDirectory() as path:
+        yield os.path.join(path, "cassette")
+
+
+def _request(url="http://base/path", body=None):
+    return PreparedRequest(method="POST", url=url, headers={"k": "v"}, body=body)
+
+
+def _response(status_code, content, headers=None):
+    body = NonCallableMock(ResponseBody, buffer=content)
+    return NonCallableMock(
+        Response,
+        status_code=status_code,
+        headers=headers or {"content-type": "text/plain; charset=euc-jp"},
+        body=body,
+        elapsed=1.5,
+    )
+
+
+def test_record_and_replay(path):
+    recorder = Cassette(path, CassetteMode.RECORD)
+    assert recorder.path == path
+    assert recorder.mode is CassetteMode.RECORD
+    assert not recorder.replaying
+    recorder.record(_request(), _response(503, b""))
+    recorder.record(_request(), _response(200, "東京".encode("euc-jp")))
+    recorder.record(_request(body="body"), _response(201, b"created"))
+    recorder.close()
+
+    # Another process records to another pair of files.
+    another = Cassette(path, CassetteMode.RECORD)
+    another.record(_request(url="http://base/other", body=b"body"), _response(204, b""))
+    another.close()
+    assert len(os.listdir(path)) == 4
+
+    player = Cassette(path, CassetteMode.REPLAY)
+    assert player.replaying
+
+    response = player.replay(_request())
+    assert response.status_code == 503
+    assert response.elapsed == 1.5
+    assert response.headers == {"content-type": "text/plain; charset=euc-jp"}
+
+    response = player.replay(_request())
+    assert response.status_code == 200
+    assert response.body.text == "東京"
+
+    # The last one is replayed repeatedly.
+    assert player.replay(_request()).status_code == 200
+
+    assert player.replay(_request(body=b"body")).body.content == b"created"
+    assert player.replay(_request(url="http://base/other", body="body")).status_code == 204
+
+    with raises(LookupError):
+        player.replay(_request(url="http://base/unknown"))
+
+
+def test_record_in_chunks(path, mocker):
+    mocker.patch(f"{PKG}._CHUNK_SIZE", 3)
+
+    recorder = Cassette(path, CassetteMode.RECORD)
+    headers = {
+        "Content-Type": "text/plain",
+        "Content-Encoding": "gzip",
+        "Content-Length": "10",
+        "Transfer-Encoding": "chunked",
+    }
+    recorder.record(_request(body="東京"), _response(200, bytearray(b"0123456789"), headers))
+    recorder.close()
+
+    (data_path,) = (name for name in os.listdir(path) if name.endswith(".data"))
+    with open(os.path.join(path, data_path), "rb") as f:
+        header_line, body = zlib.decompress(f.read()).split(b"\n", 1)
+    assert json.loads(header_line)["request"]["body"] == "5p2x5Lqs"
+    assert body == b"0123456789"
+
+    response = Cassette(path, CassetteMode.REPLAY).replay(_request(body="東京"))
+    assert response.headers == {"Content-Type": "text/plain"}
+    assert response.body.content == b"0123456789"
+
+
+def test_replay_given_no_directory(path):
+    player = Cassette(path, CassetteMode.REPLAY)
+    with raises(LookupError):
+        player.replay(_request())
+
+
+def test_pickling(path):
+    cassette = Cassette(path, CassetteMode.RECORD)
+    restored = pickle.loads(pickle.dumps(cassette))
+    assert restored is cassette
+
+    restored.record(_request(), _response(200, b""))
+    restored.close()
+    assert len(os.listdir(path)) == 2
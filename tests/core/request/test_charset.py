@@ -0,0 +1,62 @@
+from unittest.mock import NonCallableMock, PropertyMock
+
+import requests
+from pytest import mark
+from requests.structures import CaseInsensitiveDict
+
+from preacher.core.request.charset import decode, detect_encoding, resolve_encoding
+from preacher.core.request.requester import ResponseBodyWrapper
+
+PKG = "preacher.core.request.charset"
+
+
+@mark.parametrize(
+    ("headers", "expected"),
+    (
+        ({}, None),
+        ({"content-type": ""}, None),
+        ({"content-type": "text/plain"}, None),
+        ({"content-type": "text/html; charset=Shift_JIS"}, "shift_jis"),
+        ({"content-type": 'text/html; charset="euc-jp"'}, "euc_jp"),
+        ({"content-type": "text/html; charset=unknown"}, None),
+        ({"content-type": "application/json"}, "utf-8"),
+        ({"content-type": "application/problem+json"}, "utf-8"),
+        ({"content-type": "application/json; charset=latin-1"}, "iso8859-1"),
+        ({"content-type": "application/json; charset=unknown"}, "utf-8"),
+        (CaseInsensitiveDict({"Content-Type": "Application/JSON"}), "utf-8"),
+    ),
+)
+def test_resolve_encoding(headers, expected):
+    assert resolve_encoding(headers) == expected
+
+
+def test_decode():
+    assert decode("東京".encode("euc-jp"), "euc_jp") == "東京"
+    assert decode("東京".encode("utf-8"), None) == "東京"
+    assert decode(b"\xff", None) == "�"
+
+
+def test_decode_with_detection(mocker):
+    detect = mocker.patch(f"{PKG}.detect", return_value={"encoding": "euc-jp"})
+    assert decode("東京".encode("euc-jp"), "euc_jp", detect=True) == "東京"
+    detect.assert_not_called()
+
+    assert decode("東京".encode("euc-jp"), None, detect=True) == "東京"
+    detect.assert_called_once()
+
+
+def test_detect_encoding(mocker):
+    mocker.patch(f"{PKG}.detect", return_value={"encoding": None})
+    assert detect_encoding(b"") == "utf-8"
+
+
+def test_text_is_decoded_once():
+    res = NonCallableMock(requests.Response)
+    res.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+    content = PropertyMock(return_value='{"k":"東京"}'.encode("utf-8"))
+    type(res).content = content
+
+    body = ResponseBodyWrapper(res)
+    assert body.text == '{"k":"東京"}'
+    assert body.text == '{"k":"東京"}'
+    content.assert_called_once_with()
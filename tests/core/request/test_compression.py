@@ -0,0 +1,63 @@
+import gzip
+
+import requests
+from pytest import mark
+
+from preacher.core.request.compression import accept_encoding, compress_body, gzip_compress
+from preacher.core.request.compression import negotiate_encoding
+
+
+def _prepare(**kwargs) -> requests.PreparedRequest:
+    return requests.Request(method="POST", url="http://base/", **kwargs).prepare()
+
+
+def test_accept_encoding():
+    codings = accept_encoding().split(", ")
+    assert "gzip" in codings
+    assert "deflate" in codings
+
+
+def test_negotiate_encoding():
+    prepped = _prepare()
+    negotiate_encoding(prepped)
+    assert prepped.headers["Accept-Encoding"] == accept_encoding()
+
+    prepped = _prepare(headers={"accept-encoding": "identity"})
+    negotiate_encoding(prepped)
+    assert prepped.headers["Accept-Encoding"] == "identity"
+
+
+@mark.parametrize("data", ("x" * 11, ("x" * 11).encode("utf-8")))
+def test_large_bodies_are_compressed(data):
+    prepped = _prepare(data=data)
+    compress_body(prepped, 10)
+    assert isinstance(prepped.body, bytes)
+    assert gzip.decompress(prepped.body) == b"x" * 11
+    assert prepped.headers["Content-Encoding"] == "gzip"
+    assert prepped.headers["Content-Length"] == str(len(prepped.body))
+
+
+@mark.parametrize(
+    "kwargs",
+    (
+        {},
+        {"data": "x" * 10},
+        {"data": "x" * 11, "headers": {"Content-Encoding": "br"}},
+        {"data": iter([b"x" * 11])},
+    ),
+)
+def test_bodies_kept_as_they_are(kwargs):
+    prepped = _prepare(**kwargs)
+    body = prepped.body
+    compress_body(prepped, 10)
+    assert prepped.body is body
+    assert prepped.headers.get("Content-Encoding") == kwargs.get("headers", {}).get(
+        "Content-Encoding"
+    )
+
+
+def test_gzip_compress_is_deterministic():
+    data = b"data" * 100
+    compressed = gzip_compress(data)
+    assert gzip.decompress(compressed) == data
+    assert gzip_compress(data) == compressed
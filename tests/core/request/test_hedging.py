@@ -0,0 +1,193 @@
+import asyncio
+import pickle
+import threading
+from unittest.mock import NonCallableMock
+
+from pytest import mark, raises
+
+from preacher.core.request.hedging import Hedging
+from preacher.core.request.response import Response
+
+URL = "https://a.com/path"
+
+
+def _warm(hedging: Hedging, latency: float, url: str = URL, count: int = 10) -> None:
+    for _ in range(count):
+        hedging.observe(url, latency)
+
+
+@mark.parametrize(
+    "kwargs",
+    (
+        {"percentile": 0.0},
+        {"percentile": 100.0},
+        {"window": 0},
+        {"min_samples": 0},
+        {"window": 5, "min_samples": 6},
+    ),
+)
+def test_given_invalid_parameters(kwargs):
+    with raises(ValueError):
+        Hedging(**kwargs)
+
+
+def test_delay():
+    hedging = Hedging(percentile=90.0, window=10, min_samples=5)
+    assert hedging.percentile == 90.0
+
+    for latency in (0.5, 0.1, 0.4, 0.2):
+        hedging.observe(URL, latency)
+    assert hedging.delay(URL) is None
+
+    hedging.observe("https://a.com/other", 0.3)
+    assert hedging.delay(URL) == 0.5
+    assert hedging.delay("https://b.com/path") is None
+    assert hedging.delay("http://a.com/path") is None
+
+    for _ in range(10):
+        hedging.observe(URL, 0.01)
+    assert hedging.delay(URL) == 0.01
+
+
+def test_run_without_observations():
+    hedging = Hedging()
+    response = NonCallableMock(Response)
+    assert hedging.run(URL, lambda: response) is response
+    assert hedging.delay(URL) is None
+
+
+def test_run_when_the_primary_answers_in_time():
+    hedging = Hedging()
+    _warm(hedging, 1.0)
+
+    calls = []
+
+    def _send():
+        calls.append(1)
+        return NonCallableMock(Response)
+
+    hedging.run(URL, _send)
+    assert len(calls) == 1
+
+
+def test_run_when_the_hedge_wins():
+    hedging = Hedging()
+    _warm(hedging, 0.01)
+
+    released = threading.Event()
+    slow = NonCallableMock(Response)
+    fast = NonCallableMock(Response)
+    responses = iter((slow, fast))
+    lock = threading.Lock()
+
+    def _send():
+        with lock:
+            response = next(responses)
+        if response is slow:
+            released.wait(5.0)
+        return response
+
+    assert hedging.run(URL, _send) is fast
+    fast.close.assert_not_called()
+
+    released.set()
+    for _ in range(100):
+        if slow.close.called:
+            break
+        threading.Event().wait(0.01)
+    slow.close.assert_called_once_with()
+
+
+def test_run_when_the_primary_fails():
+    hedging = Hedging()
+    _warm(hedging, 0.01)
+
+    released = threading.Event()
+    response = NonCallableMock(Response)
+    results = iter((RuntimeError("primary"), response))
+    lock = threading.Lock()
+
+    def _send():
+        with lock:
+            result = next(results)
+        if isinstance(result, Exception):
+            released.wait(5.0)
+            raise result
+        released.set()
+        return result
+
+    assert hedging.run(URL, _send) is response
+
+
+def test_run_when_all_fail():
+    hedging = Hedging()
+    _warm(hedging, 0.01)
+
+    errors = iter((RuntimeError("primary"), RuntimeError("hedge")))
+    lock = threading.Lock()
+
+    def _send():
+        with lock:
+            error = next(errors)
+        threading.Event().wait(0.05)
+        raise error
+
+    with raises(RuntimeError, match="primary"):
+        hedging.run(URL, _send)
+
+
+def test_async_run_without_observations():
+    hedging = Hedging()
+    response = NonCallableMock(Response)
+
+    async def _send():
+        return response
+
+    assert asyncio.run(hedging.async_run(URL, _send)) is response
+    assert hedging.delay(URL) is None
+
+
+def test_async_run_when_the_hedge_wins():
+    hedging = Hedging()
+    _warm(hedging, 0.01)
+
+    fast = NonCallableMock(Response)
+    cancelled = []
+    count = []
+
+    async def _send():
+        count.append(1)
+        if len(count) == 1:
+            try:
+                await asyncio.sleep(5.0)
+            except asyncio.CancelledError:
+                cancelled.append(1)
+                raise
+        return fast
+
+    assert asyncio.run(hedging.async_run(URL, _send)) is fast
+    assert len(count) == 2
+    assert cancelled == [1]
+
+
+def test_async_run_when_all_fail():
+    hedging = Hedging()
+    _warm(hedging, 0.01)
+
+    count = []
+
+    async def _send():
+        count.append(1)
+        index = len(count)
+        await asyncio.sleep(0.05)
+        raise RuntimeError(str(index))
+
+    with raises(RuntimeError, match="1"):
+        asyncio.run(hedging.async_run(URL, _send))
+    assert len(count) == 2
+
+
+def test_unpickled_copies_share_observations():
+    hedging = Hedging()
+    copied = pickle.loads(pickle.dumps(hedging))
+    assert copied is hedging
@@ -0,0 +1,215 @@
+import gzip
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from threading import Thread
+from typing import Iterator, List
+
+import h2.config
+import h2.connection
+import h2.events
+import httpx
+import requests
+from pytest import fixture, raises
+
+from preacher.core.request.http2 import Http2Adapter
+from preacher.core.request.session import SessionFactory
+
+
+class _H2cServer:
+    """A stand-in server that speaks HTTP/2 with prior knowledge and echoes request paths."""
+
+    def __init__(self):
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.bind(("127.0.0.1", 0))
+        self._socket.listen()
+        self.connections: List[socket.socket] = []
+
+    @property
+    def url(self) -> str:
+        host, port = self._socket.getsockname()
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        Thread(target=self._accept, daemon=True).start()
+
+    def close(self) -> None:
+        self._socket.close()
+        for sock in self.connections:
+            sock.close()
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                sock, _ = self._socket.accept()
+            except OSError:
+                return
+            self.connections.append(sock)
+            Thread(target=self._serve, args=(sock,), daemon=True).start()
+
+    @staticmethod
+    def _serve(sock: socket.socket) -> None:
+        config = h2.config.H2Configuration(client_side=False)
+        conn = h2.connection.H2Connection(config=config)
+        conn.initiate_connection()
+        sock.sendall(conn.data_to_send())
+        while True:
+            try:
+                data = sock.recv(65535)
+            except OSError:
+                return
+            if not data:
+                return
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    headers = dict(event.headers)
+                    body = headers[b":path"]
+                    conn.send_headers(
+                        event.stream_id,
+                        [
+                            (":status", "200"),
+                            ("content-type", "text/plain; charset=utf-8"),
+                            ("content-length", str(len(body))),
+                            ("set-cookie", "k=v"),
+                        ],
+                    )
+                    conn.send_data(event.stream_id, body, end_stream=True)
+            sock.sendall(conn.data_to_send())
+
+
+@fixture
+def server() -> Iterator[_H2cServer]:
+    server = _H2cServer()
+    server.start()
+    yield server
+    server.close()
+
+
+def test_requests_share_one_connection(server):
+    adapter = Http2Adapter()
+
+    def _get(path: str) -> requests.Response:
+        with requests.Session() as session:
+            session.mount("http://", adapter)
+            return session.get(f"{server.url}{path}")
+
+    with ThreadPoolExecutor(4) as executor:
+        responses = list(executor.map(_get, (f"/{i}" for i in range(8))))
+
+    for i, res in enumerate(responses):
+        assert res.status_code == 200
+        assert res.headers["Content-Type"] == "text/plain; charset=utf-8"
+        assert res.encoding == "utf-8"
+        assert res.text == f"/{i}"
+        assert res.cookies["k"] == "v"
+        assert res.url == f"{server.url}/{i}"
+    assert len(server.connections) == 1
+
+
+def test_streamed_response():
+    def _handle(request: httpx.Request) -> httpx.Response:
+        assert request.method == "POST"
+        assert request.headers["x-name"] == "value"
+        assert request.content == b"body"
+        return httpx.Response(201, content="東京".encode("utf-8"))
+
+    adapter = Http2Adapter(transport=httpx.MockTransport(_handle))
+    request = requests.Request(
+        "POST",
+        "https://example.com/path",
+        headers={"X-Name": "value"},
+        data=b"body",
+    ).prepare()
+    res = adapter.send(request, stream=True, timeout=(1.0, 2.0))
+
+    assert res.status_code == 201
+    assert res.reason == "Created"
+    assert res.request is request
+    assert res.content == "東京".encode("utf-8")
+    res.close()
+
+
+def test_elapsed(mocker):
+    # Sends and receives the headers, and then the body is read.
+    mocker.patch("preacher.core.request.http2.perf_counter", side_effect=[1.0, 1.5])
+
+    adapter = Http2Adapter(transport=httpx.MockTransport(lambda _: httpx.Response(200)))
+    request = requests.Request("GET", "https://example.com/").prepare()
+    res = adapter.send(request)
+    assert res.elapsed == timedelta(seconds=0.5)
+
+
+def test_raw_response_read():
+    content = gzip.compress(b"0123456789")
+
+    def _handle(request: httpx.Request) -> httpx.Response:
+        chunks = iter([content[:3], content[3:]])  # Streamed unlike bytes.
+        return httpx.Response(200, headers={"Content-Encoding": "gzip"}, content=chunks)
+
+    adapter = Http2Adapter(transport=httpx.MockTransport(_handle))
+    request = requests.Request("GET", "https://example.com/").prepare()
+
+    res = adapter.send(request, stream=True)
+    assert res.raw.read(2) == content[:2]
+    assert res.raw.read(3) == content[2:5]
+    assert res.raw.read() == content[5:]
+    assert res.raw.read(1) == b""
+    res.close()
+
+    res = adapter.send(request, stream=True)
+    assert res.raw.read(4, decode_content=True) == b"0123"
+    assert res.raw.read(decode_content=True) == b"456789"
+    res.close()
+
+
+def test_connection_error():
+    def _handle(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    adapter = Http2Adapter(transport=httpx.MockTransport(_handle))
+    request = requests.Request("GET", "http://example.com/").prepare()
+    with raises(requests.ConnectionError):
+        adapter.send(request)
+
+
+def test_timeout():
+    def _handle(request: httpx.Request) -> httpx.Response:
+        assert request.extensions["timeout"]["read"] == 1.0
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    adapter = Http2Adapter(transport=httpx.MockTransport(_handle))
+    request = requests.Request("GET", "http://example.com/").prepare()
+    with raises(requests.Timeout):
+        adapter.send(request, timeout=1.0)
+
+
+def test_sessions_share_the_adapter_across_threads():
+    factory = SessionFactory(http2=True)
+    assert factory.http2
+
+    adapter = factory.adapter()
+    assert isinstance(adapter, Http2Adapter)
+    with ThreadPoolExecutor(1) as executor:
+        assert executor.submit(factory.adapter).result() is adapter
+    with factory.create() as session:
+        assert session.get_adapter("https://example.com/") is adapter
+    assert factory.adapter() is adapter
+    assert SessionFactory(pool_size=3, http2=True).adapter() is not adapter
+
+
+def test_adapters_are_created_per_process(mocker):
+    factory = SessionFactory(http2=True)
+    adapter = factory.adapter()
+
+    mocker.patch("os.getpid", return_value=-1)
+    assert factory.adapter() is not adapter
+
+
+def test_when_http2_is_not_available(mocker):
+    mocker.patch.object(Http2Adapter, "is_available", return_value=False)
+    with raises(RuntimeError):
+        SessionFactory(http2=True)
+
+
+def test_is_available():
+    assert Http2Adapter.is_available()
@@ -0,0 +1,129 @@
+import asyncio
+import pickle
+import threading
+from unittest.mock import Mock
+
+from pytest import fixture, mark, raises
+
+from preacher.core.request.limit import HostLimiter
+
+PKG = "preacher.core.request.limit"
+
+
+@fixture
+def clock(mocker):
+    clock = Mock(return_value=0.0)
+    mocker.patch(f"{PKG}.time.monotonic", clock)
+    return clock
+
+
+@mark.parametrize(
+    "kwargs",
+    (
+        {"rate": 0.0},
+        {"rate": -1.0},
+        {"burst": 0},
+        {"max_in_flight": 0},
+    ),
+)
+def test_given_invalid_limits(kwargs):
+    with raises(ValueError):
+        HostLimiter(**kwargs)
+
+
+def test_no_limit(mocker):
+    sleep = mocker.patch(f"{PKG}.time.sleep")
+
+    limiter = HostLimiter()
+    assert limiter.rate is None
+    assert limiter.burst == 1
+    assert limiter.max_in_flight is None
+
+    for _ in range(3):
+        with limiter.limit("http://a.com/path"):
+            pass
+    sleep.assert_not_called()
+
+
+def test_rate(mocker, clock):
+    sleep = mocker.patch(f"{PKG}.time.sleep")
+
+    limiter = HostLimiter(rate=2.0, burst=2)
+    for _ in range(4):
+        with limiter.limit("http://a.com/path"):
+            pass
+    assert [args[0] for args, _ in sleep.call_args_list] == [0.5, 1.0]
+
+    # Other hosts are limited independently.
+    with limiter.limit("https://a.com/path"):
+        pass
+    with limiter.limit("http://b.com/path"):
+        pass
+    assert sleep.call_count == 2
+
+    # Tokens are refilled with time.
+    clock.return_value = 10.0
+    for _ in range(2):
+        with limiter.limit("http://a.com/other"):
+            pass
+    assert sleep.call_count == 2
+
+
+def test_max_in_flight():
+    limiter = HostLimiter(max_in_flight=2)
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+
+    def _request():
+        with limiter.limit("http://a.com/"):
+            with lock:
+                in_flight.append(None)
+                peak.append(len(in_flight))
+            threading.Event().wait(0.01)
+            with lock:
+                in_flight.pop()
+
+    threads = [threading.Thread(target=_request) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert max(peak) == 2
+
+
+def test_async_limit():
+    limiter = HostLimiter(rate=100.0, max_in_flight=1)
+    in_flight = []
+    peak = []
+
+    async def _request():
+        async with limiter.async_limit("http://a.com/"):
+            in_flight.append(None)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.pop()
+
+    async def _main():
+        await asyncio.gather(*(_request() for _ in range(3)))
+
+    asyncio.run(_main())
+    assert peak == [1, 1, 1]
+
+
+def test_pickling_in_the_same_process():
+    limiter = HostLimiter(rate=1.0, burst=3, max_in_flight=2)
+    assert pickle.loads(pickle.dumps(limiter)) is limiter
+
+
+def test_unpickling_in_another_process(mocker):
+    limiter = HostLimiter(rate=1.0, burst=3, max_in_flight=2)
+    dumped = pickle.dumps(limiter)
+
+    mocker.patch("preacher.core.util.process._PID", -1)
+    restored = pickle.loads(dumped)
+    assert restored is not limiter
+    assert restored.rate == 1.0
+    assert restored.burst == 3
+    assert restored.max_in_flight == 2
+    assert pickle.loads(dumped) is restored
@@ -0,0 +1,35 @@
+from pytest import mark, raises
+
+from preacher.core.request.prewarm import Prewarming
+
+
+@mark.parametrize("connections", (-1, 0))
+def test_given_invalid_connections(connections):
+    with raises(ValueError):
+        Prewarming(connections)
+
+
+def test_origins():
+    prewarming = Prewarming(2, base_url="https://a.com:8443/base", timeout=1.5)
+    assert prewarming.connections == 2
+    assert prewarming.timeout == 1.5
+    assert prewarming.origins == []
+
+    prewarming.add("/path")
+    prewarming.add("/other?query=1")
+    assert prewarming.origins == ["https://a.com:8443/"]
+
+
+def test_absolute_paths():
+    prewarming = Prewarming(1)
+    prewarming.add("http://a.com/path")
+    prewarming.add("http+unix://%2Frun%2Fapi.sock/path")
+    prewarming.add("http://b.com")
+    prewarming.add("http://a.com/other")
+    prewarming.add("/relative")
+    prewarming.add("ftp://c.com/path")
+    assert prewarming.origins == [
+        "http://a.com/",
+        "http+unix://%2Frun%2Fapi.sock/",
+        "http://b.com/",
+    ]
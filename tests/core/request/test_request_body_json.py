@@ -50,3 +50,16 @@ def test_resolve_given_values():
 
     value.resolve.assert_called_once_with(sentinel.context)
     value_of_value.resolve.assert_called_once_with(sentinel.context)
+
+
+@mark.parametrize(
+    ("data", "expected"),
+    (
+        (None, True),
+        ({"k": [1, {"k": date(2020, 1, 23)}]}, True),
+        (NonCallableMock(Value), False),
+        ({"k": [1, {"k": NonCallableMock(Value)}]}, False),
+    ),
+)
+def test_is_static(data, expected):
+    assert JsonRequestBody(data).is_static is expected
@@ -1,6 +1,7 @@
-from unittest.mock import sentinel
+from unittest.mock import NonCallableMock, sentinel
 
 from preacher.core.request.request_body import UrlencodedRequestBody
+from preacher.core.value import Value
 
 PKG = "preacher.core.request.request_body"
 
@@ -16,3 +17,9 @@ def test(mocker):
     assert resolved is sentinel.resolved_params
 
     resolve_params.assert_called_once_with(sentinel.params, sentinel.context)
+
+
+def test_is_static():
+    assert UrlencodedRequestBody("a=b").is_static
+    assert UrlencodedRequestBody({"a": ["b", 1]}).is_static
+    assert not UrlencodedRequestBody({"a": ["b", NonCallableMock(Value)]}).is_static
@@ -1,16 +1,28 @@
+import gzip
 import uuid
+from contextlib import contextmanager
 from datetime import timedelta
-from typing import Optional
-from unittest.mock import NonCallableMock, NonCallableMagicMock, sentinel
+from typing import Iterator, Optional
+from unittest.mock import ANY, Mock, NonCallableMock, NonCallableMagicMock, PropertyMock, sentinel
 
 import requests
-from pytest import fixture
+from pytest import fixture, mark, raises
 
 from preacher.core.context import Context
 from preacher.core.request import UrlParams
+from preacher.core.request.breaker import CircuitBreaker
+from preacher.core.request.cache import ResponseCache
+from preacher.core.request.cassette import Cassette
+from preacher.core.request.compression import accept_encoding
+from preacher.core.request.hedging import Hedging
+from preacher.core.request.limit import HostLimiter
 from preacher.core.request.request import Request, Method
 from preacher.core.request.request_body import RequestBody
 from preacher.core.request.requester import Requester, ResponseWrapper
+from preacher.core.request.response import Response
+from preacher.core.request.session import SessionFactory
+from preacher.core.request.spool import SpooledResponseBody
+from preacher.core.request.timeout import Timeouts
 from preacher.core.request.url_param import ResolvedUrlParams
 from preacher.core.status import Status
 
@@ -22,13 +34,15 @@ def session():
     response = NonCallableMock(requests.Response)
     response.elapsed = timedelta(seconds=1.23)
     response.status_code = 402
-    response.headers = {"Header-Name": "Header-Value"}
-    response.text = sentinel.text
-    response.content = sentinel.content
+    response.headers = {
+        "Header-Name": "Header-Value",
+        "content-type": "text/plain; charset=euc-jp",
+    }
+    response.content = "東京".encode("euc-jp")
 
     session = NonCallableMagicMock(requests.Session)
     session.__enter__.return_value = session
-    session.rebuild_proxies.return_value = sentinel.proxies
+    session.rebuild_proxies.return_value = {}
     session.send.return_value = response
     return session
 
@@ -60,9 +74,11 @@ def test_default_request(mocker, session):
     assert prepped.method == "GET"
     assert prepped.url == "http://base-url.org/"
     assert prepped.headers["User-Agent"].startswith("Preacher")
+    assert "Accept-Encoding" not in prepped.headers
     assert prepped.body is None
-    assert kwargs["proxies"] is sentinel.proxies
-    assert kwargs["timeout"] is None
+    assert kwargs["stream"] is True
+    assert kwargs["proxies"] is session.rebuild_proxies.return_value
+    assert kwargs["timeout"] == (None, None)
 
     session.__enter__.assert_called_once()
     session.__exit__.assert_called_once()
@@ -91,8 +107,10 @@ def test_when_request_preparation_fails(mocker, session):
 def test_when_proxy_building_fails(mocker, session):
     session.rebuild_proxies.side_effect = RuntimeError("message")
 
+    prepped = NonCallableMock(requests.PreparedRequest, url="http://base-url")
+    prepped.copy.return_value = prepped
     req = NonCallableMock(requests.Request)
-    req.prepare.return_value = sentinel.prepped
+    req.prepare.return_value = prepped
     mocker.patch("requests.Request", return_value=req)
 
     request = Request()
@@ -103,7 +121,7 @@ def test_when_proxy_building_fails(mocker, session):
     assert execution.request is None
     assert execution.message == "RuntimeError: message"
 
-    session.rebuild_proxies.assert_called_once_with(sentinel.prepped, proxies=None)
+    session.rebuild_proxies.assert_called_once_with(prepped, proxies=None)
     session.send.assert_not_called()
 
 
@@ -142,7 +160,10 @@ def test_when_request_succeeds(mocker, session, body):
         assert context == {"foo": "bar", "starts": sentinel.now}
         return {"name": "京", "a": ["b", "c"]}
 
-    resolve_params = mocker.patch(f"{PKG}.resolve_url_params", side_effect=_resolve_url_params)
+    resolve_params = mocker.patch(
+        "preacher.core.request.template.resolve_url_params",
+        side_effect=_resolve_url_params,
+    )
 
     request = Request(
         method=Method.POST,
@@ -154,6 +175,11 @@ def test_when_request_succeeds(mocker, session, body):
     requester = Requester("https://a.com", timeout=5.0)
     report, response = requester.execute(request, session=session, context={"foo": "bar"})
     assert report.status is Status.SUCCESS
+    assert report.elapsed == 1.23
+    assert report.timing
+    assert report.timing.dns is None
+    assert report.timing.ttfb is not None
+    assert report.timing.download is None
     assert report.request
     assert report.request.method == "POST"
     assert report.request.url == "https://a.com/path?name=%E4%BA%AC&a=b&a=c"
@@ -167,9 +193,14 @@ def test_when_request_succeeds(mocker, session, body):
     assert response.id == "id"
     assert response.elapsed == 1.23
     assert response.status_code == 402
-    assert response.headers == {"header-name": "Header-Value"}
-    assert response.body.text == sentinel.text
-    assert response.body.content == sentinel.content
+    assert response.headers == {
+        "header-name": "Header-Value",
+        "content-type": "text/plain; charset=euc-jp",
+    }
+    assert response.body.text == "東京"
+    assert response.body.content == "東京".encode("euc-jp")
+    assert response.timing
+    assert response.timing.download is not None
 
     uuid4.assert_called()
     now.assert_called()
@@ -190,8 +221,9 @@ def test_when_request_succeeds(mocker, session, body):
     assert prepped.headers["User-Agent"].startswith("Preacher")
     assert prepped.headers["k1"] == "v1"
     assert prepped.body == "x=y&name=%E6%9D%B1&name=%E4%BA%AC"
-    assert kwargs["proxies"] is sentinel.proxies
-    assert kwargs["timeout"] == 5.0
+    assert kwargs["stream"] is True
+    assert kwargs["proxies"] is session.rebuild_proxies.return_value
+    assert kwargs["timeout"] == (5.0, 5.0)
 
 
 def test_request_overwrites_default_headers(session, body):
@@ -222,3 +254,277 @@ def test_request_overwrites_default_headers(session, body):
     assert isinstance(prepped, requests.PreparedRequest)
     assert prepped.headers["User-Agent"].startswith("Preacher")
     assert prepped.headers["Content-Type"] == "text/plain"
+
+
+def test_sessions_are_created_by_the_factory(session):
+    factory = NonCallableMock(SessionFactory)
+    factory.create.return_value = session
+
+    requester = Requester("http://base-url", session_factory=factory)
+    assert requester.create_session() is session
+
+    report, _res = requester.execute(Request(path="/path"), context={"foo": "bar"})
+    assert report.status is Status.SUCCESS
+    assert report.request.url == "http://base-url/path"
+    assert factory.create.call_count == 2
+    session.__exit__.assert_called_once()
+
+
+@mark.parametrize(
+    ("headers", "drained"),
+    (
+        ({}, False),
+        ({"Content-Length": "65536"}, True),
+        ({"Content-Length": "65537"}, False),
+        ({"Content-Length": "invalid"}, False),
+    ),
+)
+def test_close_response(headers, drained):
+    res = NonCallableMock(requests.Response)
+    res.headers = headers
+    content = PropertyMock(return_value=b"")
+    type(res).content = content
+
+    response = ResponseWrapper(id="id", res=res)
+    response.close()
+
+    assert content.called is drained
+    res.close.assert_called_once_with()
+
+
+def test_close_response_when_draining_fails():
+    res = NonCallableMock(requests.Response)
+    res.headers = {"Content-Length": "1"}
+    type(res).content = PropertyMock(side_effect=requests.ConnectionError())
+
+    ResponseWrapper(id="id", res=res).close()
+    res.close.assert_called_once_with()
+
+
+def test_spool_threshold(session):
+    with raises(ValueError):
+        Requester(spool_threshold=-1)
+
+    requester = Requester("http://base-url", spool_threshold=0)
+    _report, response = requester.execute(Request(), session=session)
+    assert isinstance(response, ResponseWrapper)
+    assert isinstance(response.body, SpooledResponseBody)
+
+
+def test_limiters(session):
+    entered = []
+    exited = []
+
+    def _limiter(name: str) -> HostLimiter:
+        @contextmanager
+        def _limit(url: str) -> Iterator[None]:
+            entered.append((name, url))
+            yield
+            session.send.assert_called_once()
+            exited.append(name)
+
+        return NonCallableMock(HostLimiter, limit=Mock(side_effect=_limit))
+
+    requester = Requester(base_url="http://base", limiter=_limiter("requester"))
+    report, response = requester.execute(
+        Request(path="/path"), session=session, limiter=_limiter("case")
+    )
+    assert report.status is Status.SUCCESS
+    assert entered == [("requester", "http://base/path"), ("case", "http://base/path")]
+
+    # The slots are held while the body is streamed.
+    assert not exited
+    response.close()
+    response.close()
+    assert exited == ["case", "requester"]
+
+
+def test_limiters_released_on_recording_failure(session):
+    exited = []
+
+    @contextmanager
+    def _limit(url: str) -> Iterator[None]:
+        yield
+        exited.append(url)
+
+    limiter = NonCallableMock(HostLimiter, limit=Mock(side_effect=_limit))
+    cassette = NonCallableMock(Cassette, replaying=False)
+    cassette.record.side_effect = RuntimeError("message")
+    requester = Requester("http://base", limiter=limiter, cassette=cassette)
+    report, response = requester.execute(Request(path="/path"), session=session)
+    assert report.status is Status.UNSTABLE
+    assert response is None
+    assert exited == ["http://base/path"]
+
+
+def test_recording(session):
+    cassette = NonCallableMock(Cassette, replaying=False)
+    requester = Requester("http://base", cassette=cassette)
+    report, response = requester.execute(Request(path="/path"), session=session)
+    assert report.status is Status.SUCCESS
+
+    session.send.assert_called_once()
+    cassette.record.assert_called_once_with(report.request, response)
+    cassette.replay.assert_not_called()
+
+
+def test_replaying(session):
+    replayed = NonCallableMock(Response, elapsed=0.5)
+    cassette = NonCallableMock(Cassette, replaying=True)
+    cassette.replay.return_value = replayed
+    requester = Requester("http://base", detect_charset=True, cassette=cassette)
+    report, response = requester.execute(Request(path="/path"), session=session)
+    assert report.status is Status.SUCCESS
+    assert report.elapsed == 0.5
+    assert response is replayed
+
+    session.send.assert_not_called()
+    cassette.replay.assert_called_once_with(report.request, detect_charset=True)
+    cassette.record.assert_not_called()
+
+
+def test_replaying_not_recorded(session):
+    cassette = NonCallableMock(Cassette, replaying=True)
+    cassette.replay.side_effect = LookupError("Not recorded")
+    requester = Requester("http://base", cassette=cassette)
+    report, response = requester.execute(Request(path="/path"), session=session)
+    assert report.status is Status.UNSTABLE
+    assert report.message == "LookupError: Not recorded"
+    assert response is None
+
+    session.send.assert_not_called()
+
+
+def test_cached_responses(session):
+    cached = NonCallableMock(Response, elapsed=0.0, timing=None)
+    cache = NonCallableMock(ResponseCache)
+    cache.lookup.return_value = ("key", cached)
+    requester = Requester("http://base", detect_charset=True, cache=cache)
+    report, response = requester.execute(Request(path="/path"), session=session)
+    assert report.status is Status.SUCCESS
+    assert response is cached
+
+    session.send.assert_not_called()
+    cache.lookup.assert_called_once_with(
+        "GET",
+        "http://base/path",
+        ANY,
+        detect_charset=True,
+    )
+    cache.store.assert_not_called()
+
+
+def test_responses_stored_to_the_cache(session):
+    stored = NonCallableMock(Response, elapsed=1.0, timing=None)
+    cache = NonCallableMock(ResponseCache)
+    cache.lookup.return_value = ("key", None)
+    cache.store.return_value = stored
+    requester = Requester("http://base", cache=cache)
+    report, response = requester.execute(Request(path="/path"), session=session)
+    assert report.status is Status.SUCCESS
+    assert response is stored
+
+    session.send.assert_called_once()
+    cache.store.assert_called_once_with("key", ANY, detect_charset=False)
+
+
+def test_requests_opting_out_of_the_cache(session):
+    cache = NonCallableMock(ResponseCache)
+    requester = Requester("http://base", cache=cache)
+    report, _ = requester.execute(Request(path="/path", cache=False), session=session)
+    assert report.status is Status.SUCCESS
+
+    session.send.assert_called_once()
+    cache.lookup.assert_not_called()
+    cache.store.assert_not_called()
+
+
+def test_compression(session, body):
+    with raises(ValueError):
+        Requester(compress_threshold=-1)
+
+    body.resolve.return_value = {"x": "y" * 100}
+    requester = Requester("http://base", compressed=True, compress_threshold=10)
+    report, _ = requester.execute(Request(method=Method.POST, body=body), session=session)
+    assert report.status is Status.SUCCESS
+    assert report.request
+    assert report.request.headers["Content-Encoding"] == "gzip"
+
+    prepped = session.send.call_args[0][0]
+    assert prepped.headers["Accept-Encoding"] == accept_encoding()
+    assert gzip.decompress(prepped.body) == ("x=" + "y" * 100).encode("utf-8")
+
+
+def test_hedging(session, body):
+    hedging = NonCallableMock(Hedging)
+    hedging.run.side_effect = lambda url, send: send()
+    requester = Requester("http://base", hedging=hedging)
+
+    report, _ = requester.execute(Request(path="/path"), session=session)
+    assert report.status is Status.SUCCESS
+    hedging.run.assert_called_once_with("http://base/path", ANY)
+    session.send.assert_called_once()
+
+    report, _ = requester.execute(Request(method=Method.POST, body=body), session=session)
+    assert report.status is Status.SUCCESS
+    hedging.run.assert_called_once()
+    assert session.send.call_count == 2
+
+
+def test_circuit_breaker(session):
+    session.send.side_effect = requests.ConnectionError("refused")
+    requester = Requester("http://base", breaker=CircuitBreaker(threshold=2))
+
+    for _ in range(2):
+        report, _ = requester.execute(Request(path="/path"), session=session)
+        assert report.status is Status.UNSTABLE
+        assert report.message == "ConnectionError: refused"
+
+    report, response = requester.execute(Request(path="/path"), session=session)
+    assert report.status is Status.UNSTABLE
+    assert report.message
+    assert report.message.startswith("CircuitOpenError: ")
+    assert response is None
+    assert session.send.call_count == 2
+
+
+def test_timeouts(session):
+    session.send.return_value.iter_content.side_effect = lambda size: iter([b"x"])
+    timeouts = Timeouts(connect=1.0, read=5.0, deadline=3.0)
+    requester = Requester("http://base", timeout=timeouts)
+
+    report, _ = requester.execute(Request(path="/path"), session=session)
+    assert report.status is Status.SUCCESS
+    assert session.send.call_args[1]["timeout"] == (1.0, 3.0)
+
+    request = Request(path="/path", timeouts=Timeouts(read=2.0, deadline=10.0))
+    report, _ = requester.execute(request, session=session)
+    assert report.status is Status.SUCCESS
+    assert session.send.call_args[1]["timeout"] == (1.0, 2.0)
+
+
+@mark.parametrize("spool_threshold", (None, 0))
+def test_deadline(mocker, session, spool_threshold):
+    res = session.send.return_value
+    res.iter_content.return_value = iter([b"x", b"y"])
+    mocker.patch(f"{PKG}.perf_counter", return_value=0.0)
+    clock = mocker.patch("preacher.core.request.timeout.perf_counter", return_value=0.5)
+
+    requester = Requester(
+        "http://base",
+        timeout=Timeouts(deadline=1.0),
+        spool_threshold=spool_threshold,
+    )
+    report, response = requester.execute(Request(path="/path"), session=session)
+    assert report.status is Status.SUCCESS
+    assert response
+    assert response.body.content == b"xy"
+
+    res.iter_content.return_value = iter([b"x", b"y"])
+    clock.return_value = 1.5
+    report, response = requester.execute(Request(path="/path"), session=session)
+    assert report.status is Status.UNSTABLE
+    assert report.message
+    assert report.message.startswith("DeadlineExceeded: ")
+    assert response is None
+    res.close.assert_called()
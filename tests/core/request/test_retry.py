@@ -0,0 +1,128 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import NonCallableMock
+
+from pytest import approx, mark, raises
+
+from preacher.core.request import Response
+from preacher.core.request.retry import Backoff, RetryBudget, RetryOverride, RetryPolicy
+from preacher.core.request.retry import parse_retry_after
+
+PKG = "preacher.core.request.retry"
+
+
+def _response(retry_after=None):
+    headers = {} if retry_after is None else {"retry-after": retry_after}
+    return NonCallableMock(Response, headers=headers)
+
+
+@mark.parametrize(
+    "kwargs",
+    (
+        {"retry": -1},
+        {"delay": -0.1},
+        {"max_delay": -0.1},
+    ),
+)
+def test_policy_given_invalid_values(kwargs):
+    with raises(ValueError):
+        RetryPolicy(**kwargs)
+
+
+def test_constant_backoff():
+    policy = RetryPolicy(retry=2, delay=0.5)
+    assert policy.attempts == 3
+    assert policy.wait_time(1) == 0.5
+    assert policy.wait_time(5, _response()) == 0.5
+    assert policy.wait_time(1, _response("3")) == 3.0
+    assert policy.wait_time(1, _response("invalid")) == 0.5
+
+
+def test_exponential_backoff(mocker):
+    uniform = mocker.patch(f"{PKG}.random.uniform", return_value=1.5)
+
+    policy = RetryPolicy(delay=0.5, backoff=Backoff.EXPONENTIAL, max_delay=1.0)
+    assert policy.wait_time(1) == 1.0
+    uniform.assert_called_once_with(0.0, 0.5)
+
+    policy = RetryPolicy(delay=0.5, backoff=Backoff.EXPONENTIAL)
+    assert policy.wait_time(4) == 1.5
+    uniform.assert_called_with(0.0, 4.0)
+
+
+def test_accepts():
+    policy = RetryPolicy(max_delay=2.0)
+    assert policy.accepts(None)
+    assert policy.accepts(_response())
+    assert policy.accepts(_response("2"))
+    assert not policy.accepts(_response("3"))
+    assert RetryPolicy().accepts(_response("3"))
+    assert not RetryPolicy().accepts(_response("3600"))
+
+
+def test_retry_after_is_clamped():
+    assert RetryPolicy().wait_time(1, _response("3600")) == 60.0
+    assert RetryPolicy(max_delay=2.0).wait_time(1, _response("3")) == 2.0
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(_response()) is None
+    assert parse_retry_after(_response("")) is None
+    assert parse_retry_after(_response(" 120 ")) == 120.0
+    assert parse_retry_after(_response("-1")) is None
+    assert parse_retry_after(_response("Wed, 21 Oct 2015 07:28:00 GMT")) == 0.0
+
+    date = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert parse_retry_after(_response(format_datetime(date, usegmt=True))) == approx(30, abs=2)
+
+
+def test_override():
+    policy = RetryPolicy(retry=1, delay=0.5, backoff=Backoff.EXPONENTIAL, max_delay=3.0)
+    assert RetryOverride().apply(policy) == policy
+    assert RetryOverride(retry=0, delay=0.0, backoff=Backoff.CONSTANT, max_delay=0.0,).apply(
+        policy
+    ) == RetryPolicy(retry=0, delay=0.0, backoff=Backoff.CONSTANT, max_delay=0.0)
+
+
+def test_budget():
+    with raises(ValueError):
+        RetryBudget(-1)
+
+    budget = RetryBudget(2)
+    assert budget.retries == 2
+    assert budget.acquire()
+    assert budget.acquire()
+    assert not budget.acquire()
+    assert budget.remaining == 0
+
+
+def test_budget_is_shared_in_a_process(mocker):
+    budget = RetryBudget(1)
+    assert pickle.loads(pickle.dumps(budget)) is budget
+
+    dumped = pickle.dumps(budget)
+    # Restored as if in another process, whose registry is empty.
+    mocker.patch("preacher.core.util.process._PID", -1)
+    restored = pickle.loads(dumped)
+    assert restored is not budget
+    assert restored.retries == 1
+
+    # The remaining count is shared with the other processes.
+    assert restored.acquire()
+    assert budget.remaining == 0
+    assert not budget.acquire()
+    assert not restored.acquire()
+
+
+def _acquire(budget: RetryBudget, count: int) -> int:
+    return sum(budget.acquire() for _ in range(count))
+
+
+def test_budget_is_shared_between_processes():
+    budget = RetryBudget(7)
+    with ProcessPoolExecutor(3) as executor:
+        acquired = list(executor.map(_acquire, [budget] * 4, [5] * 4))
+    assert sum(acquired) == 7
+    assert budget.remaining == 0
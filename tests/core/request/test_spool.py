@@ -0,0 +1,87 @@
+import mmap
+from unittest.mock import NonCallableMock
+
+import requests
+from pytest import fixture, mark, raises
+
+from preacher.core.extraction import ResponseBodyAnalyzer
+from preacher.core.request.spool import SpooledResponseBody
+
+CONTENT = "<root><elem>東京</elem></root>".encode("utf-8")
+
+
+@fixture
+def res():
+    mock = NonCallableMock(requests.Response)
+    mock.headers = {}
+    mock.iter_content.side_effect = lambda size: iter(
+        CONTENT[i:j] for i, j in zip(range(0, len(CONTENT), 4), range(4, len(CONTENT) + 4, 4))
+    )
+    return mock
+
+
+def test_given_invalid_threshold(res):
+    with raises(ValueError):
+        SpooledResponseBody(res, threshold=-1)
+
+
+@mark.parametrize("threshold", (len(CONTENT), 1024))
+def test_small_body_is_kept_in_memory(res, threshold):
+    body = SpooledResponseBody(res, threshold=threshold)
+    res.iter_content.assert_not_called()
+    assert body.download_time is None
+
+    assert body.content == CONTENT
+    assert body.download_time is not None
+    assert isinstance(body.buffer, bytes)
+    assert not body.spooled
+    assert body.text == "<root><elem>東京</elem></root>"
+    assert "".join(body.iter_text()) == body.text
+    res.iter_content.assert_called_once()
+    body.close()
+
+
+@mark.parametrize("threshold", (0, 5, len(CONTENT) - 1))
+def test_large_body_is_spooled(res, threshold):
+    body = SpooledResponseBody(res, threshold=threshold)
+
+    buffer = body.buffer
+    assert isinstance(buffer, mmap.mmap)
+    assert body.spooled
+    assert body.buffer is buffer
+    assert body.content == CONTENT
+    assert body.encoding == "utf-8"
+    assert body.text == "<root><elem>東京</elem></root>"
+    assert "".join(body.iter_text()) == body.text
+
+    analyzer = ResponseBodyAnalyzer(body)
+    assert analyzer.for_etree(lambda elem: elem.find("elem").text) == "東京"
+    assert analyzer.for_text(len) == len(body.text)
+
+    body.close()
+    assert buffer.closed
+    res.iter_content.assert_called_once()
+
+
+def test_chunks_split_in_characters(mocker, res):
+    mocker.patch("preacher.core.request.spool._CHUNK_SIZE", 1)
+    body = SpooledResponseBody(res, threshold=0)
+    assert list(body.iter_text())[:3] == ["<", "r", "o"]
+    assert "".join(body.iter_text()) == "<root><elem>東京</elem></root>"
+
+
+def test_encoding_of_response(res):
+    res.headers = {"content-type": "text/plain; charset=Shift_JIS"}
+    res.iter_content.side_effect = lambda size: iter(["東京".encode("shift_jis")])
+    body = SpooledResponseBody(res, threshold=0)
+    assert body.encoding == "shift_jis"
+    assert body.text == "東京"
+    assert body.text is body.text  # Decoded once.
+
+
+def test_detect_charset(res):
+    content = "東京都は日本の首都です。".encode("shift_jis")
+    res.iter_content.side_effect = lambda size: iter([content])
+    body = SpooledResponseBody(res, threshold=0, detect_charset=True)
+    assert body.encoding.lower() in ("shift_jis", "cp932")
+    assert body.text == "東京都は日本の首都です。"
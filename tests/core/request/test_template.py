@@ -0,0 +1,81 @@
+import pickle
+from unittest.mock import NonCallableMock
+
+import requests
+
+from preacher.core.context import Context
+from preacher.core.request.request import Method, Request
+from preacher.core.request.request_body import JsonRequestBody, RequestBody
+from preacher.core.value import Value
+from preacher.core.value.impl.static import StaticValue
+
+PKG = "preacher.core.request.template"
+
+
+def test_static_request_is_prepared_once(mocker):
+    request_ctor = mocker.spy(requests, "Request")
+
+    request = Request(
+        method=Method.POST,
+        path="/path",
+        headers={"k": "v"},
+        params={"a": ["b", 1]},
+        body=JsonRequestBody({"x": [1, 2]}),
+    )
+    template = request.template
+    assert template.is_static
+
+    prepped1 = template.prepare(Context(), base_url="http://base")
+    prepped1.headers["Connection"] = "close"
+    prepped2 = template.prepare(Context(), base_url="http://base")
+    assert request_ctor.call_count == 1
+
+    assert prepped1 is not prepped2
+    assert "Connection" not in prepped2.headers
+    assert prepped2.method == "POST"
+    assert prepped2.url == "http://base/path?a=b&a=1"
+    assert prepped2.headers["User-Agent"].startswith("Preacher")
+    assert prepped2.headers["Content-Type"] == "application/json"
+    assert prepped2.headers["k"] == "v"
+    assert prepped2.body == '{"x":[1,2]}'
+
+    other = template.prepare(Context(), base_url="http://other")
+    assert other.url == "http://other/path?a=b&a=1"
+    assert request_ctor.call_count == 2
+
+
+def test_dynamic_request_is_prepared_every_time(mocker):
+    request_ctor = mocker.spy(requests, "Request")
+    value = NonCallableMock(Value)
+    value.resolve.side_effect = ["1", "2"]
+
+    template = Request(path="/path", params={"a": value}).template
+    assert not template.is_static
+    assert template.prepare(Context(), base_url="http://base").url == "http://base/path?a=1"
+    assert template.prepare(Context(), base_url="http://base").url == "http://base/path?a=2"
+    assert request_ctor.call_count == 2
+
+
+def test_unknown_body_is_dynamic():
+    body = NonCallableMock(RequestBody, content_type="text/plain", is_static=False)
+    body.resolve.side_effect = ["1", "2"]
+
+    template = Request(method=Method.POST, body=body).template
+    assert not template.is_static
+    assert template.prepare(Context(foo="bar"), base_url="http://base").body == "1"
+    assert template.prepare(Context(foo="bar"), base_url="http://base").body == "2"
+    body.resolve.assert_called_with(Context(foo="bar"))
+
+
+def test_cache_is_not_pickled():
+    request = Request(path="/path", params={"a": StaticValue("b")})
+    assert not request.template.is_static
+
+    static = Request(path="/path", params={"a": "b"})
+    static.template.prepare(Context(), base_url="http://base")
+    unpickled = pickle.loads(pickle.dumps(static))
+    assert unpickled.template.is_static
+    assert unpickled.template._prepared == {}
+    assert unpickled.template.prepare(Context(), base_url="http://base").url == (
+        "http://base/path?a=b"
+    )
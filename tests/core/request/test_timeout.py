@@ -0,0 +1,59 @@
+from pytest import mark, raises
+
+from preacher.core.request.timeout import DeadlineExceeded, Timeouts, iter_by
+
+PKG = "preacher.core.request.timeout"
+
+
+@mark.parametrize(
+    ("timeout", "expected"),
+    (
+        (None, Timeouts()),
+        (1.5, Timeouts(connect=1.5, read=1.5)),
+        (Timeouts(deadline=2.0), Timeouts(deadline=2.0)),
+    ),
+)
+def test_of(timeout, expected):
+    assert Timeouts.of(timeout) == expected
+
+
+def test_override():
+    timeouts = Timeouts(connect=1.0, read=2.0)
+    assert timeouts.override(None) is timeouts
+    assert timeouts.override(Timeouts()) == timeouts
+    assert timeouts.override(Timeouts(read=3.0, deadline=4.0)) == Timeouts(
+        connect=1.0,
+        read=3.0,
+        deadline=4.0,
+    )
+
+
+@mark.parametrize(
+    ("timeouts", "expected"),
+    (
+        (Timeouts(), (None, None)),
+        (Timeouts(connect=1.0, read=2.0), (1.0, 2.0)),
+        (Timeouts(connect=1.0, deadline=1.5), (1.0, 1.5)),
+        (Timeouts(connect=3.0, read=2.0, deadline=1.5), (1.5, 1.5)),
+    ),
+)
+def test_to_requests(timeouts, expected):
+    assert timeouts.to_requests() == expected
+
+
+def test_iter_by(mocker):
+    clock = mocker.patch(f"{PKG}.perf_counter", return_value=0.0)
+    assert list(iter_by(iter([b"a", b"b"]), None)) == [b"a", b"b"]
+    assert list(iter_by(iter([b"a", b"b"]), 1.0)) == [b"a", b"b"]
+
+    chunks = iter_by(iter([b"a", b"b"]), 1.0)
+    assert next(chunks) == b"a"
+    clock.return_value = 1.5
+    with raises(DeadlineExceeded):
+        next(chunks)
+
+
+def test_deadline_exceeded_is_a_timeout():
+    import requests
+
+    assert issubclass(DeadlineExceeded, requests.Timeout)
@@ -0,0 +1,146 @@
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+import requests
+from pytest import approx, fixture, raises
+from urllib3.connection import HTTPSConnection
+
+from preacher.core.request.session import SessionFactory
+from preacher.core.request.timing import Phases, Timing, TimedHTTPSConnection
+from preacher.core.request.timing import recording_phases, _current_phases
+
+PKG = "preacher.core.request.timing"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@fixture
+def url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://localhost:{server.server_port}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_phases_to_timing():
+    phases = Phases()
+    assert phases.setup == 0.0
+    assert phases.to_timing(0.5) == Timing(ttfb=0.5)
+
+    phases.dns = 0.1
+    phases.connect = 0.2
+    timing = phases.to_timing(0.5)
+    assert timing.dns == 0.1
+    assert timing.connect == 0.2
+    assert timing.tls is None
+    assert timing.ttfb == approx(0.2)
+    assert timing.download is None
+
+    assert phases.to_timing(0.1).ttfb == 0.0
+
+
+def test_recording_phases_are_nested():
+    assert _current_phases() is None
+    with recording_phases() as outer:
+        assert _current_phases() is outer
+        with recording_phases() as inner:
+            assert _current_phases() is inner
+        assert _current_phases() is outer
+    assert _current_phases() is None
+
+
+def test_new_connections_record_phases(url):
+    with SessionFactory().create() as session:
+        with recording_phases() as phases:
+            assert session.get(url).content == b"ok"
+        assert phases.dns is not None
+        assert phases.connect is not None
+        assert phases.tls is None
+
+        # The connection is reused.
+        with recording_phases() as phases:
+            assert session.get(url).content == b"ok"
+        assert phases.dns is None
+        assert phases.connect is None
+
+
+def test_connections_without_recording(url):
+    factory = SessionFactory(keep_alive=False)
+    with factory.create() as session:
+        assert session.get(url).content == b"ok"
+
+
+def test_connections_try_the_resolved_addresses_in_order(mocker, url):
+    port = int(url.rsplit(":", 1)[1].strip("/"))
+    addresses = [
+        (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.2", port)),
+        (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", port)),
+    ]
+    refused = ConnectionRefusedError("refused")
+    create_connection = mocker.patch(
+        "urllib3.util.connection.create_connection",
+        side_effect=[refused, socket.create_connection(("127.0.0.1", port))],
+    )
+    mocker.patch(f"{PKG}.socket.getaddrinfo", return_value=addresses)
+
+    with SessionFactory(pool_size=2).create() as session:
+        with recording_phases() as phases:
+            assert session.get(url).content == b"ok"
+    assert phases.connect is not None
+    assert [c.args[0] for c in create_connection.call_args_list] == [
+        ("127.0.0.2", port),
+        ("127.0.0.1", port),
+    ]
+
+
+def test_connections_fail_when_no_address_is_available(mocker, url):
+    mocker.patch(
+        "urllib3.util.connection.create_connection",
+        side_effect=ConnectionRefusedError("refused"),
+    )
+    with SessionFactory(pool_size=3).create() as session:
+        with recording_phases(), raises(requests.ConnectionError):
+            session.get(url)
+
+
+def test_connections_fail_when_the_host_is_not_resolved(mocker, url):
+    mocker.patch(f"{PKG}.socket.getaddrinfo", side_effect=socket.gaierror("unknown"))
+    with SessionFactory(pool_size=4).create() as session:
+        with recording_phases(), raises(requests.ConnectionError):
+            session.get(url)
+
+
+def test_https_connections_record_tls_handshakes(mocker):
+    def _connect(self):
+        phases = _current_phases()
+        phases.dns = 0.0
+        phases.connect = 0.0
+
+    mocker.patch.object(HTTPSConnection, "connect", _connect)
+
+    connection = TimedHTTPSConnection("localhost")
+    with recording_phases() as phases:
+        connection.connect()
+    assert phases.tls is not None
+
+    with recording_phases() as phases:
+        mocker.patch.object(HTTPSConnection, "connect", lambda self: None)
+        connection.connect()
+    assert phases.tls is None
@@ -0,0 +1,111 @@
+import os
+import threading
+from http.server import BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn, UnixStreamServer
+from typing import Iterator
+from unittest.mock import NonCallableMock
+from urllib.parse import quote
+
+import requests
+from pytest import fixture, mark
+
+from preacher.core.request.request import Request
+from preacher.core.request.requester import Requester
+from preacher.core.request.session import ProxyCache, SessionFactory
+from preacher.core.request.timing import recording_phases
+from preacher.core.request.unix import is_unix_url
+from preacher.core.status import Status
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = self.path.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        # Unix sockets have no client addresses, which `BaseHTTPRequestHandler` requires.
+        request, _ = super().get_request()
+        return request, ("local", 0)
+
+
+@fixture
+def base_url(tmp_path) -> Iterator[str]:
+    path = os.path.join(str(tmp_path), "api.sock")
+    server = _Server(path, _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http+unix://{quote(path, safe='')}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@mark.parametrize(
+    ("url", "expected"),
+    (
+        ("http+unix://%2Frun%2Fapi.sock/path", True),
+        ("HTTP+UNIX://%2Frun%2Fapi.sock", True),
+        ("http://localhost/path", False),
+        ("", False),
+    ),
+)
+def test_is_unix_url(url, expected):
+    assert is_unix_url(url) is expected
+
+
+def test_requests_over_unix_sockets(base_url):
+    requester = Requester(base_url)
+    with SessionFactory().create() as session:
+        request = Request(path="/path", params={"key": "value"})
+        report, response = requester.execute(request, session=session)
+        assert report.status is Status.SUCCESS
+        assert response
+        assert response.body.text == "/path?key=value"
+        assert report.timing
+        assert report.timing.connect is not None
+        response.close()
+
+        # The connection is reused.
+        report, response = requester.execute(request, session=session)
+        assert report.status is Status.SUCCESS
+        assert report.timing
+        assert report.timing.connect is None
+        assert response
+        response.close()
+
+
+def test_connections_without_recording(base_url):
+    with SessionFactory(keep_alive=False).create() as session:
+        assert session.get(f"{base_url}/path").content == b"/path"
+
+
+def test_unix_sockets_not_found(tmp_path):
+    path = os.path.join(str(tmp_path), "not-found.sock")
+    requester = Requester(f"http+unix://{quote(path, safe='')}")
+    with SessionFactory().create() as session, recording_phases():
+        report, response = requester.execute(Request(), session=session)
+    assert report.status is Status.UNSTABLE
+    assert report.message
+    assert report.message.startswith("ConnectionError: ")
+    assert response is None
+
+
+def test_unix_sockets_are_not_proxied(monkeypatch):
+    monkeypatch.setenv("ALL_PROXY", "http://proxy")
+    session = NonCallableMock(requests.Session)
+    request = requests.Request("GET", "http+unix://%2Frun%2Fapi.sock/path").prepare()
+    assert ProxyCache().resolve(session, request) == {}
+    session.rebuild_proxies.assert_not_called()
@@ -0,0 +1,100 @@
+import asyncio
+from datetime import timedelta
+from unittest.mock import NonCallableMock, sentinel
+
+from preacher.core.context import Context
+from preacher.core.request import ExecutionReport, Response
+from preacher.core.scenario import CaseListener
+from preacher.core.scenario.async_case_runner import AsyncCaseRunner
+from preacher.core.scenario.case import Case
+from preacher.core.status import Status
+from preacher.core.unit.async_runner import AsyncUnitRunner
+from preacher.core.verification import Description, Verification
+
+PKG = "preacher.core.scenario.async_case_runner"
+
+
+class _UnitRunner(AsyncUnitRunner):
+    def __init__(self, result):
+        self.calls = []
+        self._result = result
+
+    @property
+    def base_url(self) -> str:
+        return "base-url"
+
+    async def run(
+        self, request, requirements, session=None, context=None, limiter=None, retry=None
+    ):
+        self.calls.append((request, requirements, session, dict(context), limiter, retry))
+        return self._result
+
+
+def test_runner_properties():
+    runner = AsyncCaseRunner(_UnitRunner(None))
+    assert runner.base_url == "base-url"
+
+
+def test_when_disabled():
+    unit_runner = _UnitRunner(None)
+    runner = AsyncCaseRunner(unit_runner=unit_runner)
+
+    case = Case(label=sentinel.label, enabled=False)
+    actual = asyncio.run(runner.run(case))
+    assert actual.label is sentinel.label
+    assert actual.status is Status.SKIPPED
+
+    assert not unit_runner.calls
+
+
+def test_given_bad_condition():
+    condition = NonCallableMock(Description)
+    condition.verify.return_value = Verification(status=Status.FAILURE)
+    unit_runner = _UnitRunner(None)
+    listener = NonCallableMock(CaseListener)
+    runner = AsyncCaseRunner(unit_runner=unit_runner, listener=listener)
+
+    case = Case(label=sentinel.label, conditions=[condition])
+    actual = asyncio.run(runner.run(case))
+    assert actual.status is Status.FAILURE
+
+    assert not unit_runner.calls
+    listener.on_execution.assert_not_called()
+
+
+def test_when_given_an_response(mocker):
+    mocker.patch(f"{PKG}.now", return_value=sentinel.starts)
+
+    execution = ExecutionReport(status=Status.SUCCESS)
+    verification = NonCallableMock(status=Status.UNSTABLE)
+    response = NonCallableMock(Response)
+    unit_runner = _UnitRunner((execution, response, verification))
+    listener = NonCallableMock(CaseListener)
+    runner = AsyncCaseRunner(unit_runner=unit_runner, listener=listener)
+
+    case = Case(
+        label=sentinel.label,
+        request=sentinel.request,
+        response=sentinel.requirements,
+        waiting_time=timedelta(seconds=1.5),
+        limiter=sentinel.limiter,
+        retry=sentinel.retry,
+    )
+    result = asyncio.run(runner.run(case, session=sentinel.session, context=Context(foo="bar")))
+    assert result.label is sentinel.label
+    assert result.status is Status.UNSTABLE
+    assert result.execution is execution
+    assert result.response is verification
+
+    assert unit_runner.calls == [
+        (
+            sentinel.request,
+            sentinel.requirements,
+            sentinel.session,
+            {"foo": "bar", "starts": sentinel.starts, "base_url": "base-url"},
+            sentinel.limiter,
+            sentinel.retry,
+        )
+    ]
+    listener.on_execution.assert_called_once_with(execution, response)
+    response.close.assert_called_once_with()
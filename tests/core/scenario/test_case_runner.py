@@ -8,7 +8,8 @@ from pytest import mark
 
 from preacher.core.context import Context
 from preacher.core.extraction import Analyzer
-from preacher.core.request import ExecutionReport, Request
+from preacher.core.request import ExecutionReport, HostLimiter, Request, Response
+from preacher.core.request import RetryOverride
 from preacher.core.scenario import CaseListener
 from preacher.core.scenario.case import Case
 from preacher.core.scenario.case_runner import CaseRunner
@@ -32,13 +33,13 @@ def test_case_listener():
 
 def test_runner_properties():
     unit_runner = NonCallableMock(UnitRunner, base_url=sentinel.base_url)
+    unit_runner.create_session.return_value = sentinel.session
     runner = CaseRunner(unit_runner)
     assert runner.base_url is sentinel.base_url
+    assert runner.create_session() is sentinel.session
 
 
-def test_when_disabled(mocker):
-    sleep = mocker.patch(f"{PKG}.sleep")
-
+def test_when_disabled():
     case = Case(label=sentinel.label, enabled=False, waiting_time=timedelta(1.0))
 
     unit_runner = NonCallableMock(UnitRunner)
@@ -47,7 +48,6 @@ def test_when_disabled(mocker):
     assert actual.label is sentinel.label
     assert actual.status is Status.SKIPPED
 
-    sleep.assert_not_called()
     unit_runner.run.assert_not_called()
 
 
@@ -74,7 +74,6 @@ def test_when_disabled(mocker):
 )
 def test_given_bad_condition(mocker, condition_verifications, expected_status):
     mocker.patch(f"{PKG}.now", return_value=sentinel.starts)
-    sleep = mocker.patch(f"{PKG}.sleep")
 
     def _analyze_context(context: Context) -> Analyzer:
         assert context == Context(foo="bar", starts=sentinel.starts, base_url=sentinel.base_url)
@@ -115,14 +114,12 @@ def test_given_bad_condition(mocker, condition_verifications, expected_status):
         condition.verify.assert_called_once_with(sentinel.context_analyzer, Context(foo="bar"))
     analyze_context.assert_called_once_with(Context(foo="bar"))
 
-    sleep.assert_not_called()
     unit_runner.run.assert_not_called()
     listener.on_execution.assert_not_called()
 
 
 def test_when_given_no_response(mocker):
     mocker.patch(f"{PKG}.now", return_value=sentinel.starts)
-    sleep = mocker.patch(f"{PKG}.sleep")
 
     execution = ExecutionReport(status=Status.FAILURE)
     case = Case(label=sentinel.label, request=sentinel.request, response=sentinel.response)
@@ -132,6 +129,8 @@ def test_when_given_no_response(mocker):
         requirements: ResponseDescription,
         session: Optional[requests.Session] = None,
         context: Optional[Context] = None,
+        limiter: Optional[HostLimiter] = None,
+        retry: Optional[RetryOverride] = None,
     ) -> Result:
         assert request is sentinel.request
         assert requirements is sentinel.response
@@ -150,19 +149,19 @@ def test_when_given_no_response(mocker):
     assert result.execution is execution
     assert result.response is None
 
-    sleep.assert_called_once_with(0.0)
     unit_runner.run.assert_called_once_with(  # Contextual values will disappear.
         request=sentinel.request,
         requirements=sentinel.response,
         session=None,
         context=Context(),
+        limiter=None,
+        retry=None,
     )
     listener.on_execution.assert_called_once_with(execution, None)
 
 
 def test_when_given_an_response(mocker):
     mocker.patch(f"{PKG}.now", return_value=sentinel.starts)
-    sleep = mocker.patch(f"{PKG}.sleep")
 
     execution = ExecutionReport(status=Status.SUCCESS, starts=sentinel.starts)
     verification = ResponseVerification(
@@ -177,6 +176,8 @@ def test_when_given_an_response(mocker):
         request=sentinel.request,
         response=sentinel.response,
         waiting_time=timedelta(minutes=1.2),
+        limiter=sentinel.limiter,
+        retry=sentinel.retry,
     )
 
     def _run_unit(
@@ -184,18 +185,21 @@ def test_when_given_an_response(mocker):
         requirements: ResponseDescription,
         session: Optional[requests.Session] = None,
         context: Optional[Context] = None,
+        limiter: Optional[HostLimiter] = None,
+        retry: Optional[RetryOverride] = None,
     ) -> Result:
         assert request is sentinel.request
         assert requirements is sentinel.response
         assert session is sentinel.session
         assert context == Context(foo="bar", starts=sentinel.starts, base_url=sentinel.base_url)
-        sleep.assert_called_once_with(72.0)
 
-        return execution, sentinel.response, verification
+        return execution, response, verification
 
+    response = NonCallableMock(Response)
     unit_runner = NonCallableMock(UnitRunner, base_url=sentinel.base_url)
     unit_runner.run.side_effect = Mock(side_effect=_run_unit)
     listener = NonCallableMock(spec=CaseListener)
+    listener.on_execution.side_effect = lambda *_: response.close.assert_not_called()
     runner = CaseRunner(unit_runner=unit_runner, listener=listener)
     result = runner.run(case, session=sentinel.session, context=Context(foo="bar"))
 
@@ -210,18 +214,8 @@ def test_when_given_an_response(mocker):
         requirements=sentinel.response,
         session=sentinel.session,
         context=Context(foo="bar"),
+        limiter=sentinel.limiter,
+        retry=sentinel.retry,
     )
-    listener.on_execution.assert_called_once_with(execution, sentinel.response)
-
-
-def test_given_a_negative_waiting_time(mocker):
-    mocker.patch(f"{PKG}.now", return_value=sentinel.starts)
-    sleep = mocker.patch(f"{PKG}.sleep")
-
-    case = Case(waiting_time=timedelta(seconds=-2.4))
-    unit_runner = NonCallableMock(UnitRunner, base_url=sentinel.base_url)
-    unit_runner.run.return_value = ExecutionReport(), None, None
-    runner = CaseRunner(unit_runner=unit_runner)
-    runner.run(case)
-
-    sleep.assert_called_once_with(0.0)
+    listener.on_execution.assert_called_once_with(execution, response)
+    response.close.assert_called_once_with()
@@ -0,0 +1,24 @@
+from concurrent.futures import Future
+from unittest.mock import Mock
+
+from preacher.core.scenario.deferred import DeferredScenarioTask, decode_result, encode_result
+from preacher.core.scenario.scenario_result import ScenarioResult
+from preacher.core.status import Status
+
+
+def test_encode_result():
+    result = ScenarioResult(label="label", status=Status.UNSTABLE, message="message")
+    assert decode_result(encode_result(result)) == result
+
+
+def test_deferred_scenario_task():
+    future: Future = Future()
+    task = DeferredScenarioTask(future)
+    fn = Mock()
+    task.add_done_callback(fn)
+    fn.assert_not_called()
+
+    result = ScenarioResult(status=Status.SUCCESS)
+    future.set_result(encode_result(result))
+    fn.assert_called_once_with(task)
+    assert task.result() == result
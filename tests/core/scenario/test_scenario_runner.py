@@ -1,10 +1,17 @@
+from concurrent.futures import Executor, Future
+from threading import Barrier
 from unittest.mock import Mock, NonCallableMock, call, sentinel
 
-from pytest import mark
+from pytest import mark, raises
 
 from preacher.core.context import Context
+from preacher.core.scenario.async_case_runner import AsyncCaseRunner
+from preacher.core.scenario.case import Case
+from preacher.core.scenario.case_result import CaseResult
 from preacher.core.scenario.case_runner import CaseRunner
+from preacher.core.scenario.deferred import DeferredScenario
 from preacher.core.scenario.scenario import Scenario
+from preacher.core.scenario.scenario_result import ScenarioResult
 from preacher.core.scenario.scenario_runner import ScenarioRunner
 from preacher.core.status import Status
 from preacher.core.verification import Description, Verification
@@ -139,3 +146,119 @@ def test_ordered(mocker):
             ),
         ]
     )
+
+
+@mark.parametrize(
+    ("case_runner_type", "ctor_name"),
+    (
+        (CaseRunner, "DependentCasesTask"),
+        (AsyncCaseRunner, "AsyncDependentCasesTask"),
+    ),
+)
+def test_ordered_by_dependency(mocker, case_runner_type, ctor_name):
+    mocker.patch(f"{PKG}.now", return_value=sentinel.starts)
+    ordered_cases_task_ctor = mocker.patch(f"{PKG}.OrderedCasesTask")
+    cases_task_ctor = mocker.patch(f"{PKG}.{ctor_name}", return_value=sentinel.cases_task)
+    mocker.patch(f"{PKG}.RunningScenarioTask", return_value=sentinel.task)
+
+    case_runner = NonCallableMock(case_runner_type, base_url="")
+    runner = ScenarioRunner(
+        executor=sentinel.executor,
+        case_runner=case_runner,
+        ordered_by_dependency=True,
+    )
+    assert runner.submit(Scenario(ordered=True, cases=sentinel.cases)) is sentinel.task
+
+    cases_task_ctor.assert_called_once_with(
+        sentinel.executor,
+        case_runner,
+        sentinel.cases,
+        context=Context(starts=sentinel.starts, base_url=""),
+    )
+    ordered_cases_task_ctor.assert_not_called()
+
+
+@mark.parametrize(
+    ("ordered", "ctor_name", "expected_kwargs"),
+    (
+        (False, "AsyncUnorderedCasesTask", {}),
+        (True, "AsyncOrderedCasesTask", {"context": Context(starts=sentinel.starts, base_url="")}),
+    ),
+)
+def test_given_an_async_case_runner(mocker, ordered, ctor_name, expected_kwargs):
+    mocker.patch(f"{PKG}.now", return_value=sentinel.starts)
+    ordered_cases_task_ctor = mocker.patch(f"{PKG}.OrderedCasesTask")
+    unordered_cases_task_ctor = mocker.patch(f"{PKG}.UnorderedCasesTask")
+    cases_task_ctor = mocker.patch(f"{PKG}.{ctor_name}", return_value=sentinel.cases_task)
+    mocker.patch(f"{PKG}.RunningScenarioTask", return_value=sentinel.task)
+
+    scenario = Scenario(ordered=ordered, cases=sentinel.cases)
+    case_runner = NonCallableMock(AsyncCaseRunner, base_url="")
+    runner = ScenarioRunner(executor=sentinel.executor, case_runner=case_runner)
+    task = runner.submit(scenario)
+    assert task is sentinel.task
+
+    cases_task_ctor.assert_called_once_with(
+        sentinel.executor,
+        case_runner,
+        sentinel.cases,
+        **expected_kwargs,
+    )
+    ordered_cases_task_ctor.assert_not_called()
+    unordered_cases_task_ctor.assert_not_called()
+
+
+def test_deferred_scenarios(mocker):
+    case_runner = NonCallableMock(CaseRunner, base_url="")
+    executor = NonCallableMock(Executor)
+    executor.submit.side_effect = lambda fn, *args, **kwargs: _done(fn(*args, **kwargs))
+    submit = mocker.patch.object(ScenarioRunner, "submit")
+    submit.return_value.result.return_value = ScenarioResult(status=Status.UNSTABLE)
+
+    scenario = NonCallableMock(DeferredScenario)
+    scenario.construct.return_value = sentinel.scenario
+    task = ScenarioRunner(executor=executor, case_runner=case_runner).submit_deferred(scenario)
+    assert task.result().status is Status.UNSTABLE
+    submit.assert_called_once_with(sentinel.scenario)
+
+    scenario.construct.side_effect = RuntimeError("message")
+    task = ScenarioRunner(executor=executor, case_runner=case_runner).submit_deferred(scenario)
+    result = task.result()
+    assert result.label == "Not a constructed scenario"
+    assert result.status is Status.FAILURE
+    assert result.message == "RuntimeError: message"
+
+
+def test_deferred_scenarios_run_cases_concurrently():
+    barrier = Barrier(2)
+
+    def _run(case: Case, **kwargs) -> CaseResult:
+        # Blocks unless the cases run at the same time.
+        barrier.wait(timeout=5.0)
+        return CaseResult()
+
+    case_runner = NonCallableMock(CaseRunner, base_url="")
+    case_runner.run.side_effect = _run
+    executor = NonCallableMock(Executor)
+    executor.submit.side_effect = lambda fn, *args, **kwargs: _done(fn(*args, **kwargs))
+
+    scenario = NonCallableMock(DeferredScenario)
+    scenario.construct.return_value = Scenario(ordered=False, cases=[Case(), Case()])
+    runner = ScenarioRunner(executor=executor, case_runner=case_runner, deferred_concurrency=2)
+    result = runner.submit_deferred(scenario).result()
+    assert result.status is Status.SKIPPED
+    assert len(result.cases.items) == 2
+
+
+def test_deferred_scenarios_with_async_case_runner():
+    runner = ScenarioRunner(
+        executor=sentinel.executor, case_runner=NonCallableMock(AsyncCaseRunner)
+    )
+    with raises(ValueError):
+        runner.submit_deferred(NonCallableMock(DeferredScenario))
+
+
+def _done(result: object) -> Future:
+    future: Future = Future()
+    future.set_result(result)
+    return future
@@ -1,4 +1,4 @@
-from unittest.mock import NonCallableMock, sentinel
+from unittest.mock import Mock, NonCallableMock, sentinel
 
 from pytest import mark
 
@@ -13,6 +13,10 @@ def test_static_scenario_task():
     task = StaticScenarioTask(sentinel.result)
     assert task.result() is sentinel.result
 
+    fn = Mock()
+    task.add_done_callback(fn)
+    fn.assert_called_once_with(task)
+
 
 def test_running_scenario_task_empty():
     cases_result = NonCallableMock(StatusedList, status=Status.SKIPPED)
@@ -68,3 +72,21 @@ def test_running_scenario_task_filled(cases_status, subscenario_status, expected
     assert result.cases is cases_result
     assert len(result.subscenarios.items) == 1
     assert result.subscenarios.items[0] is subscenario_result
+
+
+def test_running_scenario_task_done_callback():
+    cases = NonCallableMock(CasesTask)
+    subscenario = NonCallableMock(ScenarioTask)
+    task = RunningScenarioTask(
+        label=sentinel.label,
+        conditions=sentinel.conditions,
+        cases=cases,
+        subscenarios=[subscenario],
+    )
+    fn = Mock()
+    task.add_done_callback(fn)
+
+    cases.add_done_callback.call_args[0][0](cases)
+    fn.assert_not_called()
+    subscenario.add_done_callback.call_args[0][0](subscenario)
+    fn.assert_called_once_with(task)
@@ -0,0 +1,297 @@
+import threading
+from concurrent.futures import CancelledError, Executor, Future, ThreadPoolExecutor
+from functools import partial
+from unittest.mock import MagicMock, NonCallableMock, sentinel
+
+from pytest import mark, raises
+from requests import Session
+
+from preacher.core.context import Context
+from preacher.core.extraction.impl.key import KeyExtractor
+from preacher.core.request import ExecutionReport, PreparedRequest, Request
+from preacher.core.scenario.case import Case
+from preacher.core.scenario.case_result import CaseResult
+from preacher.core.scenario.case_runner import CaseRunner
+from preacher.core.scenario.deferred import encode_result
+from preacher.core.scenario.scenario_result import ScenarioResult
+from preacher.core.scenario.util.adaptive import AdaptiveExecutor, AimdController
+from preacher.core.scenario.util.concurrency import DependentCasesTask, OrderedCasesTask
+from preacher.core.status import Status, StatusedList
+from preacher.core.value.impl.context import ContextualValue
+from preacher.core.verification import Description, ResponseDescription
+
+PKG = "preacher.core.scenario.util.adaptive"
+
+
+def _execution(status=Status.SUCCESS, elapsed=None, url="http://a.com/path?q=1"):
+    request = PreparedRequest(method="GET", url=url, headers={}, body=None)
+    return ExecutionReport(status=status, request=request, elapsed=elapsed)
+
+
+@mark.parametrize(
+    "kwargs",
+    (
+        {"max_limit": 0},
+        {"max_limit": 1, "min_limit": 0},
+        {"max_limit": 1, "min_limit": 2},
+        {"max_limit": 1, "tolerance": 1.0},
+        {"max_limit": 1, "backoff": 0.0},
+        {"max_limit": 1, "backoff": 1.0},
+    ),
+)
+def test_controller_given_invalid_parameters(kwargs):
+    with raises(ValueError):
+        AimdController(**kwargs)
+
+
+def test_controller_increases_and_decreases(mocker):
+    mocker.patch(f"{PKG}.time.monotonic", return_value=10.0)
+
+    controller = AimdController(max_limit=8)
+    assert controller.limit == 1
+
+    # Slow start.
+    for _ in range(3):
+        controller.observe(0.0, [("a", 1.0)])
+    assert controller.limit == 4
+
+    # Latency of another endpoint is compared with its own.
+    controller.observe(0.0, [("b", 3.0)])
+    assert controller.limit == 5
+
+    controller.observe(0.0, [("a", 2.5)])
+    assert controller.limit == 2
+
+    # Signals of the tasks submitted before the decrease are ignored.
+    controller.observe(9.0, [("a", 2.5)], error=True)
+    assert controller.limit == 2
+
+    # Additive increase from 2.5.
+    controller.observe(11.0, [("a", 1.0)])
+    assert controller.limit == 2
+    controller.observe(11.0, [("b", 3.0)])
+    assert controller.limit == 3
+
+    controller.observe(11.0, error=True)
+    assert controller.limit == 1
+
+
+def test_controller_is_bounded():
+    controller = AimdController(max_limit=3, min_limit=2)
+    assert controller.limit == 2
+    for _ in range(5):
+        controller.observe(0.0, [("a", 1.0)])
+    assert controller.limit == 3
+
+
+def test_executor_limits_tasks_in_flight():
+    controller = NonCallableMock(AimdController, limit=2)
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+
+    def _task():
+        with lock:
+            in_flight.append(None)
+            peak.append(len(in_flight))
+        threading.Event().wait(0.01)
+        with lock:
+            in_flight.pop()
+        return CaseResult(execution=_execution(elapsed=0.01))
+
+    with ThreadPoolExecutor(4) as inner:
+        executor = AdaptiveExecutor(inner, controller)
+        assert executor.executor is inner
+        futures = [executor.submit(_task) for _ in range(6)]
+        for future in futures:
+            future.result()
+
+    assert max(peak) == 2
+    assert controller.observe.call_count == 6
+
+
+def test_executor_observes_results(mocker):
+    mocker.patch(f"{PKG}.time.monotonic", return_value=sentinel.submitted)
+    controller = NonCallableMock(AimdController, limit=10)
+    inner = NonCallableMock(Executor)
+    futures = []
+
+    def _submit(fn, *args, **kwargs):
+        future: Future = Future()
+        futures.append(future)
+        return future
+
+    inner.submit.side_effect = _submit
+    executor = AdaptiveExecutor(inner, controller)
+    for _ in range(5):
+        executor.submit(sentinel.fn)
+
+    futures[0].set_result(
+        StatusedList(
+            [
+                CaseResult(execution=_execution(elapsed=1.0)),
+                CaseResult(execution=_execution(elapsed=2.0, url="http://a.com/other")),
+                CaseResult(execution=_execution(Status.SKIPPED)),
+            ]
+        )
+    )
+    controller.observe.assert_called_once_with(
+        sentinel.submitted,
+        [("GET http://a.com/path", 1.0), ("GET http://a.com/other", 2.0)],
+        error=False,
+    )
+
+    controller.observe.reset_mock()
+    futures[1].set_result(CaseResult(execution=_execution(Status.UNSTABLE)))
+    controller.observe.assert_called_once_with(sentinel.submitted, [], error=True)
+
+    controller.observe.reset_mock()
+    futures[2].set_result(CaseResult())
+    futures[3].set_exception(RuntimeError())
+    futures[4].cancel()
+    controller.observe.assert_not_called()
+
+
+@mark.parametrize(
+    "result",
+    (
+        (StatusedList([CaseResult(execution=_execution(elapsed=1.0))]), Context()),
+        (CaseResult(execution=_execution(elapsed=1.0)), {"foo": "bar"}),
+        encode_result(
+            ScenarioResult(
+                cases=StatusedList([CaseResult(execution=_execution(elapsed=1.0))]),
+                subscenarios=StatusedList(
+                    [ScenarioResult(cases=StatusedList([CaseResult(execution=_execution())]))]
+                ),
+            )
+        ),
+    ),
+    ids=["ordered", "dependent", "deferred"],
+)
+def test_executor_observes_wrapped_results(mocker, result):
+    mocker.patch(f"{PKG}.time.monotonic", return_value=sentinel.submitted)
+    controller = NonCallableMock(AimdController, limit=1)
+    inner = NonCallableMock(Executor)
+    inner.submit.return_value = Future()
+
+    executor = AdaptiveExecutor(inner, controller)
+    executor.submit(sentinel.fn)
+    inner.submit.return_value.set_result(result)
+    controller.observe.assert_called_once_with(
+        sentinel.submitted,
+        [("GET http://a.com/path", 1.0)],
+        error=False,
+    )
+
+
+def _case_runner() -> CaseRunner:
+    runner = NonCallableMock(CaseRunner)
+    runner.create_session.return_value = MagicMock(Session)
+    runner.run.side_effect = lambda case, **kwargs: CaseResult(
+        label=case.label,
+        execution=_execution(elapsed=1.0),
+    )
+    return runner
+
+
+def test_executor_adapts_to_ordered_cases():
+    runner = _case_runner()
+    cases = [Case(label="1"), Case(label="2")]
+    controller = AimdController(max_limit=8)
+
+    with ThreadPoolExecutor(8) as inner:
+        executor = AdaptiveExecutor(inner, controller)
+        tasks = [OrderedCasesTask(executor, runner, cases) for _ in range(3)]
+        for task in tasks:
+            assert [item.label for item in task.result().items] == ["1", "2"]
+    assert controller.limit == 4
+
+
+def test_executor_adapts_to_dependent_cases():
+    runner = _case_runner()
+    writing = Case(
+        label="1",
+        response=ResponseDescription(
+            body=[Description(KeyExtractor("id"), [], value_name="foo")],
+        ),
+    )
+    reading = Case(label="2", request=Request(params={"id": ContextualValue("foo")}))
+    controller = AimdController(max_limit=8)
+
+    with ThreadPoolExecutor(8) as inner:
+        executor = AdaptiveExecutor(inner, controller)
+        task = DependentCasesTask(executor, runner, [writing, reading, reading])
+        assert [item.label for item in task.result().items] == ["1", "2", "2"]
+    assert controller.limit == 4
+
+
+def test_executor_releases_when_submission_fails():
+    controller = NonCallableMock(AimdController, limit=1)
+    inner = NonCallableMock(Executor)
+    inner.submit.side_effect = RuntimeError()
+    executor = AdaptiveExecutor(inner, controller)
+
+    futures = [executor.submit(sentinel.fn, sentinel.arg) for _ in range(2)]
+    for future in futures:
+        assert isinstance(future.exception(timeout=1.0), RuntimeError)
+    assert inner.submit.call_count == 2
+    inner.submit.assert_called_with(sentinel.fn, sentinel.arg)
+
+    executor.shutdown(wait=False)
+    inner.shutdown.assert_called_once_with(wait=False)
+    with raises(RuntimeError):
+        executor.submit(sentinel.fn)
+
+
+def test_executor_queues_tasks_over_limit():
+    controller = NonCallableMock(AimdController, limit=1)
+    inner = NonCallableMock(Executor)
+    inner_futures = []
+
+    def _submit(fn, *args, **kwargs):
+        future: Future = Future()
+        inner_futures.append(future)
+        return future
+
+    inner.submit.side_effect = _submit
+    executor = AdaptiveExecutor(inner, controller)
+
+    futures = [executor.submit(sentinel.fn) for _ in range(3)]
+    assert len(inner_futures) == 1
+
+    futures[1].cancel()
+    inner_futures[0].set_result(sentinel.result0)
+    assert futures[0].result(timeout=1.0) is sentinel.result0
+    assert len(inner_futures) == 2
+
+    controller.limit = 2
+    futures.append(executor.submit(sentinel.fn))
+    assert len(inner_futures) == 3
+
+    inner_futures[1].set_result(sentinel.result2)
+    inner_futures[2].cancel()
+    assert futures[2].result(timeout=1.0) is sentinel.result2
+    with raises(CancelledError):
+        futures[3].result(timeout=1.0)
+
+    executor.shutdown()
+    inner.shutdown.assert_called_once_with(wait=True)
+
+
+def test_executor_submits_in_callbacks_without_blocking():
+    controller = NonCallableMock(AimdController, limit=1)
+    done = threading.Event()
+
+    with ThreadPoolExecutor(1) as inner:
+        executor = AdaptiveExecutor(inner, controller)
+
+        def _chain(n, _future):
+            if n:
+                following = executor.submit(CaseResult)
+                following.add_done_callback(partial(_chain, n - 1))
+            else:
+                done.set()
+
+        executor.submit(CaseResult).add_done_callback(partial(_chain, 3))
+        assert done.wait(5.0)
+        executor.shutdown()
@@ -0,0 +1,183 @@
+import asyncio
+import threading
+from datetime import timedelta
+from unittest.mock import Mock, NonCallableMock, sentinel
+
+from pytest import fixture, raises
+
+from preacher.core.scenario.async_case_runner import AsyncCaseRunner
+from preacher.core.scenario.case import Case
+from preacher.core.scenario.case_result import CaseResult
+from preacher.core.context import Context
+from preacher.core.scenario.util.async_concurrency import AsyncDependentCasesTask
+from preacher.core.scenario.util.async_concurrency import AsyncioExecutor
+from preacher.core.scenario.util.async_concurrency import AsyncOrderedCasesTask
+from preacher.core.scenario.util.async_concurrency import AsyncUnorderedCasesTask
+from preacher.core.status import Status
+
+PKG = "preacher.core.scenario.util.async_concurrency"
+
+
+class _CaseRunner(AsyncCaseRunner):
+    def __init__(self, results):
+        self.calls = []
+        self._results = list(results)
+        self._in_flight = 0
+        self.max_in_flight = 0
+
+    async def run(self, case, session=None, context=None):
+        self.calls.append((case, session, context))
+        self._in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        await asyncio.sleep(0.01)
+        self._in_flight -= 1
+        return self._results.pop(0)
+
+
+class _Session:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def test_executor_given_invalid_concurrency():
+    with raises(ValueError):
+        AsyncioExecutor(0)
+
+
+def test_executor_runs_coroutine_functions_and_callables():
+    async def _coroutine(value):
+        return threading.current_thread().name, value
+
+    def _function(value):
+        return value * 2
+
+    with AsyncioExecutor(2) as executor:
+        loop_thread, value = executor.submit(_coroutine, 1).result()
+        assert loop_thread != threading.current_thread().name
+        assert value == 1
+        assert executor.submit(_function, 2).result() == 4
+
+    with raises(RuntimeError):
+        executor.submit(_function, 3)
+    executor.shutdown()  # Can be called twice.
+
+
+def test_executor_limits_concurrency():
+    runner = _CaseRunner([sentinel.result] * 8)
+    with AsyncioExecutor(3) as executor:
+        futures = [executor.submit(runner.run, sentinel.case) for _ in range(8)]
+        assert [f.result() for f in futures] == [sentinel.result] * 8
+    assert runner.max_in_flight == 3
+
+
+def test_executor_shutdown_without_waiting():
+    executor = AsyncioExecutor(1)
+    future = executor.submit(asyncio.sleep, 10.0)
+    executor.shutdown(wait=False)
+    assert future.cancelled()
+
+
+@fixture
+def session(mocker):
+    session = _Session()
+    mocker.patch(f"{PKG}.create_client_session", return_value=session)
+    return session
+
+
+def test_executor_shares_client_session(session):
+    with AsyncioExecutor(2) as executor:
+        assert executor.client_session() is session
+        assert executor.client_session() is session
+        assert not session.closed
+    assert session.closed
+
+
+def test_ordered_cases_task(session):
+    case_results = [
+        NonCallableMock(CaseResult, status=Status.SUCCESS),
+        NonCallableMock(CaseResult, status=Status.UNSTABLE),
+    ]
+    runner = _CaseRunner(case_results)
+    case1 = Case(label="1")
+    case2 = Case(label="2")
+
+    with AsyncioExecutor(4) as executor:
+        task = AsyncOrderedCasesTask(
+            executor,
+            runner,
+            [case1, case2],
+            context=sentinel.context,
+        )
+        done = threading.Event()
+        task.add_done_callback(lambda _: done.set())
+        result = task.result()
+        assert done.wait(1.0)
+    assert result.status is Status.UNSTABLE
+    assert result.items == case_results
+    assert runner.calls == [
+        (case1, session, sentinel.context),
+        (case2, session, sentinel.context),
+    ]
+    assert runner.max_in_flight == 1
+
+
+def test_dependent_cases_task(session):
+    case_results = [
+        NonCallableMock(CaseResult, status=Status.SUCCESS),
+        NonCallableMock(CaseResult, status=Status.UNSTABLE),
+    ]
+    runner = _CaseRunner(case_results)
+    case1 = Case(label="1")
+    case2 = Case(label="2")
+
+    with AsyncioExecutor(4) as executor:
+        task = AsyncDependentCasesTask(executor, runner, [case1, case2], context=Context(k="v"))
+        done = threading.Event()
+        task.add_done_callback(lambda _: done.set())
+        result = task.result()
+        assert done.wait(1.0)
+    assert result.status is Status.UNSTABLE
+    assert {c[0] for c in runner.calls} == {case1, case2}
+    assert all(c[1] is session for c in runner.calls)
+    assert all(dict(c[2]) == {"k": "v"} for c in runner.calls)
+    assert runner.max_in_flight == 2
+
+
+def test_unordered_cases_task(session):
+    case_results = [
+        NonCallableMock(CaseResult, status=Status.SUCCESS),
+        NonCallableMock(CaseResult, status=Status.FAILURE),
+    ]
+    runner = _CaseRunner(case_results)
+    case1 = Case(label="1")
+    case2 = Case(label="2")
+
+    with AsyncioExecutor(4) as executor:
+        task = AsyncUnorderedCasesTask(executor, runner, [case1, case2])
+        result = task.result()
+        fn = Mock()
+        task.add_done_callback(fn)
+        fn.assert_called_once_with(task)
+    assert result.status is Status.FAILURE
+    assert {c[0] for c in runner.calls} == {case1, case2}
+    assert all(c[1] is session for c in runner.calls)
+    assert session.closed
+    assert runner.max_in_flight == 2
+
+
+def test_waiting_cases_free_the_executor(session):
+    runner = _CaseRunner([sentinel.result1, sentinel.result2, sentinel.result3])
+    case1 = Case(label="1", waiting_time=timedelta(seconds=0.2))
+    case2 = Case(label="2", waiting_time=timedelta(seconds=0.2))
+
+    with AsyncioExecutor(1) as executor:
+        ordered = AsyncOrderedCasesTask(executor, runner, [case1], context=sentinel.context)
+        unordered = AsyncUnorderedCasesTask(executor, runner, [case2])
+        future = executor.submit(runner.run, sentinel.case)
+        assert future.result() is sentinel.result1
+        assert ordered.result().items == [sentinel.result2]
+        assert unordered.result().items == [sentinel.result3]
+    assert runner.calls[1] == (case1, session, sentinel.context)
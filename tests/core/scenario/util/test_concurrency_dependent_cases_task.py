@@ -0,0 +1,133 @@
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Dict, Optional
+from unittest.mock import Mock, NonCallableMock
+
+from pytest import mark, raises
+
+from preacher.core.context import Context
+from preacher.core.extraction.impl.key import KeyExtractor
+from preacher.core.request import Request
+from preacher.core.scenario.case import Case
+from preacher.core.scenario.case_result import CaseResult
+from preacher.core.scenario.case_runner import CaseRunner
+from preacher.core.scenario.util.adaptive import AdaptiveExecutor, AimdController
+from preacher.core.scenario.util.concurrency import DependentCasesTask
+from preacher.core.status import Status
+from preacher.core.value.impl.context import ContextualValue
+from preacher.core.verification import Description, ResponseDescription
+
+
+def _writing(label: str, key: str) -> Case:
+    description = Description(KeyExtractor("id"), [], value_name=key)
+    return Case(label=label, response=ResponseDescription(body=[description]))
+
+
+def _reading(label: str, key: str) -> Case:
+    return Case(label=label, request=Request(params={"id": ContextualValue(key)}))
+
+
+def test_given_no_cases():
+    executor = NonCallableMock(Executor)
+    task = DependentCasesTask(executor, NonCallableMock(CaseRunner), [])
+    result = task.result()
+    assert result.status is Status.SKIPPED
+    assert not result.items
+    executor.submit.assert_not_called()
+
+
+def test_independent_cases_run_concurrently():
+    barrier = threading.Barrier(2)
+    contexts: Dict[str, dict] = {}
+
+    def _run(case: Case, context: Context) -> CaseResult:
+        if case.label in ("1", "2"):
+            barrier.wait(timeout=5.0)
+        if case.label == "1":
+            context["foo"] = "written"
+        contexts[str(case.label)] = dict(context)
+        return CaseResult(label=case.label)
+
+    runner = NonCallableMock(CaseRunner)
+    runner.run.side_effect = _run
+    cases = [_writing("1", "foo"), Case(label="2"), _reading("3", "foo")]
+
+    with ThreadPoolExecutor(2) as executor:
+        task = DependentCasesTask(executor, runner, cases, context=Context(base="value"))
+        result = task.result()
+    assert [item.label for item in result.items] == ["1", "2", "3"]
+    assert contexts["2"] == {"base": "value"}
+    assert contexts["3"] == {"base": "value", "foo": "written"}
+
+
+@mark.parametrize(
+    ("written", "expected"),
+    (
+        ({"1": 1, "2": 2}, 2),
+        ({"1": 1, "2": None}, 1),
+        ({"1": None, "2": None}, None),
+    ),
+)
+def test_values_are_given_in_order(written: Dict[str, Optional[int]], expected):
+    read = []
+
+    def _run(case: Case, context: Context) -> CaseResult:
+        value = written.get(str(case.label))
+        if value is not None:
+            context["foo"] = value
+        if case.label == "3":
+            read.append(context.get("foo"))
+        return CaseResult(label=case.label)
+
+    runner = NonCallableMock(CaseRunner)
+    runner.run.side_effect = _run
+    cases = [_writing("1", "foo"), _writing("2", "foo"), _reading("3", "foo")]
+
+    with ThreadPoolExecutor(2) as executor:
+        DependentCasesTask(executor, runner, cases).result()
+    assert read == [expected]
+
+
+def test_dependents_are_submitted_to_adaptive_executor():
+    def _run(case: Case, context: Context) -> CaseResult:
+        # Done after the callbacks are added so that they run in the worker thread.
+        threading.Event().wait(0.01)
+        return CaseResult(label=case.label)
+
+    runner = NonCallableMock(CaseRunner)
+    runner.run.side_effect = _run
+    cases = [_writing("1", "foo"), _reading("2", "foo"), _reading("3", "foo")]
+
+    with ThreadPoolExecutor(1) as inner:
+        executor = AdaptiveExecutor(inner, AimdController(max_limit=1))
+        task = DependentCasesTask(executor, runner, cases)
+        done = threading.Event()
+        task.add_done_callback(lambda _: done.set())
+        assert done.wait(5.0)
+    assert [item.label for item in task.result().items] == ["1", "2", "3"]
+
+
+def test_given_failing_case():
+    runner = NonCallableMock(CaseRunner)
+    runner.run.side_effect = RuntimeError()
+
+    with ThreadPoolExecutor(2) as executor:
+        task = DependentCasesTask(executor, runner, [Case(), Case(), Case()])
+        with raises(RuntimeError):
+            task.result()
+
+
+def test_done_callback():
+    future: Future = Future()
+    executor = NonCallableMock(Executor)
+    executor.submit.return_value = future
+    runner = NonCallableMock(CaseRunner)
+
+    task = DependentCasesTask(executor, runner, [Case()])
+    fn = Mock()
+    task.add_done_callback(fn)
+    fn.assert_not_called()
+
+    future.set_result((CaseResult(), {}))
+    fn.assert_called_once_with(task)
+    assert task.result().status is Status.SKIPPED
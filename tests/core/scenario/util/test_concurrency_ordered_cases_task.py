@@ -1,15 +1,17 @@
-from concurrent.futures import Executor, Future
-from unittest.mock import MagicMock, NonCallableMock, call, sentinel
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from datetime import timedelta
+from unittest.mock import MagicMock, Mock, NonCallableMock, call, sentinel
 
-from pytest import fixture
+from pytest import fixture, raises
 from requests import Session
 
+from preacher.core.context import Context
+from preacher.core.scenario.case import Case
 from preacher.core.scenario.case_result import CaseResult
 from preacher.core.scenario.case_runner import CaseRunner
-from preacher.core.scenario.util.concurrency import OrderedCasesTask
-from preacher.core.status import Status
-
-PACKAGE = "preacher.core.scenario.util.concurrency"
+from preacher.core.scenario.util.concurrency import OrderedCasesTask, split_by_waits
+from preacher.core.status import Status, StatusedList
 
 
 def submit(func, *args, **kwargs) -> Future:
@@ -27,6 +29,7 @@ def executor():
 
 def test_given_no_cases(executor):
     runner = NonCallableMock(CaseRunner)
+    runner.create_session.return_value = MagicMock(Session)
     task = OrderedCasesTask(executor, runner, [])
     result = task.result()
     assert result.status is Status.SKIPPED
@@ -36,18 +39,18 @@ def test_given_no_cases(executor):
     runner.run.assert_not_called()
 
 
-def test_given_cases(mocker, executor):
+def test_given_cases(executor):
     session = MagicMock(Session)
     session.__enter__.return_value = session
-    session_ctor = mocker.patch(f"{PACKAGE}.Session", return_value=session)
 
     case_results = [
         NonCallableMock(CaseResult, status=Status.SUCCESS),
         NonCallableMock(CaseResult, status=Status.UNSTABLE),
     ]
     runner = NonCallableMock(CaseRunner)
+    runner.create_session.return_value = session
     runner.run.side_effect = case_results
-    cases = [sentinel.case1, sentinel.case2]
+    cases = [Case(label="1"), Case(label="2")]
 
     task = OrderedCasesTask(executor, runner, cases, context=sentinel.context)
     result = task.result()
@@ -57,10 +60,74 @@ def test_given_cases(mocker, executor):
     executor.submit.assert_called_once()
     runner.run.assert_has_calls(
         [
-            call(sentinel.case1, session=session, context=sentinel.context),
-            call(sentinel.case2, session=session, context=sentinel.context),
+            call(cases[0], session=session, context=sentinel.context),
+            call(cases[1], session=session, context=sentinel.context),
         ]
     )
 
-    session_ctor.assert_called_once()
+    runner.create_session.assert_called_once_with()
     session.__exit__.assert_called()
+
+
+def test_split_by_waits():
+    case1 = Case(label="1")
+    case2 = Case(label="2", waiting_time=timedelta(seconds=1.5))
+    case3 = Case(label="3", enabled=False, waiting_time=timedelta(seconds=2))
+    case4 = Case(label="4", waiting_time=timedelta(seconds=-1))
+    case5 = Case(label="5", waiting_time=timedelta(seconds=3))
+
+    assert split_by_waits([]) == [(0.0, [])]
+    assert split_by_waits([case1, case2, case3, case4, case5]) == [
+        (0.0, [case1]),
+        (1.5, [case2, case3, case4]),
+        (3.0, [case5]),
+    ]
+    assert split_by_waits([case5, case1]) == [(3.0, [case5, case1])]
+
+
+def test_waiting_cases_free_workers():
+    contexts = []
+
+    def _run(case, session, context):
+        contexts.append(dict(context))
+        context[case.label] = time.monotonic()
+        return CaseResult(label=case.label)
+
+    runner = NonCallableMock(CaseRunner)
+    runner.create_session.return_value = MagicMock(Session)
+    runner.run.side_effect = _run
+    cases = [Case(label="1"), Case(label="2", waiting_time=timedelta(seconds=0.2))]
+
+    with ThreadPoolExecutor(1) as executor:
+        starts = time.monotonic()
+        task = OrderedCasesTask(executor, runner, cases, context=Context())
+        other = executor.submit(time.monotonic)
+        assert other.result() - starts < 0.2
+
+        result = task.result()
+    assert [item.label for item in result.items] == ["1", "2"]
+    assert list(contexts[1]) == ["1"]
+    assert runner.create_session.call_count == 2
+
+
+def test_given_failing_segment(executor):
+    runner = NonCallableMock(CaseRunner)
+    runner.create_session.side_effect = RuntimeError()
+    task = OrderedCasesTask(executor, runner, [Case()])
+    with raises(RuntimeError):
+        task.result()
+
+
+def test_done_callback():
+    future: Future = Future()
+    executor = NonCallableMock(Executor)
+    executor.submit.return_value = future
+    runner = NonCallableMock(CaseRunner)
+
+    task = OrderedCasesTask(executor, runner, [Case()])
+    fn = Mock()
+    task.add_done_callback(fn)
+    fn.assert_not_called()
+
+    future.set_result((StatusedList([]), None))
+    fn.assert_called_once_with(task)
@@ -1,13 +1,17 @@
 from concurrent.futures import Executor, Future
-from unittest.mock import NonCallableMock, call, sentinel
+from datetime import timedelta
+from unittest.mock import Mock, NonCallableMock, call, sentinel
 
 from pytest import fixture
 
+from preacher.core.scenario.case import Case
 from preacher.core.scenario.case_result import CaseResult
 from preacher.core.scenario.case_runner import CaseRunner
-from preacher.core.scenario.util.concurrency import UnorderedCasesTask
+from preacher.core.scenario.util.concurrency import UnorderedCasesTask, when_all_done
 from preacher.core.status import Status
 
+PKG = "preacher.core.scenario.util.concurrency"
+
 
 def submit(func, *args, **kwargs) -> Future:
     future: Future = Future()
@@ -40,7 +44,7 @@ def test_given_cases(executor):
     ]
     runner = NonCallableMock(CaseRunner)
     runner.run.side_effect = case_results
-    cases = [sentinel.case1, sentinel.case2]
+    cases = [Case(label="1"), Case(label="2")]
 
     task = UnorderedCasesTask(executor, runner, cases)
     result = task.result()
@@ -48,4 +52,49 @@ def test_given_cases(executor):
     assert result.items == case_results
 
     assert executor.submit.call_count == 2
-    runner.run.assert_has_calls([call(sentinel.case1), call(sentinel.case2)])
+    runner.run.assert_has_calls([call(cases[0]), call(cases[1])])
+
+
+def test_given_waiting_cases(mocker):
+    submit_later = mocker.patch(
+        f"{PKG}.submit_later", side_effect=lambda _e, _s, f, *a: submit(f, *a)
+    )
+    runner = NonCallableMock(CaseRunner)
+    runner.run.return_value = CaseResult()
+    cases = [Case(waiting_time=timedelta(seconds=1.5)), Case(enabled=False)]
+
+    task = UnorderedCasesTask(sentinel.executor, runner, cases)
+    task.result()
+
+    submit_later.assert_has_calls(
+        [
+            call(sentinel.executor, 1.5, runner.run, cases[0]),
+            call(sentinel.executor, 0.0, runner.run, cases[1]),
+        ]
+    )
+
+
+def test_done_callback():
+    futures = [Future(), Future()]
+    executor = NonCallableMock(Executor)
+    executor.submit.side_effect = futures
+    runner = NonCallableMock(CaseRunner)
+
+    task = UnorderedCasesTask(executor, runner, [Case(), Case()])
+    fn = Mock()
+    task.add_done_callback(fn)
+
+    futures[1].set_result(CaseResult())
+    fn.assert_not_called()
+    futures[0].set_result(CaseResult())
+    fn.assert_called_once_with(task)
+
+    # Called immediately after done.
+    task.add_done_callback(fn)
+    assert fn.call_count == 2
+
+
+def test_when_all_done_given_nothing():
+    fn = Mock()
+    when_all_done([], fn)
+    fn.assert_called_once_with()
@@ -0,0 +1,120 @@
+from datetime import timedelta
+from typing import Optional
+
+import hamcrest
+from pytest import mark
+
+from preacher.core.context import Context
+from preacher.core.extraction.impl.key import KeyExtractor
+from preacher.core.request import Request
+from preacher.core.request.request_body import JsonRequestBody
+from preacher.core.scenario.case import Case
+from preacher.core.scenario.util.dependency import ContextAccess, RecordingContext
+from preacher.core.scenario.util.dependency import analyze_access, analyze_dependencies
+from preacher.core.value.impl.context import ContextualValue
+from preacher.core.value.impl.datetime import RelativeDatetime
+from preacher.core.verification import Description, MatcherWrappingPredicate, Predicate
+from preacher.core.verification import ResponseDescription, ValueMatcherFactory, Verification
+
+
+class _Predicate(Predicate):
+    def verify(self, actual: object, context: Optional[Context] = None) -> Verification:
+        return Verification.succeed()
+
+
+def _writing(key: str) -> ResponseDescription:
+    return ResponseDescription(body=[Description(KeyExtractor("id"), [], value_name=key)])
+
+
+def _reading(key: str) -> Request:
+    return Request(params={"id": ContextualValue(key)})
+
+
+def _matching(predicate: Predicate) -> ResponseDescription:
+    return ResponseDescription(status_code=[predicate])
+
+
+@mark.parametrize(
+    ("case", "expected"),
+    (
+        (Case(), ContextAccess()),
+        (Case(request=Request(params={"at": RelativeDatetime()})), ContextAccess()),
+        (Case(request=_reading("foo")), ContextAccess(reads=frozenset(("foo",)))),
+        (
+            Case(request=Request(body=JsonRequestBody({"items": [ContextualValue("foo")]}))),
+            ContextAccess(reads=frozenset(("foo",))),
+        ),
+        (
+            Case(request=_reading("foo"), response=_writing("bar")),
+            ContextAccess(reads=frozenset(("foo",)), writes=frozenset(("bar",))),
+        ),
+        (
+            Case(
+                response=_matching(
+                    MatcherWrappingPredicate(
+                        ValueMatcherFactory(hamcrest.equal_to, ContextualValue("foo"))
+                    )
+                )
+            ),
+            ContextAccess(reads=frozenset(("foo",))),
+        ),
+        (
+            Case(
+                response=_matching(
+                    MatcherWrappingPredicate(
+                        ValueMatcherFactory(hamcrest.equal_to, "foo", value_func=ContextualValue)
+                    )
+                )
+            ),
+            ContextAccess(reads=frozenset(("foo",))),
+        ),
+        (
+            Case(conditions=[Description(KeyExtractor("foo"), [])]),
+            ContextAccess(reads=None),
+        ),
+        (Case(waiting_time=timedelta(seconds=1)), ContextAccess(barrier=True)),
+        (Case(response=_matching(_Predicate())), ContextAccess(barrier=True)),
+        (
+            Case(enabled=False, request=_reading("foo"), waiting_time=timedelta(seconds=1)),
+            ContextAccess(),
+        ),
+    ),
+)
+def test_analyze_access(case, expected):
+    assert analyze_access(case) == expected
+
+
+def test_analyze_dependencies():
+    cases = [
+        Case(label="0", response=_writing("foo")),
+        Case(label="1", request=_reading("foo"), response=_writing("bar")),
+        Case(label="2"),
+        Case(label="3", response=_writing("foo")),
+        Case(label="4", request=_reading("foo")),
+        Case(label="5", conditions=[Description(KeyExtractor("bar"), [])]),
+        Case(label="6", waiting_time=timedelta(seconds=1)),
+        Case(label="7"),
+        Case(label="8", request=_reading("bar")),
+    ]
+    assert analyze_dependencies(cases) == [
+        frozenset(),
+        frozenset((0,)),
+        frozenset(),
+        frozenset(),
+        frozenset((0, 3)),
+        frozenset((0, 1, 3)),
+        frozenset(range(6)),
+        frozenset((6,)),
+        frozenset((1, 6)),
+    ]
+
+
+def test_recording_context():
+    context = RecordingContext(foo=1, bar=2)
+    assert context.written() == {}
+
+    context["foo"] = 3
+    context["baz"] = 4
+    del context["baz"]
+    assert context.written() == {"foo": 3}
+    assert dict(context) == {"foo": 3, "bar": 2}
@@ -0,0 +1,96 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from operator import add
+
+from pytest import fixture, mark, raises
+
+from preacher.core.scenario.util.hybrid import HybridExecutor
+
+
+@fixture
+def manager():
+    with multiprocessing.Manager() as manager:
+        yield manager
+
+
+def _identify() -> tuple:
+    return os.getpid(), threading.get_ident()
+
+
+def _wait(barrier: object) -> tuple:
+    barrier.wait(timeout=5.0)  # type: ignore
+    return _identify()
+
+
+@mark.parametrize(("processes", "threads"), ((0, 1), (2, 1)))
+def test_given_invalid_numbers(processes, threads):
+    with raises(ValueError):
+        HybridExecutor(processes, threads)
+
+
+def test_hybrid_executor():
+    with HybridExecutor(2, 3) as executor:
+        assert executor.processes == 2
+        assert executor.threads == 3
+
+        assert executor.submit(add, 1, 2).result(timeout=5.0) == 3
+
+        error = executor.submit(int, "x").exception(timeout=5.0)
+        assert isinstance(error, ValueError)
+
+        # Unpicklable callables are not sent to the workers.
+        error = executor.submit(lambda: None).exception(timeout=5.0)
+        assert error
+
+
+def test_hybrid_executor_runs_threads_in_processes(manager):
+    # Every task waits for the others, which requires all the threads to run at once.
+    barrier = manager.Barrier(4)
+    with HybridExecutor(2, 4) as executor:
+        futures = [executor.submit(_wait, barrier) for _ in range(4)]
+        identities = [future.result(timeout=10.0) for future in futures]
+
+    assert len({pid for pid, _ in identities}) == 2
+    assert len(set(identities)) == 4
+    assert os.getpid() not in {pid for pid, _ in identities}
+
+
+def test_hybrid_executor_after_shutdown():
+    executor = HybridExecutor(1, 1)
+    executor.shutdown()
+    executor.shutdown()
+    with raises(RuntimeError):
+        executor.submit(add, 1, 2)
+
+
+def test_hybrid_executor_broken():
+    with HybridExecutor(1, 2) as executor:
+        future = executor.submit(os._exit, 1)
+        with raises(BrokenProcessPool):
+            future.result(timeout=5.0)
+        with raises(BrokenProcessPool):
+            executor.submit(add, 1, 2)
+
+
+def _wait_for(event: object) -> int:
+    event.wait(timeout=5.0)  # type: ignore
+    return os.getpid()
+
+
+def test_hybrid_executor_cancel(manager):
+    event = manager.Event()
+    with HybridExecutor(1, 1) as executor:
+        running = executor.submit(_wait_for, event)
+        queued = executor.submit(_wait_for, event)
+        for _ in range(500):
+            if running.running():
+                break
+            threading.Event().wait(0.01)
+
+        assert not running.cancel()
+        assert queued.cancel()
+        event.set()
+        assert running.result(timeout=5.0) != os.getpid()
+    assert queued.cancelled()
@@ -1,8 +1,9 @@
-from unittest.mock import MagicMock, patch, sentinel
+import asyncio
+from unittest.mock import MagicMock, call, patch, sentinel
 
 from pytest import fixture, mark, raises
 
-from preacher.core.scenario.util.retry import retry_while_false
+from preacher.core.scenario.util.retry import async_retry_while_false, retry_while_false
 
 
 @fixture
@@ -44,3 +45,50 @@ def test_retrying_with_delay(func):
     with patch("time.sleep") as sleep:
         retry_while_false(func, attempts=2, delay=sentinel.delay)
     sleep.assert_called_once_with(sentinel.delay)
+
+
+@mark.parametrize(
+    "attempts, expected_result, expected_call_count, expected_sleep_count",
+    (
+        (1, 0, 1, 0),
+        (2, 0, 2, 1),
+        (3, 1, 3, 2),
+        (4, 1, 3, 2),
+    ),
+)
+def test_async_retrying(
+    func,
+    attempts,
+    expected_result,
+    expected_call_count,
+    expected_sleep_count,
+):
+    async def _func():
+        return func()
+
+    sleep = MagicMock()
+
+    async def _sleep(seconds):
+        sleep(seconds)
+
+    with patch("asyncio.sleep", new=_sleep):
+        actual = asyncio.run(async_retry_while_false(_func, attempts=attempts, delay=0.5))
+    assert actual == expected_result
+
+    assert func.call_count == expected_call_count
+    assert sleep.call_count == expected_sleep_count
+
+
+@mark.parametrize("attempts", (-1, 0))
+def test_async_retrying_when_given_invalid_args(func, attempts):
+    with raises(ValueError):
+        asyncio.run(async_retry_while_false(func, attempts=attempts))
+
+
+def test_retrying_with_computed_delay():
+    func = MagicMock(side_effect=[0, 2, 0])
+    delay = MagicMock(side_effect=[sentinel.delay1, sentinel.delay2])
+    with patch("time.sleep") as sleep:
+        retry_while_false(func, attempts=3, delay=delay, predicate=lambda n: n == 1)
+    delay.assert_has_calls([call(1, 0), call(2, 2)])
+    sleep.assert_has_calls([call(sentinel.delay1), call(sentinel.delay2)])
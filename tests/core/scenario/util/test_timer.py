@@ -0,0 +1,80 @@
+import threading
+import time
+from concurrent.futures import CancelledError, Executor, Future, ThreadPoolExecutor
+from unittest.mock import NonCallableMock, sentinel
+
+from pytest import raises
+
+from preacher.core.scenario.util.timer import Timer, submit_later
+
+
+def test_timer_calls_in_order_of_time():
+    called = []
+    done = threading.Event()
+
+    timer = Timer()
+    timer.call_later(0.05, lambda: called.append(2) or done.set())
+    timer.call_later(0.0, lambda: called.append(1))
+    assert done.wait(5.0)
+    assert called == [1, 2]
+
+
+def test_submit_later_without_delay():
+    executor = NonCallableMock(Executor)
+    executor.submit.return_value = sentinel.future
+    assert submit_later(executor, 0.0, sentinel.fn, sentinel.arg) is sentinel.future
+    executor.submit.assert_called_once_with(sentinel.fn, sentinel.arg)
+
+
+def test_submit_later_does_not_occupy_workers():
+    with ThreadPoolExecutor(1) as executor:
+        starts = time.monotonic()
+        delayed = submit_later(executor, 0.2, time.monotonic)
+        immediate = executor.submit(time.monotonic)
+        assert immediate.result() - starts < 0.2
+        assert delayed.result() - starts >= 0.2
+
+
+def test_submit_later_per_executor():
+    blocking = NonCallableMock(Executor)
+    release = threading.Event()
+    blocking.submit.side_effect = lambda *args: release.wait(5.0) and Future()
+
+    with ThreadPoolExecutor(1) as executor:
+        submit_later(blocking, 0.01, sentinel.fn)
+        starts = time.monotonic()
+        delayed = submit_later(executor, 0.05, time.monotonic)
+        try:
+            assert delayed.result(5.0) - starts < 1.0
+        finally:
+            release.set()
+
+
+def test_submit_later_fails():
+    def _fail():
+        raise RuntimeError("task")
+
+    with ThreadPoolExecutor(1) as executor:
+        with raises(RuntimeError):
+            submit_later(executor, 0.01, _fail).result(5.0)
+
+    executor = NonCallableMock(Executor)
+    executor.submit.side_effect = RuntimeError("submission")
+    with raises(RuntimeError):
+        submit_later(executor, 0.01, sentinel.fn).result(5.0)
+
+
+def test_submit_later_cancelled():
+    inner: Future = Future()
+    executor = NonCallableMock(Executor)
+    executor.submit.return_value = inner
+
+    future = submit_later(executor, 10.0, sentinel.fn)
+    assert future.cancel()
+
+    future = submit_later(executor, 0.01, sentinel.fn)
+    while not executor.submit.called:
+        time.sleep(0.01)
+    inner.cancel()
+    with raises(CancelledError):
+        future.result(5.0)
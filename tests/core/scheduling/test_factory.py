@@ -1,14 +1,30 @@
-from unittest.mock import sentinel
+from unittest.mock import NonCallableMock, sentinel
 
+from pytest import mark, raises
+
+from preacher.core.request import Timeouts
+from preacher.core.scenario.util.async_concurrency import AsyncioExecutor
 from preacher.core.scheduling import create_scheduler
 
 PKG = "preacher.core.scheduling.factory"
 
 
 def test_create_scheduler(mocker):
+    limiter_ctor = mocker.patch(f"{PKG}.HostLimiter", return_value=sentinel.limiter)
+    budget_ctor = mocker.patch(f"{PKG}.RetryBudget", return_value=sentinel.budget)
+    cache_ctor = mocker.patch(f"{PKG}.ResponseCache", return_value=sentinel.cache)
+    hedging_ctor = mocker.patch(f"{PKG}.Hedging", return_value=sentinel.hedging)
+    breaker_ctor = mocker.patch(f"{PKG}.CircuitBreaker", return_value=sentinel.breaker)
+    prewarming_ctor = mocker.patch(f"{PKG}.Prewarming", return_value=sentinel.prewarming)
+    timeouts_ctor = mocker.patch(f"{PKG}.Timeouts", return_value=sentinel.timeouts)
+    session_factory_ctor = mocker.patch(
+        f"{PKG}.SessionFactory",
+        return_value=sentinel.session_factory,
+    )
     requester_ctor = mocker.patch(f"{PKG}.Requester", return_value=sentinel.requester)
     unit_runner_ctor = mocker.patch(f"{PKG}.UnitRunner", return_value=sentinel.unit_runner)
     case_runner_ctor = mocker.patch(f"{PKG}.CaseRunner", return_value=sentinel.case_runner)
+    executor_ctor = mocker.patch(f"{PKG}.AdaptiveExecutor", return_value=sentinel.adaptive)
     runner_ctor = mocker.patch(f"{PKG}.ScenarioRunner", return_value=sentinel.runner)
     scheduler_ctor = mocker.patch(f"{PKG}.ScenarioScheduler", return_value=sentinel.scheduler)
 
@@ -17,23 +33,176 @@ def test_create_scheduler(mocker):
         listener=sentinel.listener,
         base_url=sentinel.base_url,
         timeout=sentinel.timeout,
+        connect_timeout=sentinel.connect_timeout,
+        read_timeout=sentinel.read_timeout,
+        deadline=sentinel.deadline,
         retry=sentinel.retry,
         delay=sentinel.delay,
+        backoff=sentinel.backoff,
+        max_delay=sentinel.max_delay,
+        retry_budget=sentinel.retry_budget,
+        pool_size=sentinel.pool_size,
+        keep_alive=sentinel.keep_alive,
+        http2=sentinel.http2,
+        spool_threshold=sentinel.spool_threshold,
+        detect_charset=sentinel.detect_charset,
+        rate_limit=sentinel.rate_limit,
+        max_in_flight=sentinel.max_in_flight,
+        concurrency_controller=sentinel.controller,
+        cassette=sentinel.cassette,
+        cache_size=sentinel.cache_size,
+        compressed=sentinel.compressed,
+        compress_threshold=sentinel.compress_threshold,
+        hedge_percentile=sentinel.hedge_percentile,
+        circuit_breaker=sentinel.circuit_breaker,
+        circuit_reset=sentinel.circuit_reset,
+        prewarm=sentinel.prewarm,
+        stream=sentinel.stream,
+        window=sentinel.window,
+        ordered_by_dependency=sentinel.ordered_by_dependency,
+        deferred_concurrency=sentinel.deferred_concurrency,
     )
     assert scheduler is sentinel.scheduler
 
-    requester_ctor.assert_called_once_with(base_url=sentinel.base_url, timeout=sentinel.timeout)
+    timeouts_ctor.assert_called_once_with(
+        connect=sentinel.connect_timeout,
+        read=sentinel.read_timeout,
+        deadline=sentinel.deadline,
+    )
+    budget_ctor.assert_called_once_with(sentinel.retry_budget)
+    cache_ctor.assert_called_once_with(sentinel.cache_size)
+    hedging_ctor.assert_called_once_with(percentile=sentinel.hedge_percentile)
+    breaker_ctor.assert_called_once_with(
+        threshold=sentinel.circuit_breaker,
+        reset_timeout=sentinel.circuit_reset,
+    )
+    prewarming_ctor.assert_called_once_with(
+        sentinel.prewarm,
+        base_url=sentinel.base_url,
+        timeout=sentinel.connect_timeout,
+    )
+    limiter_ctor.assert_called_once_with(
+        rate=sentinel.rate_limit,
+        max_in_flight=sentinel.max_in_flight,
+    )
+
+    session_factory_ctor.assert_called_once_with(
+        pool_size=sentinel.pool_size,
+        keep_alive=sentinel.keep_alive,
+        http2=sentinel.http2,
+        prewarming=sentinel.prewarming,
+    )
+    requester_ctor.assert_called_once_with(
+        base_url=sentinel.base_url,
+        timeout=sentinel.timeouts,
+        session_factory=sentinel.session_factory,
+        spool_threshold=sentinel.spool_threshold,
+        detect_charset=sentinel.detect_charset,
+        limiter=sentinel.limiter,
+        cassette=sentinel.cassette,
+        cache=sentinel.cache,
+        compressed=sentinel.compressed,
+        compress_threshold=sentinel.compress_threshold,
+        hedging=sentinel.hedging,
+        breaker=sentinel.breaker,
+    )
     unit_runner_ctor.assert_called_once_with(
         requester=sentinel.requester,
         retry=sentinel.retry,
         delay=sentinel.delay,
+        backoff=sentinel.backoff,
+        max_delay=sentinel.max_delay,
+        budget=sentinel.budget,
     )
     case_runner_ctor.assert_called_once_with(
         unit_runner=sentinel.unit_runner,
         listener=sentinel.listener,
     )
+    executor_ctor.assert_called_once_with(sentinel.executor, sentinel.controller)
     runner_ctor.assert_called_once_with(
-        executor=sentinel.executor,
+        executor=sentinel.adaptive,
         case_runner=sentinel.case_runner,
+        ordered_by_dependency=sentinel.ordered_by_dependency,
+        deferred_concurrency=sentinel.deferred_concurrency,
+    )
+    scheduler_ctor.assert_called_once_with(
+        runner=sentinel.runner,
+        listener=sentinel.listener,
+        prewarming=sentinel.prewarming,
+        streaming=sentinel.stream,
+        window=sentinel.window,
     )
-    scheduler_ctor.assert_called_once_with(runner=sentinel.runner, listener=sentinel.listener)
+
+
+def test_create_async_scheduler(mocker):
+    limiter_ctor = mocker.patch(f"{PKG}.HostLimiter")
+    budget_ctor = mocker.patch(f"{PKG}.RetryBudget", return_value=sentinel.budget)
+    requester_ctor = mocker.patch(f"{PKG}.AsyncRequester", return_value=sentinel.requester)
+    unit_runner_ctor = mocker.patch(f"{PKG}.AsyncUnitRunner", return_value=sentinel.unit_runner)
+    case_runner_ctor = mocker.patch(f"{PKG}.AsyncCaseRunner", return_value=sentinel.case_runner)
+    runner_ctor = mocker.patch(f"{PKG}.ScenarioRunner", return_value=sentinel.runner)
+    mocker.patch(f"{PKG}.ScenarioScheduler", return_value=sentinel.scheduler)
+
+    executor = NonCallableMock(AsyncioExecutor)
+    scheduler = create_scheduler(
+        executor=executor,
+        listener=sentinel.listener,
+        base_url="http://base",
+        timeout=sentinel.timeout,
+        retry=sentinel.retry,
+        delay=sentinel.delay,
+        backoff=sentinel.backoff,
+        max_delay=sentinel.max_delay,
+        retry_budget=sentinel.retry_budget,
+        detect_charset=sentinel.detect_charset,
+        cassette=sentinel.cassette,
+        compress_threshold=sentinel.compress_threshold,
+    )
+    assert scheduler is sentinel.scheduler
+
+    budget_ctor.assert_called_once_with(sentinel.retry_budget)
+    limiter_ctor.assert_not_called()
+    requester_ctor.assert_called_once_with(
+        base_url="http://base",
+        timeout=Timeouts(connect=sentinel.timeout, read=sentinel.timeout),
+        detect_charset=sentinel.detect_charset,
+        limiter=None,
+        cassette=sentinel.cassette,
+        cache=None,
+        compress_threshold=sentinel.compress_threshold,
+        hedging=None,
+        breaker=None,
+    )
+    unit_runner_ctor.assert_called_once_with(
+        requester=sentinel.requester,
+        retry=sentinel.retry,
+        delay=sentinel.delay,
+        backoff=sentinel.backoff,
+        max_delay=sentinel.max_delay,
+        budget=sentinel.budget,
+    )
+    case_runner_ctor.assert_called_once_with(
+        unit_runner=sentinel.unit_runner,
+        listener=sentinel.listener,
+    )
+    runner_ctor.assert_called_once_with(
+        executor=executor,
+        case_runner=sentinel.case_runner,
+        ordered_by_dependency=False,
+        deferred_concurrency=1,
+    )
+
+
+@mark.parametrize(
+    "kwargs",
+    (
+        {"http2": True},
+        {"spool_threshold": 0},
+        {"base_url": "http+unix://%2Frun%2Fapi.sock"},
+        {"prewarm": 1},
+    ),
+)
+def test_create_async_scheduler_with_unsupported_options(kwargs):
+    executor = NonCallableMock(AsyncioExecutor)
+    with raises(ValueError):
+        create_scheduler(executor=executor, **kwargs)
@@ -1,7 +1,12 @@
-from typing import Iterable, Iterator
+from threading import Event, Timer
+from typing import Callable, Iterable, Iterator, List
 from unittest.mock import Mock, NonCallableMock, call, sentinel
 
-from preacher.core.scenario import Scenario, ScenarioRunner, ScenarioResult, ScenarioTask
+from pytest import raises
+
+from preacher.core.request import Prewarming, Request
+from preacher.core.scenario import Case, DeferredScenario, Scenario, ScenarioRunner, ScenarioResult
+from preacher.core.scenario import ScenarioTask
 from preacher.core.scheduling.listener import Listener
 from preacher.core.scheduling.scenario_scheduler import ScenarioScheduler
 from preacher.core.status import Status
@@ -74,3 +79,215 @@ def test_given_scenarios():
         task.result.assert_called_once_with()
     listener.on_scenario.assert_has_calls([call(r) for r in results])
     listener.on_end.assert_called_once_with(Status.FAILURE)
+
+
+def test_prewarming():
+    def _case(path: str, enabled: bool = True) -> Case:
+        return NonCallableMock(Case, enabled=enabled, request=Request(path=path))
+
+    scenarios = [
+        NonCallableMock(
+            Scenario,
+            cases=[_case("/a"), _case("http://disabled.com", enabled=False)],
+            subscenarios=[
+                NonCallableMock(Scenario, cases=[_case("http://other.com/b")], subscenarios=[])
+            ],
+        ),
+        NonCallableMock(Scenario, cases=[_case("/c")], subscenarios=[]),
+    ]
+    prewarming = NonCallableMock(Prewarming)
+
+    def _submit(_: Scenario) -> ScenarioTask:
+        # Hosts are added before the first scenario is submitted.
+        assert prewarming.add.call_count == 3
+        result = ScenarioResult(status=Status.SUCCESS)
+        return NonCallableMock(ScenarioTask, result=Mock(return_value=result))
+
+    runner = NonCallableMock(ScenarioRunner)
+    runner.submit.side_effect = _submit
+    scheduler = ScenarioScheduler(runner, prewarming=prewarming)
+    assert scheduler.run(scenarios) is Status.SUCCESS
+
+    prewarming.add.assert_has_calls([call("/a"), call("http://other.com/b"), call("/c")])
+    assert runner.submit.call_count == 2
+
+
+def test_given_deferred_scenarios():
+    deferred = NonCallableMock(DeferredScenario)
+    task = NonCallableMock(ScenarioTask)
+    task.result.return_value = ScenarioResult(status=Status.UNSTABLE)
+    prewarming = NonCallableMock(Prewarming)
+
+    runner = NonCallableMock(ScenarioRunner)
+    runner.submit_deferred.return_value = task
+    scheduler = ScenarioScheduler(runner, prewarming=prewarming)
+    assert scheduler.run([deferred]) is Status.UNSTABLE
+
+    runner.submit_deferred.assert_called_once_with(deferred)
+    runner.submit.assert_not_called()
+    deferred.construct.assert_not_called()
+    prewarming.add.assert_not_called()
+
+
+class _Task(ScenarioTask):
+    def __init__(self, status: Status):
+        self._result = ScenarioResult(status=status)
+        self._callbacks: List[Callable[[ScenarioTask], None]] = []
+        self._done = False
+        self._event = Event()
+
+    def complete(self) -> None:
+        self._done = True
+        self._event.set()
+        for callback in self._callbacks:
+            callback(self)
+
+    def result(self) -> ScenarioResult:
+        assert self._event.wait(timeout=5.0)
+        return self._result
+
+    def add_done_callback(self, fn: Callable[[ScenarioTask], None]) -> None:
+        if self._done:
+            fn(self)
+        else:
+            self._callbacks.append(fn)
+
+
+def test_given_invalid_window():
+    with raises(ValueError):
+        ScenarioScheduler(sentinel.runner, window=0)
+
+
+def test_streaming():
+    tasks = [_Task(Status.SUCCESS), _Task(Status.UNSTABLE), _Task(Status.FAILURE)]
+    scenarios = [NonCallableMock(Scenario) for _ in tasks]
+    listener = NonCallableMock(Listener)
+
+    def _submit(scenario: Scenario) -> ScenarioTask:
+        index = scenarios.index(scenario)
+        if index == 2:
+            # Submitted after a scenario in the window of 2 completes.
+            assert listener.on_scenario.call_count == 1
+        if index > 0:
+            tasks[index].complete()
+        return tasks[index]
+
+    def _on_scenario(result: ScenarioResult) -> None:
+        if result.status is Status.FAILURE:
+            tasks[0].complete()
+
+    runner = NonCallableMock(ScenarioRunner)
+    runner.submit.side_effect = _submit
+    listener.on_scenario.side_effect = _on_scenario
+    scheduler = ScenarioScheduler(runner, listener=listener, streaming=True, window=2)
+    status = scheduler.run(scenarios)
+    assert status is Status.FAILURE
+
+    results = [c[0][0] for c in listener.on_scenario.call_args_list]
+    assert [r.status for r in results] == [Status.UNSTABLE, Status.FAILURE, Status.SUCCESS]
+    listener.on_end.assert_called_once_with(Status.FAILURE)
+
+
+def test_streaming_without_window():
+    tasks = [_Task(Status.SUCCESS), _Task(Status.UNSTABLE)]
+
+    def _on_scenario(_: ScenarioResult) -> None:
+        # All the scenarios are submitted before waiting.
+        assert runner.submit.call_count == 2
+        tasks[0].complete()
+
+    runner = NonCallableMock(ScenarioRunner)
+    runner.submit.side_effect = tasks
+    tasks[1].complete()
+    listener = NonCallableMock(Listener)
+    listener.on_scenario.side_effect = _on_scenario
+    scheduler = ScenarioScheduler(runner, listener=listener, streaming=True)
+    assert scheduler.run([sentinel.scenario1, sentinel.scenario2]) is Status.UNSTABLE
+
+    results = [c[0][0] for c in listener.on_scenario.call_args_list]
+    assert [r.status for r in results] == [Status.UNSTABLE, Status.SUCCESS]
+
+
+def test_window():
+    pulled = []
+    tasks = [
+        _Task(Status.SUCCESS),
+        _Task(Status.FAILURE),
+        _Task(Status.SKIPPED),
+        _Task(Status.SUCCESS),
+    ]
+    scenarios = [NonCallableMock(Scenario) for _ in tasks]
+
+    def _scenarios() -> Iterator[Scenario]:
+        for index, scenario in enumerate(scenarios):
+            pulled.append(index)
+            yield scenario
+
+    def _submit(scenario: Scenario) -> ScenarioTask:
+        index = scenarios.index(scenario)
+        # Scenarios are constructed lazily.
+        assert pulled == list(range(index + 1))
+        if index >= 2:
+            # Submitted after the ones before the window of 2 are reported.
+            assert listener.on_scenario.call_count == index - 1
+        tasks[index].complete()
+        return tasks[index]
+
+    runner = NonCallableMock(ScenarioRunner)
+    runner.submit.side_effect = _submit
+    listener = NonCallableMock(Listener)
+    scheduler = ScenarioScheduler(runner, listener=listener, window=2)
+    assert scheduler.run(_scenarios()) is Status.FAILURE
+
+    listener.on_scenario.assert_has_calls([call(task.result()) for task in tasks])
+    assert runner.submit.call_count == 4
+
+
+def test_window_with_slow_head():
+    tasks = [_Task(Status.SUCCESS) for _ in range(5)]
+    held = []
+
+    def _submit(_: Scenario) -> ScenarioTask:
+        index = runner.submit.call_count - 1
+        held.append(runner.submit.call_count - listener.on_scenario.call_count)
+        if index == 0:
+            Timer(0.1, tasks[0].complete).start()
+        else:
+            tasks[index].complete()
+        return tasks[index]
+
+    runner = NonCallableMock(ScenarioRunner)
+    runner.submit.side_effect = _submit
+    listener = NonCallableMock(Listener)
+    scheduler = ScenarioScheduler(runner, listener=listener, window=2)
+    assert scheduler.run([sentinel.scenario] * 5) is Status.SUCCESS
+
+    # The completed ones behind the slow head are held within the window.
+    assert max(held) == 2
+    listener.on_scenario.assert_has_calls([call(task.result()) for task in tasks])
+
+
+def test_prewarming_with_window():
+    scenarios = [
+        NonCallableMock(Scenario, cases=[NonCallableMock(Case, request=Request(path=path))])
+        for path in ("/a", "/b", "/c")
+    ]
+    for scenario in scenarios:
+        scenario.subscenarios = []
+    prewarming = NonCallableMock(Prewarming)
+    added = []
+
+    def _submit(scenario: Scenario) -> ScenarioTask:
+        added.append(prewarming.add.call_count)
+        task = _Task(Status.SUCCESS)
+        task.complete()
+        return task
+
+    runner = NonCallableMock(ScenarioRunner)
+    runner.submit.side_effect = _submit
+    scheduler = ScenarioScheduler(runner, prewarming=prewarming, window=2)
+    assert scheduler.run(iter(scenarios)) is Status.SUCCESS
+
+    # The hosts of the first window are added before running, and the others as constructed.
+    assert added == [2, 2, 3]
+    prewarming.add.assert_has_calls([call("/a"), call("/b"), call("/c")])
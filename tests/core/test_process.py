@@ -0,0 +1,50 @@
+import pickle
+from unittest.mock import Mock, sentinel
+
+from preacher.core.util.process import ProcessShared, register, restore
+
+PKG = "preacher.core.util.process"
+
+
+def test_register_and_restore(mocker):
+    mocker.patch(f"{PKG}._PID", -1)  # Starts with an empty registry.
+    factory = Mock(return_value=sentinel.created)
+
+    register("registered", sentinel.registered)
+    register("registered", sentinel.other)
+    assert restore("registered", factory) is sentinel.registered
+    factory.assert_not_called()
+
+    assert restore("unregistered", factory) is sentinel.created
+    assert restore("unregistered", factory) is sentinel.created
+    factory.assert_called_once_with()
+
+
+def test_registry_is_cleared_in_another_process(mocker):
+    register("key", sentinel.parent)
+
+    # Restored as if in another process, whose registry is empty.
+    mocker.patch(f"{PKG}._PID", -1)
+    assert restore("key", lambda: sentinel.child) is sentinel.child
+
+
+class _Shared(ProcessShared):
+    def __init__(self, value: int):
+        self.value = value
+
+    def _shared_args(self):
+        return (self.value,)
+
+
+def test_process_shared(mocker):
+    shared = _Shared(1)
+    data = pickle.dumps(shared)
+    assert pickle.loads(data) is shared
+    assert pickle.loads(pickle.dumps(shared)) is shared
+
+    mocker.patch(f"{PKG}._PID", -1)
+    restored = pickle.loads(data)
+    assert restored is not shared
+    assert restored.value == 1
+    assert pickle.loads(data) is restored
+    assert pickle.loads(pickle.dumps(restored)) is restored
@@ -0,0 +1,91 @@
+import asyncio
+from typing import Optional
+from unittest.mock import Mock, NonCallableMock, sentinel
+
+from pytest import mark, raises
+
+from preacher.core.context import Context
+from preacher.core.extraction import Analyzer
+from preacher.core.request import ExecutionReport, Response
+from preacher.core.request.async_requester import AsyncRequester
+from preacher.core.status import Status
+from preacher.core.unit.async_runner import AsyncUnitRunner
+from preacher.core.verification import ResponseDescription, Verification
+
+PKG = "preacher.core.unit.async_runner"
+
+
+class _Requester(AsyncRequester):
+    def __init__(self, *results):
+        super().__init__(base_url="base-url")
+        self.calls = []
+        self._results = list(results)
+
+    async def execute(self, request, session=None, context=None, limiter=None):
+        self.calls.append((request, session, context, limiter))
+        return self._results.pop(0)
+
+
+@mark.parametrize("retry", [-2, -1])
+def test_given_invalid_retry_count(retry):
+    with raises(ValueError):
+        AsyncUnitRunner(sentinel.requester, retry=retry)
+
+
+def test_given_no_response():
+    requester = _Requester((ExecutionReport(Status.FAILURE), None))
+    requirements = NonCallableMock(ResponseDescription)
+
+    runner = AsyncUnitRunner(requester)
+    assert runner.base_url == "base-url"
+
+    execution, response, verification = asyncio.run(runner.run(sentinel.request, requirements))
+    assert execution.status is Status.FAILURE
+    assert response is None
+    assert verification is None
+
+    assert requester.calls == [(sentinel.request, None, Context(), None)]
+    requirements.verify.assert_not_called()
+
+
+def test_given_a_response(mocker):
+    sleep = Mock()
+
+    async def _sleep(seconds):
+        sleep(seconds)
+
+    mocker.patch("asyncio.sleep", new=_sleep)
+    executions = [
+        ExecutionReport(status=Status.UNSTABLE, starts=sentinel.starts),
+        ExecutionReport(status=Status.SUCCESS, starts=sentinel.starts),
+    ]
+    res = NonCallableMock(Response, timing=sentinel.timing)
+    requester = _Requester((executions[0], None), (executions[1], res))
+
+    def _verify(analyzer: Analyzer, context: Optional[Context] = None) -> Verification:
+        assert analyzer is res
+        assert context == Context(foo="bar", starts=sentinel.starts)
+        return Verification.succeed()
+
+    requirements = NonCallableMock(ResponseDescription, verify=Mock(side_effect=_verify))
+
+    runner = AsyncUnitRunner(requester=requester, retry=3, delay=0.5)
+    execution, response, verification = asyncio.run(
+        runner.run(
+            sentinel.request,
+            requirements,
+            sentinel.session,
+            context=Context(foo="bar"),
+            limiter=sentinel.limiter,
+        )
+    )
+    assert execution.status is Status.SUCCESS
+    assert execution.timing is sentinel.timing
+    assert response is res
+    assert verification.status is Status.SUCCESS
+
+    assert len(requester.calls) == 2
+    assert all(call[3] is sentinel.limiter for call in requester.calls)
+    # Contextual values will disappear.
+    requirements.verify.assert_called_once_with(res, Context(foo="bar"))
+    sleep.assert_called_once_with(0.5)
@@ -1,13 +1,15 @@
 from typing import Optional
-from unittest.mock import ANY, Mock, NonCallableMock, sentinel
+from unittest.mock import ANY, Mock, NonCallableMock, call, sentinel
 
 from pytest import mark, raises
 
 from preacher.core.context import Context
 from preacher.core.extraction import Analyzer
-from preacher.core.request import ExecutionReport, Requester
+from preacher.core.request import ExecutionReport, Requester, Response, RetryBudget
+from preacher.core.request import RetryOverride, RetryPolicy
 from preacher.core.status import Status
-from preacher.core.unit.runner import predicate, UnitRunner
+from preacher.core.unit.runner import UnitRunner, closing_predicate, predicate
+from preacher.core.unit.runner import retrying_delay, retrying_predicate
 from preacher.core.verification import ResponseVerification, ResponseDescription, Verification
 
 PKG = "preacher.core.unit.runner"
@@ -43,6 +45,22 @@ def test_predicate(execution, verification, expected):
     assert predicate((execution, None, verification)) == expected
 
 
+@mark.parametrize(("status", "closed"), ((Status.SUCCESS, False), (Status.UNSTABLE, True)))
+def test_closing_predicate(status, closed):
+    execution = ExecutionReport(status=Status.SUCCESS)
+    verification = ResponseVerification(
+        response_id=sentinel.response_id,
+        body=Verification(status=status),
+    )
+    response = NonCallableMock(Response)
+    assert closing_predicate((execution, response, verification)) is not closed
+    assert response.close.called is closed
+
+
+def test_closing_predicate_without_response():
+    assert not closing_predicate((ExecutionReport(status=Status.FAILURE), None, None))
+
+
 @mark.parametrize("retry", [-2, -1])
 def test_given_invalid_retry_count(retry):
     with raises(ValueError):
@@ -66,44 +84,123 @@ def test_given_no_response(mocker):
     assert response is None
     assert verification is None
 
-    requester.execute.assert_called_once_with(sentinel.request, session=None, context=Context())
+    requester.execute.assert_called_once_with(
+        sentinel.request,
+        session=None,
+        context=Context(),
+        limiter=None,
+    )
     requirements.verify.assert_not_called()
-    retry.assert_called_once_with(ANY, attempts=1, delay=0.1, predicate=predicate)
+    retry.assert_called_once_with(ANY, attempts=1, delay=ANY, predicate=ANY)
 
 
 def test_given_a_response(mocker):
     retry = mocker.patch(f"{PKG}.retry_while_false", side_effect=_retry)
 
     execution = ExecutionReport(starts=sentinel.starts)
+    res = NonCallableMock(Response, timing=sentinel.timing)
     requester = NonCallableMock(Requester)
     requester.base_url = sentinel.requester_base_url
-    requester.execute.return_value = (execution, sentinel.response)
+    requester.execute.return_value = (execution, res)
 
     def _verify(analyzer: Analyzer, context: Optional[Context] = None) -> Verification:
-        assert analyzer is sentinel.response
+        assert analyzer is res
         assert context == Context(foo="bar", starts=sentinel.starts)
         return sentinel.verification
 
     requirements = NonCallableMock(ResponseDescription, verify=Mock(side_effect=_verify))
 
-    runner = UnitRunner(requester=requester, retry=3, delay=sentinel.delay)
+    runner = UnitRunner(requester=requester, retry=3, delay=0.5)
     assert runner.base_url is sentinel.requester_base_url
 
-    execution, response, verification = runner.run(
+    result, response, verification = runner.run(
         sentinel.request,
         requirements,
         sentinel.session,
         context=Context(foo="bar"),
+        limiter=sentinel.limiter,
     )
-    assert execution is execution
-    assert response is sentinel.response
+    assert result.starts is sentinel.starts
+    assert result.timing is sentinel.timing
+    assert response is res
     assert verification is sentinel.verification
 
     requester.execute.assert_called_with(
         sentinel.request,
         session=sentinel.session,
         context=Context(foo="bar"),
+        limiter=sentinel.limiter,
     )
     # Contextual values will disappear.
-    requirements.verify.assert_called_with(sentinel.response, Context(foo="bar"))
-    retry.assert_called_once_with(ANY, attempts=4, delay=sentinel.delay, predicate=ANY)
+    requirements.verify.assert_called_with(res, Context(foo="bar"))
+    retry.assert_called_once_with(ANY, attempts=4, delay=ANY, predicate=ANY)
+
+
+def test_create_session():
+    requester = NonCallableMock(Requester)
+    requester.create_session.return_value = sentinel.session
+    runner = UnitRunner(requester)
+    assert runner.create_session() is sentinel.session
+
+
+def _failed(headers=None):
+    response = NonCallableMock(Response, headers=headers or {})
+    verification = ResponseVerification(
+        response_id=sentinel.response_id,
+        body=Verification(status=Status.UNSTABLE),
+    )
+    return ExecutionReport(status=Status.SUCCESS), response, verification
+
+
+def test_retrying_predicate():
+    policy = RetryPolicy(retry=3, max_delay=10.0)
+    budget = RetryBudget(1)
+    retrying = retrying_predicate(policy, budget)
+
+    assert retrying((ExecutionReport(status=Status.SUCCESS), None, None))
+
+    result = _failed({"retry-after": "11"})
+    assert retrying(result)
+    result[1].close.assert_not_called()
+    assert budget.remaining == 1
+
+    result = _failed()
+    assert not retrying(result)
+    result[1].close.assert_called_once_with()
+
+    # The budget is exhausted.
+    result = _failed()
+    assert retrying(result)
+    result[1].close.assert_not_called()
+
+
+def test_retrying_delay(mocker):
+    policy = NonCallableMock(RetryPolicy)
+    policy.wait_time.return_value = sentinel.wait_time
+    result = _failed()
+
+    assert retrying_delay(policy)(2, result) is sentinel.wait_time
+    policy.wait_time.assert_called_once_with(2, result[1])
+
+
+def test_retrying_with_overrides_and_budget(mocker):
+    sleep = mocker.patch("time.sleep")
+
+    requester = NonCallableMock(Requester)
+    requester.execute.side_effect = lambda *args, **kwargs: _failed()[:2]
+    requirements = NonCallableMock(ResponseDescription)
+    requirements.verify.return_value = _failed()[2]
+
+    budget = RetryBudget(3)
+    runner = UnitRunner(requester, retry=1, delay=0.5, budget=budget)
+    runner.run(sentinel.request, requirements, retry=RetryOverride(retry=2))
+    assert requester.execute.call_count == 3
+    sleep.assert_has_calls([call(0.5), call(0.5)])
+
+    runner.run(sentinel.request, requirements)
+    assert requester.execute.call_count == 5
+    assert budget.remaining == 0
+
+    runner.run(sentinel.request, requirements)
+    assert requester.execute.call_count == 6
+    assert sleep.call_count == 3
@@ -1,6 +1,6 @@
 from typing import List
 
-from preacher.core.request import ExecutionReport, PreparedRequest
+from preacher.core.request import ExecutionReport, PreparedRequest, Timing
 from preacher.core.scenario import ScenarioResult, CaseResult
 from preacher.core.status import Status, StatusedList
 from preacher.core.verification import Verification, ResponseVerification
@@ -40,6 +40,8 @@ FILLED_SCENARIO_RESULTS: List[ScenarioResult] = [
                             body="spam=ham",
                         ),
                         message="msg",
+                        elapsed=0.012,
+                        timing=Timing(connect=0.002, tls=0.004, ttfb=0.006, download=0.001),
                     ),
                     response=ResponseVerification(
                         response_id="response-id",
@@ -46,6 +46,7 @@ def test_export_execution(path):
     response_body = NonCallableMock(ResponseBody)
     response_body.text = "ABC"
     response_body.content = b"ABC"
+    response_body.iter_text.return_value = iter(["ABC"])
 
     response = NonCallableMock(Response)
     response.id = "res-id"